@@ -29,6 +29,8 @@ import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from frontmatter_rules import load_frontmatter_rules
+
 # Configuration du logging
 logging.basicConfig(
     level=logging.INFO,
@@ -139,19 +141,8 @@ EXPECTED_TEMPLATES = {
     'intervenant.md': {'required': True}
 }
 
-# Règles pour les frontmatter YAML par type de document
-FRONTMATTER_RULES = {
-    'personnages/.*': {
-        'required_fields': ['nom', 'tags'],
-        'recommended_fields': ['citation', 'expertise'],
-        'valid_tags': ['personnage', 'entite', 'mortel', 'manifestation', 'secondaire']
-    },
-    'review/.*todo.*\.md': {
-        'required_fields': ['id', 'titre', 'statut', 'priorite', 'date_creation'],
-        'recommended_fields': ['date_debut', 'date_fin', 'tags'],
-        'valid_tags': ['tâche']
-    }
-}
+# Règles pour les frontmatter YAML par type de document (automation/config/frontmatter-rules.yaml)
+FRONTMATTER_RULES = load_frontmatter_rules()
 
 def validate_structure(project_path, expected_structure, path="", issues=None):
     """
@@ -271,11 +262,8 @@ def validate_frontmatter(project_path, issues=None):
         relative_path = md_file.relative_to(project_path)
         str_path = str(relative_path)
         
-        # Vérifier si ce fichier correspond à une règle de frontmatter
-        matching_rules = []
-        for pattern, rules in FRONTMATTER_RULES.items():
-            if re.match(pattern, str_path):
-                matching_rules.append(rules)
+        # Règles qui s'appliquent à ce fichier
+        matching_rules = FRONTMATTER_RULES.rules_for(str_path)
         
         if not matching_rules:
             continue  # Aucune règle spécifique pour ce fichier
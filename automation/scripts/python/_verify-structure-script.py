@@ -20,106 +20,9 @@ import logging
 import argparse
 import time
 
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f"structure_verification_{time.strftime('%Y%m%d-%H%M%S')}.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger('verify_structure')
+from structure_spec import diff_structure
 
-# Définition de la structure standard du projet
-PROJECT_STRUCTURE = {
-    'index.md': "# Projet Littéraire\n\n[Description du projet]",
-    'import': {
-        'README.md': "# Dossier d'import\n\nCe dossier est destiné à contenir les manuscrits originaux et documents externes à importer dans le projet.\n\n## Utilisation\n\n1. Placez vos documents originaux (manuscrits, notes, etc.) dans ce dossier\n2. Utilisez les scripts d'importation du dossier `automation/scripts/python/` pour les traiter\n3. Les documents traités seront convertis au format approprié et placés dans les dossiers correspondants"
-    },
-    'chapitres': {},
-    'structure': {
-        'plan-general.md': "# Plan Général\n\n[Ajouter le plan général ici]",
-        'arcs-narratifs.md': "# Arcs Narratifs\n\n[Ajouter les arcs narratifs ici]",
-        'chronologie.md': "# Chronologie\n\n[Ajouter la chronologie ici]",
-        'personnages': {
-            'index.md': "# Index des Personnages\n\n[Liste des personnages]",
-            'entites': {},
-            'manifestations': {},
-            'mortels': {},
-            'secondaires': {}
-        }
-    },
-    'lieux': {
-        'reels': {},
-        'fictifs': {}
-    },
-    'concepts': {
-        'temporalite.md': "# Temporalité\n\n[Concepts liés au temps]",
-        'manifestations.md': "# Manifestations\n\n[Concept des manifestations]"
-    },
-    'ressources': {
-        'brainstorming': {},
-        'recherche': {},
-        'medias': {
-            'playlists': {},
-            'moodboards': {}
-        },
-        'extraits': {},
-        'auteurs': {}
-    },
-    'references': {
-        'index.md': "# Index des Références\n\n[Liste des références]"
-    },
-    'styles': {
-        'index.md': "# Styles Narratifs\n\n[Vue d'ensemble des styles]",
-        'registres': {},
-        'transitions.md': "# Transitions entre styles\n\n[Matrices de transition]",
-        'verification.md': "# Vérification de style\n\n[Checklist de cohérence]"
-    },
-    'claude-sessions': {
-        'index.md': "# Sessions Claude\n\n[Organisation des sessions]",
-        'developpement': {},
-        'personnages': {},
-        'revision': {},
-        'brainstorming': {}
-    },
-    'automation': {
-        'scripts': {
-            'python': {
-                'README.md': "# Scripts Python\n\nCette section contient les scripts Python pour l'automatisation du projet littéraire."
-            },
-            'bash': {},
-            'js': {}
-        },
-        'config': {},
-        'hooks': {},
-        'templates': {},
-        'docs': {
-            'README.md': "# Documentation des scripts\n\nCette section contient la documentation pour les scripts et workflows d'automatisation."
-        }
-    },
-    'review': {
-        'pending': {},
-        'in_progress': {},
-        'completed': {},
-        'claude_suggestions': {},
-        'templates': {}
-    },
-    'templates': {
-        'personnage-avance.md': "# Template de Personnage Avancé\n\n[Contenu du template]",
-        'chapitre.md': "# Template de Chapitre\n\n[Contenu du template]",
-        'reference.md': "# Template de Référence\n\n[Contenu du template]",
-        'intervenant.md': "# Template d'Intervenant\n\n[Contenu du template]",
-        'todo.md': "# Template de Tâche\n\n[Contenu du template]",
-        'gantt.md': "# Template de Diagramme Gantt\n\n[Contenu du template]"
-    },
-    'export': {
-        'pdf': {},
-        'epub': {},
-        'html': {}
-    }
-}
+logger = logging.getLogger('verify_structure')
 
 def file_needs_update(src_content, dest_path):
     """
@@ -145,48 +48,76 @@ def file_needs_update(src_content, dest_path):
         logger.warning(f"Erreur lors de la lecture du fichier {dest_path}: {e}")
         return True
 
-def check_structure(project_path, structure=None, path_prefix="", dry_run=False, interactive=True):
+def create_item(item_path, node):
+    """
+    Crée un élément manquant de la structure standard.
+    
+    Args:
+        item_path (Path): Chemin de l'élément
+        node (StructureNode): Élément attendu
+    """
+    if node.kind == 'dir':
+        item_path.mkdir(parents=True, exist_ok=True)
+    else:
+        item_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(item_path, 'w', encoding='utf-8') as f:
+            f.write(node.content)
+
+def check_structure(project_path, tree=None, dry_run=False, interactive=True):
     """
-    Vérifie récursivement la structure du projet et propose des corrections.
+    Vérifie la structure du projet et propose des corrections.
+    
+    La structure est comparée au disque en une passe (diff_structure); seuls
+    les éléments que l'initialisation crée (PROJECT_STRUCTURE) sont corrigés.
     
     Args:
         project_path (Path): Chemin racine du projet
-        structure (dict): Structure à vérifier (partie de PROJECT_STRUCTURE)
-        path_prefix (str): Préfixe du chemin pour l'affichage
+        tree (StructureNode): Arbre attendu (par défaut STRUCTURE_TREE)
         dry_run (bool): Si True, affiche les actions sans les exécuter
         interactive (bool): Si True, demande confirmation avant chaque action
     
     Returns:
         tuple: (nb_issues, nb_fixed) Nombre de problèmes détectés et corrigés
     """
-    if structure is None:
-        structure = PROJECT_STRUCTURE
-    
     nb_issues = 0
     nb_fixed = 0
     
-    for item_name, item_content in structure.items():
-        item_path = project_path / item_name
-        full_path = f"{path_prefix}/{item_name}" if path_prefix else item_name
+    for entry in diff_structure(project_path, tree).entries:
+        node = entry.node
+        
+        if entry.status == 'extra':
+            logger.info(f"Élément non prévu par la structure standard: {entry.path}")
+            continue
+        if not node.scaffold:
+            continue
         
-        # Si c'est un fichier (contenu est une chaîne)
-        if isinstance(item_content, str):
-            if not item_path.exists():
+        if entry.status == 'missing':
+            # Un dossier manquant est créé avec tout son contenu standard
+            for full_path, item in node.walk(entry.path):
+                if not item.scaffold:
+                    continue
                 nb_issues += 1
-                action = f"Créer le fichier manquant: {full_path}"
-                logger.warning(f"Problème: Fichier manquant {full_path}")
+                kind = "Dossier" if item.kind == 'dir' else "Fichier"
+                action = f"Créer le {kind.lower()} manquant: {full_path}"
+                logger.warning(f"Problème: {kind} manquant {full_path}")
                 
                 if not dry_run and (not interactive or prompt_user(action)):
                     logger.info(f"Action: {action}")
-                    item_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(item_path, 'w', encoding='utf-8') as f:
-                        f.write(item_content)
+                    create_item(project_path / full_path, item)
                     nb_fixed += 1
-            elif file_needs_update(item_content, item_path):
+        
+        elif entry.status == 'mismatch':
+            nb_issues += 1
+            expected = "un dossier" if node.kind == 'dir' else "un fichier"
+            logger.warning(f"Problème: {entry.path} devrait être {expected}")
+        
+        elif node.kind == 'file' and node.content is not None:
+            item_path = project_path / entry.path
+            if file_needs_update(node.content, item_path):
                 # Le fichier existe mais a peut-être besoin d'être mis à jour
                 nb_issues += 1
-                action = f"Mettre à jour le fichier: {full_path}"
-                logger.warning(f"Problème: Fichier différent du standard {full_path}")
+                action = f"Mettre à jour le fichier: {entry.path}"
+                logger.warning(f"Problème: Fichier différent du standard {entry.path}")
                 
                 if not dry_run and (not interactive or prompt_user(action)):
                     # Créer une sauvegarde avant mise à jour
@@ -196,28 +127,9 @@ def check_structure(project_path, structure=None, path_prefix="", dry_run=False,
                     
                     # Mettre à jour le fichier
                     with open(item_path, 'w', encoding='utf-8') as f:
-                        f.write(item_content)
+                        f.write(node.content)
                     logger.info(f"Action: {action}")
                     nb_fixed += 1
-        
-        # Si c'est un dossier (contenu est un dictionnaire)
-        else:
-            if not item_path.exists():
-                nb_issues += 1
-                action = f"Créer le dossier manquant: {full_path}"
-                logger.warning(f"Problème: Dossier manquant {full_path}")
-                
-                if not dry_run and (not interactive or prompt_user(action)):
-                    logger.info(f"Action: {action}")
-                    item_path.mkdir(parents=True, exist_ok=True)
-                    nb_fixed += 1
-            
-            # Récursion pour vérifier la structure interne
-            sub_issues, sub_fixed = check_structure(
-                item_path, item_content, full_path, dry_run, interactive
-            )
-            nb_issues += sub_issues
-            nb_fixed += sub_fixed
     
     return nb_issues, nb_fixed
 
@@ -245,6 +157,16 @@ def main():
     
     args = parser.parse_args()
     
+    # Configuration du logging (à l'exécution seulement, jamais à l'import)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(f"structure_verification_{time.strftime('%Y%m%d-%H%M%S')}.log"),
+            logging.StreamHandler()
+        ]
+    )
+    
     project_path = args.project_path.resolve()
     logger.info(f"Vérification de la structure du projet dans: {project_path}")
     
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sauvegarde des seuls fichiers qu'une correction va modifier.
+
+Avant d'exécuter un plan de correction, les fichiers concernés sont copiés
+dans un magasin adressé par contenu (.structure-backups/objects/, un objet
+par empreinte SHA-1, partagé entre les sauvegardes) et un manifeste JSON
+décrit l'état de chaque fichier: son empreinte, ou son absence s'il va être
+créé. Les objets sont des liens physiques quand le système de fichiers le
+permet: les correcteurs remplacent les fichiers (os.replace) au lieu de les
+réécrire sur place, l'objet garde donc l'ancien contenu. Un fichier réécrit
+sur place par ailleurs (éditeur, open(..., 'w'), shutil.copy2 sur un fichier
+existant) modifie aussi l'objet lié: un objet existant n'est réutilisé que si
+son empreinte est toujours la bonne, sinon il est remplacé, et la copie
+restaurée est vérifiée avant de remplacer le fichier.
+
+Les sauvegardes les plus anciennes s'élaguent avec --prune: seuls les
+manifestes les plus récents sont gardés, avec les objets auxquels ils (ou le
+journal d'une exécution interrompue, voir plan_executor) font référence.
+
+Utilisation:
+    python backup_store.py --project-dir PATH --list
+    python backup_store.py --project-dir PATH --restore [MANIFESTE]
+    python backup_store.py --project-dir PATH --prune [N]
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+logger = logging.getLogger('structure_verification')
+
+BACKUP_DIRNAME = '.structure-backups'
+
+# Journal d'une exécution de plan_executor en cours ou interrompue
+JOURNAL_FILENAME = 'journal.json'
+
+# Nombre de sauvegardes gardées par défaut par --prune
+DEFAULT_KEEP = 10
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """
+    Calcule l'empreinte SHA-1 d'un fichier par blocs.
+
+    Args:
+        path (str): Chemin du fichier
+        chunk_size (int): Taille des blocs lus
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def backup_root(project_path):
+    """Dossier caché des sauvegardes du projet."""
+    return Path(project_path) / BACKUP_DIRNAME
+
+
+def object_path(project_path, sha1):
+    """Chemin de l'objet stockant un contenu d'empreinte donnée."""
+    return backup_root(project_path) / 'objects' / sha1[:2] / sha1[2:]
+
+
+def store_object(project_path, abs_path, sha1):
+    """
+    Range le contenu d'un fichier dans le magasin, par lien physique si possible.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        abs_path (str): Fichier à sauvegarder
+        sha1 (str): Empreinte de son contenu
+
+    Returns:
+        bool: True si un lien physique a été utilisé
+    """
+    target = object_path(project_path, sha1)
+    if target.exists():
+        if file_hash(str(target)) == sha1:
+            return False
+        # Objet lié à un fichier réécrit sur place depuis: il est remplacé
+        logger.warning(f"Objet de sauvegarde altéré, remplacé: {target}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=str(target.parent), suffix='.tmp')
+    os.close(fd)
+    try:
+        os.unlink(temp_path)
+        os.link(abs_path, temp_path)
+        linked = True
+    except OSError:
+        # Système de fichiers sans liens physiques: copie
+        shutil.copy2(abs_path, temp_path)
+        linked = False
+    # Remplacement atomique: un ancien objet altéré est délié, pas réécrit
+    os.replace(temp_path, target)
+    return linked
+
+
+def store_content(project_path, data):
+    """
+    Range un contenu en mémoire dans le magasin.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        data (bytes): Contenu à ranger
+
+    Returns:
+        str: Empreinte SHA-1 du contenu
+    """
+    sha1 = hashlib.sha1(data).hexdigest()
+    target = object_path(project_path, sha1)
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(target.parent), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, target)
+    return sha1
+
+
+def create_backup(project_path, rel_paths, label=None):
+    """
+    Sauvegarde les fichiers indiqués et enregistre un manifeste.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        rel_paths (iterable): Chemins relatifs des fichiers qui vont être
+            modifiés ou créés
+        label (str, optional): Description de l'opération sauvegardée
+
+    Returns:
+        Path: Chemin du manifeste créé
+    """
+    project_path = Path(project_path)
+    entries = []
+    linked = 0
+    for rel_path in sorted(set(rel_paths)):
+        abs_path = project_path / rel_path
+        if abs_path.is_file():
+            sha1 = file_hash(str(abs_path))
+            linked += store_object(project_path, str(abs_path), sha1)
+            stat = abs_path.stat()
+            entries.append({'path': rel_path, 'sha1': sha1, 'mode': stat.st_mode & 0o7777,
+                            'mtime': stat.st_mtime})
+        elif not abs_path.exists():
+            # Fichier qui sera créé: la restauration le supprimera
+            entries.append({'path': rel_path, 'sha1': None})
+
+    timestamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
+    manifest = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'label': label or '',
+        'files': entries,
+    }
+    manifest_dir = backup_root(project_path) / 'manifests'
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = manifest_dir / f"{timestamp}.json"
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    logger.info(f"Sauvegarde de {len(entries)} fichiers ({linked} liens physiques): {manifest_path}")
+    return manifest_path
+
+
+def list_backups(project_path):
+    """
+    Liste les manifestes de sauvegarde, du plus ancien au plus récent.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+
+    Returns:
+        list: Chemins des manifestes
+    """
+    manifest_dir = backup_root(project_path) / 'manifests'
+    if not manifest_dir.is_dir():
+        return []
+    return sorted(manifest_dir.glob('*.json'))
+
+
+def restore_backup(project_path, manifest_path=None):
+    """
+    Restaure les fichiers décrits par un manifeste (le plus récent par défaut).
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        manifest_path (Path, optional): Manifeste à restaurer
+
+    Returns:
+        int: Nombre de fichiers restaurés ou supprimés
+    """
+    project_path = Path(project_path)
+    if manifest_path is None:
+        manifests = list_backups(project_path)
+        if not manifests:
+            logger.error(f"Aucune sauvegarde trouvée dans {backup_root(project_path)}")
+            return 0
+        manifest_path = manifests[-1]
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    restored = 0
+    for entry in manifest['files']:
+        abs_path = project_path / entry['path']
+        if entry['sha1'] is None:
+            if abs_path.is_file():
+                abs_path.unlink()
+                logger.info(f"Fichier créé par la correction supprimé: {entry['path']}")
+                restored += 1
+            continue
+
+        source = object_path(project_path, entry['sha1'])
+        if not source.is_file():
+            logger.error(f"Objet de sauvegarde manquant pour {entry['path']}: {source}")
+            continue
+        if abs_path.is_file() and file_hash(str(abs_path)) == entry['sha1']:
+            continue
+
+        # Copie (jamais de lien physique), vérifiée, puis remplacement atomique
+        abs_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(abs_path.parent), prefix=f".{abs_path.name}.", suffix='.tmp')
+        os.close(fd)
+        shutil.copyfile(source, temp_path)
+        if file_hash(temp_path) != entry['sha1']:
+            os.unlink(temp_path)
+            logger.error(f"Objet de sauvegarde altéré pour {entry['path']}, fichier non restauré: {source}")
+            continue
+        os.chmod(temp_path, entry.get('mode', 0o644))
+        os.replace(temp_path, abs_path)
+        if 'mtime' in entry:
+            os.utime(abs_path, (entry['mtime'], entry['mtime']))
+        logger.info(f"Fichier restauré: {entry['path']}")
+        restored += 1
+
+    logger.info(f"{restored} fichiers restaurés depuis {manifest_path}")
+    return restored
+
+
+def prune_backups(project_path, keep=DEFAULT_KEEP):
+    """
+    Supprime les sauvegardes les plus anciennes et les objets qui ne servent plus.
+
+    Un objet est gardé tant qu'un manifeste conservé ou le journal d'une
+    exécution interrompue (manifeste et contenus prévus) y fait référence.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        keep (int): Nombre de sauvegardes les plus récentes à garder
+
+    Returns:
+        tuple: (manifestes supprimés, objets supprimés)
+    """
+    project_path = Path(project_path)
+    manifests = list_backups(project_path)
+    kept = manifests[len(manifests) - keep:] if keep > 0 else []
+
+    referenced = set()
+    try:
+        with open(backup_root(project_path) / JOURNAL_FILENAME, 'r', encoding='utf-8') as f:
+            journal = json.load(f)
+    except FileNotFoundError:
+        journal = None
+    if journal is not None:
+        referenced.update(entry['sha1'] for entry in journal['files'] if entry['sha1'])
+        kept.extend(path for path in manifests if path.name == journal['manifest'] and path not in kept)
+
+    removed_manifests = 0
+    for manifest_path in manifests:
+        if manifest_path in kept:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                referenced.update(entry['sha1'] for entry in json.load(f)['files'] if entry['sha1'])
+        else:
+            manifest_path.unlink()
+            removed_manifests += 1
+
+    removed_objects = 0
+    objects_dir = backup_root(project_path) / 'objects'
+    if objects_dir.is_dir():
+        for prefix_dir in sorted(objects_dir.iterdir()):
+            for object_file in prefix_dir.iterdir():
+                # Les fichiers temporaires laissés par une copie interrompue partent aussi
+                if prefix_dir.name + object_file.name not in referenced:
+                    object_file.unlink()
+                    removed_objects += 1
+            if not any(prefix_dir.iterdir()):
+                prefix_dir.rmdir()
+
+    logger.info(f"{removed_manifests} sauvegardes et {removed_objects} objets supprimés, "
+                f"{len(manifests) - removed_manifests} sauvegardes gardées")
+    return removed_manifests, removed_objects
+
+
+def main(argv=None):
+    """
+    Liste, restaure ou élague les sauvegardes d'un projet.
+
+    Args:
+        argv (list, optional): Arguments de la ligne de commande (par défaut sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Gère les sauvegardes créées avant les corrections de structure.")
+    parser.add_argument("--project-dir", default=".", help="Chemin vers le répertoire du projet")
+    parser.add_argument("--list", action="store_true", help="Liste les sauvegardes disponibles")
+    parser.add_argument("--restore", nargs='?', const='latest', metavar="MANIFESTE",
+                        help="Restaure une sauvegarde (la plus récente par défaut)")
+    parser.add_argument("--prune", nargs='?', type=int, const=DEFAULT_KEEP, metavar="N",
+                        help=f"Supprime les sauvegardes sauf les N plus récentes (défaut: {DEFAULT_KEEP}) "
+                             "et les objets qui ne servent plus")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    project_path = Path(args.project_dir).resolve()
+
+    if args.restore:
+        manifest_path = None
+        if args.restore != 'latest':
+            manifest_path = Path(args.restore)
+            if not manifest_path.exists():
+                manifest_path = backup_root(project_path) / 'manifests' / args.restore
+        restore_backup(project_path, manifest_path)
+        return 0
+
+    if args.prune is not None:
+        prune_backups(project_path, args.prune)
+        return 0
+
+    for manifest_path in list_backups(project_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        print(f"{manifest_path.name}  {manifest['created']}  {len(manifest['files'])} fichiers  {manifest['label']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
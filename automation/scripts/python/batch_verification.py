@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vérification de plusieurs projets en une exécution (option --projects-root).
+
+Les projets (un dossier contenant index.md et chapitres/) sont recherchés
+sous un dossier racine puis vérifiés en parallèle par un groupe de
+processus. Chaque processus de travail importe les scripts une seule fois
+et garde d'un projet à l'autre ses caches: règles de frontmatter compilées
+(par empreinte, voir frontmatter_rules) et blocs YAML déjà analysés. Les
+résultats sont réunis dans un rapport de synthèse avec le détail de chaque
+projet.
+"""
+
+import os
+import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from phase_profiler import merge_counters
+
+logger = logging.getLogger('structure_verification')
+
+# Rapport de synthèse écrit à la racine des projets
+BATCH_REPORT_FILE = 'structure-batch-report.md'
+
+# Profondeur maximale de recherche des projets sous la racine
+DISCOVERY_DEPTH = 3
+
+
+def is_project(path):
+    """
+    Indique si un dossier est un projet littéraire (index.md et chapitres/).
+
+    Args:
+        path (Path): Dossier à tester
+
+    Returns:
+        bool: True si le dossier est un projet
+    """
+    return (path / 'index.md').is_file() and (path / 'chapitres').is_dir()
+
+
+def discover_projects(projects_root, max_depth=DISCOVERY_DEPTH):
+    """
+    Recherche les projets sous un dossier racine. Le contenu d'un projet
+    n'est pas parcouru: les projets ne s'imbriquent pas.
+
+    Args:
+        projects_root (Path): Dossier racine
+        max_depth (int): Profondeur maximale de recherche
+
+    Returns:
+        list: Chemins des projets trouvés, triés
+    """
+    projects = []
+    pending = [(Path(projects_root), 0)]
+    while pending:
+        directory, depth = pending.pop()
+        if is_project(directory):
+            projects.append(directory)
+            continue
+        if depth >= max_depth:
+            continue
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            pending.append((Path(entry.path), depth + 1))
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Impossible de parcourir {directory}: {e}")
+    return sorted(projects)
+
+
+def verify_projects(worker, tasks, jobs):
+    """
+    Vérifie des projets en parallèle.
+
+    Args:
+        worker (callable): Fonction de vérification d'un projet, importable
+            par les processus de travail; elle reçoit une tâche et retourne
+            un résultat avec au moins 'project', 'issues' et 'counters'
+        tasks (list): Une tâche par projet
+        jobs (int): Nombre de processus de travail
+
+    Yields:
+        dict: Résultat de chaque projet, dans l'ordre des tâches
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield worker(task)
+        return
+
+    # Un projet par envoi: les durées des projets sont très inégales
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        for result in executor.map(worker, tasks, chunksize=1):
+            merge_counters(result['counters'])
+            yield result
+
+
+def create_batch_report(projects_root, results, output_file=BATCH_REPORT_FILE, seconds=None):
+    """
+    Crée le rapport de synthèse de plusieurs projets au format Markdown.
+
+    Args:
+        projects_root (Path): Dossier racine des projets
+        results (list): Résultats par projet (voir verify_projects), complétés
+            de 'report' (rapport du projet) et 'error' (échec de la vérification)
+        output_file (str): Fichier de sortie, relatif à la racine
+        seconds (float, optional): Durée totale de la vérification
+
+    Returns:
+        str: Chemin du fichier de rapport créé
+    """
+    projects_root = Path(projects_root)
+    error_count = 0
+    warning_count = 0
+    conforming = 0
+    for result in results:
+        result_errors = sum(1 for issue in result['issues'] if issue['level'] == 'error')
+        error_count += result_errors
+        warning_count += sum(1 for issue in result['issues'] if issue['level'] == 'warning')
+        if not result_errors and not result.get('error'):
+            conforming += 1
+
+    output_path = projects_root / output_file
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(f"""# Rapport de vérification des projets
+
+Dossier: {projects_root}
+Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+## Résumé
+
+- **Projets**: {len(results)}
+- **Projets sans erreur**: {conforming}
+- **Erreurs**: {error_count}
+- **Avertissements**: {warning_count}
+""")
+        if seconds is not None:
+            f.write(f"- **Durée**: {seconds:.2f} s\n")
+
+        f.write("""
+| Projet | Fichiers | Erreurs | Avertissements | Durée (s) | Rapport |
+|--------|----------|---------|----------------|-----------|---------|
+""")
+        for result in results:
+            name = os.path.relpath(result['project'], projects_root)
+            if result.get('error'):
+                f.write(f"| {name} | - | échec | - | - | - |\n")
+                continue
+            result_errors = sum(1 for issue in result['issues'] if issue['level'] == 'error')
+            result_warnings = sum(1 for issue in result['issues'] if issue['level'] == 'warning')
+            report = os.path.relpath(result['report'], projects_root) if result.get('report') else '-'
+            f.write(f"| {name} | {result['files']} | {result_errors} | {result_warnings} | "
+                    f"{result['seconds']:.2f} | {report} |\n")
+
+        f.write("\n## Détail par projet\n\n")
+        for result in results:
+            name = os.path.relpath(result['project'], projects_root)
+            f.write(f"### {name}\n\n")
+            if result.get('error'):
+                f.write(f"Vérification impossible: {result['error']}\n\n")
+                continue
+            if not result['issues']:
+                f.write("Aucun problème détecté.\n\n")
+                continue
+
+            # Nombre de problèmes par type, puis les erreurs en détail
+            by_type = Counter((issue['type'], issue['level']) for issue in result['issues'])
+            for (issue_type, level), count in sorted(by_type.items()):
+                level_icon = "🔴" if level == 'error' else "🟠"
+                f.write(f"- {level_icon} {issue_type.replace('_', ' ').title()}: {count}\n")
+            errors = [issue for issue in result['issues'] if issue['level'] == 'error']
+            if errors:
+                f.write("\nErreurs:\n\n")
+                for issue in sorted(errors, key=lambda x: x['path']):
+                    f.write(f"- **{issue['path']}**: {issue['message']}\n")
+            f.write("\n")
+
+    logger.info(f"Rapport de synthèse créé: {output_path}")
+    return str(output_path)
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mesures de performance du script de vérification de structure.
+
+- vault_generator: génère des projets synthétiques de taille arbitraire;
+- run_benchmarks: chronomètre chaque phase de la vérification et compare
+  les mesures aux références enregistrées (baselines.json);
+- import_budget: vérifie le temps d'import et de démarrage des points
+  d'entrée (verify-structure).
+
+Utilisation (depuis automation/scripts/python):
+    python -m benchmarks.run_benchmarks --scales 1k 10k
+    python -m benchmarks.vault_generator --output /tmp/vault --files 1000
+    python -m benchmarks.import_budget
+"""
+
+import sys
+from pathlib import Path
+
+# Dossier des scripts mesurés, importables comme modules
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
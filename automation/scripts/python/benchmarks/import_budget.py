@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Budget de démarrage des points d'entrée de la vérification de structure.
+
+Chaque module de IMPORT_BUDGETS est importé dans un nouvel interpréteur avec
+-X importtime: son temps d'import cumulé (meilleur de plusieurs essais) doit
+rester sous le budget, les modules réservés à certaines commandes (YAML,
+SQLite, multiprocessing, difflib...) ne doivent pas être chargés, et
+l'import ne doit créer aucun fichier (aucun journal ouvert à l'import).
+Les commandes de COMMAND_BUDGETS sont chronométrées de bout en bout, le
+démarrage d'un interpréteur vide étant déduit: `verify-structure --help`
+et `verify-structure analyze` sur un petit projet généré.
+
+Les modules sont compilés une première fois (fichiers .pyc), comme après
+une installation. Le script retourne 1 si un budget est dépassé: à lancer
+après tout changement des imports d'un point d'entrée.
+
+Utilisation:
+    python -m benchmarks.import_budget [--repeat N]
+"""
+
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import subprocess
+
+from benchmarks import SCRIPTS_DIR
+from benchmarks.vault_generator import generate_vault
+
+logger = logging.getLogger('structure_verification')
+
+# Module -> (temps d'import maximal en ms, modules qui ne doivent pas être chargés)
+IMPORT_BUDGETS = {
+    'structure_cli': (30, ['logging', 'yaml', 'sqlite3', 'multiprocessing', 'concurrent.futures',
+                           'difflib', 'textwrap', 'verify_structure_script']),
+    'verify_structure_script': (100, ['multiprocessing', 'concurrent.futures', 'difflib', 'ctypes',
+                                      'batch_verification', 'fix_policy', 'plan_executor', 'vault_watcher']),
+}
+
+# Commande -> (arguments de structure_cli, durée maximale en ms hors démarrage de l'interpréteur)
+COMMAND_BUDGETS = {
+    'verify-structure --help': (['--help'], 40),
+    'verify-structure analyze': (['analyze', '--project-dir', '{project}', '--no-cache'], 250),
+}
+
+# Taille du projet généré pour la commande analyze
+PROJECT_FILES = 50
+
+
+def child_environment():
+    """Environnement des interpréteurs lancés: scripts importables, .pyc autorisés."""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SCRIPTS_DIR), env.get('PYTHONPATH')]))
+    return env
+
+
+def measure_import(module_name, repeat, env):
+    """
+    Importe un module dans de nouveaux interpréteurs.
+
+    Args:
+        module_name (str): Module à importer
+        repeat (int): Nombre d'essais
+        env (dict): Environnement des interpréteurs
+
+    Returns:
+        tuple: (meilleur temps d'import cumulé en ms, modules chargés,
+                fichiers créés dans le dossier courant)
+    """
+    best = None
+    loaded = set()
+    created = []
+    for _ in range(repeat):
+        work_dir = tempfile.mkdtemp(prefix='import-budget-')
+        try:
+            result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module_name}"],
+                                    cwd=work_dir, env=env, capture_output=True, text=True, check=True)
+            created = sorted(set(created) | set(os.listdir(work_dir)))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        # Lignes "import time: propre | cumulé | module" (en microsecondes)
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            name = name.strip()
+            loaded.add(name)
+            if name == module_name:
+                milliseconds = int(cumulative) / 1000
+                best = milliseconds if best is None else min(best, milliseconds)
+    return best, loaded, created
+
+
+def measure_command(argv, repeat, env, cwd):
+    """
+    Durée d'une commande, meilleur de plusieurs essais.
+
+    Args:
+        argv (list): Commande complète
+        repeat (int): Nombre d'essais
+        env (dict): Environnement de la commande
+        cwd (str): Dossier courant de la commande
+
+    Returns:
+        tuple: (meilleure durée en ms, code de retour du dernier essai)
+    """
+    best = None
+    returncode = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        returncode = subprocess.run(argv, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL).returncode
+        milliseconds = (time.perf_counter() - start) * 1000
+        best = milliseconds if best is None else min(best, milliseconds)
+    return best, returncode
+
+
+def main():
+    """
+    Mesure les points d'entrée et les compare à leur budget.
+    """
+    parser = argparse.ArgumentParser(description="Vérifie le temps de démarrage des points d'entrée.")
+    parser.add_argument("--repeat", type=int, default=5, help="Essais par mesure, meilleur temps retenu (défaut: 5)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    env = child_environment()
+    overruns = []
+
+    # Compilation des modules avant les mesures, comme après une installation
+    for module_name in IMPORT_BUDGETS:
+        measure_import(module_name, 1, env)
+
+    print(f"\n  {'import':<28} {'temps (ms)':>10} {'budget':>8}")
+    for module_name, (budget, forbidden) in IMPORT_BUDGETS.items():
+        milliseconds, loaded, created = measure_import(module_name, args.repeat, env)
+        print(f"  {module_name:<28} {milliseconds:>10.1f} {budget:>8}")
+        if milliseconds > budget:
+            overruns.append(f"import {module_name}: {milliseconds:.1f} ms au lieu de {budget} ms au plus")
+        for name in sorted(set(forbidden) & loaded):
+            overruns.append(f"import {module_name}: charge {name}")
+        for name in created:
+            overruns.append(f"import {module_name}: crée le fichier {name}")
+
+    work_dir = tempfile.mkdtemp(prefix='import-budget-')
+    try:
+        project_path = os.path.join(work_dir, 'projet')
+        generate_vault(project_path, PROJECT_FILES)
+        interpreter, _ = measure_command([sys.executable, '-c', 'pass'], args.repeat, env, work_dir)
+
+        print(f"\n  {'commande':<28} {'temps (ms)':>10} {'budget':>8}   (hors démarrage de Python: {interpreter:.1f} ms)")
+        for label, (command_args, budget) in COMMAND_BUDGETS.items():
+            argv = [sys.executable, '-m', 'structure_cli'] + [arg.format(project=project_path) for arg in command_args]
+            milliseconds, returncode = measure_command(argv, args.repeat, env, work_dir)
+            milliseconds -= interpreter
+            print(f"  {label:<28} {milliseconds:>10.1f} {budget:>8}")
+            # analyze retourne 1 quand le projet a des erreurs; au-delà, la commande a échoué
+            if returncode > 1:
+                overruns.append(f"{label}: échec (code {returncode})")
+            elif milliseconds > budget:
+                overruns.append(f"{label}: {milliseconds:.1f} ms au lieu de {budget} ms au plus")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if overruns:
+        print("\nDépassements:")
+        for overrun in overruns:
+            print(f"  - {overrun}")
+        return 1
+    print("\nBudgets respectés.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mesure des performances de la vérification de structure sur des projets
+synthétiques, et détection des régressions.
+
+Pour chaque échelle, un projet est généré (une seule fois, puis réutilisé
+depuis le dossier de travail) et chaque phase de la vérification est
+mesurée séparément avec le PhaseProfiler de --profile: parcours du projet,
+structure et templates, frontmatter, liens cassés et recherche de fichiers
+similaires. Sont relevés le temps écoulé (meilleur de plusieurs
+répétitions), les compteurs (fichiers et octets lus, analyses YAML,
+comparaisons approximatives...) et le pic de mémoire allouée (tracemalloc,
+lors d'une passe séparée pour ne pas fausser les temps). Les mesures sont comparées à baselines.json: au-delà
+des tolérances, la phase est signalée en régression et le script retourne 1.
+
+Les références dépendent de la machine: après un changement volontaire ou
+sur une nouvelle machine, les réenregistrer avec --update-baselines.
+
+Utilisation:
+    python -m benchmarks.run_benchmarks [--scales 1k 10k 100k] [--repeat N]
+        [--work-dir PATH] [--update-baselines] [--json FICHIER]
+"""
+
+import gc
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.vault_generator import generate_vault
+from phase_profiler import PhaseProfiler
+import vault_snapshot
+import verify_structure_improved_part1 as link_fixer
+import verify_structure_script as verifier
+
+logger = logging.getLogger('structure_verification')
+
+# Version du générateur: à incrémenter quand les projets générés changent
+GENERATOR_VERSION = 1
+
+# Paramètres communs des projets générés
+DEFAULT_PROFILE = {
+    'depth': 3,
+    'link_density': 4.0,
+    'broken_ratio': 0.05,
+    'seed': 0,
+}
+
+# Échelles disponibles: nombre de notes de contenu
+SCALES = {
+    '1k': 1000,
+    '10k': 10000,
+    '100k': 100000,
+}
+
+DEFAULT_SCALES = ['1k', '10k']
+
+PHASES = ['snapshot', 'structure', 'frontmatter', 'links', 'fuzzy']
+
+BASELINES_FILE = Path(__file__).resolve().parent / 'baselines.json'
+
+# Tolérances relatives avant de signaler une régression
+TIME_TOLERANCE = 0.30
+MEMORY_TOLERANCE = 0.20
+COUNTER_TOLERANCE = 0.05
+
+# Compteurs déterministes pour un projet donné, comparés aux références
+COMPARED_COUNTERS = ['files_read', 'bytes_read', 'yaml_parses', 'fuzzy_comparisons']
+
+# Écart absolu ignoré sur les phases très courtes (secondes)
+TIME_SLACK = 0.02
+
+
+def prepare_vault(work_dir, scale):
+    """
+    Retourne le projet synthétique d'une échelle, généré au premier appel.
+
+    Args:
+        work_dir (Path): Dossier des projets générés
+        scale (str): Échelle ('1k', '10k' ou '100k')
+
+    Returns:
+        tuple: (chemin du projet, statistiques de génération)
+    """
+    project_path = work_dir / f"vault-{scale}-v{GENERATOR_VERSION}-seed{DEFAULT_PROFILE['seed']}"
+    stats_path = project_path / '.benchmark-vault.json'
+    if stats_path.exists():
+        with open(stats_path, 'r', encoding='utf-8') as f:
+            return project_path, json.load(f)
+
+    if project_path.exists():
+        # Génération interrompue: recommencer dans un dossier propre
+        shutil.rmtree(project_path)
+
+    logger.info(f"Génération du projet synthétique {scale} dans {project_path}...")
+    start = time.perf_counter()
+    stats = generate_vault(project_path, files=SCALES[scale], **DEFAULT_PROFILE)
+    logger.info(f"Projet {scale} généré en {time.perf_counter() - start:.1f}s")
+    with open(stats_path, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2)
+    return project_path, stats
+
+
+def run_phases(project_path, on_phase):
+    """
+    Exécute la vérification complète, phase par phase, sans cache.
+
+    Args:
+        project_path (Path): Chemin du projet
+        on_phase (callable): Appelée pour chaque phase, on_phase(nom, fonction, état)
+            doit exécuter fonction() et retourner son résultat; état contient
+            l'instantané une fois construit
+
+    Returns:
+        dict: Nombre de problèmes par phase
+    """
+    # Chaque exécution repart du cache des blocs YAML vide, comme un nouveau processus
+    vault_snapshot._frontmatter_lru.clear()
+
+    state = {}
+    counts = {}
+
+    def snapshot_phase():
+        state['snapshot'] = verifier.VaultSnapshot.build(project_path)
+        return []
+
+    def structure_phase():
+        issues = verifier.validate_structure(project_path, verifier.EXPECTED_STRUCTURE)
+        return verifier.validate_template_existence(project_path, issues)
+
+    def frontmatter_phase():
+        return verifier.validate_frontmatter(project_path, snapshot=state['snapshot'])
+
+    def links_phase():
+        state['broken_links'] = verifier.check_broken_links(project_path, snapshot=state['snapshot'])
+        return state['broken_links']
+
+    def fuzzy_phase():
+        found = []
+        for issue in state['broken_links']:
+            broken_link = link_fixer.get_broken_link(issue)
+            if broken_link:
+                found.extend(link_fixer.find_similar_files(project_path, broken_link, state['snapshot'])[:1])
+        return found
+
+    phases = {
+        'snapshot': snapshot_phase,
+        'structure': structure_phase,
+        'frontmatter': frontmatter_phase,
+        'links': links_phase,
+        'fuzzy': fuzzy_phase,
+    }
+    for name in PHASES:
+        counts[name] = len(on_phase(name, phases[name], state))
+    return counts
+
+
+def measure_times(project_path):
+    """
+    Chronomètre chaque phase et relève ses compteurs.
+
+    Args:
+        project_path (Path): Chemin du projet
+
+    Returns:
+        tuple: ({phase: {'wall_seconds', compteurs...}}, {phase: nombre de problèmes})
+    """
+    profiler = PhaseProfiler(enabled=True)
+
+    def on_phase(name, function, state):
+        gc.collect()
+        with profiler.phase(name):
+            return function()
+
+    counts = run_phases(project_path, on_phase)
+    results = profiler.as_dict()
+    for values in results.values():
+        values['wall_seconds'] = round(values['wall_seconds'], 4)
+        values['yaml_seconds'] = round(values['yaml_seconds'], 4)
+        values['regex_seconds'] = round(values['regex_seconds'], 4)
+    return results, counts
+
+
+def measure_memory(project_path):
+    """
+    Mesure le pic de mémoire allouée par chaque phase (passe séparée).
+
+    Args:
+        project_path (Path): Chemin du projet
+
+    Returns:
+        dict: {phase: pic en Kio au-dessus de la mémoire au début de la phase}
+    """
+    peaks = {}
+
+    def on_phase(name, function, state):
+        gc.collect()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks[name] = max(0, peak - current) // 1024
+        return result
+
+    tracemalloc.start()
+    try:
+        run_phases(project_path, on_phase)
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def benchmark_scale(work_dir, scale, repeat):
+    """
+    Mesure toutes les phases pour une échelle.
+
+    Args:
+        work_dir (Path): Dossier des projets générés
+        scale (str): Échelle
+        repeat (int): Nombre de répétitions (le meilleur temps est retenu)
+
+    Returns:
+        tuple: ({phase: mesures}, liste des incohérences avec le projet généré)
+    """
+    project_path, stats = prepare_vault(work_dir, scale)
+
+    measures = None
+    counts = None
+    for _ in range(max(repeat, 1)):
+        times, counts = measure_times(project_path)
+        if measures is None:
+            measures = times
+        else:
+            for name, values in times.items():
+                measures[name]['wall_seconds'] = min(measures[name]['wall_seconds'], values['wall_seconds'])
+
+    for name, peak in measure_memory(project_path).items():
+        measures[name]['peak_kib'] = peak
+    for name, count in counts.items():
+        measures[name]['issues'] = count
+
+    # Vérifier que la vérification trouve bien ce qui a été généré
+    problems = []
+    if counts['links'] != stats['broken_links']:
+        problems.append(f"{scale}: {counts['links']} liens cassés détectés pour {stats['broken_links']} générés")
+    return measures, problems
+
+
+def compare(scale, measures, baselines, time_tolerance, memory_tolerance):
+    """
+    Compare les mesures d'une échelle à ses références.
+
+    Args:
+        scale (str): Échelle
+        measures (dict): Mesures par phase
+        baselines (dict): Références par échelle puis par phase
+        time_tolerance (float): Hausse relative de temps tolérée
+        memory_tolerance (float): Hausse relative de mémoire tolérée
+
+    Returns:
+        list: Descriptions des régressions
+    """
+    regressions = []
+    reference = baselines.get(scale, {})
+    for name, values in measures.items():
+        base = reference.get(name)
+        if not base:
+            continue
+        if values['wall_seconds'] > base['wall_seconds'] * (1 + time_tolerance) \
+                and values['wall_seconds'] - base['wall_seconds'] > TIME_SLACK:
+            regressions.append(f"{scale}/{name}: {values['wall_seconds']:.3f}s au lieu de {base['wall_seconds']:.3f}s")
+        for counter in COMPARED_COUNTERS:
+            if counter in base and values[counter] > base[counter] * (1 + COUNTER_TOLERANCE):
+                regressions.append(f"{scale}/{name}: {counter} = {values[counter]} au lieu de {base[counter]}")
+        if values['peak_kib'] > base['peak_kib'] * (1 + memory_tolerance) \
+                and values['peak_kib'] - base['peak_kib'] > 1024:
+            regressions.append(f"{scale}/{name}: pic de {values['peak_kib']} Kio au lieu de {base['peak_kib']} Kio")
+    return regressions
+
+
+def print_table(scale, measures, baselines):
+    """
+    Affiche les mesures d'une échelle et leur écart aux références.
+
+    Args:
+        scale (str): Échelle
+        measures (dict): Mesures par phase
+        baselines (dict): Références par échelle puis par phase
+    """
+    reference = baselines.get(scale, {})
+    print(f"\n{scale}")
+    print(f"  {'phase':<12} {'temps (s)':>10} {'réf.':>10} {'écart':>8} {'octets lus':>14} "
+          f"{'YAML':>6} {'comparaisons':>13} {'pic (Kio)':>10} {'problèmes':>10}")
+    for name in PHASES:
+        values = measures[name]
+        base = reference.get(name)
+        if base and base.get('wall_seconds'):
+            delta = f"{(values['wall_seconds'] / base['wall_seconds'] - 1) * 100:+.0f}%"
+            base_seconds = f"{base['wall_seconds']:.3f}"
+        else:
+            delta, base_seconds = '-', '-'
+        print(f"  {name:<12} {values['wall_seconds']:>10.3f} {base_seconds:>10} {delta:>8} "
+              f"{values['bytes_read']:>14} {values['yaml_parses']:>6} {values['fuzzy_comparisons']:>13} "
+              f"{values['peak_kib']:>10} {values['issues']:>10}")
+
+
+def load_baselines(path):
+    """Charge les références, vides si le fichier n'existe pas."""
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    """
+    Lance les mesures et compare aux références.
+    """
+    parser = argparse.ArgumentParser(description="Mesure les performances de la vérification de structure.")
+    parser.add_argument("--scales", nargs='+', choices=list(SCALES), default=DEFAULT_SCALES,
+                        help="Échelles à mesurer (défaut: 1k 10k)")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions par échelle, meilleur temps retenu (défaut: 3)")
+    parser.add_argument("--work-dir", default=str(Path(tempfile.gettempdir()) / 'structure-benchmarks'),
+                        help="Dossier des projets générés, réutilisés d'une exécution à l'autre")
+    parser.add_argument("--baselines", default=str(BASELINES_FILE), help="Fichier des références")
+    parser.add_argument("--update-baselines", action="store_true", help="Enregistre les mesures comme nouvelles références")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE,
+                        help="Hausse relative de temps tolérée (défaut: 0.30)")
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE,
+                        help="Hausse relative du pic de mémoire tolérée (défaut: 0.20)")
+    parser.add_argument("--json", help="Écrit les mesures dans ce fichier JSON")
+    parser.add_argument("--verbose", action="store_true", help="Affiche les messages du script mesuré")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if not args.verbose:
+        logger.setLevel(logging.WARNING)
+
+    work_dir = Path(args.work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    baselines_path = Path(args.baselines)
+    baselines = load_baselines(baselines_path)
+
+    results = {}
+    regressions = []
+    for scale in args.scales:
+        measures, problems = benchmark_scale(work_dir, scale, args.repeat)
+        results[scale] = measures
+        regressions.extend(problems)
+        print_table(scale, measures, baselines)
+        if not args.update_baselines:
+            regressions.extend(compare(scale, measures, baselines, args.time_tolerance, args.memory_tolerance))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baselines:
+        baselines.update(results)
+        with open(baselines_path, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nRéférences mises à jour: {baselines_path}")
+
+    if regressions:
+        print("\nRégressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print("\nAucune régression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
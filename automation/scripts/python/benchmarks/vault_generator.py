@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Génération de projets littéraires synthétiques pour les mesures de performance.
+
+Le projet généré contient l'arborescence attendue (EXPECTED_STRUCTURE et
+EXPECTED_TEMPLATES) puis des notes réparties dans les dossiers de contenu,
+sur plusieurs niveaux de sous-dossiers. Les frontmatters suivent la forme
+des règles FRONTMATTER_RULES (champs requis, recommandés et tags valides)
+selon un mélange configurable de frontmatters valides, incomplets, absents
+et syntaxiquement invalides. Chaque note contient des liens wiki et
+markdown, dont une proportion donnée est cassée (faute de frappe, mauvais
+dossier ou note inexistante). Le générateur est déterministe pour une
+graine donnée.
+
+Utilisation:
+    python -m benchmarks.vault_generator --output PATH [--files N] [--depth N]
+        [--link-density N] [--broken-ratio R] [--seed N]
+"""
+
+import os
+import re
+import sys
+import random
+import logging
+import argparse
+from pathlib import Path
+
+logger = logging.getLogger('structure_verification')
+
+# Dossiers de contenu: (dossier, préfixe des noms, proportion des notes)
+CONTENT_DIRS = [
+    ('chapitres', 'chapitre', 0.30),
+    ('personnages/mortels', 'mortel', 0.08),
+    ('personnages/entites', 'entite', 0.04),
+    ('personnages/manifestations', 'manifestation', 0.03),
+    ('personnages/secondaires', 'secondaire', 0.05),
+    ('lieux/reels', 'lieu', 0.05),
+    ('lieux/fictifs', 'lieu', 0.05),
+    ('concepts', 'concept', 0.10),
+    ('references', 'reference', 0.10),
+    ('review/pending', 'todo', 0.10),
+    ('claude-sessions', 'session', 0.10),
+]
+
+# Mélange par défaut des frontmatters
+DEFAULT_FRONTMATTER_MIX = {
+    'valid': 0.80,
+    'incomplete': 0.10,
+    'missing': 0.07,
+    'invalid': 0.03,
+}
+
+# Nombre de sous-dossiers par niveau
+FANOUT = 4
+
+WORDS = [
+    'ombre', 'lumiere', 'riviere', 'silence', 'memoire', 'horizon', 'brume', 'cendre',
+    'echo', 'seuil', 'abime', 'aube', 'crepuscule', 'orage', 'vertige', 'passage',
+    'miroir', 'serment', 'exil', 'retour', 'lisiere', 'murmure', 'vestige', 'rivage',
+]
+
+STATUTS = ['a_faire', 'en_cours', 'termine']
+PRIORITES = ['basse', 'moyenne', 'haute']
+
+
+def weighted_choice(rng, weights):
+    """
+    Tire une clé au hasard selon les poids d'un dictionnaire.
+
+    Args:
+        rng (random.Random): Générateur aléatoire
+        weights (dict): Poids par clé
+
+    Returns:
+        clé tirée
+    """
+    keys = list(weights)
+    return rng.choices(keys, weights=[weights[key] for key in keys])[0]
+
+
+def create_skeleton(output_dir, expected_structure, expected_templates, path=""):
+    """
+    Crée l'arborescence attendue: dossiers et fichiers requis ou facultatifs.
+
+    Args:
+        output_dir (Path): Racine du projet généré
+        expected_structure (dict): Structure attendue (voir EXPECTED_STRUCTURE)
+        expected_templates (dict): Templates attendus (voir EXPECTED_TEMPLATES)
+        path (str): Chemin relatif en cours
+
+    Returns:
+        list: Chemins relatifs des fichiers markdown créés
+    """
+    created = []
+    for name, details in expected_structure.items():
+        rel_path = os.path.join(path, name) if path else name
+        abs_path = output_dir / rel_path
+        if details['type'] == 'dir':
+            abs_path.mkdir(parents=True, exist_ok=True)
+            created.extend(create_skeleton(output_dir, details.get('children', {}), {}, rel_path))
+        else:
+            abs_path.parent.mkdir(parents=True, exist_ok=True)
+            abs_path.write_text(f"# {Path(name).stem}\n", encoding='utf-8')
+            created.append(rel_path)
+
+    for template_name in expected_templates:
+        template_path = output_dir / 'templates' / template_name
+        template_path.parent.mkdir(parents=True, exist_ok=True)
+        template_path.write_text(f"# Template {Path(template_name).stem}\n", encoding='utf-8')
+        created.append(f"templates/{template_name}")
+    return created
+
+
+def plan_notes(rng, files, depth):
+    """
+    Choisit le chemin de chaque note à générer.
+
+    Args:
+        rng (random.Random): Générateur aléatoire
+        files (int): Nombre de notes
+        depth (int): Nombre maximal de niveaux de sous-dossiers
+
+    Returns:
+        list: Chemins relatifs des notes, dans l'ordre de génération
+    """
+    weights = {index: share for index, (_, _, share) in enumerate(CONTENT_DIRS)}
+    paths = []
+    for number in range(files):
+        base_dir, prefix, _ = CONTENT_DIRS[weighted_choice(rng, weights)]
+        parts = [base_dir]
+        for level in range(rng.randint(0, max(depth - 1, 0))):
+            parts.append(f"partie-{rng.randrange(FANOUT) + 1:02d}")
+        name = f"{prefix}-{rng.choice(WORDS)}-{number:06d}.md"
+        paths.append('/'.join(parts + [name]))
+    return paths
+
+
+def field_value(rng, field, rules, number):
+    """
+    Valeur plausible d'un champ de frontmatter.
+
+    Args:
+        rng (random.Random): Générateur aléatoire
+        field (str): Nom du champ
+        rules (dict): Règle de frontmatter qui s'applique
+        number (int): Numéro de la note
+
+    Returns:
+        valeur du champ (str, int ou liste)
+    """
+    if field == 'tags':
+        return [rng.choice(rules.get('valid_tags') or ['note'])]
+    if field == 'id':
+        return number
+    if field.startswith('date'):
+        return f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    if field == 'statut':
+        return rng.choice(STATUTS)
+    if field == 'priorite':
+        return rng.choice(PRIORITES)
+    return f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)}"
+
+
+def format_frontmatter(fields):
+    """
+    Écrit un frontmatter YAML simple (chaînes, entiers et listes de chaînes).
+
+    Args:
+        fields (dict): Champs du frontmatter
+
+    Returns:
+        str: Bloc délimité par ---
+    """
+    lines = ['---']
+    for field, value in fields.items():
+        if isinstance(value, list):
+            lines.append(f"{field}: [{', '.join(value)}]")
+        elif isinstance(value, int):
+            lines.append(f"{field}: {value}")
+        else:
+            lines.append(f'{field}: "{value}"')
+    lines.append('---')
+    return '\n'.join(lines) + '\n'
+
+
+def make_frontmatter(rng, rel_path, number, kind, compiled_rules):
+    """
+    Construit le frontmatter d'une note selon son genre.
+
+    Args:
+        rng (random.Random): Générateur aléatoire
+        rel_path (str): Chemin relatif de la note
+        number (int): Numéro de la note
+        kind (str): 'valid', 'incomplete', 'missing' ou 'invalid'
+        compiled_rules (list): [(motif compilé, règle)]
+
+    Returns:
+        str: Frontmatter (vide s'il est absent)
+    """
+    if kind == 'missing':
+        return ''
+    if kind == 'invalid':
+        return f"---\ntitre: [{rng.choice(WORDS)}\ntags: personnage\n---\n"
+
+    rules = {}
+    for pattern, rule in compiled_rules:
+        if pattern.match(rel_path):
+            rules = rule
+            break
+
+    fields = {}
+    for field in list(rules.get('required_fields', ['titre'])) + list(rules.get('recommended_fields', ['tags'])):
+        fields[field] = field_value(rng, field, rules, number)
+    if 'tags' not in fields:
+        fields['tags'] = field_value(rng, 'tags', rules, number)
+
+    if kind == 'incomplete':
+        required = list(rules.get('required_fields', []))
+        if required:
+            del fields[rng.choice(required)]
+        if 'valid_tags' in rules and 'tags' in fields:
+            fields['tags'] = ['inconnu']
+    return format_frontmatter(fields)
+
+
+def broken_target(rng, target, existing):
+    """
+    Dérive d'une note existante une cible de lien qui n'existe pas.
+
+    Args:
+        rng (random.Random): Générateur aléatoire
+        target (str): Chemin relatif d'une note existante
+        existing (set): Chemins relatifs de toutes les notes
+
+    Returns:
+        str: Chemin relatif inexistant
+    """
+    directory, name = os.path.split(target)
+    while True:
+        mode = rng.randrange(3)
+        if mode == 0:
+            # Faute de frappe dans le nom
+            position = rng.randrange(len(name) - 3)
+            candidate = os.path.join(directory, name[:position] + 'x' + name[position + 1:])
+        elif mode == 1:
+            # Bon nom dans un mauvais dossier
+            base_dir = CONTENT_DIRS[rng.randrange(len(CONTENT_DIRS))][0]
+            candidate = os.path.join(base_dir, name)
+        else:
+            # Note jamais écrite
+            candidate = os.path.join(directory, f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-inexistant.md")
+        if candidate not in existing:
+            return candidate
+
+
+def make_link(rng, source, target):
+    """
+    Écrit un lien vers une cible, dans l'une des formes utilisées dans le projet.
+
+    Args:
+        rng (random.Random): Générateur aléatoire
+        source (str): Chemin relatif de la note qui contient le lien
+        target (str): Chemin relatif de la cible
+
+    Returns:
+        str: Lien wiki ou markdown
+    """
+    form = rng.randrange(4)
+    anchor = '#' + rng.choice(WORDS) if rng.random() < 0.1 else ''
+    if form == 0:
+        return f"[[/{target[:-3]}{anchor}]]"
+    if form == 1:
+        return f"[[/{target}{anchor}|{rng.choice(WORDS)}]]"
+    relative = os.path.relpath(target, os.path.dirname(source) or '.')
+    return f"[{rng.choice(WORDS)}]({relative}{anchor})"
+
+
+def make_body(rng, rel_path, links):
+    """
+    Construit le corps d'une note en y répartissant les liens.
+
+    Args:
+        rng (random.Random): Générateur aléatoire
+        rel_path (str): Chemin relatif de la note
+        links (list): Liens à insérer
+
+    Returns:
+        str: Corps markdown
+    """
+    lines = [f"# {Path(rel_path).stem}", '']
+    pending = list(links)
+    for paragraph in range(max(3, len(links))):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(20, 60))]
+        if pending:
+            words.insert(rng.randrange(len(words)), pending.pop())
+        if rng.random() < 0.05:
+            words.append(f"[source](https://example.org/{rng.choice(WORDS)})")
+        lines.append(' '.join(words).capitalize() + '.')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def generate_vault(output_dir, files=1000, depth=3, link_density=4.0, broken_ratio=0.05,
+                   frontmatter_mix=None, seed=0, frontmatter_rules=None,
+                   expected_structure=None, expected_templates=None):
+    """
+    Génère un projet synthétique.
+
+    Args:
+        output_dir (Path): Dossier à créer (doit être vide ou absent)
+        files (int): Nombre de notes de contenu
+        depth (int): Nombre maximal de niveaux de sous-dossiers sous les
+            dossiers de contenu
+        link_density (float): Nombre moyen de liens par note
+        broken_ratio (float): Proportion de liens internes cassés
+        frontmatter_mix (dict): Proportions des frontmatters 'valid',
+            'incomplete', 'missing' et 'invalid'
+        seed (int): Graine du générateur aléatoire
+        frontmatter_rules (dict, optional): Règles de frontmatter (par défaut
+            celles du script de vérification)
+        expected_structure (dict, optional): Structure attendue
+        expected_templates (dict, optional): Templates attendus
+
+    Returns:
+        dict: Statistiques du projet généré (fichiers, liens, liens cassés,
+              frontmatters par genre, octets écrits)
+    """
+    if frontmatter_rules is None or expected_structure is None or expected_templates is None:
+        from frontmatter_rules import load_frontmatter_rules
+        import verify_structure_script as verifier
+        frontmatter_rules = frontmatter_rules if frontmatter_rules is not None else load_frontmatter_rules().rules
+        expected_structure = expected_structure if expected_structure is not None else verifier.EXPECTED_STRUCTURE
+        expected_templates = expected_templates if expected_templates is not None else verifier.EXPECTED_TEMPLATES
+    frontmatter_mix = frontmatter_mix or DEFAULT_FRONTMATTER_MIX
+
+    compiled_rules = [(re.compile(pattern), rule) for pattern, rule in frontmatter_rules.items()]
+
+    output_dir = Path(output_dir)
+    if output_dir.exists() and any(output_dir.iterdir()):
+        raise ValueError(f"Le dossier de destination n'est pas vide: {output_dir}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(seed)
+    skeleton = create_skeleton(output_dir, expected_structure, expected_templates)
+    paths = plan_notes(rng, files, depth)
+    existing = set(paths) | set(skeleton)
+
+    stats = {
+        'files': len(skeleton) + len(paths),
+        'links': 0,
+        'broken_links': 0,
+        'frontmatter': dict.fromkeys(frontmatter_mix, 0),
+        'bytes': 0,
+    }
+    created_dirs = set()
+
+    for number, rel_path in enumerate(paths):
+        kind = weighted_choice(rng, frontmatter_mix)
+        stats['frontmatter'][kind] += 1
+
+        links = []
+        for _ in range(rng.randint(0, int(2 * link_density))):
+            target = paths[rng.randrange(len(paths))]
+            if rng.random() < broken_ratio:
+                target = broken_target(rng, target, existing)
+                stats['broken_links'] += 1
+            links.append(make_link(rng, rel_path, target))
+        stats['links'] += len(links)
+
+        content = make_frontmatter(rng, rel_path, number, kind, compiled_rules) + make_body(rng, rel_path, links)
+        abs_path = output_dir / rel_path
+        if abs_path.parent not in created_dirs:
+            abs_path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(abs_path.parent)
+        data = content.encode('utf-8')
+        abs_path.write_bytes(data)
+        stats['bytes'] += len(data)
+
+    logger.info(f"Projet synthétique généré dans {output_dir}: {stats['files']} fichiers, "
+                f"{stats['links']} liens dont {stats['broken_links']} cassés")
+    return stats
+
+
+def main():
+    """
+    Génère un projet synthétique depuis la ligne de commande.
+    """
+    parser = argparse.ArgumentParser(description="Génère un projet littéraire synthétique pour les mesures de performance.")
+    parser.add_argument("--output", required=True, help="Dossier du projet à générer (vide ou absent)")
+    parser.add_argument("--files", type=int, default=1000, help="Nombre de notes de contenu (défaut: 1000)")
+    parser.add_argument("--depth", type=int, default=3, help="Niveaux de sous-dossiers maximal (défaut: 3)")
+    parser.add_argument("--link-density", type=float, default=4.0, help="Nombre moyen de liens par note (défaut: 4)")
+    parser.add_argument("--broken-ratio", type=float, default=0.05, help="Proportion de liens cassés (défaut: 0.05)")
+    parser.add_argument("--frontmatter-mix", metavar="GENRE=POIDS,...",
+                        help="Mélange des frontmatters, ex: valid=0.8,incomplete=0.1,missing=0.07,invalid=0.03")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur aléatoire (défaut: 0)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    frontmatter_mix = None
+    if args.frontmatter_mix:
+        frontmatter_mix = {}
+        for item in args.frontmatter_mix.split(','):
+            kind, _, weight = item.partition('=')
+            if kind not in DEFAULT_FRONTMATTER_MIX:
+                parser.error(f"Genre de frontmatter inconnu: {kind}")
+            frontmatter_mix[kind] = float(weight)
+
+    try:
+        generate_vault(args.output, args.files, args.depth, args.link_density, args.broken_ratio,
+                       frontmatter_mix, args.seed)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Découpage en chapitres d'un manuscrit, en une seule lecture.
+
+Le texte est lu ligne par ligne par un automate qui reconnaît tous les styles
+de titres de chapitre (`# Titre`, `## Titre`, `Chapitre N[: Titre]`,
+`CHAPITRE N[: Titre]`, N en chiffres arabes ou romains) et ignore les blocs
+de code. Le découpage suit le style le plus prioritaire (dans l'ordre
+ci-dessus) qui compte au moins deux titres: les titres des autres styles
+(un résumé en `##`, une ligne `Chapitre` isolée...) font partie du contenu
+des chapitres.
+
+Les lignes sont recopiées telles quelles dans document-complet.md en notant
+la position des titres de chaque style, jusqu'à ce que le style soit connu:
+dès le deuxième titre `#` (aucun style ne peut le supplanter), sinon à la fin
+du texte. Un texte sans style retenu donne ce fichier unique, à l'identique.
+Sinon la copie est découpée, puis chaque chapitre est écrit au fil de la
+lecture et fermé dès que le titre suivant apparaît: seules les positions des
+titres sont gardées en mémoire. Le texte qui précède le premier titre devient
+le chapitre 00 (« Préambule »).
+"""
+
+import os
+import re
+
+# Style -> motif d'une ligne de titre, par ordre de priorité
+HEADING_PATTERNS = (
+    ('#', re.compile(r"^#[ \t]+(.*?)\s*$")),
+    ('##', re.compile(r"^##[ \t]+(.*?)\s*$")),
+    ('Chapitre', re.compile(r"^Chapitre[ \t]+(\d+|[IVXLCDM]+)(?:[ \t]*:[ \t]*(.*?))?\s*$")),
+    ('CHAPITRE', re.compile(r"^CHAPITRE[ \t]+(\d+|[IVXLCDM]+)(?:[ \t]*:[ \t]*(.*?))?\s*$")),
+)
+
+FENCE_PATTERN = re.compile(r"^[ \t]*(```|~~~)")
+
+SINGLE_FILENAME = "document-complet.md"
+PREAMBLE_TITLE = "Préambule"
+
+
+def match_heading(line):
+    """
+    Reconnaît une ligne de titre de chapitre.
+
+    Args:
+        line (str): Ligne du texte
+
+    Returns:
+        tuple: (style, titre), ou None si la ligne n'est pas un titre
+    """
+    if not line or line[0] not in '#C':
+        return None
+    for style, pattern in HEADING_PATTERNS:
+        match = pattern.match(line)
+        if match:
+            if len(match.groups()) == 1:
+                return (style, match.group(1).strip()) if match.group(1).strip() else None
+            chapter_num = match.group(1)
+            return style, (match.group(2).strip() if match.group(2) else f"Chapitre {chapter_num}")
+    return None
+
+
+def chapter_filename(number, title):
+    """
+    Nom du fichier d'un chapitre.
+
+    Args:
+        number (int): Numéro du chapitre
+        title (str): Titre du chapitre
+
+    Returns:
+        str: chapitre-NN-titre-nettoye.md
+    """
+    clean_title = re.sub(r'[\\/*?:"<>|]', "", title).strip()
+    clean_title = re.sub(r'\s+', "-", clean_title).lower()
+    return f"chapitre-{number:02d}-{clean_title[:30]}.md"
+
+
+class ChapterWriter(object):
+    """
+    Fichier de chapitre écrit ligne par ligne: `# Titre`, une ligne vide, puis
+    le contenu sans les lignes vides de début et de fin.
+    """
+
+    def __init__(self, path, title):
+        self.path = path
+        self.file = open(path, "w", encoding="utf-8")
+        self.file.write(f"# {title}\n\n")
+        # Dernière ligne non vide et lignes vides qui la suivent, écrites
+        # seulement si une autre ligne non vide arrive
+        self.last_line = None
+        self.blank_lines = []
+
+    def write(self, line):
+        if not line.strip():
+            if self.last_line is not None:
+                self.blank_lines.append(line)
+            return
+        if self.last_line is None:
+            line = line.lstrip()
+        else:
+            self.file.write(self.last_line)
+            self.file.writelines(self.blank_lines)
+        self.blank_lines = []
+        self.last_line = line if line.endswith("\n") else line + "\n"
+
+    def close(self):
+        self.file.write((self.last_line or "").rstrip() + "\n")
+        self.file.close()
+
+
+class ChapterSplitter(object):
+    """
+    Automate de découpage: feed() pour chaque ligne du texte, puis close().
+    """
+
+    def __init__(self, chapters_dir):
+        self.chapters_dir = chapters_dir
+        self.chapters = []       # [(numéro, titre, nom de fichier)]
+        self.style = None
+        self.in_fence = False
+        self.writer = None
+        # Mode recopie: lignes écrites telles quelles tant que le style n'est pas retenu
+        self.spool_path = os.path.join(chapters_dir, SINGLE_FILENAME)
+        self.spool = open(self.spool_path, "w", encoding="utf-8")
+        # Style -> [(position dans la copie, titre)]
+        self.headings = {style: [] for style, _ in HEADING_PATTERNS}
+
+    def feed(self, line):
+        """
+        Traite une ligne du texte.
+
+        Args:
+            line (str): Ligne du texte, avec sa fin de ligne (sauf la dernière)
+        """
+        heading = None
+        if FENCE_PATTERN.match(line):
+            self.in_fence = not self.in_fence
+        elif not self.in_fence:
+            heading = match_heading(line)
+
+        if self.spool is not None:
+            if heading is not None:
+                self.spool.flush()
+                self.headings[heading[0]].append((self.spool.tell(), heading[1]))
+            self.spool.write(line)
+            top_style = HEADING_PATTERNS[0][0]
+            if heading is not None and heading[0] == top_style and len(self.headings[top_style]) == 2:
+                self._split_spool(top_style)
+            return
+
+        if heading is not None and heading[0] == self.style:
+            self._start_chapter(heading[1])
+        else:
+            self.writer.write(line)
+
+    def _start_chapter(self, title, number=None):
+        if self.writer is not None:
+            self.writer.close()
+        number = len([chapter for chapter in self.chapters if chapter[0] > 0]) + 1 if number is None else number
+        filename = chapter_filename(number, title)
+        self.writer = ChapterWriter(os.path.join(self.chapters_dir, filename), title)
+        self.chapters.append((number, title, filename))
+
+    def _split_spool(self, style):
+        """Style retenu: découpe la copie en préambule et chapitres selon ses titres."""
+        self.style = style
+        self.spool.close()
+        self.spool = None
+        headings = iter(self.headings[style])
+        next_heading = next(headings)
+        position = 0
+        # Lecture binaire: les positions notées sont celles des octets de la copie
+        with open(self.spool_path, "rb") as spool:
+            for raw_line in spool:
+                if next_heading is not None and position == next_heading[0]:
+                    self._start_chapter(next_heading[1])
+                    next_heading = next(headings, None)
+                else:
+                    line = raw_line.decode("utf-8").replace("\r\n", "\n")
+                    if self.writer is None and line.strip():
+                        self._start_chapter(PREAMBLE_TITLE, 0)
+                    if self.writer is not None:
+                        self.writer.write(line)
+                position += len(raw_line)
+        self.headings = None
+        os.remove(self.spool_path)
+
+    def close(self):
+        """
+        Termine le découpage.
+
+        Returns:
+            list: Chapitres écrits [(numéro, titre, nom de fichier)]; vide si
+                  le texte a été recopié dans document-complet.md
+        """
+        if self.spool is not None:
+            style = next((style for style, _ in HEADING_PATTERNS if len(self.headings[style]) >= 2), None)
+            if style is not None:
+                self._split_spool(style)
+            else:
+                self.spool.close()
+                self.spool = None
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        return self.chapters
+
+
+def split_chapters(lines, chapters_dir):
+    """
+    Découpe un texte en fichiers de chapitre.
+
+    Args:
+        lines (iterable): Lignes du texte avec leurs fins de ligne (fichier
+            ouvert, générateur...)
+        chapters_dir (str): Dossier des chapitres
+
+    Returns:
+        list: Chapitres écrits [(numéro, titre, nom de fichier)]; vide si le
+              texte a été recopié dans document-complet.md
+    """
+    splitter = ChapterSplitter(chapters_dir)
+    try:
+        for line in lines:
+            splitter.feed(line)
+    finally:
+        chapters = splitter.close()
+    return chapters
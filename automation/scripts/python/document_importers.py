@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Conversion en Markdown des documents importés dans un projet littéraire.
+
+IMPORTERS associe chaque extension à une fonction qui reçoit le chemin du
+document et produit ses lignes Markdown une à une: elles alimentent
+directement le découpage en chapitres (chapter_splitter), sans que le
+document soit jamais chargé en entier.
+
+- .txt, .md: lecture ligne par ligne (UTF-8), comme tout format inconnu;
+- .docx (word/document.xml) et .odt (content.xml): lus dans l'archive avec
+  zipfile et analysés au fil de l'eau (iterparse); chaque paragraphe est
+  converti dès sa fin puis retiré de l'arbre;
+- .html, .htm, .xhtml: HTMLParser alimenté par blocs;
+- .epub: documents XHTML de l'archive, dans l'ordre de lecture (spine).
+
+Titres (# selon le niveau), listes, gras et italique sont conservés.
+register_importer() ajoute un format.
+"""
+
+import io
+import os
+import re
+import zipfile
+import posixpath
+from html.parser import HTMLParser
+from urllib.parse import unquote
+import xml.etree.ElementTree as ET
+
+import chapter_splitter
+
+# Taille des blocs lus dans les documents HTML
+READ_SIZE = 64 * 1024
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+TEXT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+STYLE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}'
+FO = '{urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0}'
+CONTAINER = '{urn:oasis:names:tc:opendocument:xmlns:container}'
+OPF = '{http://www.idpf.org/2007/opf}'
+
+# Styles de paragraphe Word des titres: Heading1, Titre1, heading 2...
+DOCX_HEADING_STYLE = re.compile(r"^(?:heading|titre)\s*(\d)$", re.IGNORECASE)
+
+# Styles de caractère ODT nommés (les styles automatiques sont lus dans content.xml)
+ODT_NAMED_STYLES = {
+    'Strong_20_Emphasis': (True, False),
+    'Emphasis': (False, True),
+}
+
+
+def format_runs(runs):
+    """
+    Texte Markdown d'une suite de fragments mis en forme.
+
+    Args:
+        runs (list): Fragments [(texte, gras, italique)]
+
+    Returns:
+        str: Texte, les fragments voisins de même forme étant fusionnés
+    """
+    merged = []
+    for text, bold, italic in runs:
+        if not text:
+            continue
+        if merged and merged[-1][1:] == (bold, italic):
+            merged[-1] = (merged[-1][0] + text, bold, italic)
+        else:
+            merged.append((text, bold, italic))
+
+    parts = []
+    for text, bold, italic in merged:
+        marker = ('**' if bold else '') + ('*' if italic else '')
+        core = text.strip()
+        if not marker or not core:
+            parts.append(text)
+            continue
+        # Les marqueurs Markdown ne peuvent pas entourer d'espace
+        leading = text[:len(text) - len(text.lstrip())]
+        trailing = text[len(text.rstrip()):]
+        parts.append(f"{leading}{marker}{core}{marker[::-1]}{trailing}")
+    return ''.join(parts)
+
+
+def paragraph_lines(text, prefix=''):
+    """
+    Lignes Markdown d'un paragraphe, suivies d'une ligne vide.
+
+    Args:
+        text (str): Texte du paragraphe (sauts de ligne internes compris)
+        prefix (str): Préfixe de la première ligne ('# ', '- '...)
+
+    Returns:
+        list: Lignes avec leur fin de ligne; vide si le paragraphe est vide
+    """
+    lines = [line.strip() for line in text.strip().split('\n')]
+    if not lines[0]:
+        return []
+    lines[0] = prefix + lines[0]
+    return [line + '\n' for line in lines] + ['\n']
+
+
+def iter_blocks(xml_file, tags):
+    """
+    Éléments complets dont la balise est dans tags, au fil de l'analyse.
+    Chaque élément est retiré de l'arbre une fois traité: la mémoire ne
+    dépend pas de la taille du document.
+
+    Args:
+        xml_file (file): Fichier XML ouvert en binaire
+        tags (set): Balises des éléments à produire (les plus externes seulement)
+
+    Yields:
+        tuple: (élément, balises de ses ancêtres)
+    """
+    stack = []
+    open_blocks = 0
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            if elem.tag in tags:
+                open_blocks += 1
+            continue
+        stack.pop()
+        if elem.tag not in tags:
+            continue
+        open_blocks -= 1
+        if open_blocks:
+            continue
+        yield elem, [ancestor.tag for ancestor in stack]
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
+def text_lines(document_path):
+    """Lignes d'un document texte ou Markdown (UTF-8)."""
+    with open(document_path, 'r', encoding='utf-8') as f:
+        yield from f
+
+
+def _docx_flag(properties, name):
+    element = properties.find(W + name) if properties is not None else None
+    return element is not None and element.get(W + 'val', 'true') not in ('0', 'false', 'none')
+
+
+def docx_lines(document_path):
+    """Lignes Markdown d'un document Word (.docx)."""
+    with zipfile.ZipFile(document_path) as archive, archive.open('word/document.xml') as xml_file:
+        for paragraph, _ in iter_blocks(xml_file, {W + 'p'}):
+            style = paragraph.find(f'{W}pPr/{W}pStyle')
+            style_name = style.get(W + 'val', '') if style is not None else ''
+            heading = DOCX_HEADING_STYLE.match(style_name)
+            if heading:
+                prefix = '#' * int(heading.group(1)) + ' '
+            elif paragraph.find(f'{W}pPr/{W}numPr') is not None:
+                prefix = '- '
+            else:
+                prefix = ''
+
+            runs = []
+            for run in paragraph.iter(W + 'r'):
+                properties = run.find(W + 'rPr')
+                # Les titres sont souvent en gras: pas de marqueurs dans un titre
+                bold = not prefix.startswith('#') and _docx_flag(properties, 'b')
+                italic = not prefix.startswith('#') and _docx_flag(properties, 'i')
+                for child in run:
+                    if child.tag == W + 't':
+                        runs.append((child.text or '', bold, italic))
+                    elif child.tag == W + 'tab':
+                        runs.append(('\t', bold, italic))
+                    elif child.tag in (W + 'br', W + 'cr'):
+                        runs.append(('\n', False, False))
+            yield from paragraph_lines(format_runs(runs), prefix)
+
+
+def _odt_runs(element, styles, bold=False, italic=False, runs=None):
+    runs = [] if runs is None else runs
+    if element.text:
+        runs.append((element.text, bold, italic))
+    for child in element:
+        if child.tag == TEXT + 's':
+            runs.append((' ' * int(child.get(TEXT + 'c', '1')), bold, italic))
+        elif child.tag == TEXT + 'tab':
+            runs.append(('\t', bold, italic))
+        elif child.tag == TEXT + 'line-break':
+            runs.append(('\n', False, False))
+        elif child.tag in (TEXT + 'note', TEXT + 'bookmark', TEXT + 'bookmark-start', TEXT + 'bookmark-end'):
+            pass
+        elif child.tag == TEXT + 'span':
+            span_bold, span_italic = styles.get(child.get(TEXT + 'style-name'), (False, False))
+            _odt_runs(child, styles, bold or span_bold, italic or span_italic, runs)
+        else:
+            _odt_runs(child, styles, bold, italic, runs)
+        if child.tail:
+            runs.append((child.tail, bold, italic))
+    return runs
+
+
+def odt_lines(document_path):
+    """Lignes Markdown d'un document OpenDocument (.odt)."""
+    styles = dict(ODT_NAMED_STYLES)
+    with zipfile.ZipFile(document_path) as archive, archive.open('content.xml') as xml_file:
+        # Les styles automatiques précèdent le corps du document
+        for element, ancestors in iter_blocks(xml_file, {STYLE + 'style', TEXT + 'p', TEXT + 'h'}):
+            if element.tag == STYLE + 'style':
+                properties = element.find(STYLE + 'text-properties')
+                if properties is not None:
+                    styles[element.get(STYLE + 'name')] = (properties.get(FO + 'font-weight') == 'bold',
+                                                           properties.get(FO + 'font-style') == 'italic')
+                continue
+            if element.tag == TEXT + 'h':
+                prefix = '#' * int(element.get(TEXT + 'outline-level', '1')) + ' '
+                runs = [(text, False, False) for text, _, _ in _odt_runs(element, styles)]
+            else:
+                prefix = '- ' if TEXT + 'list-item' in ancestors else ''
+                runs = _odt_runs(element, styles)
+            yield from paragraph_lines(format_runs(runs), prefix)
+
+
+class MarkdownHTMLParser(HTMLParser):
+    """
+    Convertit du HTML en lignes Markdown au fil de feed(); les lignes
+    produites s'accumulent dans lines jusqu'à ce que l'appelant les retire.
+    """
+
+    BLOCK_TAGS = {'p', 'div', 'section', 'article', 'header', 'footer', 'aside', 'blockquote',
+                  'li', 'ul', 'ol', 'dd', 'dt', 'tr', 'table', 'figure', 'figcaption', 'hr', 'body'}
+    HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+    SKIPPED_TAGS = {'head', 'script', 'style', 'title', 'nav'}
+    BOLD_TAGS = {'b', 'strong'}
+    ITALIC_TAGS = {'i', 'em', 'cite'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines = []
+        self.runs = []
+        self.prefix = ''
+        self.skipped = 0
+        self.bold = 0
+        self.italic = 0
+        self.quote = 0
+        self.preformatted = False
+
+    def flush(self):
+        """Termine le bloc en cours."""
+        text = format_runs(self.runs)
+        prefix = '> ' * self.quote
+        for line in paragraph_lines(text, self.prefix):
+            self.lines.append(prefix + line if line != '\n' else line)
+        self.runs = []
+        self.prefix = ''
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self.skipped += 1
+        elif tag in self.HEADING_TAGS:
+            self.flush()
+            self.prefix = '#' * self.HEADING_TAGS[tag] + ' '
+        elif tag == 'pre':
+            self.flush()
+            self.lines.append('```\n')
+            self.preformatted = True
+        elif tag in self.BLOCK_TAGS:
+            self.flush()
+            if tag == 'li':
+                self.prefix = '- '
+            elif tag == 'blockquote':
+                self.quote += 1
+        elif tag == 'br':
+            self.runs.append(('\n', False, False))
+        elif tag in self.BOLD_TAGS:
+            self.bold += 1
+        elif tag in self.ITALIC_TAGS:
+            self.italic += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS:
+            self.skipped = max(0, self.skipped - 1)
+        elif tag in self.HEADING_TAGS:
+            self.flush()
+        elif tag == 'pre':
+            self.preformatted = False
+            self.lines.append('```\n\n')
+        elif tag in self.BLOCK_TAGS:
+            self.flush()
+            if tag == 'blockquote':
+                self.quote = max(0, self.quote - 1)
+        elif tag in self.BOLD_TAGS:
+            self.bold = max(0, self.bold - 1)
+        elif tag in self.ITALIC_TAGS:
+            self.italic = max(0, self.italic - 1)
+
+    def handle_data(self, data):
+        if self.skipped:
+            return
+        if self.preformatted:
+            self.lines.extend(data.splitlines(True))
+            return
+        # Pas de marqueurs de mise en forme dans un titre
+        in_heading = self.prefix.startswith('#')
+        self.runs.append((re.sub(r"\s+", " ", data), self.bold > 0 and not in_heading,
+                          self.italic > 0 and not in_heading))
+
+
+def markdown_from_html(text_file):
+    """
+    Lignes Markdown d'un document HTML lu par blocs.
+
+    Args:
+        text_file (file): Document HTML ouvert en mode texte
+
+    Yields:
+        str: Lignes Markdown
+    """
+    parser = MarkdownHTMLParser()
+    for chunk in iter(lambda: text_file.read(READ_SIZE), ''):
+        parser.feed(chunk)
+        yield from parser.lines
+        parser.lines = []
+    parser.close()
+    parser.flush()
+    yield from parser.lines
+
+
+def html_lines(document_path):
+    """Lignes Markdown d'un document HTML."""
+    with open(document_path, 'r', encoding='utf-8', errors='replace') as f:
+        yield from markdown_from_html(f)
+
+
+def epub_lines(document_path):
+    """Lignes Markdown d'un livre EPUB, documents dans l'ordre de lecture."""
+    with zipfile.ZipFile(document_path) as archive:
+        with archive.open('META-INF/container.xml') as container:
+            rootfile = ET.parse(container).getroot().find(f'.//{CONTAINER}rootfile')
+        if rootfile is None:
+            raise ValueError(f"EPUB sans fichier OPF: {document_path}")
+        opf_path = rootfile.get('full-path')
+        with archive.open(opf_path) as opf:
+            package = ET.parse(opf).getroot()
+
+        manifest = {item.get('id'): item.get('href') for item in package.iter(OPF + 'item')}
+        opf_dir = posixpath.dirname(opf_path)
+        for itemref in package.iter(OPF + 'itemref'):
+            href = manifest.get(itemref.get('idref'))
+            if not href:
+                continue
+            name = posixpath.normpath(posixpath.join(opf_dir, unquote(href.split('#')[0])))
+            with archive.open(name) as raw, io.TextIOWrapper(raw, encoding='utf-8', errors='replace') as f:
+                yield from markdown_from_html(f)
+
+
+# Extension -> fonction produisant les lignes Markdown du document
+IMPORTERS = {
+    '.txt': text_lines,
+    '.md': text_lines,
+    '.markdown': text_lines,
+    '.docx': docx_lines,
+    '.odt': odt_lines,
+    '.html': html_lines,
+    '.htm': html_lines,
+    '.xhtml': html_lines,
+    '.epub': epub_lines,
+}
+
+
+def register_importer(extension, importer):
+    """
+    Ajoute ou remplace le convertisseur d'un format.
+
+    Args:
+        extension (str): Extension des documents (ex: '.rtf')
+        importer (callable): Fonction importer(chemin) produisant des lignes Markdown
+    """
+    IMPORTERS[extension.lower()] = importer
+
+
+def document_lines(document_path):
+    """
+    Lignes Markdown d'un document, selon son extension (texte UTF-8 par défaut).
+
+    Args:
+        document_path (str): Chemin du document
+
+    Returns:
+        iterator: Lignes avec leur fin de ligne
+    """
+    extension = os.path.splitext(document_path)[1].lower()
+    return IMPORTERS.get(extension, text_lines)(document_path)
+
+
+def convert_document(task):
+    """
+    Convertit un document et le découpe en chapitres dans un dossier
+    (fonction exécutée par les processus de travail).
+
+    Args:
+        task (tuple): (chemin du document, dossier de sortie, découper en chapitres)
+
+    Returns:
+        dict: 'document', 'chapters' (voir chapter_splitter.split_chapters;
+              vide pour un fichier unique) et 'error' (None si réussi)
+    """
+    document_path, output_dir, split = task
+    result = {'document': document_path, 'chapters': [], 'error': None}
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        lines = document_lines(document_path)
+        if split:
+            result['chapters'] = chapter_splitter.split_chapters(lines, output_dir)
+        else:
+            with open(os.path.join(output_dir, chapter_splitter.SINGLE_FILENAME), 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+        result['error'] = str(e)
+    return result
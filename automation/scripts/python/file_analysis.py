@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analyse par fichier: validation du frontmatter et extraction des liens.
+
+Ces fonctions ne dépendent que du fichier analysé et des règles passées en
+paramètre, ce qui permet de répartir l'analyse d'un projet entre plusieurs
+processus (option --jobs) puis de fusionner les résultats dans l'ordre de
+l'instantané, pour des rapports identiques d'une exécution à l'autre.
+"""
+
+import os
+import logging
+
+from phase_profiler import counters_since, merge_counters, read_counters
+from structure_cache import content_hash
+from vault_snapshot import VaultSnapshot, VaultFile
+
+logger = logging.getLogger('structure_verification')
+
+
+def validate_file_frontmatter(md_file, frontmatter_rules):
+    """
+    Vérifie le frontmatter YAML d'un fichier selon les règles qui s'y appliquent.
+
+    Args:
+        md_file (VaultFile): Fichier à vérifier
+        frontmatter_rules (RuleDispatcher): Règles compilées (voir load_frontmatter_rules)
+
+    Returns:
+        list: Liste des problèmes détectés pour ce fichier
+    """
+    issues = []
+    str_path = md_file.rel_path
+
+    # Règles qui s'appliquent à ce fichier
+    matching_rules = frontmatter_rules.rules_for(str_path)
+
+    if not matching_rules:
+        return issues  # Aucune règle spécifique pour ce fichier
+
+    # Extraire le frontmatter
+    try:
+        frontmatter = md_file.frontmatter
+
+        if frontmatter is None:
+            issues.append({
+                'level': 'warning',
+                'type': 'missing_frontmatter',
+                'path': str_path,
+                'message': f"Frontmatter YAML manquant dans {str_path}"
+            })
+            return issues
+
+        # Vérifier les champs requis et recommandés selon les règles
+        for rules in matching_rules:
+            for field in rules.get('required_fields', []):
+                if field not in frontmatter:
+                    issues.append({
+                        'level': 'error',
+                        'type': 'missing_required_field',
+                        'path': str_path,
+                        'message': f"Champ requis manquant dans {str_path}: {field}"
+                    })
+
+            for field in rules.get('recommended_fields', []):
+                if field not in frontmatter:
+                    issues.append({
+                        'level': 'warning',
+                        'type': 'missing_recommended_field',
+                        'path': str_path,
+                        'message': f"Champ recommandé manquant dans {str_path}: {field}"
+                    })
+
+            # Vérifier les tags si définis
+            if 'tags' in frontmatter and 'valid_tags' in rules:
+                tags = frontmatter['tags']
+                if isinstance(tags, str):
+                    # Certains fichiers pourraient avoir les tags comme une chaîne
+                    tags = [tag.strip() for tag in tags.split(',')]
+
+                valid_tags = rules['valid_tags']
+                if not any(tag in valid_tags for tag in tags):
+                    issues.append({
+                        'level': 'warning',
+                        'type': 'invalid_tags',
+                        'path': str_path,
+                        'message': f"Aucun tag valide trouvé dans {str_path}. Tags attendus: {', '.join(valid_tags)}"
+                    })
+
+    except Exception as e:
+        issues.append({
+            'level': 'error',
+            'type': 'frontmatter_parsing_error',
+            'path': str_path,
+            'message': f"Erreur lors de l'analyse du frontmatter dans {str_path}: {str(e)}"
+        })
+
+    return issues
+
+
+def resolve_link_target(str_path, link):
+    """
+    Résout un lien brut en chemin relatif à la racine du projet.
+
+    Args:
+        str_path (str): Chemin relatif du fichier contenant le lien
+        link (str): Lien brut (wiki ou markdown)
+
+    Returns:
+        str: Chemin cible normalisé, ou None pour un lien externe ou une ancre
+    """
+    # Ignorer les liens externes et les ancres
+    if link.startswith(('http://', 'https://', '#')):
+        return None
+
+    # Normaliser le lien
+    link = link.split('#')[0]  # Enlever les ancres
+
+    # Si le lien est relatif au dossier courant du fichier
+    if not link.startswith('/'):
+        current_dir = os.path.dirname(str_path)
+        link = os.path.normpath(os.path.join(current_dir, link))
+    else:
+        # Enlever le / initial pour les chemins absolus dans le projet
+        link = link.lstrip('/')
+
+    return link or None
+
+
+def resolve_link_targets(md_file):
+    """
+    Résout tous les liens internes d'un fichier.
+
+    Args:
+        md_file (VaultFile): Fichier analysé
+
+    Returns:
+        list: Chemins cibles normalisés, alignés sur les liens (None pour
+              un lien externe ou une ancre)
+    """
+    return [resolve_link_target(md_file.rel_path, link) for link in md_file.links]
+
+
+def analyze_file(job):
+    """
+    Analyse complète d'un fichier, exécutée dans un processus de travail.
+
+    Args:
+        job (tuple): (project_path, rel_path, abs_path, stat, frontmatter_rules)
+
+    Returns:
+        dict: Résultats sérialisables (liens, cibles, problèmes de frontmatter,
+              empreinte, nombre d'octets lus et compteurs de performance)
+    """
+    project_path, rel_path, abs_path, stat, frontmatter_rules = job
+    before = read_counters()
+
+    # Instantané jetable limité à ce fichier, pour réutiliser la même logique de lecture
+    snapshot = VaultSnapshot(project_path)
+    md_file = VaultFile(snapshot, rel_path, abs_path, stat)
+    snapshot.files[rel_path] = md_file
+
+    result = {
+        'rel_path': rel_path,
+        'frontmatter_issues': validate_file_frontmatter(md_file, frontmatter_rules),
+        'links': md_file.link_positions,
+        'targets': resolve_link_targets(md_file),
+        'sha1': content_hash(md_file.raw),
+        'bytes_read': snapshot.bytes_read,
+    }
+    result['counters'] = counters_since(before)
+    return result
+
+
+def analyze_in_parallel(snapshot, frontmatter_rules, jobs):
+    """
+    Répartit l'analyse des fichiers sans résultat connu entre plusieurs processus.
+
+    Les résultats sont fusionnés dans l'instantané dans l'ordre de ses
+    fichiers; validate_frontmatter et check_broken_links les réutilisent
+    ensuite sans relire ni réanalyser les fichiers.
+
+    Args:
+        snapshot (VaultSnapshot): Instantané du projet
+        frontmatter_rules (RuleDispatcher): Règles de frontmatter à appliquer
+        jobs (int): Nombre de processus de travail
+
+    Returns:
+        int: Nombre de fichiers analysés
+    """
+    # multiprocessing n'est chargé que si l'analyse est répartie
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending = [md_file for md_file in snapshot
+               if snapshot.cached_result(md_file, 'frontmatter_issues') is None
+               or snapshot.cached_result(md_file, 'targets') is None]
+    if not pending:
+        return 0
+
+    work = [(snapshot.project_path, md_file.rel_path, md_file.path, md_file.stat, frontmatter_rules)
+            for md_file in pending]
+    chunksize = max(1, len(work) // (jobs * 4))
+    logger.debug(f"Analyse de {len(work)} fichiers sur {jobs} processus (lots de {chunksize})")
+
+    # map() conserve l'ordre des entrées: la fusion reste déterministe
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for md_file, result in zip(pending, executor.map(analyze_file, work, chunksize=chunksize)):
+            md_file.preload(result['links'], result['sha1'], result['bytes_read'])
+            merge_counters(result['counters'])
+            snapshot.record_result(md_file, 'targets', result['targets'])
+            snapshot.record_result(md_file, 'frontmatter_issues', result['frontmatter_issues'])
+
+    return len(pending)
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corrections sans intervention, décidées par une politique déclarative.
+
+La politique (automation/config/fix-policy.yaml du projet, ou celle livrée
+avec les scripts) associe des types de problèmes et des motifs de chemin à
+des actions: créer un dossier ou un fichier, corriger un lien (casse,
+préfixe, fichier au nom proche) au-delà d'un seuil de confiance, ignorer.
+Tous les problèmes sont évalués d'un bloc; les corrections retenues sont
+réunies en un seul plan de modifications appliqué par plan_executor (une
+réécriture par fichier, journal, annulation possible). Seuls les cas
+ambigus ou sans règle sont écrits dans une file de révision.
+"""
+
+import os
+import re
+import logging
+from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import yaml
+
+from file_analysis import resolve_link_target
+from frontmatter_rules import CONFIG_DIR, DEFAULT_RULES_PATH
+from fuzzy_index import fuzzy_index_for
+from link_graph import link_graph_for
+from link_rewriter import rewrite_links
+from plan_executor import PlannedChanges, execute_changes
+
+logger = logging.getLogger('structure_verification')
+
+POLICY_FILENAME = 'fix-policy.yaml'
+
+# Politique livrée avec les scripts (automation/config/ du dépôt)
+DEFAULT_POLICY_PATH = DEFAULT_RULES_PATH.parent / POLICY_FILENAME
+
+# File de révision des problèmes non corrigés, relative au projet
+REVIEW_QUEUE_FILE = 'review/fix-queue.md'
+
+ACTIONS = ('create_dir', 'create_file', 'fix_case', 'replace_prefix', 'link_similar', 'skip', 'review')
+RULE_KEYS = ('type', 'path', 'link', 'action', 'template', 'min_confidence', 'min_margin')
+
+DEFAULT_MIN_CONFIDENCE = 0.9
+DEFAULT_MIN_MARGIN = 0.05
+
+
+class PolicyRule(object):
+    """
+    Règle de la politique: problèmes concernés et action à appliquer.
+    """
+
+    __slots__ = ('types', 'path', 'link', 'action', 'template', 'min_confidence', 'min_margin')
+
+    def __init__(self, rule):
+        types = rule['type']
+        self.types = frozenset([types] if isinstance(types, str) else types)
+        self.path = re.compile(rule['path']) if rule.get('path') else None
+        self.link = re.compile(rule['link']) if rule.get('link') else None
+        self.action = rule['action']
+        self.template = rule.get('template')
+        self.min_confidence = float(rule.get('min_confidence', DEFAULT_MIN_CONFIDENCE))
+        self.min_margin = float(rule.get('min_margin', DEFAULT_MIN_MARGIN))
+
+    def matches(self, issue):
+        """Indique si la règle concerne un problème."""
+        if issue['type'] not in self.types:
+            return False
+        if self.path is not None and not self.path.search(issue['path']):
+            return False
+        if self.link is not None and not self.link.search(issue.get('link') or ''):
+            return False
+        return True
+
+
+class FixPolicy(object):
+    """
+    Règles de la politique, dans l'ordre du fichier.
+    """
+
+    def __init__(self, rules, source=None):
+        self.rules = [PolicyRule(rule) for rule in rules]
+        self.source = source
+
+    def rules_for(self, issue):
+        """Règles qui concernent un problème, dans l'ordre."""
+        return [rule for rule in self.rules if rule.matches(issue)]
+
+
+def check_policy(policy, source):
+    """
+    Vérifie la forme d'une politique lue dans un fichier.
+
+    Args:
+        policy: Contenu YAML du fichier
+        source (Path): Fichier lu, pour les messages d'erreur
+
+    Raises:
+        ValueError: Si une règle est mal formée
+    """
+    if not isinstance(policy, dict) or not isinstance(policy.get('rules'), list):
+        raise ValueError(f"{source}: une liste 'rules' est attendue")
+    for index, rule in enumerate(policy['rules'], 1):
+        if not isinstance(rule, dict) or 'type' not in rule or 'action' not in rule:
+            raise ValueError(f"{source}: la règle {index} doit avoir un type et une action")
+        unknown = set(rule) - set(RULE_KEYS)
+        if unknown:
+            raise ValueError(f"{source}: clés inconnues dans la règle {index}: {', '.join(sorted(unknown))}")
+        if rule['action'] not in ACTIONS:
+            raise ValueError(f"{source}: action inconnue dans la règle {index}: {rule['action']}")
+        for key in ('path', 'link'):
+            try:
+                re.compile(rule.get(key) or '')
+            except re.error as e:
+                raise ValueError(f"{source}: motif '{key}' invalide dans la règle {index}: {e}")
+
+
+def load_fix_policy(project_path=None, policy_path=None):
+    """
+    Charge la politique de correction.
+
+    Args:
+        project_path (Path, optional): Chemin de base du projet
+        policy_path (Path, optional): Fichier de politique explicite
+
+    Returns:
+        FixPolicy: Politique chargée
+
+    Raises:
+        ValueError: Si le fichier est absent ou mal formé
+    """
+    if policy_path is None:
+        policy_path = DEFAULT_POLICY_PATH
+        if project_path is not None and (Path(project_path) / CONFIG_DIR / POLICY_FILENAME).is_file():
+            policy_path = Path(project_path) / CONFIG_DIR / POLICY_FILENAME
+    policy_path = Path(policy_path)
+
+    try:
+        with open(policy_path, 'r', encoding='utf-8') as f:
+            policy = yaml.safe_load(f) or {}
+    except OSError as e:
+        raise ValueError(f"Politique de correction introuvable: {policy_path} ({e})")
+    except yaml.YAMLError as e:
+        raise ValueError(f"{policy_path}: YAML invalide: {e}")
+    check_policy(policy, policy_path)
+
+    logger.debug(f"{len(policy['rules'])} règles de correction chargées depuis {policy_path}")
+    return FixPolicy(policy['rules'], policy_path)
+
+
+class Decision(object):
+    """
+    Décision prise pour un problème: action retenue, nouvelle cible et confiance.
+    """
+
+    __slots__ = ('issue', 'action', 'target', 'confidence', 'reason', 'rule')
+
+    def __init__(self, issue, action, target=None, confidence=None, reason=None):
+        self.issue = issue
+        self.action = action
+        self.target = target          # chemin créé ou nouvelle cible du lien
+        self.confidence = confidence
+        self.reason = reason          # motif de la mise en file de révision
+        self.rule = None              # règle appliquée
+
+
+def link_path(issue):
+    """Cible d'un lien cassé telle qu'écrite dans le fichier, sans ancre."""
+    return (issue.get('raw_link') or issue.get('link') or '').split('#')[0]
+
+
+def name_similarity(name1, name2):
+    """Similarité de deux noms de fichier, sans extension ni casse."""
+    name1 = os.path.splitext(os.path.basename(name1))[0].lower()
+    name2 = os.path.splitext(os.path.basename(name2))[0].lower()
+    return SequenceMatcher(None, name1, name2).ratio()
+
+
+def written_link(issue, rel_path):
+    """
+    Chemin d'une note tel qu'il doit être écrit dans le fichier du lien:
+    les liens sont résolus depuis le dossier du fichier, sauf s'ils
+    commencent par '/' (voir file_analysis.resolve_link_target).
+
+    Args:
+        issue (dict): Lien cassé
+        rel_path (str): Chemin de la note, relatif à la racine du projet
+
+    Returns:
+        str: Cible à écrire dans le lien
+    """
+    if link_path(issue).startswith('/'):
+        return '/' + rel_path
+    return os.path.relpath(rel_path, os.path.dirname(issue['path']) or '.').replace(os.sep, '/')
+
+
+def keep_link_style(old_target, new_path):
+    """Nouvelle cible écrite comme l'ancienne (avec ou sans extension .md)."""
+    if not old_target.endswith('.md') and new_path.endswith('.md'):
+        return new_path[:-3]
+    return new_path
+
+
+class PolicyEngine(object):
+    """
+    Évalue les problèmes d'un projet selon une politique.
+    """
+
+    def __init__(self, project_path, snapshot, policy):
+        self.project_path = Path(project_path)
+        self.snapshot = snapshot
+        self.policy = policy
+        self.graph = link_graph_for(snapshot)
+        self._root_dirs = None
+
+    @property
+    def root_dirs(self):
+        """Dossiers de premier niveau du projet (hors dossiers cachés)."""
+        if self._root_dirs is None:
+            with os.scandir(self.project_path) as iterator:
+                self._root_dirs = sorted(entry.name for entry in iterator
+                                         if entry.is_dir() and not entry.name.startswith('.'))
+        return self._root_dirs
+
+    def decide(self, issue):
+        """
+        Décide de l'action à appliquer à un problème: la première règle dont
+        l'action aboutit l'emporte.
+
+        Args:
+            issue (dict): Problème détecté
+
+        Returns:
+            Decision: Décision (action 'review' si aucune règle n'aboutit)
+        """
+        reason = "aucune règle de la politique ne s'applique"
+        for rule in self.policy.rules_for(issue):
+            decision = getattr(self, '_' + rule.action)(issue, rule)
+            if decision.action != 'review' or rule.action == 'review':
+                decision.rule = rule
+                return decision
+            reason = decision.reason
+        return Decision(issue, 'review', reason=reason)
+
+    def _skip(self, issue, rule):
+        return Decision(issue, 'skip')
+
+    def _review(self, issue, rule):
+        return Decision(issue, 'review', reason="la politique demande une révision")
+
+    def _create_dir(self, issue, rule):
+        if os.path.splitext(issue['path'])[1]:
+            return Decision(issue, 'review', reason="le chemin désigne un fichier")
+        return Decision(issue, 'create_dir', issue['path'], 1.0)
+
+    def _create_file(self, issue, rule):
+        if issue['type'] == 'broken_link':
+            target = issue.get('link') or ''
+            path = target if target.endswith('.md') else target + '.md'
+        else:
+            path = issue['path']
+        if not path.endswith('.md'):
+            return Decision(issue, 'review', reason="le chemin ne désigne pas un fichier markdown")
+        return Decision(issue, 'create_file', path, 1.0)
+
+    def _fix_case(self, issue, rule):
+        resolved = issue.get('link') or ''
+        target = self.snapshot.targets_by_lower.get(resolved.lower())
+        if target is None or target == resolved:
+            return Decision(issue, 'review', reason="aucun fichier ne diffère seulement par la casse")
+        return Decision(issue, 'fix_case', written_link(issue, target), 1.0)
+
+    def _replace_prefix(self, issue, rule):
+        raw = link_path(issue)
+        lead = '/' if raw.startswith('/') else ''
+        prefix, sep, rest = raw[len(lead):].partition('/')
+        if not sep:
+            return Decision(issue, 'review', reason="le lien n'a pas de dossier à corriger")
+
+        scored = sorted(((SequenceMatcher(None, prefix, name).ratio(), name)
+                         for name in self.root_dirs if name != prefix), reverse=True)
+        for confidence, name in scored:
+            if confidence < rule.min_confidence:
+                break
+            new_target = f"{lead}{name}/{rest}"
+            if self.graph.resolves(resolve_link_target(issue['path'], new_target)):
+                return Decision(issue, 'replace_prefix', new_target, confidence)
+        best = f" (meilleur dossier: {scored[0][1]}, confiance {scored[0][0]:.2f})" if scored else ""
+        return Decision(issue, 'review', reason=f"aucun préfixe sûr vers une note existante{best}")
+
+    def _link_similar(self, issue, rule):
+        raw = link_path(issue)
+        candidates = fuzzy_index_for(self.snapshot).candidates(os.path.basename(raw))
+        scored = sorted(((name_similarity(rel_path, raw), rel_path) for rel_path, _ in candidates),
+                        reverse=True)
+        if not scored:
+            return Decision(issue, 'review', reason="aucun fichier au nom proche")
+
+        confidence, best = scored[0]
+        if confidence < rule.min_confidence:
+            return Decision(issue, 'review',
+                            reason=f"confiance {confidence:.2f} pour {best} (seuil {rule.min_confidence:.2f})")
+        if len(scored) > 1 and confidence - scored[1][0] < rule.min_margin:
+            return Decision(issue, 'review', reason=f"ambigu entre {best} et {scored[1][1]}")
+        return Decision(issue, 'link_similar', keep_link_style(raw, written_link(issue, best)), confidence)
+
+
+def template_content(changes, template_name, rel_path):
+    """
+    Contenu d'un fichier créé par la politique.
+
+    Args:
+        changes (PlannedChanges): Modifications prévues (templates déjà créés compris)
+        template_name (str): Template du projet (templates/NOM.md), ou None
+        rel_path (str): Chemin du fichier créé
+
+    Returns:
+        str: Contenu du template, ou contenu minimal
+    """
+    if template_name:
+        content = changes.read(f"templates/{template_name}.md")
+        if content is not None:
+            return content
+        logger.warning(f"Template {template_name} non trouvé, utilisation du contenu par défaut")
+    title = os.path.splitext(os.path.basename(rel_path))[0].replace('-', ' ').title()
+    return f"""---
+title: {title}
+created: {datetime.now().strftime('%Y-%m-%d')}
+status: draft
+---
+
+# {title}
+
+<!-- Fichier créé automatiquement par la politique de correction -->
+"""
+
+
+def format_review_queue(decisions, policy_source):
+    """
+    Met en forme la file de révision.
+
+    Args:
+        decisions (list): Décisions 'review'
+        policy_source (Path): Fichier de politique appliqué
+
+    Returns:
+        str: Contenu markdown de la file
+    """
+    lines = [
+        "---",
+        "titre: File de révision des corrections",
+        f"date_creation: {datetime.now().strftime('%Y-%m-%d')}",
+        "tags: révision-structure",
+        "---",
+        "",
+        "# File de révision des corrections",
+        "",
+        f"Problèmes que la politique de correction (`{policy_source}`) n'a pas pu traiter sans intervention.",
+        "",
+    ]
+
+    by_type = {}
+    for decision in decisions:
+        by_type.setdefault(decision.issue['type'], []).append(decision)
+    for issue_type, type_decisions in sorted(by_type.items()):
+        lines.append(f"## {issue_type.replace('_', ' ').title()} ({len(type_decisions)})")
+        lines.append("")
+        for decision in sorted(type_decisions, key=lambda d: (d.issue['path'], d.issue.get('line') or 0)):
+            issue = decision.issue
+            where = f" (ligne {issue['line']})" if issue.get('line') else ""
+            lines.append(f"- [ ] **{issue['path']}**{where}: {issue['message']} — {decision.reason}")
+        lines.append("")
+    return '\n'.join(lines).rstrip('\n') + '\n'
+
+
+def apply_fix_policy(project_path, issues, policy, snapshot, dry_run=False):
+    """
+    Évalue tous les problèmes selon la politique et applique les corrections
+    retenues en une seule exécution journalisée.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Problèmes détectés
+        policy (FixPolicy): Politique de correction
+        snapshot (VaultSnapshot): Instantané du projet (index des liens et des noms)
+        dry_run (bool): Si True, calcule les modifications sans rien écrire
+
+    Returns:
+        dict: 'decisions' (par action), 'changes' (PlannedChanges) et 'fixed'
+    """
+    project_path = Path(project_path)
+    engine = PolicyEngine(project_path, snapshot, policy)
+    decisions = {}
+    for issue in issues:
+        decision = engine.decide(issue)
+        decisions.setdefault(decision.action, []).append(decision)
+
+    # Créations d'abord: un lien peut viser un fichier créé
+    changes = PlannedChanges(project_path)
+    for decision in decisions.get('create_dir', []):
+        changes.make_dir(decision.target)
+    for decision in decisions.get('create_file', []):
+        if changes.exists(decision.target):
+            continue
+        changes.write(decision.target, template_content(changes, decision.rule.template, decision.target))
+
+    # Liens: toutes les corrections d'un fichier en une seule réécriture
+    replacements_by_file = {}
+    for action in ('fix_case', 'replace_prefix', 'link_similar'):
+        for decision in decisions.get(action, []):
+            replacements_by_file.setdefault(decision.issue['path'], {})[link_path(decision.issue)] = decision.target
+    links_fixed = 0
+    for rel_path, replacements in replacements_by_file.items():
+        content = changes.read(rel_path)
+        if content is None:
+            continue
+        new_content, count = rewrite_links(content, replacements)
+        if count and changes.write(rel_path, new_content):
+            links_fixed += count
+
+    # File de révision des cas restants, écrite avec les corrections s'il y en a;
+    # une file devenue vide est supprimée dans la même exécution journalisée
+    review_decisions = decisions.get('review', [])
+    if review_decisions:
+        changes.write(REVIEW_QUEUE_FILE, format_review_queue(review_decisions, policy.source))
+    else:
+        changes.delete(REVIEW_QUEUE_FILE)
+
+    summary = ', '.join(f"{action}: {len(action_decisions)}" for action, action_decisions in sorted(decisions.items()))
+    logger.info(f"Politique de correction appliquée à {len(issues)} problèmes ({summary or 'aucun'}).")
+    logger.info(f"Modifications prévues: {changes.summary()}")
+
+    if not dry_run:
+        execute_changes(changes, "verify-structure --policy")
+        if review_decisions:
+            logger.info(f"{len(review_decisions)} problèmes placés dans la file de révision: {REVIEW_QUEUE_FILE}")
+        elif changes.deleted:
+            logger.info(f"File de révision vide supprimée: {REVIEW_QUEUE_FILE}")
+
+    fixed = (len(decisions.get('create_dir', [])) + len(decisions.get('create_file', [])) + links_fixed)
+    return {'decisions': decisions, 'changes': changes, 'fixed': fixed}
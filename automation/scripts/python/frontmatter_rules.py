@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Règles de frontmatter chargées depuis automation/config/ et compilées en un
+aiguillage unique.
+
+Les règles (motif de chemin -> champs requis, recommandés, tags valides) sont
+lues dans automation/config/frontmatter-rules.yaml du projet vérifié, ou à
+défaut dans celui livré avec les scripts. Elles sont compilées une fois en
+un arbre des préfixes littéraux des motifs, dossier par dossier: pour un
+fichier, seuls les motifs dont le préfixe correspond à son chemin sont
+ensuite évalués. La recherche dépend de la profondeur du chemin et non du
+nombre de règles. Le résultat compilé est conservé pour le processus tant
+que le fichier de configuration ne change pas; d'une exécution à l'autre,
+l'empreinte des règles valide le cache des résultats par fichier.
+"""
+
+import os
+import re
+import logging
+from pathlib import Path
+
+import yaml
+
+from structure_cache import rules_fingerprint
+
+logger = logging.getLogger('structure_verification')
+
+RULES_FILENAME = 'frontmatter-rules.yaml'
+
+# Emplacement des règles dans un projet
+CONFIG_DIR = Path('automation') / 'config'
+
+# Règles livrées avec les scripts (automation/config/ du dépôt)
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent.parent / 'config' / RULES_FILENAME
+
+RULE_FIELDS = ('required_fields', 'recommended_fields', 'valid_tags')
+
+# Caractères qui terminent la partie littérale d'un motif
+REGEX_SPECIAL = frozenset('.^$*+?{}[]\\|()')
+
+# Quantificateurs qui rendent facultatif le caractère précédent
+QUANTIFIERS = frozenset('*?{')
+
+# Aiguillages déjà compilés: chemin -> (date, taille, RuleDispatcher)
+_loaded = {}
+
+# Aiguillages par empreinte, pour les processus de travail (voir __reduce__)
+_by_fingerprint = {}
+
+
+def literal_prefix(pattern):
+    """
+    Partie littérale au début d'un motif: tout chemin qui lui correspond
+    commence nécessairement par ce préfixe.
+
+    Args:
+        pattern (str): Expression régulière appliquée avec re.match
+
+    Returns:
+        str: Préfixe littéral (vide si le motif contient une alternative)
+    """
+    if '|' in pattern:
+        return ''
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+    prefix = []
+    for char in pattern:
+        if char in REGEX_SPECIAL:
+            if char in QUANTIFIERS and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return ''.join(prefix)
+
+
+class RuleNode(object):
+    """
+    Nœud de l'arbre des préfixes: un dossier et les règles dont le préfixe
+    littéral s'arrête à ce dossier.
+    """
+
+    __slots__ = ('children', 'rules')
+
+    def __init__(self):
+        self.children = {}
+        self.rules = []  # [(rang, motif compilé, règle)]
+
+
+class RuleDispatcher(object):
+    """
+    Aiguillage des fichiers vers les règles de frontmatter qui s'y appliquent.
+    """
+
+    def __init__(self, rules, source=None):
+        self.rules = rules
+        self.source = source
+        self.fingerprint = rules_fingerprint(rules)
+        self.root = RuleNode()
+        for rank, (pattern, rule) in enumerate(rules.items()):
+            # Seuls les dossiers complets du préfixe servent à l'aiguillage
+            node = self.root
+            for segment in literal_prefix(pattern).split('/')[:-1]:
+                node = node.children.setdefault(segment, RuleNode())
+            node.rules.append((rank, re.compile(pattern), rule))
+        _by_fingerprint[self.fingerprint] = self
+
+    def __reduce__(self):
+        # Transmis aux processus de travail par empreinte: compilé une seule
+        # fois par processus et non pour chaque fichier
+        return (dispatcher_for, (self.fingerprint, self.rules))
+
+    def __len__(self):
+        return len(self.rules)
+
+    def rules_for(self, rel_path):
+        """
+        Règles qui s'appliquent à un fichier.
+
+        Args:
+            rel_path (str): Chemin relatif du fichier
+
+        Returns:
+            list: Règles correspondantes, dans l'ordre de la configuration
+        """
+        candidates = list(self.root.rules)
+        node = self.root
+        for segment in rel_path.replace(os.sep, '/').split('/'):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            candidates.extend(node.rules)
+        if len(candidates) > 1:
+            candidates.sort(key=lambda candidate: candidate[0])
+        return [rule for _, pattern, rule in candidates if pattern.match(rel_path)]
+
+
+def dispatcher_for(fingerprint, rules):
+    """
+    Retourne l'aiguillage d'un jeu de règles, compilé une seule fois par processus.
+
+    Args:
+        fingerprint (str): Empreinte des règles
+        rules (dict): Règles par motif de chemin
+
+    Returns:
+        RuleDispatcher: Aiguillage compilé
+    """
+    dispatcher = _by_fingerprint.get(fingerprint)
+    if dispatcher is None:
+        dispatcher = RuleDispatcher(rules)
+    return dispatcher
+
+
+def check_rules(rules, source):
+    """
+    Vérifie la forme des règles lues dans un fichier de configuration.
+
+    Args:
+        rules: Contenu YAML du fichier
+        source (Path): Fichier lu, pour les messages d'erreur
+
+    Raises:
+        ValueError: Si une règle est mal formée ou un motif invalide
+    """
+    if not isinstance(rules, dict):
+        raise ValueError(f"{source}: un dictionnaire motif -> règle est attendu")
+    for pattern, rule in rules.items():
+        if not isinstance(rule, dict):
+            raise ValueError(f"{source}: la règle '{pattern}' doit être un dictionnaire")
+        unknown = set(rule) - set(RULE_FIELDS)
+        if unknown:
+            raise ValueError(f"{source}: champs inconnus dans la règle '{pattern}': {', '.join(sorted(unknown))}")
+        for field in RULE_FIELDS:
+            if not isinstance(rule.get(field, []), list):
+                raise ValueError(f"{source}: '{field}' doit être une liste dans la règle '{pattern}'")
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"{source}: motif invalide '{pattern}': {e}")
+
+
+def rules_path_for(project_path=None):
+    """
+    Fichier de règles à utiliser pour un projet.
+
+    Args:
+        project_path (Path, optional): Chemin de base du projet
+
+    Returns:
+        Path: Règles du projet si elles existent, sinon celles livrées avec les scripts
+    """
+    if project_path is not None:
+        project_rules = Path(project_path) / CONFIG_DIR / RULES_FILENAME
+        if project_rules.is_file():
+            return project_rules
+    return DEFAULT_RULES_PATH
+
+
+def load_frontmatter_rules(project_path=None, rules_path=None):
+    """
+    Charge et compile les règles de frontmatter.
+
+    Args:
+        project_path (Path, optional): Chemin de base du projet
+        rules_path (Path, optional): Fichier de règles explicite
+
+    Returns:
+        RuleDispatcher: Aiguillage compilé
+
+    Raises:
+        ValueError: Si le fichier est absent ou mal formé
+    """
+    rules_path = Path(rules_path) if rules_path is not None else rules_path_for(project_path)
+    try:
+        stat = rules_path.stat()
+    except OSError as e:
+        raise ValueError(f"Règles de frontmatter introuvables: {rules_path} ({e})")
+
+    key = str(rules_path.resolve())
+    loaded = _loaded.get(key)
+    if loaded is not None and loaded[:2] == (stat.st_mtime_ns, stat.st_size):
+        return loaded[2]
+
+    with open(rules_path, 'r', encoding='utf-8') as f:
+        try:
+            rules = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"{rules_path}: YAML invalide: {e}")
+    check_rules(rules, rules_path)
+
+    dispatcher = RuleDispatcher(rules, rules_path)
+    _loaded[key] = (stat.st_mtime_ns, stat.st_size, dispatcher)
+    logger.debug(f"{len(dispatcher)} règles de frontmatter chargées depuis {rules_path}")
+    return dispatcher
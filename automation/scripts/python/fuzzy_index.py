@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Index approximatif des noms de fichiers, pour proposer des cibles aux liens cassés.
+
+Les noms de fichiers normalisés sont découpés en trigrammes et rangés dans un
+index inversé (trigramme -> fichiers). Une recherche ne parcourt que les
+listes des trigrammes du nom cherché et retourne les meilleurs candidats
+selon le coefficient de Dice; le score de chemin pondéré, plus coûteux,
+n'est ensuite calculé que pour ces quelques candidats.
+"""
+
+import os
+import heapq
+import logging
+
+from phase_profiler import counters
+
+logger = logging.getLogger('structure_verification')
+
+# Nombre de candidats retournés par défaut
+DEFAULT_LIMIT = 20
+
+# Proportion minimale de trigrammes communs (coefficient de Dice)
+MIN_SCORE = 0.2
+
+
+def normalize_name(name):
+    """
+    Normalise un nom de fichier pour la recherche approximative.
+
+    Args:
+        name (str): Nom ou chemin de fichier
+
+    Returns:
+        str: Nom de base en minuscules, sans extension .md ni séparateurs variables
+    """
+    name = os.path.basename(name.replace('\\', '/')).lower()
+    if name.endswith('.md'):
+        name = name[:-3]
+    return name.replace('_', '-').replace(' ', '-')
+
+
+def trigrams(text):
+    """
+    Découpe un texte en trigrammes, bornes comprises.
+
+    Args:
+        text (str): Texte normalisé
+
+    Returns:
+        set: Ensemble des trigrammes
+    """
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex(object):
+    """
+    Index inversé de trigrammes sur les noms de fichiers.
+    """
+
+    def __init__(self):
+        self.paths = []      # identifiant -> chemin relatif
+        self.sizes = []      # identifiant -> nombre de trigrammes
+        self.postings = {}   # trigramme -> [identifiants]
+        self._results = {}   # recherches déjà effectuées
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Indexe tous les fichiers markdown d'un instantané.
+
+        Args:
+            snapshot (VaultSnapshot): Instantané du projet
+
+        Returns:
+            TrigramIndex: Index construit
+        """
+        index = cls()
+        for md_file in snapshot:
+            index.add(md_file.rel_path)
+        logger.debug(f"Index approximatif: {len(index.paths)} fichiers, {len(index.postings)} trigrammes")
+        return index
+
+    def add(self, rel_path):
+        """Ajoute un fichier à l'index."""
+        file_id = len(self.paths)
+        grams = trigrams(normalize_name(rel_path))
+        self.paths.append(rel_path)
+        self.sizes.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(file_id)
+        self._results.clear()
+
+    def candidates(self, name, limit=DEFAULT_LIMIT, min_score=MIN_SCORE):
+        """
+        Retourne les fichiers dont le nom ressemble le plus à celui cherché.
+
+        Args:
+            name (str): Nom ou chemin recherché
+            limit (int): Nombre maximal de candidats
+            min_score (float): Coefficient de Dice minimal
+
+        Returns:
+            list: Meilleurs candidats [(chemin, score)], dans l'ordre d'indexation
+        """
+        key = (normalize_name(name), limit, min_score)
+        if key in self._results:
+            return self._results[key]
+
+        grams = trigrams(key[0])
+        shared = {}
+        for gram in grams:
+            for file_id in self.postings.get(gram, ()):
+                shared[file_id] = shared.get(file_id, 0) + 1
+        counters['fuzzy_comparisons'] += len(shared)
+
+        scored = []
+        for file_id, count in shared.items():
+            score = 2.0 * count / (len(grams) + self.sizes[file_id])
+            if score >= min_score:
+                scored.append((score, -file_id))
+
+        best = sorted(heapq.nlargest(limit, scored), key=lambda item: -item[1])
+        result = [(self.paths[-neg_id], score) for score, neg_id in best]
+        self._results[key] = result
+        return result
+
+
+def fuzzy_index_for(snapshot):
+    """
+    Retourne l'index approximatif d'un instantané, construit une seule fois.
+
+    Args:
+        snapshot (VaultSnapshot): Instantané du projet
+
+    Returns:
+        TrigramIndex: Index des noms de fichiers
+    """
+    if snapshot.fuzzy_index is None:
+        snapshot.fuzzy_index = TrigramIndex.from_snapshot(snapshot)
+    return snapshot.fuzzy_index
@@ -9,11 +9,15 @@ en le segmentant éventuellement en chapitres.
 
 import os
 import re
+import glob
 import argparse
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+import chapter_splitter
+import document_importers
+
 
 def create_directory_structure(root_dir):
     """Crée la structure de répertoires pour le projet littéraire."""
@@ -216,118 +220,16 @@ def create_structure_files(root_dir):
             print(f"! Fichier structure existant: {file_path}")
 
 
-def detect_chapters(text):
-    """
-    Détecte automatiquement les chapitres dans le texte.
-    Retourne une liste de tuples (titre_chapitre, contenu_chapitre).
-    """
-    # Différents motifs pour détecter les chapitres
-    patterns = [
-        r"^#\s+(.*?)$(.*?)(?=^#\s+|\Z)",  # Format Markdown: # Titre
-        r"^##\s+(.*?)$(.*?)(?=^##\s+|\Z)",  # Format Markdown: ## Titre
-        r"^Chapitre\s+(\d+|[IVXLCDM]+)(?:\s*:\s*(.*?))?$(.*?)(?=^Chapitre\s+|\Z)",  # Chapitre X: Titre
-        r"^CHAPITRE\s+(\d+|[IVXLCDM]+)(?:\s*:\s*(.*?))?$(.*?)(?=^CHAPITRE\s+|\Z)",  # CHAPITRE X: Titre
-    ]
-    
-    # Essayer chaque pattern
-    for pattern in patterns:
-        chapters = []
-        matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
-        
-        for match in matches:
-            if len(match.groups()) == 2:  # Format: # Titre + Contenu
-                title = match.group(1).strip()
-                content = match.group(2).strip()
-                chapters.append((title, content))
-            elif len(match.groups()) == 3:  # Format: Chapitre X: Titre + Contenu
-                chapter_num = match.group(1).strip()
-                title = match.group(2).strip() if match.group(2) else f"Chapitre {chapter_num}"
-                content = match.group(3).strip()
-                chapters.append((title, content))
-        
-        if chapters:
-            return chapters
-    
-    # Si aucun chapitre détecté, retourner le texte entier comme un seul chapitre
-    return [("Document complet", text)]
-
-
-def import_document(root_dir, document_path, title, author, split_chapters=True):
-    """
-    Importe un document existant et le segmente éventuellement en chapitres.
-    """
-    if not os.path.exists(document_path):
-        print(f"Erreur: Le document {document_path} n'existe pas.")
-        return
-    
-    print(f"Importation du document: {document_path}")
-    
-    # Lecture du document
-    with open(document_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Créer une copie du document original dans le répertoire ressources
+def copy_original(root_dir, document_path):
+    """Copie le document original dans le répertoire ressources."""
     doc_filename = os.path.basename(document_path)
     doc_copy_path = os.path.join(root_dir, "ressources", "original_" + doc_filename)
     shutil.copy2(document_path, doc_copy_path)
     print(f"✓ Copie du document original créée: {doc_copy_path}")
-    
-    # Si split_chapters est vrai, détecter et créer des fichiers séparés par chapitre
-    chapters_dir = os.path.join(root_dir, "chapitres")
-    chapter_links = []
-    
-    if split_chapters:
-        chapters = detect_chapters(content)
-        
-        if len(chapters) > 1:
-            print(f"Détection de {len(chapters)} chapitres...")
-            
-            for i, (title, chapter_content) in enumerate(chapters, 1):
-                # Nettoyer le titre pour le nom de fichier
-                clean_title = re.sub(r'[\\/*?:"<>|]', "", title).strip()
-                clean_title = re.sub(r'\s+', "-", clean_title).lower()
-                
-                # Formatage du numéro de chapitre avec zéros de tête
-                chapter_num = f"{i:02d}"
-                
-                # Créer le nom de fichier
-                chapter_filename = f"chapitre-{chapter_num}-{clean_title[:30]}.md"
-                chapter_path = os.path.join(chapters_dir, chapter_filename)
-                
-                # Formater le contenu du chapitre
-                chapter_md_content = f"""# {title}
 
-{chapter_content}
-"""
-                
-                # Écrire le fichier de chapitre
-                with open(chapter_path, "w", encoding="utf-8") as f:
-                    f.write(chapter_md_content)
-                
-                print(f"✓ Chapitre créé: {chapter_path}")
-                
-                # Ajouter le lien au chapitre pour l'index
-                chapter_links.append(f"- [Chapitre {chapter_num}: {title}](chapitres/{chapter_filename})")
-        else:
-            print("Aucune structure de chapitres détectée. Création d'un fichier unique.")
-            
-            # Créer un seul fichier
-            chapter_path = os.path.join(chapters_dir, "document-complet.md")
-            with open(chapter_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            
-            print(f"✓ Document unique créé: {chapter_path}")
-            chapter_links.append("- [Document complet](chapitres/document-complet.md)")
-    else:
-        # Créer un seul fichier sans segmentation
-        chapter_path = os.path.join(chapters_dir, "document-complet.md")
-        with open(chapter_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        
-        print(f"✓ Document unique créé: {chapter_path}")
-        chapter_links.append("- [Document complet](chapitres/document-complet.md)")
-    
-    # Mettre à jour l'index avec les liens vers les chapitres
+
+def update_index_chapters(root_dir, chapter_links):
+    """Remplace la section des chapitres de l'index par les liens donnés."""
     index_path = os.path.join(root_dir, "index.md")
     if os.path.exists(index_path):
         with open(index_path, "r", encoding="utf-8") as f:
@@ -353,6 +255,110 @@ def import_document(root_dir, document_path, title, author, split_chapters=True)
         print(f"✓ Index mis à jour avec les liens vers les chapitres")
 
 
+def import_document(root_dir, document_path, title, author, split_chapters=True):
+    """
+    Importe un document existant (texte, Markdown, docx, odt, epub, html)
+    et le segmente éventuellement en chapitres.
+    """
+    if not os.path.exists(document_path):
+        print(f"Erreur: Le document {document_path} n'existe pas.")
+        return
+    
+    print(f"Importation du document: {document_path}")
+    copy_original(root_dir, document_path)
+    
+    # Le document est converti et lu ligne par ligne, jamais chargé en entier
+    # (voir document_importers et chapter_splitter), dans un dossier temporaire:
+    # chapitres/ n'est modifié que si la conversion a réussi
+    chapters_dir = os.path.join(root_dir, "chapitres")
+    output_dir = os.path.join(chapters_dir, ".import")
+    shutil.rmtree(output_dir, ignore_errors=True)
+    try:
+        result = document_importers.convert_document((document_path, output_dir, split_chapters))
+        if result['error']:
+            print(f"Erreur: Impossible d'importer {document_path}: {result['error']}")
+            return
+        
+        chapters = result['chapters']
+        chapter_links = []
+        
+        if chapters:
+            print(f"Détection de {len(chapters)} chapitres...")
+            
+            for chapter_num, chapter_title, chapter_filename in chapters:
+                os.replace(os.path.join(output_dir, chapter_filename), os.path.join(chapters_dir, chapter_filename))
+                print(f"✓ Chapitre créé: {os.path.join(chapters_dir, chapter_filename)}")
+                
+                # Ajouter le lien au chapitre pour l'index
+                chapter_links.append(f"- [Chapitre {chapter_num:02d}: {chapter_title}](chapitres/{chapter_filename})")
+        else:
+            if split_chapters:
+                print("Aucune structure de chapitres détectée. Création d'un fichier unique.")
+            os.replace(os.path.join(output_dir, chapter_splitter.SINGLE_FILENAME),
+                       os.path.join(chapters_dir, chapter_splitter.SINGLE_FILENAME))
+            print(f"✓ Document unique créé: {os.path.join(chapters_dir, chapter_splitter.SINGLE_FILENAME)}")
+            chapter_links.append(f"- [Document complet](chapitres/{chapter_splitter.SINGLE_FILENAME})")
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    
+    # Mettre à jour l'index avec les liens vers les chapitres
+    update_index_chapters(root_dir, chapter_links)
+
+
+def import_documents(root_dir, document_paths, title, author, split_chapters=True, jobs=None):
+    """
+    Importe plusieurs documents, convertis en parallèle (un processus par
+    document). Les chapitres sont numérotés à la suite, dans l'ordre des
+    documents; un document sans chapitres devient un chapitre portant son nom.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    chapters_dir = os.path.join(root_dir, "chapitres")
+    tasks = []
+    for i, document_path in enumerate(document_paths):
+        copy_original(root_dir, document_path)
+        tasks.append((document_path, os.path.join(chapters_dir, f".import-{i:03d}"), split_chapters))
+    
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    print(f"Importation de {len(tasks)} documents sur {jobs} processus...")
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(document_importers.convert_document, tasks, chunksize=1))
+    else:
+        results = [document_importers.convert_document(task) for task in tasks]
+    
+    chapter_links = []
+    chapter_num = 0
+    for (document_path, output_dir, _), result in zip(tasks, results):
+        if result['error']:
+            print(f"Erreur: Impossible d'importer {document_path}: {result['error']}")
+        else:
+            document_title = os.path.splitext(os.path.basename(document_path))[0]
+            parts = [(chapter_title, filename) for _, chapter_title, filename in result['chapters']]
+            for chapter_title, filename in parts or [(document_title, chapter_splitter.SINGLE_FILENAME)]:
+                chapter_num += 1
+                chapter_filename = chapter_splitter.chapter_filename(chapter_num, chapter_title)
+                os.replace(os.path.join(output_dir, filename), os.path.join(chapters_dir, chapter_filename))
+                print(f"✓ Chapitre créé: {os.path.join(chapters_dir, chapter_filename)}")
+                chapter_links.append(f"- [Chapitre {chapter_num:02d}: {chapter_title}](chapitres/{chapter_filename})")
+        shutil.rmtree(output_dir, ignore_errors=True)
+    
+    update_index_chapters(root_dir, chapter_links)
+
+
+def find_documents(pattern):
+    """
+    Documents désignés par --document: un chemin, un motif glob ou un dossier
+    (tous les documents de format connu qu'il contient).
+    """
+    if os.path.isdir(pattern):
+        return sorted(os.path.join(pattern, name) for name in os.listdir(pattern)
+                      if os.path.splitext(name)[1].lower() in document_importers.IMPORTERS)
+    if glob.has_magic(pattern):
+        return sorted(glob.glob(pattern))
+    return [pattern]
+
+
 def create_simple_scripts(root_dir):
     """Crée des scripts utilitaires de base."""
     scripts_dir = os.path.join(root_dir, "scripts")
@@ -363,99 +369,625 @@ def create_simple_scripts(root_dir):
 
 \"\"\"
 Compile tous les chapitres en un seul document
+
+La compilation est incrémentale: le fragment de chaque chapitre est mis en
+cache dans export/.cache, sous l'empreinte de son contenu. Seuls les chapitres
+modifiés depuis la compilation précédente sont retraités, le livre est écrit
+au fil de l'eau à partir des fragments, et le fichier compilé précédent est
+conservé tel quel si rien n'a changé. Les mêmes fragments servent à l'export
+HTML et EPUB (voir export_book.py).
 \"\"\"
 
 import os
 import re
+import json
+import shutil
+import hashlib
 import argparse
+from datetime import datetime
 from pathlib import Path
 
+CACHE_DIR = "export/.cache"
+MANIFEST_FILE = "manifest.json"
+
+# À incrémenter quand process_chapter change, pour invalider les fragments
+FRAGMENT_VERSION = "2"
+
+BUFFER_SIZE = 1024 * 1024
+
 def get_chapter_files(chapters_dir):
     \"\"\"Récupère tous les fichiers de chapitres triés par numéro.\"\"\"
     chapter_files = []
-    
+
     for file in os.listdir(chapters_dir):
         if file.endswith(".md") and file.startswith("chapitre-"):
             chapter_files.append(file)
-    
+
     # Trier les fichiers par numéro de chapitre
-    chapter_files.sort(key=lambda x: int(re.search(r'chapitre-(\d+)', x).group(1)))
+    chapter_files.sort(key=lambda x: int(re.search(r'chapitre-(\\d+)', x).group(1)))
     return chapter_files
 
-def compile_book(project_dir, output_file="export/livre_complet.md"):
-    \"\"\"Compile tous les chapitres en un seul document.\"\"\"
-    project_dir = Path(project_dir)
-    chapters_dir = project_dir / "chapitres"
-    output_path = project_dir / output_file
-    
-    # Créer le répertoire de sortie si nécessaire
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # Lire le fichier index pour les métadonnées
+def get_metadata(project_dir):
+    \"\"\"Lit le titre et l'auteur dans le fichier index.\"\"\"
     index_path = project_dir / "index.md"
     title = "Livre"
     author = "Auteur"
-    
+
     if index_path.exists():
         with open(index_path, "r", encoding="utf-8") as f:
             index_content = f.read()
-            
+
             # Extraire le titre et l'auteur
             title_match = re.search(r'^# (.+)$', index_content, re.MULTILINE)
             if title_match:
                 title = title_match.group(1)
-            
+
             author_match = re.search(r'- Auteur: (.+)$', index_content, re.MULTILINE)
             if author_match:
                 author = author_match.group(1)
-    
-    # Commencer le fichier compilé avec les métadonnées
-    output_content = f\"\"\"---
+
+    return title, author
+
+def process_chapter(content):
+    \"\"\"
+    Transforme le contenu d'un chapitre en fragment normalisé du livre:
+    sans frontmatter YAML ni lignes vides finales, suivi d'une ligne vide.
+    \"\"\"
+    if content.startswith("---\\n"):
+        end = content.find("\\n---\\n", 3)
+        if end != -1:
+            content = content[end + 5:].lstrip("\\n")
+    return content.rstrip() + "\\n\\n"
+
+def load_manifest(cache_dir):
+    \"\"\"Charge le manifeste du cache (vide s'il est absent, illisible ou d'une autre version).\"\"\"
+    try:
+        with open(cache_dir / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != FRAGMENT_VERSION:
+        manifest = {"version": FRAGMENT_VERSION}
+    manifest.setdefault("chapters", {})
+    manifest.setdefault("outputs", {})
+    return manifest
+
+def save_manifest(cache_dir, manifest):
+    \"\"\"Écrit le manifeste du cache.\"\"\"
+    temp_path = cache_dir / (MANIFEST_FILE + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temp_path, cache_dir / MANIFEST_FILE)
+
+def chapter_fragment(chapter_path, fragments_dir, entry):
+    \"\"\"
+    Met à jour le fragment d'un chapitre dans le cache.
+
+    Le chapitre n'est relu que si sa date de modification ou sa taille ont
+    changé, et retraité seulement si l'empreinte de son contenu a changé.
+
+    Returns:
+        tuple: (entrée du manifeste, fragment retraité ou non)
+    \"\"\"
+    stat = chapter_path.stat()
+    if (entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+            and (fragments_dir / (entry["sha1"] + ".md")).exists()):
+        return entry, False
+
+    with open(chapter_path, "rb") as f:
+        raw = f.read()
+    sha1 = hashlib.sha1(raw).hexdigest()
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha1": sha1}
+    fragment_path = fragments_dir / (sha1 + ".md")
+    if fragment_path.exists():
+        return entry, False
+
+    # Mêmes fins de ligne qu'une lecture en mode texte
+    content = raw.decode("utf-8").replace("\\r\\n", "\\n").replace("\\r", "\\n")
+    temp_path = fragments_dir / (sha1 + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(process_chapter(content))
+    os.replace(temp_path, fragment_path)
+    return entry, True
+
+def update_fragments(project_dir, force=False):
+    \"\"\"
+    Met à jour les fragments de tous les chapitres et le manifeste du cache.
+
+    Returns:
+        tuple: (manifeste, chapitres dans l'ordre du livre, nombre de chapitres retraités)
+    \"\"\"
+    chapters_dir = project_dir / "chapitres"
+    cache_dir = project_dir / CACHE_DIR
+    fragments_dir = cache_dir / "fragments"
+    if force:
+        shutil.rmtree(fragments_dir, ignore_errors=True)
+    os.makedirs(fragments_dir, exist_ok=True)
+
+    manifest = load_manifest(cache_dir)
+
+    # Récupérer tous les fichiers de chapitres
+    chapter_files = get_chapter_files(chapters_dir)
+
+    # S'il n'y a pas de fichiers chapitre-XX, vérifier s'il y a un document complet
+    if not chapter_files and os.path.exists(chapters_dir / "document-complet.md"):
+        chapter_files = ["document-complet.md"]
+
+    chapters = {}
+    rebuilt = 0
+    for chapter_file in chapter_files:
+        entry, was_rebuilt = chapter_fragment(chapters_dir / chapter_file, fragments_dir,
+                                              manifest["chapters"].get(chapter_file))
+        chapters[chapter_file] = entry
+        rebuilt += was_rebuilt
+    manifest["chapters"] = chapters
+
+    # Supprimer les fragments (et leurs dérivés) des versions précédentes des chapitres
+    current = {entry["sha1"] for entry in chapters.values()}
+    for name in os.listdir(fragments_dir):
+        if name.split(".")[0] not in current:
+            os.remove(fragments_dir / name)
+
+    return manifest, chapter_files, rebuilt
+
+def build_key(target, *inputs):
+    \"\"\"Empreinte d'un fichier exporté: format et données dont il dépend (métadonnées, fragments dans l'ordre).\"\"\"
+    return hashlib.sha1(json.dumps([target, FRAGMENT_VERSION] + list(inputs)).encode("utf-8")).hexdigest()
+
+def write_markdown(output_path, fragments_dir, title, author, fragments):
+    \"\"\"Écrit le livre compilé au fil de l'eau à partir des fragments, puis remplace l'ancien.\"\"\"
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8", buffering=BUFFER_SIZE) as output:
+        # Commencer le fichier compilé avec les métadonnées
+        output.write(f\"\"\"---
 title: {title}
 author: {author}
-date: {os.popen('date +"%d %B %Y"').read().strip()}
+date: {datetime.now().strftime("%d %B %Y")}
 ---
 
-\"\"\"
-    
-    # Récupérer tous les fichiers de chapitres
-    chapter_files = get_chapter_files(chapters_dir)
-    
-    if not chapter_files:
-        # S'il n'y a pas de fichiers chapitre-XX, vérifier s'il y a un document complet
-        if os.path.exists(chapters_dir / "document-complet.md"):
-            with open(chapters_dir / "document-complet.md", "r", encoding="utf-8") as f:
-                output_content += f.read()
-    else:
-        # Compiler tous les chapitres
-        for chapter_file in chapter_files:
-            with open(chapters_dir / chapter_file, "r", encoding="utf-8") as f:
-                chapter_content = f.read()
-                
-                # Ajouter un saut de page avant chaque chapitre (pour la génération PDF)
-                if chapter_file != chapter_files[0]:
-                    output_content += "\\pagebreak\n\n"
-                
-                # Ajouter le contenu du chapitre
-                output_content += chapter_content + "\n\n"
-    
-    # Écrire le fichier de sortie
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(output_content)
-    
-    print(f"Livre compilé avec succès: {output_path}")
+\"\"\")
+
+        for position, sha1 in enumerate(fragments):
+            # Ajouter un saut de page avant chaque chapitre (pour la génération PDF)
+            if position > 0:
+                output.write("\\\\pagebreak\\n\\n")
+
+            with open(fragments_dir / (sha1 + ".md"), "r", encoding="utf-8") as fragment:
+                shutil.copyfileobj(fragment, output, BUFFER_SIZE)
+    os.replace(temp_path, output_path)
+
+def compile_book(project_dir, output_file="export/livre_complet.md", force=False):
+    \"\"\"Compile tous les chapitres en un seul document.\"\"\"
+    project_dir = Path(project_dir)
+    output_path = project_dir / output_file
+    cache_dir = project_dir / CACHE_DIR
+
+    # Créer le répertoire de sortie si nécessaire
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    # Lire le fichier index pour les métadonnées
+    title, author = get_metadata(project_dir)
+
+    manifest, chapter_files, rebuilt = update_fragments(project_dir, force)
+    fragments = [manifest["chapters"][chapter_file]["sha1"] for chapter_file in chapter_files]
+
+    # Le livre ne dépend que des métadonnées et des fragments, dans l'ordre
+    key = build_key("md", title, author, fragments)
+    if not force and manifest["outputs"].get(output_file) == key and output_path.exists():
+        save_manifest(cache_dir, manifest)
+        print(f"Livre inchangé: {output_path}")
+        return output_path
+
+    write_markdown(output_path, cache_dir / "fragments", title, author, fragments)
+
+    manifest["outputs"][output_file] = key
+    save_manifest(cache_dir, manifest)
+
+    print(f"Livre compilé avec succès: {output_path} ({rebuilt} chapitre(s) retraité(s) sur {len(fragments)})")
     return output_path
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Compile tous les chapitres en un seul document.")
     parser.add_argument("project_dir", default=".", nargs="?", help="Répertoire du projet (par défaut: répertoire courant)")
     parser.add_argument("-o", "--output", default="export/livre_complet.md", help="Chemin du fichier de sortie (par défaut: export/livre_complet.md)")
-    
+    parser.add_argument("--force", action="store_true", help="Retraiter tous les chapitres, sans utiliser le cache")
+
     args = parser.parse_args()
-    
-    output_path = compile_book(args.project_dir, args.output)
+
+    output_path = compile_book(args.project_dir, args.output, args.force)
     print(f"Pour générer un PDF: pandoc -s {output_path} -o {str(output_path).replace('.md', '.pdf')} --pdf-engine=xelatex")
-    print(f"Pour générer un EPUB: pandoc -s {output_path} -o {str(output_path).replace('.md', '.epub')} --epub-cover-image=media/cover.jpg")
+    print(f"Pour générer HTML et EPUB: python scripts/export_book.py {args.project_dir}")
+""",
+
+        "export_book.py": """#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+\"\"\"
+Exporte le livre en Markdown, HTML et EPUB
+
+L'export suit un petit graphe de dépendances:
+chapitres -> fragments normalisés (cache de compile_book.py)
+          -> fragments HTML (un par chapitre, en cache eux aussi)
+          -> livre Markdown, livre HTML, livre EPUB.
+Les fragments HTML des chapitres modifiés, puis les formats demandés, sont
+produits en parallèle par des processus distincts. Un format n'est régénéré
+que si ses métadonnées ou l'un de ses fragments ont changé. L'EPUB est écrit
+chapitre par chapitre dans l'archive zip: le livre entier n'est jamais chargé
+en mémoire.
+\"\"\"
+
+import os
+import re
+import html
+import uuid
+import shutil
+import zipfile
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from compile_book import (BUFFER_SIZE, CACHE_DIR, build_key, get_metadata, save_manifest,
+                          update_fragments, write_markdown)
+
+# Format -> fichier exporté
+TARGETS = {
+    "md": "export/livre_complet.md",
+    "html": "export/livre_complet.html",
+    "epub": "export/livre_complet.epub",
+}
+
+# À incrémenter quand markdown_to_html change, pour invalider les fragments HTML
+HTML_VERSION = "1"
+
+HEADING = re.compile(r"^(#{1,6})[ \\t]+(.*?)[ \\t#]*$")
+FENCE = re.compile(r"^[ \\t]*(```|~~~)")
+LIST_ITEM = re.compile(r"^[ \\t]*(?:([-*+])|(\\d+)[.)])[ \\t]+(.*)$")
+RULE = re.compile(r"^[ \\t]*([-*_])(?:[ \\t]*\\1){2,}[ \\t]*$")
+
+# Règles inline appliquées au texte déjà échappé
+INLINE_RULES = [
+    (re.compile(r"!\\[([^\\]]*)\\]\\(([^)\\s\\"]+)\\)"), r'<img src="\\2" alt="\\1"/>'),
+    (re.compile(r"\\[\\[([^\\]|]+)\\|([^\\]]+)\\]\\]"), r"\\2"),
+    (re.compile(r"\\[\\[([^\\]]+)\\]\\]"), r"\\1"),
+    (re.compile(r"\\[([^\\]]+)\\]\\(([^)\\s\\"]+)\\)"), r'<a href="\\2">\\1</a>'),
+    (re.compile(r"\\*\\*(.+?)\\*\\*"), r"<strong>\\1</strong>"),
+    (re.compile(r"(?<![\\w*])\\*(?!\\s)(.+?)(?<!\\s)\\*(?![\\w*])"), r"<em>\\1</em>"),
+    (re.compile(r"(?<!\\w)_(?!\\s)(.+?)(?<!\\s)_(?!\\w)"), r"<em>\\1</em>"),
+]
+INLINE_CODE = re.compile(r"`([^`]+)`")
+
+def inline_html(text):
+    \"\"\"Convertit le Markdown inline d'une ligne en HTML (code, images, liens, gras, italique).\"\"\"
+    parts = INLINE_CODE.split(text)
+    for position, part in enumerate(parts):
+        part = html.escape(part, quote=False)
+        if position % 2:
+            parts[position] = f"<code>{part}</code>"
+            continue
+        for pattern, replacement in INLINE_RULES:
+            part = pattern.sub(replacement, part)
+        parts[position] = part
+    return "".join(parts)
+
+def markdown_to_html(lines):
+    \"\"\"
+    Convertit un fragment Markdown en HTML (XHTML bien formé), ligne par ligne.
+
+    Gère titres, paragraphes, listes, citations, blocs de code et filets.
+    \"\"\"
+    paragraph = []
+    block = None  # "ul", "ol", "blockquote", "pre" ou None
+
+    def close_paragraph():
+        if paragraph:
+            yield "<p>" + "\\n".join(paragraph) + "</p>\\n"
+            paragraph.clear()
+
+    def close_block():
+        nonlocal block
+        yield from close_paragraph()
+        if block == "blockquote":
+            yield "</blockquote>\\n"
+        elif block in ("ul", "ol"):
+            yield f"</{block}>\\n"
+        block = None
+
+    for line in lines:
+        line = line.rstrip("\\n")
+
+        if block == "pre":
+            if FENCE.match(line):
+                yield "</code></pre>\\n"
+                block = None
+            else:
+                yield html.escape(line, quote=False) + "\\n"
+            continue
+        if FENCE.match(line):
+            yield from close_block()
+            yield "<pre><code>"
+            block = "pre"
+            continue
+
+        if not line.strip() or line.strip() == "\\\\pagebreak":
+            yield from close_paragraph() if block == "blockquote" else close_block()
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            yield from close_block()
+            level = len(heading.group(1))
+            yield f"<h{level}>{inline_html(heading.group(2))}</h{level}>\\n"
+            continue
+
+        if RULE.match(line):
+            yield from close_block()
+            yield "<hr/>\\n"
+            continue
+
+        if line.startswith(">"):
+            if block != "blockquote":
+                yield from close_block()
+                yield "<blockquote>\\n"
+                block = "blockquote"
+            text = line[1:].strip()
+            if text:
+                paragraph.append(inline_html(text))
+            else:
+                yield from close_paragraph()
+            continue
+
+        item = LIST_ITEM.match(line)
+        if item:
+            kind = "ul" if item.group(1) else "ol"
+            if block != kind:
+                yield from close_block()
+                yield f"<{kind}>\\n"
+                block = kind
+            yield f"<li>{inline_html(item.group(3))}</li>\\n"
+            continue
+
+        if block is not None:
+            yield from close_block()
+        paragraph.append(inline_html(line.strip()))
+
+    if block == "pre":
+        yield "</code></pre>\\n"
+        block = None
+    yield from close_block()
+
+def render_html_fragment(task):
+    \"\"\"
+    Convertit le fragment Markdown d'un chapitre en fragment HTML (exécuté dans un processus séparé).
+
+    Args:
+        task (tuple): (dossier des fragments, empreinte du fragment)
+
+    Returns:
+        dict: {'sha1': empreinte, 'error': message ou None}
+    \"\"\"
+    fragments_dir, sha1 = task
+    html_path = fragments_dir / f"{sha1}.{HTML_VERSION}.html"
+    temp_path = html_path.with_suffix(".tmp")
+    try:
+        with open(fragments_dir / (sha1 + ".md"), "r", encoding="utf-8") as source, \\
+                open(temp_path, "w", encoding="utf-8", buffering=BUFFER_SIZE) as output:
+            output.writelines(markdown_to_html(source))
+        os.replace(temp_path, html_path)
+    except (OSError, ValueError) as e:
+        return {'sha1': sha1, 'error': str(e)}
+    return {'sha1': sha1, 'error': None}
+
+def chapter_title(fragment_path, default):
+    \"\"\"Titre du chapitre: premier titre Markdown de son fragment.\"\"\"
+    with open(fragment_path, "r", encoding="utf-8") as f:
+        for line in f:
+            heading = HEADING.match(line)
+            if heading:
+                return html.unescape(re.sub(r"<[^>]+>", "", inline_html(heading.group(2))))
+    return default
+
+def write_html(output_path, fragments_dir, title, author, fragments):
+    \"\"\"Écrit le livre HTML au fil de l'eau à partir des fragments HTML.\"\"\"
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8", buffering=BUFFER_SIZE) as output:
+        output.write(f\"\"\"<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8"/>
+<meta name="author" content="{html.escape(author)}"/>
+<title>{html.escape(title)}</title>
+<style>section {{ page-break-before: always; }}</style>
+</head>
+<body>
+\"\"\")
+        for sha1 in fragments:
+            output.write("<section>\\n")
+            with open(fragments_dir / f"{sha1}.{HTML_VERSION}.html", "r", encoding="utf-8") as fragment:
+                shutil.copyfileobj(fragment, output, BUFFER_SIZE)
+            output.write("</section>\\n")
+        output.write("</body>\\n</html>\\n")
+    os.replace(temp_path, output_path)
+
+def xhtml_page(title, body=""):
+    \"\"\"Page XHTML d'un EPUB (en-tête et pied, autour du corps).\"\"\"
+    head = f\"\"\"<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" xml:lang="fr" lang="fr">
+<head>
+<title>{html.escape(title)}</title>
+</head>
+<body>
+\"\"\"
+    return head + body, "</body>\\n</html>\\n"
+
+def write_epub(output_path, fragments_dir, title, author, fragments, cover_path=None):
+    \"\"\"
+    Écrit le livre EPUB 3: une page XHTML par chapitre, copiée dans l'archive
+    depuis son fragment HTML au fil de l'eau.
+    \"\"\"
+    titles = [chapter_title(fragments_dir / (sha1 + ".md"), f"Chapitre {number}")
+              for number, sha1 in enumerate(fragments, 1)]
+    identifier = uuid.uuid5(uuid.NAMESPACE_URL, f"{title}/{author}")
+    modified = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as epub:
+        # Le type MIME doit être la première entrée, non compressée
+        epub.writestr(zipfile.ZipInfo("mimetype"), "application/epub+zip", zipfile.ZIP_STORED)
+        epub.writestr("META-INF/container.xml", \"\"\"<?xml version="1.0" encoding="utf-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+<rootfiles>
+<rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+</rootfiles>
+</container>
+\"\"\")
+
+        items = []
+        for number, sha1 in enumerate(fragments, 1):
+            name = f"chapitre-{number:03d}.xhtml"
+            items.append(f'<item id="c{number}" href="{name}" media-type="application/xhtml+xml"/>')
+            head, tail = xhtml_page(titles[number - 1])
+            with epub.open(f"OEBPS/{name}", "w") as page, \\
+                    open(fragments_dir / f"{sha1}.{HTML_VERSION}.html", "rb") as fragment:
+                page.write(head.encode("utf-8"))
+                shutil.copyfileobj(fragment, page, BUFFER_SIZE)
+                page.write(tail.encode("utf-8"))
+
+        cover_meta = ""
+        if cover_path is not None:
+            epub.write(cover_path, "OEBPS/cover.jpg")
+            items.append('<item id="cover" href="cover.jpg" media-type="image/jpeg" properties="cover-image"/>')
+            cover_meta = '<meta name="cover" content="cover"/>\\n'
+
+        toc = "".join(f'<li><a href="chapitre-{number:03d}.xhtml">{html.escape(chapter)}</a></li>\\n'
+                      for number, chapter in enumerate(titles, 1))
+        head, tail = xhtml_page(title, f'<nav epub:type="toc" id="toc">\\n<h1>{html.escape(title)}</h1>\\n<ol>\\n{toc}</ol>\\n</nav>\\n')
+        epub.writestr("OEBPS/nav.xhtml", head + tail)
+
+        spine = "".join(f'<itemref idref="c{number}"/>\\n' for number in range(1, len(fragments) + 1))
+        epub.writestr("OEBPS/content.opf", f\"\"\"<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="bookid" xml:lang="fr">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:identifier id="bookid">urn:uuid:{identifier}</dc:identifier>
+<dc:title>{html.escape(title)}</dc:title>
+<dc:creator>{html.escape(author)}</dc:creator>
+<dc:language>fr</dc:language>
+<meta property="dcterms:modified">{modified}</meta>
+{cover_meta}</metadata>
+<manifest>
+<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
+{chr(10).join(items)}
+</manifest>
+<spine>
+{spine}</spine>
+</package>
+\"\"\")
+    os.replace(temp_path, output_path)
+
+def render_target(task):
+    \"\"\"
+    Produit un format du livre (exécuté dans un processus séparé).
+
+    Args:
+        task (tuple): (format, projet, fichier exporté, titre, auteur, fragments)
+
+    Returns:
+        dict: {'target': format, 'path': chemin, 'error': message ou None}
+    \"\"\"
+    target, project_dir, output_file, title, author, fragments = task
+    output_path = project_dir / output_file
+    fragments_dir = project_dir / CACHE_DIR / "fragments"
+    try:
+        os.makedirs(output_path.parent, exist_ok=True)
+        if target == "md":
+            write_markdown(output_path, fragments_dir, title, author, fragments)
+        elif target == "html":
+            write_html(output_path, fragments_dir, title, author, fragments)
+        else:
+            cover_path = project_dir / "media" / "cover.jpg"
+            write_epub(output_path, fragments_dir, title, author, fragments,
+                       cover_path if cover_path.exists() else None)
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        return {'target': target, 'path': output_path, 'error': str(e)}
+    return {'target': target, 'path': output_path, 'error': None}
+
+def run_tasks(function, tasks, jobs):
+    \"\"\"Exécute les tâches, en parallèle si plusieurs processus sont demandés.\"\"\"
+    if jobs <= 1 or len(tasks) <= 1:
+        return [function(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        return list(executor.map(function, tasks, chunksize=1))
+
+def export_book(project_dir, targets=tuple(TARGETS), jobs=None, force=False):
+    \"\"\"
+    Exporte le livre dans les formats demandés.
+
+    Returns:
+        dict: Format -> chemin du fichier exporté (formats en échec exclus)
+    \"\"\"
+    project_dir = Path(project_dir).resolve()
+    cache_dir = project_dir / CACHE_DIR
+    fragments_dir = cache_dir / "fragments"
+    jobs = jobs or os.cpu_count() or 1
+
+    # Étape 1: chapitres -> fragments normalisés
+    title, author = get_metadata(project_dir)
+    manifest, chapter_files, rebuilt = update_fragments(project_dir, force)
+    fragments = [manifest["chapters"][chapter_file]["sha1"] for chapter_file in chapter_files]
+    print(f"Fragments: {rebuilt} chapitre(s) retraité(s) sur {len(fragments)}")
+
+    # Étape 2: fragments -> fragments HTML, pour ceux qui manquent
+    failed = set()
+    if "html" in targets or "epub" in targets:
+        missing = sorted({sha1 for sha1 in fragments
+                          if force or not (fragments_dir / f"{sha1}.{HTML_VERSION}.html").exists()})
+        for result in run_tasks(render_html_fragment, [(fragments_dir, sha1) for sha1 in missing], jobs):
+            if result['error']:
+                print(f"Erreur lors de la conversion HTML d'un fragment: {result['error']}")
+                failed.add(result['sha1'])
+
+    # Étape 3: formats, chacun seulement si ses entrées ont changé
+    exported = {}
+    tasks = []
+    for target in targets:
+        output_file = TARGETS[target]
+        output_path = project_dir / output_file
+        inputs = [title, author, fragments]
+        if target != "md":
+            inputs.append(HTML_VERSION)
+        if target == "epub" and (project_dir / "media" / "cover.jpg").exists():
+            inputs.append((project_dir / "media" / "cover.jpg").stat().st_mtime_ns)
+        key = build_key(target, *inputs)
+        if target != "md" and failed:
+            print(f"! {target.upper()} non exporté: conversion HTML incomplète")
+        elif not force and manifest["outputs"].get(output_file) == key and output_path.exists():
+            print(f"{target.upper()} inchangé: {output_path}")
+            exported[target] = output_path
+        else:
+            tasks.append(((target, project_dir, output_file, title, author, fragments), key))
+
+    for (task, key), result in zip(tasks, run_tasks(render_target, [task for task, key in tasks], jobs)):
+        if result['error']:
+            print(f"Erreur lors de l'export {result['target'].upper()}: {result['error']}")
+            continue
+        manifest["outputs"][task[2]] = key
+        exported[result['target']] = result['path']
+        print(f"✓ {result['target'].upper()} exporté: {result['path']}")
+
+    save_manifest(cache_dir, manifest)
+    return exported
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exporte le livre en Markdown, HTML et EPUB.")
+    parser.add_argument("project_dir", default=".", nargs="?", help="Répertoire du projet (par défaut: répertoire courant)")
+    parser.add_argument("-f", "--formats", nargs="+", choices=sorted(TARGETS), default=list(TARGETS), help="Formats à exporter (par défaut: tous)")
+    parser.add_argument("-j", "--jobs", type=int, help="Nombre de processus (par défaut: nombre de processeurs)")
+    parser.add_argument("--force", action="store_true", help="Tout régénérer, sans utiliser le cache")
+
+    args = parser.parse_args()
+
+    export_book(args.project_dir, args.formats, args.jobs, args.force)
 """,
 
         "extract_for_claude.py": """#!/usr/bin/env python3
@@ -590,69 +1122,231 @@ if __name__ == "__main__":
 
 \"\"\"
 Corrige la typographie française dans un fichier Markdown
+
+Le texte est parcouru une seule fois, ligne par ligne. Le frontmatter YAML
+et les blocs de code (délimités ou indentés) sont recopiés tels quels; dans
+les autres lignes, une
+seule expression reconnaît à la fois les zones protégées (code inline,
+liens wiki, cibles des liens, URL, balises HTML, notes et définitions de
+liens), recopiées telles quelles, et les corrections à appliquer au reste du
+texte:
+- espace fine insécable avant ; ! ? et espace insécable avant :
+- guillemets français « » avec espaces insécables, qu'ils viennent de
+  guillemets droits ou soient déjà présents
+- tiret cadratin pour les dialogues
+- points de suspension
+- espace fine insécable entre les milliers
 \"\"\"
 
 import os
 import re
+import shutil
 import argparse
 
-def fix_french_typography(text):
+NBSP = "\\u00a0"      # Espace insécable
+NNBSP = "\\u202f"     # Espace fine insécable
+SPACES = " \\t" + NBSP + NNBSP
+
+FENCE = re.compile(r"^[ \\t]*(```|~~~)")
+INDENTED = re.compile(r"^(?: {4}|\\t)")
+
+# Zones protégées d'une ligne et règles typographiques, en une seule expression.
+# Les espaces qui précèdent un guillemet ou une ponctuation double sont traitées
+# dans le texte qui précède: chaque élément commence par l'un des caractères de
+# l'anticipation initiale, ce qui évite d'essayer toutes les règles à chaque position.
+TOKENS = re.compile(
+    r"(?=[\\[\\]`<hfw.\\"«»\\d;:!?])(?:"
+    r"(?P<protected>"
+    r"^[ \\t]*\\[[^\\]]+\\]:.*$"              # Définition de lien ou de note: [id]: cible
+    r"|(`+).*?\\2"                         # Code inline
+    r"|\\[\\[[^\\]]*\\]\\]"                    # Lien wiki
+    r"|\\]\\([^)]*\\)"                       # Cible d'un lien ou d'une image
+    r"|\\[\\^[^\\]]*\\]"                      # Appel de note
+    r"|<!--.*?-->|</?[A-Za-z][^>]*>"      # Commentaire et balise HTML
+    r"|<[a-z]+:[^>\\s]*>"                  # Lien automatique
+    r"|\\b(?:https?|ftp)://\\S*[^\\s.,;:!?…'\\")\\]»]"  # URL, sans la ponctuation qui la suit
+    r"|\\bwww\\.\\S*[^\\s.,;:!?…'\\")\\]»]"
+    r")"
+    r"|(?P<ellipsis>\\.\\.\\.)"
+    r"|(?P<quote>\\"[ \\t]*)"
+    r"|(?P<guillemet>«[ \\t\\u00a0\\u202f]*|»)"
+    r"|(?P<thousands>(?<!\\d)\\d{1,3}(?: \\d{3})+(?!\\d))"
+    r"|(?P<punctuation>[;:!?]+)"
+    r")"
+)
+
+# Caractères qui peuvent suivre une ponctuation double (sinon: 12:30, a:b, !important...)
+AFTER_PUNCTUATION = set(SPACES + "»\\"')]*_.,…")
+
+class TypographyCorrector(object):
+    \"\"\"
+    Correcteur typographique ligne par ligne: feed() pour chaque ligne du
+    texte, dans l'ordre. L'état (frontmatter, bloc de code, guillemet
+    ouvert) est conservé d'une ligne à l'autre.
+    \"\"\"
+
+    def __init__(self, dialogues=True):
+        self.dialogues = dialogues
+        self.line_number = 0
+        self.in_frontmatter = False
+        self.fence = None
+        self.indented = False
+        self.after_blank = True
+        self.quote_open = False
+
+    def feed(self, line):
+        \"\"\"Retourne la ligne corrigée (avec sa fin de ligne).\"\"\"
+        self.line_number += 1
+        stripped = line.strip()
+
+        # Frontmatter YAML en tête de fichier
+        if self.line_number == 1 and stripped == "---":
+            self.in_frontmatter = True
+            return line
+        if self.in_frontmatter:
+            if stripped in ("---", "..."):
+                self.in_frontmatter = False
+            return line
+
+        # Blocs de code délimités
+        fence = FENCE.match(line)
+        if self.fence is not None:
+            if fence and fence.group(1) == self.fence:
+                self.fence = None
+            return line
+
+        # Un guillemet non fermé ne déborde pas sur le paragraphe suivant
+        if not stripped:
+            self.quote_open = False
+            self.after_blank = True
+            return line
+
+        # Blocs de code indentés (4 espaces ou une tabulation), après une ligne vide
+        if INDENTED.match(line) and (self.after_blank or self.indented):
+            self.indented = True
+            return line
+        self.indented = False
+        self.after_blank = False
+
+        if fence:
+            self.fence = fence.group(1)
+            return line
+
+        body = line.rstrip("\\r\\n")
+        ending = line[len(body):]
+
+        if self.dialogues and body.startswith("- "):
+            body = "—" + NBSP + body[2:].lstrip()
+
+        parts = []
+        position = 0
+        for match in TOKENS.finditer(body):
+            # Une zone protégée est recopiée avec le texte qui la suit
+            if match.lastgroup != "protected":
+                parts.append(body[position:match.start()])
+                parts.append(self._replace(match, body, parts))
+                position = match.end()
+        parts.append(body[position:])
+        return "".join(parts) + ending
+
+    def _replace(self, match, text, parts):
+        \"\"\"Correction d'un élément; parts[-1] est le texte qui le précède, dont
+        les espaces finales peuvent être retirées.\"\"\"
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "ellipsis":
+            return "…"
+
+        if kind == "thousands":
+            return value.replace(" ", NNBSP)
+
+        after = text[match.end()] if match.end() < len(text) else ""
+
+        if kind == "guillemet":
+            if value[0] == "«":
+                self.quote_open = True
+                return "«" + NBSP if after else "«"
+            self.quote_open = False
+            if not text[:match.start()].strip(SPACES):
+                # Guillemet fermant en début de ligne
+                return "»"
+            parts[-1] = parts[-1].rstrip(SPACES)
+            return NBSP + "»"
+
+        if kind == "quote":
+            gap = parts[-1].rstrip(" \\t")
+            leading = len(parts[-1]) - len(gap)
+            before = text[match.start() - leading - 1] if match.start() > leading else ""
+            trailing = value[1:]
+            # Le contexte l'emporte sur l'état: "mot → ouvrant, mot" → fermant
+            if (not leading and before and not before.isspace() and before not in "([«—") or (trailing and not after):
+                opening = False
+            elif (leading or not before or before in "([«—") and after and not trailing:
+                opening = True
+            else:
+                opening = not self.quote_open
+            self.quote_open = opening
+            if opening:
+                return "«" + NBSP
+            parts[-1] = gap
+            return NBSP + "»" + trailing
+
+        # Ponctuation double: espace insécable avant, seulement après un mot
+        # et devant une espace, la fin de ligne ou une ponctuation fermante
+        gap = parts[-1].rstrip(SPACES)
+        leading = len(parts[-1]) - len(gap)
+        before = text[match.start() - leading - 1] if match.start() > leading else ""
+        if match.start() == 0:
+            return value
+        if after and after not in AFTER_PUNCTUATION:
+            return value
+        if before in "([«" + NBSP and not leading:
+            return value
+        parts[-1] = gap
+        return (NBSP if value[0] == ":" else NNBSP) + value
+
+def correct_lines(lines, dialogues=True):
+    \"\"\"
+    Corrige la typographie d'un texte ligne par ligne, au fil de la lecture.
+
+    Args:
+        lines (iterable): Lignes du texte avec leurs fins de ligne (fichier ouvert, générateur...)
+        dialogues (bool): Remplacer les tirets en début de ligne par des tirets de dialogue
+
+    Returns:
+        generator: Lignes corrigées
+    \"\"\"
+    corrector = TypographyCorrector(dialogues)
+    for line in lines:
+        yield corrector.feed(line)
+
+def fix_french_typography(text, dialogues=True):
     \"\"\"Corrige la typographie française dans un texte.\"\"\"
-    # Liste des transformations à appliquer
-    transformations = [
-        # Espaces insécables avant les signes doubles
-        (r'(?<!\s)(:)', r' \1'),  # Avant les deux-points
-        (r'(?<!\s)(;)', r' \1'),  # Avant le point-virgule
-        (r'(?<!\s)(!)', r' \1'),  # Avant le point d'exclamation
-        (r'(?<!\s)(\?)', r' \1'),  # Avant le point d'interrogation
-        
-        # Guillemets français
-        (r'"([^"]*)"', r'« \1 »'),  # Guillemets français avec espaces insécables
-        
-        # Tirets pour les dialogues
-        (r'^- ', r'— '),  # Tiret cadratin pour les dialogues
-        
-        # Correction des points de suspension
-        (r'\.\.\.', r'…'),  # Remplacer trois points par le caractère points de suspension
-        
-        # Espaces insécables dans les nombres
-        (r'(\d{1,3}) (\d{3})', r'\1 \2'),  # Espace insécable pour les milliers
-    ]
-    
-    # Appliquer toutes les transformations
-    for pattern, replacement in transformations:
-        text = re.sub(pattern, replacement, text, flags=re.MULTILINE)
-    
-    return text
+    return "".join(correct_lines(text.splitlines(keepends=True), dialogues))
 
-def fix_file_typography(file_path, output_path=None, backup=True):
-    \"\"\"Corrige la typographie française dans un fichier.\"\"\"
+def fix_file_typography(file_path, output_path=None, backup=True, dialogues=True):
+    \"\"\"Corrige la typographie française dans un fichier, sans le charger entièrement en mémoire.\"\"\"
     if not os.path.exists(file_path):
         print(f"Erreur: Le fichier {file_path} n'existe pas.")
         return
-    
-    # Lire le contenu du fichier
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Corriger la typographie
-    corrected_content = fix_french_typography(content)
-    
+
     # Créer une sauvegarde si demandé
     if backup:
         backup_path = f"{file_path}.bak"
-        with open(backup_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        shutil.copyfile(file_path, backup_path)
         print(f"✓ Sauvegarde créée: {backup_path}")
-    
-    # Écrire le contenu corrigé
+
+    # Écrire le contenu corrigé à côté de la destination, puis la remplacer
+    target_path = output_path or file_path
+    temp_path = f"{target_path}.tmp"
+    with open(file_path, "r", encoding="utf-8", newline="") as source, \\
+            open(temp_path, "w", encoding="utf-8", newline="") as output:
+        output.writelines(correct_lines(source, dialogues))
+    os.replace(temp_path, target_path)
+
     if output_path:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(corrected_content)
         print(f"✓ Fichier corrigé écrit: {output_path}")
     else:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(corrected_content)
         print(f"✓ Fichier corrigé: {file_path}")
 
 if __name__ == "__main__":
@@ -660,10 +1354,11 @@ if __name__ == "__main__":
     parser.add_argument("file_path", help="Chemin du fichier à corriger")
     parser.add_argument("-o", "--output", help="Chemin du fichier de sortie (par défaut: remplace le fichier d'origine)")
     parser.add_argument("--no-backup", action="store_true", help="Ne pas créer de sauvegarde du fichier original")
-    
+    parser.add_argument("--no-dialogues", action="store_true", help="Conserver les tirets en début de ligne (listes)")
+
     args = parser.parse_args()
-    
-    fix_file_typography(args.file_path, args.output, not args.no_backup)
+
+    fix_file_typography(args.file_path, args.output, not args.no_backup, not args.no_dialogues)
 """
     }
     
@@ -686,7 +1381,8 @@ if __name__ == "__main__":
 def main():
     parser = argparse.ArgumentParser(description="Initialise un projet littéraire et importe un document existant.")
     parser.add_argument("--root-dir", "-d", default=".", help="Répertoire racine du projet (par défaut: répertoire courant)")
-    parser.add_argument("--document", "-f", help="Chemin du document à importer")
+    parser.add_argument("--document", "-f", help="Document à importer (txt, md, docx, odt, epub, html), ou dossier ou motif glob entre guillemets (ex: 'brouillons/*.docx') pour importer plusieurs documents en parallèle")
+    parser.add_argument("--jobs", "-j", type=int, help="Nombre de processus pour importer plusieurs documents (défaut: nombre de processeurs)")
     parser.add_argument("--title", "-t", default="Mon Projet Littéraire", help="Titre du projet")
     parser.add_argument("--author", "-a", default="Auteur", help="Nom de l'auteur")
     parser.add_argument("--no-split", action="store_true", help="Ne pas diviser le document en chapitres")
@@ -710,7 +1406,13 @@ def main():
     
     # Importation du document s'il est spécifié
     if args.document:
-        import_document(args.root_dir, args.document, args.title, args.author, not args.no_split)
+        documents = find_documents(args.document)
+        if len(documents) == 1:
+            import_document(args.root_dir, documents[0], args.title, args.author, not args.no_split)
+        elif documents:
+            import_documents(args.root_dir, documents, args.title, args.author, not args.no_split, args.jobs)
+        else:
+            print(f"Erreur: Aucun document ne correspond à {args.document}.")
     
     print("\n✓ Initialisation du projet terminée !")
     print
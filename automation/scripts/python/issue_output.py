@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sortie des problèmes détectés dans des formats exploitables par d'autres outils.
+
+- jsonl: un objet JSON par ligne, écrit dès que le problème est produit;
+- sarif: document SARIF 2.1.0 (annotations de revue de code, CI), dont les
+  résultats sont écrits un par un entre l'en-tête et la fin du document.
+
+Les validateurs accumulent leurs problèmes avec append/extend: un IssueStream
+passé à la place d'une liste transmet chaque problème aux rédacteurs au fil
+de l'eau et peut ne pas les conserver, pour une mémoire constante quel que
+soit le nombre de problèmes.
+"""
+
+import sys
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger('structure_verification')
+
+OUTPUT_FORMATS = ('markdown', 'jsonl', 'sarif')
+
+DEFAULT_OUTPUT_FILES = {
+    'markdown': 'structure-report.md',
+    'jsonl': 'structure-report.jsonl',
+    'sarif': 'structure-report.sarif',
+}
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+
+class IssueWriter(object):
+    """
+    Rédacteur de problèmes vers un fichier, ou la sortie standard pour '-'.
+    """
+
+    def __init__(self, project_path, output_file):
+        self.project_path = project_path
+        self.output_file = output_file
+        self.output_path = None
+        self.stream = None
+        self.count = 0
+
+    def open(self):
+        """Ouvre la sortie et écrit l'éventuel en-tête."""
+        if self.output_file == '-':
+            self.stream = sys.stdout
+        else:
+            self.output_path = Path(self.project_path) / self.output_file
+            self.stream = open(self.output_path, 'w', encoding='utf-8')
+        self.write_header()
+        return self
+
+    def write_header(self):
+        pass
+
+    def write_footer(self):
+        pass
+
+    def write(self, issue):
+        """Écrit un problème."""
+        raise NotImplementedError
+
+    def close(self):
+        """Termine le document et ferme la sortie."""
+        if self.stream is None:
+            return
+        self.write_footer()
+        if self.stream is sys.stdout:
+            self.stream.flush()
+        else:
+            self.stream.close()
+            logger.info(f"{self.count} problèmes écrits dans {self.output_path}")
+        self.stream = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JsonlIssueWriter(IssueWriter):
+    """
+    Un problème par ligne, au format JSON.
+    """
+
+    def write(self, issue):
+        self.stream.write(json.dumps(issue, ensure_ascii=False))
+        self.stream.write('\n')
+        self.count += 1
+
+
+class SarifIssueWriter(IssueWriter):
+    """
+    Document SARIF 2.1.0 à un seul « run »; chaque problème devient un résultat.
+    """
+
+    def write_header(self):
+        header = {
+            '$schema': SARIF_SCHEMA,
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {'driver': {'name': 'verify-structure', 'rules': []}},
+                'originalUriBaseIds': {'PROJECTROOT': {'uri': Path(self.project_path).resolve().as_uri() + '/'}},
+                'results': [],
+            }],
+        }
+        # Écrire le document jusqu'à l'ouverture de la liste des résultats
+        text = json.dumps(header, ensure_ascii=False)
+        self.stream.write(text[:text.rindex('[]')] + '[\n')
+
+    def write(self, issue):
+        result = {
+            'ruleId': issue['type'],
+            'level': 'error' if issue['level'] == 'error' else 'warning',
+            'message': {'text': issue['message']},
+        }
+        location = {'artifactLocation': {'uri': issue['path'], 'uriBaseId': 'PROJECTROOT'}}
+        if issue.get('line'):
+            location['region'] = {'startLine': issue['line'], 'startColumn': issue.get('column', 1)}
+        result['locations'] = [{'physicalLocation': location}]
+
+        if self.count:
+            self.stream.write(',\n')
+        self.stream.write(json.dumps(result, ensure_ascii=False))
+        self.count += 1
+
+    def write_footer(self):
+        self.stream.write('\n]}]}\n')
+
+
+WRITERS = {
+    'jsonl': JsonlIssueWriter,
+    'sarif': SarifIssueWriter,
+}
+
+
+def create_issue_writer(output_format, project_path, output_file):
+    """
+    Crée le rédacteur correspondant à un format machine.
+
+    Args:
+        output_format (str): 'jsonl' ou 'sarif'
+        project_path (Path): Chemin de base du projet
+        output_file (str): Fichier de sortie relatif au projet, ou '-'
+
+    Returns:
+        IssueWriter: Rédacteur (à ouvrir)
+    """
+    return WRITERS[output_format](project_path, output_file)
+
+
+def write_issues(output_format, project_path, issues, output_file):
+    """
+    Écrit une liste complète de problèmes dans un format machine.
+
+    Args:
+        output_format (str): 'jsonl' ou 'sarif'
+        project_path (Path): Chemin de base du projet
+        issues (iterable): Problèmes à écrire
+        output_file (str): Fichier de sortie relatif au projet, ou '-'
+
+    Returns:
+        str: Chemin du fichier écrit
+    """
+    with create_issue_writer(output_format, project_path, output_file) as writer:
+        for issue in issues:
+            writer.write(issue)
+    return str(writer.output_path or output_file)
+
+
+class IssueStream(object):
+    """
+    Remplaçant d'une liste de problèmes: chaque problème ajouté est compté et
+    transmis aux rédacteurs, et n'est conservé que si keep est vrai.
+    """
+
+    def __init__(self, writers=(), keep=True):
+        self.writers = list(writers)
+        self.keep = keep
+        self.issues = []
+        self.error_count = 0
+        self.warning_count = 0
+
+    def append(self, issue):
+        if issue['level'] == 'error':
+            self.error_count += 1
+        elif issue['level'] == 'warning':
+            self.warning_count += 1
+        for writer in self.writers:
+            writer.write(issue)
+        if self.keep:
+            self.issues.append(issue)
+
+    def extend(self, issues):
+        for issue in issues:
+            self.append(issue)
+
+    def __len__(self):
+        return self.error_count + self.warning_count
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stockage indexé des problèmes détectés.
+
+Les problèmes sont rangés dans une table SQLite en mémoire dont les colonnes
+sont calculées une seule fois, à l'ajout: niveau, type, fichier, cible du
+lien cassé et son premier segment, catégorie du plan de correction et score
+de priorité. Regroupements par type, par fichier ou par motif, préfixes de
+liens fréquents, meilleurs problèmes et pages du rapport sont alors des
+requêtes sur index, sans reparcourir la liste ni analyser les messages.
+
+Les problèmes eux-mêmes (dictionnaires) restent en mémoire Python et sont
+rendus tels quels, dans l'ordre où ils ont été ajoutés à égalité de tri.
+"""
+
+import re
+import sqlite3
+import logging
+from itertools import groupby
+
+logger = logging.getLogger('structure_verification')
+
+# Nombre de problèmes lus par requête lors des parcours paginés
+PAGE_SIZE = 1000
+
+# Poids de priorité de chaque type de problème
+PRIORITY_WEIGHTS = {
+    'missing_required': 100,    # Éléments requis manquants (plus haute priorité)
+    'missing_template': 90,     # Templates manquants
+    'type_mismatch': 80,        # Type incorrect (fichier vs dossier)
+    'frontmatter_parsing_error': 70,  # Erreurs de parsing YAML
+    'missing_required_field': 60,     # Champs requis manquants
+    'broken_link': 50,          # Liens cassés
+    'invalid_tags': 40,         # Tags invalides
+    'missing_recommended_field': 30,  # Champs recommandés manquants
+    'missing_optional': 20,     # Éléments optionnels manquants (priorité plus basse)
+    'default': 10               # Valeur par défaut pour les autres types
+}
+
+# Catégories du plan de correction (voir group_issues_by_pattern)
+LIST_CATEGORIES = ('missing_dirs', 'missing_files', 'template_issues', 'other_issues')
+KEYED_CATEGORIES = ('broken_links', 'frontmatter_issues')
+
+# Dossier -> type de fichier pour le regroupement des problèmes de frontmatter
+FRONTMATTER_FILE_TYPES = (
+    ('personnages/', 'personnages'),
+    ('chapitres/', 'chapitres'),
+    ('structure/', 'structure'),
+    ('review/', 'review'),
+)
+
+SCHEMA = """
+CREATE TABLE issues (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    type TEXT NOT NULL,
+    path TEXT NOT NULL,
+    link TEXT,
+    link_prefix TEXT,
+    category TEXT NOT NULL,
+    group_key TEXT,
+    priority INTEGER NOT NULL
+)
+"""
+
+# Index créés à la première requête qui en a besoin: insérer puis indexer
+# est bien plus rapide que maintenir les index à chaque insertion
+INDEXES = {
+    'type': "CREATE INDEX issues_type ON issues (type, path)",
+    'path': "CREATE INDEX issues_path ON issues (path)",
+    'priority': "CREATE INDEX issues_priority ON issues (priority DESC, id)",
+    'category': "CREATE INDEX issues_category ON issues (category, group_key)",
+    'link_prefix': "CREATE INDEX issues_link_prefix ON issues (link_prefix) WHERE link_prefix IS NOT NULL",
+}
+
+
+def get_broken_link(issue):
+    """
+    Retourne la cible d'un lien cassé signalé dans un problème.
+
+    Args:
+        issue (dict): Problème de type 'broken_link'
+
+    Returns:
+        str: Cible du lien, ou None si elle ne peut être déterminée
+    """
+    if issue.get('link'):
+        return issue['link']
+
+    # Problèmes produits sans l'index des liens: extraire le chemin du message
+    link_match = re.search(r"'([^']+)'", issue['message'])
+    return link_match.group(1) if link_match else None
+
+
+def priority_score(issue):
+    """
+    Score de priorité d'un problème: poids du type, doublé pour une erreur,
+    plus un bonus pour les fichiers de structure, templates et index.
+
+    Args:
+        issue (dict): Problème détecté
+
+    Returns:
+        int: Score (plus il est élevé, plus le problème est prioritaire)
+    """
+    base_score = PRIORITY_WEIGHTS.get(issue['type'], PRIORITY_WEIGHTS['default'])
+    level_multiplier = 2 if issue['level'] == 'error' else 1
+
+    path_bonus = 0
+    if 'path' in issue:
+        if 'structure/' in issue['path']:
+            path_bonus += 20
+        elif 'templates/' in issue['path']:
+            path_bonus += 15
+        elif 'index.md' in issue['path']:
+            path_bonus += 10
+
+    return base_score * level_multiplier + path_bonus
+
+
+def issue_category(issue, link):
+    """
+    Catégorie d'un problème dans le plan de correction.
+
+    Args:
+        issue (dict): Problème détecté
+        link (str): Cible du lien pour un lien cassé (voir get_broken_link)
+
+    Returns:
+        tuple: (catégorie, clé du groupe pour broken_links et frontmatter_issues)
+    """
+    issue_type = issue['type']
+    path = issue.get('path', '')
+    if issue_type == 'missing_required':
+        return ('missing_files' if '.md' in path else 'missing_dirs'), None
+    if issue_type == 'missing_template':
+        return 'template_issues', None
+    if issue_type == 'broken_link':
+        if not link:
+            return 'other_issues', None
+        # Motif du lien (par ex: docs/, personnages/, etc.)
+        parts = link.split('/')
+        return 'broken_links', (parts[0] if len(parts) > 1 else 'autres')
+    if 'frontmatter' in issue_type:
+        for folder, file_type in FRONTMATTER_FILE_TYPES:
+            if folder in path:
+                return 'frontmatter_issues', file_type
+        return 'frontmatter_issues', 'autres'
+    return 'other_issues', None
+
+
+class IssueStore(object):
+    """
+    Problèmes détectés, indexés dans une base SQLite en mémoire.
+
+    S'utilise à la place d'une liste (append, extend, len, itération dans
+    l'ordre d'ajout) par les validateurs comme par les rapports. Les lignes
+    ajoutées sont insérées par lots, à la première requête qui suit.
+    """
+
+    def __init__(self, issues=()):
+        self.issues = []
+        self._pending = []
+        self._indexes = set()
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.execute(SCHEMA)
+        self.extend(issues)
+
+    @classmethod
+    def of(cls, issues):
+        """
+        Retourne les problèmes sous forme d'IssueStore, sans copie s'ils le sont déjà.
+
+        Args:
+            issues (iterable): Liste de problèmes ou IssueStore
+
+        Returns:
+            IssueStore: Problèmes indexés
+        """
+        return issues if isinstance(issues, cls) else cls(issues)
+
+    def append(self, issue):
+        self.issues.append(issue)
+        link = get_broken_link(issue) if issue['type'] == 'broken_link' else issue.get('link')
+        parts = link.split('/') if link else []
+        category, group_key = issue_category(issue, link)
+        self._pending.append((len(self.issues), issue['level'], issue['type'], issue.get('path', ''), link,
+                              parts[0] if len(parts) > 1 else None, category, group_key, priority_score(issue)))
+
+    def extend(self, issues):
+        for issue in issues:
+            self.append(issue)
+
+    def _flush(self):
+        if self._pending:
+            with self.connection:
+                self.connection.executemany("INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self._pending)
+            self._pending = []
+
+    def _execute(self, query, params=(), index=None):
+        self._flush()
+        if index is not None and index not in self._indexes:
+            self.connection.execute(INDEXES[index])
+            self._indexes.add(index)
+        return self.connection.execute(query, params)
+
+    def __len__(self):
+        return len(self.issues)
+
+    def __iter__(self):
+        return iter(self.issues)
+
+    def _select(self, query, params=(), index=None):
+        """Problèmes désignés par une requête sur leurs identifiants, lus par pages."""
+        cursor = self._execute(query, params, index)
+        while True:
+            rows = cursor.fetchmany(PAGE_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield self.issues[row[0] - 1]
+
+    def level_counts(self):
+        """
+        Returns:
+            dict: Niveau ('error', 'warning') -> nombre de problèmes
+        """
+        counts = dict(self._execute("SELECT level, COUNT(*) FROM issues GROUP BY level"))
+        counts.setdefault('error', 0)
+        counts.setdefault('warning', 0)
+        return counts
+
+    def type_counts(self):
+        """
+        Returns:
+            list: (type, nombre de problèmes), par ordre alphabétique des types
+        """
+        return self._execute("SELECT type, COUNT(*) FROM issues GROUP BY type ORDER BY type", index='type').fetchall()
+
+    def of_type(self, issue_type):
+        """
+        Problèmes d'un type, par fichier (pour une page du rapport).
+
+        Args:
+            issue_type (str): Type de problème
+
+        Returns:
+            generator: Problèmes triés par chemin puis ordre d'ajout
+        """
+        return self._select("SELECT id FROM issues WHERE type = ? ORDER BY path, id", (issue_type,), 'type')
+
+    def by_file(self):
+        """
+        Returns:
+            dict: Chemin -> problèmes de ce fichier, par ordre alphabétique des chemins
+        """
+        rows = self._execute("SELECT path, id FROM issues ORDER BY path, id", index='path')
+        return {path: [self.issues[row[1] - 1] for row in path_rows]
+                for path, path_rows in groupby(rows, key=lambda row: row[0])}
+
+    def files_with(self, level, type_fragment):
+        """
+        Fichiers ayant au moins un problème du niveau donné et au moins un
+        problème dont le type contient type_fragment.
+
+        Args:
+            level (str): Niveau ('error' ou 'warning')
+            type_fragment (str): Fragment du type (ex: 'frontmatter')
+
+        Returns:
+            list: Chemins, dans l'ordre de leur premier problème
+        """
+        rows = self._execute(
+            "SELECT path FROM issues GROUP BY path "
+            "HAVING SUM(level = ?) > 0 AND SUM(instr(type, ?) > 0) > 0 ORDER BY MIN(id)",
+            (level, type_fragment), 'path')
+        return [row[0] for row in rows]
+
+    def link_prefixes(self):
+        """
+        Premier segment des liens cassés et sa fréquence (voir detect_common_path_issues).
+
+        Returns:
+            dict: Préfixe -> nombre de liens cassés, dans l'ordre d'apparition
+        """
+        return dict(self._execute(
+            "SELECT link_prefix, COUNT(*) FROM issues WHERE type = 'broken_link' AND link_prefix IS NOT NULL "
+            "GROUP BY link_prefix ORDER BY MIN(id)", index='link_prefix'))
+
+    def top(self, limit=None):
+        """
+        Problèmes les plus prioritaires (voir priority_score).
+
+        Args:
+            limit (int, optional): Nombre de problèmes (tous par défaut)
+
+        Returns:
+            list: Problèmes par score décroissant, puis ordre d'ajout
+        """
+        return list(self._select("SELECT id FROM issues ORDER BY priority DESC, id LIMIT ?",
+                                 (-1 if limit is None else limit,), 'priority'))
+
+    def groups_by_pattern(self):
+        """
+        Regroupe les problèmes par catégorie du plan de correction.
+
+        Returns:
+            dict: Listes 'missing_dirs', 'missing_files', 'template_issues',
+                  'other_issues', et dictionnaires 'broken_links' (motif ->
+                  problèmes) et 'frontmatter_issues' (type de fichier ->
+                  problèmes), clés dans l'ordre d'apparition
+        """
+        groups = {category: [] for category in LIST_CATEGORIES}
+        groups.update({category: {} for category in KEYED_CATEGORIES})
+
+        rows = self._execute("SELECT category, group_key, id FROM issues ORDER BY category, group_key, id",
+                             index='category')
+        found = []
+        for (category, group_key), group_rows in groupby(rows, key=lambda row: (row[0], row[1])):
+            ids = [row[2] for row in group_rows]
+            found.append((ids[0], category, group_key, [self.issues[issue_id - 1] for issue_id in ids]))
+
+        for _, category, group_key, issues in sorted(found, key=lambda group: group[0]):
+            if category in KEYED_CATEGORIES:
+                groups[category][group_key] = issues
+            else:
+                groups[category] = issues
+        return groups
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Index des liens internes du projet: graphe des liens sortants et entrants.
+
+Chaque arête relie un fichier source à la cible résolue d'un de ses liens,
+avec le lien brut et sa position (ligne, colonne). Les arêtes d'un fichier
+sont persistées avec ses autres résultats dans le cache de vérification
+(.structure-cache.sqlite): à chaque exécution, seules celles des fichiers
+modifiés sont recalculées. La détection des liens cassés se réduit alors à
+une recherche dans l'ensemble des fichiers existants, et les questions
+« qui pointe vers cette note ? » ou « quelles notes sont orphelines ? »
+obtiennent une réponse immédiate.
+"""
+
+import logging
+from collections import namedtuple
+
+from file_analysis import resolve_link_targets
+
+logger = logging.getLogger('structure_verification')
+
+LinkEdge = namedtuple('LinkEdge', ['source', 'raw', 'target', 'line', 'column'])
+
+
+class LinkGraph(object):
+    """
+    Graphe des liens entre fichiers markdown, indexé dans les deux sens.
+    """
+
+    def __init__(self):
+        self.forward = {}    # source -> [LinkEdge]
+        self.backward = {}   # cible -> [LinkEdge]
+        self.nodes = set()   # fichiers markdown existants
+        self.targets = set() # cibles valides (avec et sans extension .md)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Construit le graphe à partir d'un instantané; les arêtes des fichiers
+        inchangés viennent du cache, sans relecture.
+
+        Args:
+            snapshot (VaultSnapshot): Instantané du projet
+
+        Returns:
+            LinkGraph: Graphe des liens
+        """
+        graph = cls()
+        for md_file in snapshot:
+            graph.add_node(md_file.rel_path)
+        for md_file in snapshot:
+            graph.set_edges(md_file.rel_path, file_edges(snapshot, md_file))
+        logger.debug(f"Index des liens: {len(graph.nodes)} fichiers, {graph.edge_count()} liens")
+        return graph
+
+    def add_node(self, rel_path):
+        """Déclare un fichier existant."""
+        self.nodes.add(rel_path)
+        self.targets.add(rel_path)
+        self.targets.add(rel_path[:-3])
+
+    def remove_node(self, rel_path):
+        """Retire un fichier supprimé et ses liens sortants."""
+        self.set_edges(rel_path, [])
+        self.forward.pop(rel_path, None)
+        self.nodes.discard(rel_path)
+        self.targets.discard(rel_path)
+        self.targets.discard(rel_path[:-3])
+
+    def set_edges(self, source, edges):
+        """
+        Remplace les liens sortants d'un fichier (mise à jour incrémentale).
+
+        Args:
+            source (str): Chemin relatif du fichier source
+            edges (list): Nouvelles arêtes (LinkEdge)
+        """
+        for edge in self.forward.get(source, []):
+            incoming = self.backward.get(edge.target)
+            if incoming is not None:
+                incoming[:] = [other for other in incoming if other.source != source]
+                if not incoming:
+                    del self.backward[edge.target]
+        self.forward[source] = list(edges)
+        for edge in edges:
+            if edge.target:
+                self.backward.setdefault(edge.target, []).append(edge)
+
+    def refresh(self, snapshot, md_file):
+        """
+        Recalcule les liens sortants d'un fichier après sa modification.
+
+        Args:
+            snapshot (VaultSnapshot): Instantané du projet
+            md_file (VaultFile): Fichier modifié
+        """
+        self.set_edges(md_file.rel_path, file_edges(snapshot, md_file))
+
+    def edge_count(self):
+        """Nombre total de liens indexés."""
+        return sum(len(edges) for edges in self.forward.values())
+
+    def edges_from(self, source):
+        """Liens sortants d'un fichier, dans l'ordre d'extraction."""
+        return self.forward.get(source, [])
+
+    def resolves(self, target):
+        """Indique si une cible de lien correspond à un fichier existant."""
+        return target in self.targets or target + '.md' in self.targets
+
+    def unresolved_edges_from(self, source):
+        """
+        Liens internes cassés d'un fichier.
+
+        Args:
+            source (str): Chemin relatif du fichier source
+
+        Returns:
+            list: Arêtes dont la cible n'existe pas
+        """
+        return [edge for edge in self.forward.get(source, [])
+                if edge.target and not self.resolves(edge.target)]
+
+    def unresolved_edges(self):
+        """Tous les liens internes cassés, triés par fichier source."""
+        for source in sorted(self.forward):
+            for edge in self.unresolved_edges_from(source):
+                yield edge
+
+    def backlinks(self, note):
+        """
+        Liens qui pointent vers une note.
+
+        Args:
+            note (str): Chemin relatif de la note, avec ou sans extension .md
+
+        Returns:
+            list: Arêtes entrantes triées par source et position
+        """
+        note = note.lstrip('/')
+        if not note.endswith('.md'):
+            note += '.md'
+        edges = self.backward.get(note, []) + self.backward.get(note[:-3], [])
+        return sorted(edges, key=lambda edge: (edge.source, edge.line, edge.column))
+
+    def orphans(self):
+        """
+        Notes vers lesquelles aucun autre fichier ne pointe.
+
+        Returns:
+            list: Chemins relatifs triés
+        """
+        orphans = []
+        for rel_path in sorted(self.nodes):
+            incoming = self.backward.get(rel_path, []) + self.backward.get(rel_path[:-3], [])
+            if not any(edge.source != rel_path for edge in incoming):
+                orphans.append(rel_path)
+        return orphans
+
+    def edge_for_issue(self, issue):
+        """
+        Retrouve l'arête correspondant à un problème de lien cassé.
+
+        Args:
+            issue (dict): Problème de type 'broken_link'
+
+        Returns:
+            LinkEdge: Arête trouvée, ou None
+        """
+        for edge in self.unresolved_edges_from(issue.get('path', '')):
+            if 'line' in issue:
+                if edge.line == issue['line'] and edge.column == issue.get('column'):
+                    return edge
+            elif edge.target == issue.get('link'):
+                return edge
+        return None
+
+
+def file_edges(snapshot, md_file):
+    """
+    Calcule (ou reprend du cache) les arêtes sortantes d'un fichier.
+
+    Args:
+        snapshot (VaultSnapshot): Instantané du projet
+        md_file (VaultFile): Fichier source
+
+    Returns:
+        list: Arêtes (LinkEdge) dans l'ordre des liens
+    """
+    positions = md_file.link_positions
+    targets = snapshot.cached_result(md_file, 'targets')
+    if targets is None:
+        targets = resolve_link_targets(md_file)
+        snapshot.record_result(md_file, 'targets', targets)
+    return [LinkEdge(md_file.rel_path, raw, target, line, column)
+            for (raw, line, column), target in zip(positions, targets)]
+
+
+def link_graph_for(snapshot):
+    """
+    Retourne le graphe des liens d'un instantané, construit une seule fois.
+
+    Args:
+        snapshot (VaultSnapshot): Instantané du projet
+
+    Returns:
+        LinkGraph: Graphe des liens
+    """
+    if snapshot.link_graph is None:
+        snapshot.link_graph = LinkGraph.from_snapshot(snapshot)
+    return snapshot.link_graph
+
+
+def broken_link_issue(edge):
+    """
+    Construit le problème 'broken_link' correspondant à une arête non résolue.
+
+    Args:
+        edge (LinkEdge): Lien cassé
+
+    Returns:
+        dict: Problème détecté
+    """
+    return {
+        'level': 'warning',
+        'type': 'broken_link',
+        'path': edge.source,
+        'message': f"Lien cassé dans {edge.source}: '{edge.target}'",
+        'link': edge.target,
+        'raw_link': edge.raw,
+        'line': edge.line,
+        'column': edge.column
+    }
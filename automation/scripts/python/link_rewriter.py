@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Réécriture des liens d'un fichier en une seule passe, avec écriture atomique.
+
+Toutes les corrections d'un fichier sont appliquées ensemble: le contenu est
+parcouru une fois, lien wiki [[cible|alias]] ou markdown [texte](cible) par
+lien, et seule la cible est remplacée (alias, texte et ancre #section sont
+conservés). Le fichier est ensuite écrit une seule fois dans un fichier
+temporaire du même dossier puis remplacé avec os.replace, pour ne jamais
+laisser un fichier à moitié écrit.
+"""
+
+import os
+import re
+import shutil
+import logging
+import tempfile
+
+logger = logging.getLogger('structure_verification')
+
+LINK_SPAN_PATTERN = re.compile(
+    r'\[\[(?P<wiki_target>[^\]|]*?)(?P<alias>\|[^\]]*)?\]\]'
+    r'|\[(?P<text>[^\]]*)\]\((?P<md_target>[^)]*)\)'
+)
+
+
+def rewrite_links(content, replacements, applied=None):
+    """
+    Remplace les cibles de liens d'un contenu en une seule passe.
+
+    Args:
+        content (str): Contenu du fichier
+        replacements (dict): Cibles à remplacer {ancienne: nouvelle}, telles
+            qu'écrites dans les liens (une ancre #section est conservée si
+            seule la partie avant l'ancre correspond)
+        applied (dict, optional): Complété avec le nombre de liens remplacés
+            par cible {ancienne: nombre}; les cibles absentes du contenu n'y
+            figurent pas
+
+    Returns:
+        tuple: (nouveau_contenu, nombre_de_liens_remplacés)
+    """
+    if not replacements:
+        return content, 0
+
+    count = 0
+
+    def replace_target(target):
+        if target in replacements:
+            key, new_target = target, replacements[target]
+        else:
+            path, sep, anchor = target.partition('#')
+            if not (sep and path in replacements):
+                return None
+            key, new_target = path, replacements[path] + sep + anchor
+        if applied is not None:
+            applied[key] = applied.get(key, 0) + 1
+        return new_target
+
+    def replacer(match):
+        nonlocal count
+        if match.group('wiki_target') is not None:
+            new_target = replace_target(match.group('wiki_target'))
+            if new_target is None:
+                return match.group(0)
+            count += 1
+            return f"[[{new_target}{match.group('alias') or ''}]]"
+
+        new_target = replace_target(match.group('md_target'))
+        if new_target is None:
+            return match.group(0)
+        count += 1
+        return f"[{match.group('text')}]({new_target})"
+
+    new_content = LINK_SPAN_PATTERN.sub(replacer, content)
+    return new_content, count
+
+
+def atomic_write(file_path, content, encoding='utf-8'):
+    """
+    Écrit un fichier via un fichier temporaire du même dossier et os.replace.
+
+    Args:
+        file_path (str|Path): Fichier à écrire
+        content (str): Nouveau contenu
+        encoding (str): Encodage du fichier
+    """
+    file_path = str(file_path)
+    directory, name = os.path.split(file_path)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory or '.')
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def rewrite_file_links(file_path, replacements, content=None):
+    """
+    Applique toutes les corrections de liens d'un fichier, avec une seule
+    lecture et une seule écriture.
+
+    Args:
+        file_path (str|Path): Fichier à corriger
+        replacements (dict): Cibles à remplacer {ancienne: nouvelle}
+        content (str, optional): Contenu déjà lu, pour éviter une relecture
+
+    Returns:
+        dict: Nombre de liens remplacés par cible {ancienne: nombre}, seules
+            les cibles effectivement remplacées y figurent (vide si le
+            fichier n'a pas été modifié)
+    """
+    if content is None:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+
+    applied = {}
+    new_content, count = rewrite_links(content, replacements, applied)
+    if count and new_content != content:
+        atomic_write(file_path, new_content)
+        logger.debug(f"{count} liens réécrits dans {file_path}")
+        return applied
+    return {}
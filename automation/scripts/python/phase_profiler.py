@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compteurs de performance et profil par phase de la vérification (option --profile).
+
+Les modules de lecture et d'analyse incrémentent des compteurs globaux
+(fichiers parcourus et lus, octets lus, analyses YAML, temps passé dans les
+expressions régulières, comparaisons de la recherche approximative). Un
+PhaseProfiler relève ces compteurs et le temps écoulé autour de chaque phase
+de main(), affiche un tableau récapitulatif et peut enregistrer un profil
+cProfile lisible avec pstats. Les mêmes valeurs sont disponibles sous forme
+de dictionnaire (as_dict), utilisé par les mesures de benchmarks/.
+
+Les compteurs sont propres à chaque processus: les processus de travail de
+--jobs retournent leurs compteurs, fusionnés ensuite avec merge_counters.
+"""
+
+import sys
+import cProfile
+import logging
+from time import perf_counter
+from contextlib import contextmanager
+
+logger = logging.getLogger('structure_verification')
+
+COUNTER_NAMES = (
+    'files_visited',      # fichiers markdown trouvés lors du parcours
+    'files_read',         # fichiers ouverts (contenu complet ou en-tête)
+    'bytes_read',         # octets lus
+    'yaml_parses',        # blocs YAML analysés (hors cache)
+    'yaml_seconds',       # temps d'analyse YAML
+    'regex_seconds',      # temps passé dans les expressions régulières
+    'fuzzy_comparisons',  # fichiers comparés par la recherche approximative
+)
+
+# Compteurs globaux du processus, incrémentés par les modules instrumentés
+counters = dict.fromkeys(COUNTER_NAMES, 0)
+
+
+def read_counters():
+    """
+    Relève les compteurs.
+
+    Returns:
+        dict: Copie des compteurs
+    """
+    return dict(counters)
+
+
+def counters_since(before):
+    """
+    Calcule l'évolution des compteurs depuis un relevé.
+
+    Args:
+        before (dict): Relevé obtenu avec read_counters()
+
+    Returns:
+        dict: Différence pour chaque compteur
+    """
+    return {name: counters[name] - before[name] for name in COUNTER_NAMES}
+
+
+def merge_counters(values):
+    """
+    Ajoute des compteurs relevés dans un autre processus.
+
+    Args:
+        values (dict): Compteurs à ajouter
+    """
+    for name, value in values.items():
+        counters[name] += value
+
+
+class PhaseProfiler(object):
+    """
+    Mesure du temps écoulé et de l'évolution des compteurs, phase par phase.
+    Désactivé, il n'ajoute aucun coût aux phases.
+    """
+
+    def __init__(self, enabled=False, dump_path=None):
+        self.enabled = enabled or dump_path is not None
+        self.dump_path = dump_path
+        self.phases = {}
+        self._profile = None
+        self._start = None
+
+    def start(self):
+        """Démarre la mesure globale et, si demandé, le profil cProfile."""
+        if not self.enabled:
+            return self
+        self._start = perf_counter()
+        if self.dump_path is not None:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Mesure une phase; les mesures d'une phase répétée s'additionnent.
+
+        Args:
+            name (str): Nom de la phase
+        """
+        if not self.enabled:
+            yield
+            return
+        before = read_counters()
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            values = self.phases.setdefault(name, dict.fromkeys(('wall_seconds',) + COUNTER_NAMES, 0))
+            values['wall_seconds'] += elapsed
+            for counter, value in counters_since(before).items():
+                values[counter] += value
+
+    def as_dict(self):
+        """
+        Mesures par phase.
+
+        Returns:
+            dict: {phase: {'wall_seconds': ..., compteur: valeur}}, dans l'ordre des phases
+        """
+        return {name: dict(values) for name, values in self.phases.items()}
+
+    def stop(self):
+        """
+        Arrête la mesure, affiche le récapitulatif et enregistre le profil.
+
+        Returns:
+            dict: Mesures par phase (voir as_dict)
+        """
+        if not self.enabled or self._start is None:
+            return self.as_dict()
+        total = perf_counter() - self._start
+        self._start = None
+
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.dump_path)
+            self._profile = None
+            logger.info(f"Profil cProfile enregistré dans {self.dump_path} (python -m pstats {self.dump_path})")
+
+        # Sur la sortie d'erreur: la sortie standard peut porter le rapport (--output -)
+        print(self.format_summary(total), file=sys.stderr)
+        return self.as_dict()
+
+    def format_summary(self, total=None):
+        """
+        Met en forme le tableau récapitulatif des phases.
+
+        Args:
+            total (float, optional): Durée totale de l'exécution
+
+        Returns:
+            str: Tableau en texte
+        """
+        header = (f"{'phase':<12} {'temps (s)':>10} {'fichiers':>9} {'lus':>8} {'octets lus':>12} "
+                  f"{'YAML':>6} {'YAML (s)':>9} {'regex (s)':>10} {'comparaisons':>13}")
+        lines = ['', 'Profil par phase:', header, '-' * len(header)]
+        for name, values in self.phases.items():
+            lines.append(f"{name:<12} {values['wall_seconds']:>10.3f} {values['files_visited']:>9} "
+                         f"{values['files_read']:>8} {values['bytes_read']:>12} {values['yaml_parses']:>6} "
+                         f"{values['yaml_seconds']:>9.3f} {values['regex_seconds']:>10.3f} "
+                         f"{values['fuzzy_comparisons']:>13}")
+        if total is not None:
+            lines.append('-' * len(header))
+            lines.append(f"{'total':<12} {total:>10.3f}")
+        return '\n'.join(lines)
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exécution transactionnelle d'un plan de correction.
+
+Les étapes approuvées d'un plan n'écrivent pas directement dans le projet:
+elles décrivent leurs modifications dans un PlannedChanges (dossiers à créer,
+contenu final de chaque fichier écrit, fichiers à supprimer) et lisent le
+projet à travers ces modifications, si bien que plusieurs étapes peuvent
+toucher un même fichier.
+L'ensemble peut être affiché sous forme de diff (--dry-run) avant toute
+écriture.
+
+L'exécution passe par un journal (.structure-backups/journal.json): l'état
+initial des fichiers est sauvegardé (voir backup_store), leur contenu final
+rangé dans le même magasin, puis le journal est écrit en une fois avant la
+première modification. Les écritures, indépendantes les unes des autres,
+sont ensuite réparties sur plusieurs fils; la suppression du journal valide
+le tout. Un journal restant signale une exécution interrompue, que l'on peut
+annuler ou reprendre.
+
+Seules les corrections calculées d'un bloc passent par le journal: --policy
+de verify_structure_script, modes 'fix' et 'interactive --yes' du script
+amélioré. Le mode 'interactive' et le mode 'fix' de verify_structure_script
+sans --policy appliquent leurs corrections une à une, au fil des questions,
+sans journal: une exécution interrompue ne peut être ni annulée ni reprise.
+
+Utilisation:
+    python plan_executor.py --project-dir PATH --status
+    python plan_executor.py --project-dir PATH --rollback
+    python plan_executor.py --project-dir PATH --resume
+"""
+
+import os
+import sys
+import json
+import difflib
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from backup_store import (JOURNAL_FILENAME, backup_root, create_backup, file_hash, object_path, restore_backup,
+                          store_content)
+from link_rewriter import atomic_write
+
+logger = logging.getLogger('structure_verification')
+
+# Nombre de fils pour les écritures
+WRITE_THREADS = 8
+
+
+def journal_path(project_path):
+    """Journal de l'exécution en cours du projet."""
+    return backup_root(project_path) / JOURNAL_FILENAME
+
+
+def load_journal(project_path):
+    """
+    Lit le journal d'une exécution interrompue.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+
+    Returns:
+        dict: Journal, ou None s'il n'y a pas d'exécution interrompue
+    """
+    try:
+        with open(journal_path(project_path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+class PlannedChanges(object):
+    """
+    Modifications prévues par un plan de correction, sans écriture sur le disque.
+    """
+
+    def __init__(self, project_path):
+        self.project_path = Path(project_path)
+        self.directories = []  # dossiers à créer, dans l'ordre du plan
+        self.files = {}        # chemin relatif -> contenu final, dans l'ordre du plan
+        self.deleted = []      # fichiers à supprimer, dans l'ordre du plan
+        self._originals = {}   # chemin relatif -> contenu actuel (None si absent)
+
+    @staticmethod
+    def _key(rel_path):
+        return str(rel_path).replace('\\', '/')
+
+    def original(self, rel_path):
+        """
+        Contenu actuel d'un fichier sur le disque.
+
+        Args:
+            rel_path (str): Chemin relatif du fichier
+
+        Returns:
+            str: Contenu, ou None si le fichier n'existe pas
+        """
+        key = self._key(rel_path)
+        if key not in self._originals:
+            try:
+                with open(self.project_path / key, 'r', encoding='utf-8', newline='') as f:
+                    self._originals[key] = f.read()
+            except (FileNotFoundError, IsADirectoryError):
+                self._originals[key] = None
+        return self._originals[key]
+
+    def read(self, rel_path):
+        """
+        Contenu d'un fichier une fois les modifications prévues appliquées.
+
+        Args:
+            rel_path (str): Chemin relatif du fichier
+
+        Returns:
+            str: Contenu, ou None si le fichier n'existe pas
+        """
+        key = self._key(rel_path)
+        if key in self.files:
+            return self.files[key]
+        if key in self.deleted:
+            return None
+        return self.original(key)
+
+    def exists(self, rel_path):
+        """Indique si un chemin existe une fois les modifications prévues appliquées."""
+        key = self._key(rel_path)
+        if key in self.deleted:
+            return False
+        return key in self.files or key in self.directories or (self.project_path / key).exists()
+
+    def make_dir(self, rel_path):
+        """
+        Prévoit la création d'un dossier.
+
+        Args:
+            rel_path (str): Chemin relatif du dossier
+
+        Returns:
+            bool: True si le dossier n'existe pas encore
+        """
+        key = self._key(rel_path)
+        if key in self.directories or (self.project_path / key).is_dir():
+            return False
+        self.directories.append(key)
+        return True
+
+    def write(self, rel_path, content):
+        """
+        Prévoit l'écriture d'un fichier (création ou remplacement du contenu).
+
+        Args:
+            rel_path (str): Chemin relatif du fichier
+            content (str): Contenu final
+
+        Returns:
+            bool: True si le contenu change
+        """
+        key = self._key(rel_path)
+        if self.read(key) == content:
+            return False
+        if key in self.deleted:
+            self.deleted.remove(key)
+        self.files[key] = content
+        return True
+
+    def delete(self, rel_path):
+        """
+        Prévoit la suppression d'un fichier.
+
+        Args:
+            rel_path (str): Chemin relatif du fichier
+
+        Returns:
+            bool: True si le fichier existe une fois les autres modifications appliquées
+        """
+        key = self._key(rel_path)
+        if self.read(key) is None:
+            return False
+        self.files.pop(key, None)
+        if self.original(key) is not None:
+            self.deleted.append(key)
+        return True
+
+    def __len__(self):
+        return len(self.directories) + len(self.files) + len(self.deleted)
+
+    def summary(self):
+        """
+        Résumé des modifications prévues.
+
+        Returns:
+            str: Nombre de dossiers créés, de fichiers créés, modifiés et supprimés
+        """
+        created = sum(1 for key in self.files if not (self.project_path / key).exists())
+        summary = (f"{len(self.directories)} dossiers à créer, {created} fichiers à créer, "
+                   f"{len(self.files) - created} fichiers à modifier")
+        if self.deleted:
+            summary += f", {len(self.deleted)} fichiers à supprimer"
+        return summary
+
+    def format_diff(self):
+        """
+        Met en forme les modifications prévues (diff unifié pour les fichiers).
+
+        Returns:
+            str: Diff de l'ensemble des modifications
+        """
+        lines = []
+        for key in self.directories:
+            lines.append(f"+ dossier {key}/\n")
+        for key, content in self.files.items():
+            before = self.original(key)
+            diff = difflib.unified_diff((before or '').splitlines(True), content.splitlines(True),
+                                        '/dev/null' if before is None else f"a/{key}", f"b/{key}")
+            for line in diff:
+                lines.append(line if line.endswith('\n') else line + "\n\\ Pas de fin de ligne à la fin du fichier\n")
+        for key in self.deleted:
+            diff = difflib.unified_diff(self.original(key).splitlines(True), [], f"a/{key}", '/dev/null')
+            for line in diff:
+                lines.append(line if line.endswith('\n') else line + "\n\\ Pas de fin de ligne à la fin du fichier\n")
+        return ''.join(lines)
+
+    def created_directories(self):
+        """
+        Dossiers absents du disque que l'exécution va créer, y compris les
+        dossiers parents des fichiers écrits.
+
+        Returns:
+            list: Chemins relatifs, les parents avant leurs sous-dossiers
+        """
+        created = set()
+        for key in list(self.directories) + [os.path.dirname(key) for key in self.files]:
+            while key and key not in created and not (self.project_path / key).is_dir():
+                created.add(key)
+                key = os.path.dirname(key)
+        return sorted(created, key=lambda key: (key.count('/'), key))
+
+
+def _apply_directory(project_path, rel_path):
+    os.makedirs(project_path / rel_path, exist_ok=True)
+
+
+def _apply_file(project_path, rel_path, content):
+    abs_path = project_path / rel_path
+    os.makedirs(abs_path.parent, exist_ok=True)
+    atomic_write(abs_path, content)
+
+
+def _apply_delete(project_path, rel_path):
+    try:
+        os.remove(project_path / rel_path)
+    except FileNotFoundError:
+        pass
+
+
+def execute_changes(changes, label=None, threads=WRITE_THREADS):
+    """
+    Applique les modifications prévues, sous la protection du journal.
+
+    En cas d'erreur pendant les écritures, les modifications déjà faites
+    sont annulées avant que l'erreur ne soit propagée.
+
+    Args:
+        changes (PlannedChanges): Modifications à appliquer
+        label (str, optional): Description de l'opération (journal et sauvegarde)
+        threads (int): Nombre de fils pour les écritures
+
+    Returns:
+        int: Nombre de dossiers et fichiers créés ou modifiés
+
+    Raises:
+        RuntimeError: Si une exécution interrompue n'a été ni annulée ni reprise
+    """
+    project_path = changes.project_path
+    if journal_path(project_path).exists():
+        raise RuntimeError(f"Une exécution interrompue doit d'abord être annulée ou reprise "
+                           f"(python plan_executor.py --project-dir {project_path} --rollback | --resume)")
+    if not changes:
+        return 0
+
+    # 1. État initial et contenu final dans le magasin, puis journal en une écriture
+    # (un fichier à supprimer a pour contenu final None)
+    manifest_path = create_backup(project_path, list(changes.files) + changes.deleted, label)
+    journal = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'label': label or '',
+        'manifest': manifest_path.name,
+        'directories': changes.created_directories(),
+        'files': [{'path': key, 'sha1': store_content(project_path, content.encode('utf-8'))}
+                  for key, content in changes.files.items()]
+                 + [{'path': key, 'sha1': None} for key in changes.deleted],
+    }
+    atomic_write(journal_path(project_path), json.dumps(journal, ensure_ascii=False, indent=2))
+
+    # 2. Écritures indépendantes, réparties sur plusieurs fils
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = [executor.submit(_apply_directory, project_path, key) for key in changes.directories]
+            futures.extend(executor.submit(_apply_file, project_path, key, content)
+                           for key, content in changes.files.items())
+            futures.extend(executor.submit(_apply_delete, project_path, key) for key in changes.deleted)
+            for future in futures:
+                future.result()
+    except Exception as e:
+        logger.error(f"Erreur pendant l'application du plan, annulation des modifications: {e}")
+        rollback_journal(project_path)
+        raise
+
+    # 3. Validation: le journal n'est plus nécessaire
+    os.remove(journal_path(project_path))
+    logger.info(f"Plan appliqué: {len(changes.directories)} dossiers, {len(changes.files)} fichiers écrits "
+                f"et {len(changes.deleted)} supprimés (sauvegarde: {manifest_path})")
+    return len(changes)
+
+
+def rollback_journal(project_path):
+    """
+    Annule une exécution interrompue: les fichiers retrouvent leur état
+    initial et les dossiers créés (restés vides) sont supprimés.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+
+    Returns:
+        int: Nombre de fichiers restaurés ou supprimés
+    """
+    project_path = Path(project_path)
+    journal = load_journal(project_path)
+    if journal is None:
+        logger.info("Aucune exécution interrompue à annuler.")
+        return 0
+
+    restored = restore_backup(project_path, backup_root(project_path) / 'manifests' / journal['manifest'])
+    for key in reversed(journal['directories']):
+        try:
+            os.rmdir(project_path / key)
+        except OSError:
+            pass  # dossier absent ou non vide
+
+    os.remove(journal_path(project_path))
+    logger.info(f"Exécution interrompue annulée ({journal['label'] or journal['created']}).")
+    return restored
+
+
+def resume_journal(project_path):
+    """
+    Reprend une exécution interrompue: seules les modifications qui n'avaient
+    pas encore été faites sont appliquées.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+
+    Returns:
+        int: Nombre de fichiers écrits ou supprimés
+    """
+    project_path = Path(project_path)
+    journal = load_journal(project_path)
+    if journal is None:
+        logger.info("Aucune exécution interrompue à reprendre.")
+        return 0
+
+    for key in journal['directories']:
+        os.makedirs(project_path / key, exist_ok=True)
+
+    written = 0
+    for entry in journal['files']:
+        abs_path = project_path / entry['path']
+        if entry['sha1'] is None:
+            if abs_path.is_file():
+                abs_path.unlink()
+                written += 1
+            continue
+        if abs_path.is_file() and file_hash(str(abs_path)) == entry['sha1']:
+            continue
+        source = object_path(project_path, entry['sha1'])
+        if not source.is_file() or file_hash(str(source)) != entry['sha1']:
+            raise RuntimeError(f"Contenu prévu manquant ou altéré pour {entry['path']}: {source}")
+        with open(source, 'r', encoding='utf-8', newline='') as f:
+            atomic_write(abs_path, f.read())
+        written += 1
+
+    os.remove(journal_path(project_path))
+    logger.info(f"Exécution interrompue reprise: {written} fichiers écrits ou supprimés ({journal['label'] or journal['created']}).")
+    return written
+
+
+def main(argv=None):
+    """
+    Affiche, annule ou reprend une exécution interrompue.
+
+    Args:
+        argv (list, optional): Arguments de la ligne de commande (par défaut sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Gère le journal d'exécution des plans de correction.")
+    parser.add_argument("--project-dir", default=".", help="Chemin vers le répertoire du projet")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--status", action="store_true", help="Indique s'il y a une exécution interrompue (par défaut)")
+    action.add_argument("--rollback", action="store_true", help="Annule l'exécution interrompue")
+    action.add_argument("--resume", action="store_true", help="Termine l'exécution interrompue")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    project_path = Path(args.project_dir).resolve()
+
+    if args.rollback:
+        rollback_journal(project_path)
+        return 0
+    if args.resume:
+        try:
+            resume_journal(project_path)
+        except RuntimeError as e:
+            logger.error(str(e))
+            return 1
+        return 0
+
+    journal = load_journal(project_path)
+    if journal is None:
+        print("Aucune exécution interrompue.")
+        return 0
+    print(f"Exécution interrompue: {journal['created']}  {journal['label']}")
+    print(f"  {len(journal['directories'])} dossiers, {len(journal['files'])} fichiers")
+    for entry in journal['files']:
+        print(f"  - {entry['path']}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tâches de révision manuelle, indexées pour ne jamais se dupliquer.
+
+Chaque fichier problématique a au plus une tâche ouverte dans
+review/claude_suggestions/. L'index (.structure-review-index.json à la
+racine du projet) associe le chemin du fichier à sa tâche et aux empreintes
+des problèmes qu'elle décrit:
+
+- une tâche dont les problèmes n'ont pas changé n'est pas réécrite;
+- si les problèmes ont changé, seule la section « Problèmes détectés » de
+  la tâche est remplacée (cases cochées et notes sont conservées);
+- une tâche dont le fichier n'a plus de problème est fermée (statut
+  « Terminée ») et déplacée dans review/completed/.
+
+Les tâches créées, mises à jour et fermées lors d'une vérification sont
+préparées ensemble puis écrites en un lot, l'index étant enregistré une
+seule fois. Sans index (première exécution, nouveau clone), les tâches
+existantes sont reprises depuis review/claude_suggestions/ et leurs
+doublons fermés.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from link_rewriter import atomic_write
+
+logger = logging.getLogger('structure_verification')
+
+# Index des tâches ouvertes, à la racine du projet
+REVIEW_INDEX_FILE = '.structure-review-index.json'
+
+# Dossiers des tâches ouvertes et fermées
+TASKS_DIR = 'review/claude_suggestions'
+COMPLETED_DIR = 'review/completed'
+
+TASK_SUFFIX = '-structure-revision.md'
+
+ISSUES_HEADING = '## Problèmes détectés'
+
+# Fichier concerné par une tâche créée avant l'index
+LEGACY_FILE_PATTERN = re.compile(r"^Le fichier `([^`]+)`", re.MULTILINE)
+FRONTMATTER_FIELD_PATTERN = r"^{}:[ \t]*(.*)$"
+
+
+def issue_fingerprint(issue):
+    """
+    Empreinte d'un problème, stable d'une vérification à l'autre.
+
+    Args:
+        issue (dict): Problème détecté
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    key = '\0'.join([issue['type'], issue.get('link') or '', issue['message']])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def needs_manual_review(file_issues):
+    """
+    Indique si les problèmes d'un fichier justifient une révision manuelle
+    (erreurs de frontmatter qu'aucune correction automatique ne traite).
+
+    Args:
+        file_issues (list): Problèmes d'un même fichier
+
+    Returns:
+        bool: True si une tâche de révision est nécessaire
+    """
+    has_errors = any(issue['level'] == 'error' for issue in file_issues)
+    has_frontmatter_issues = any('frontmatter' in issue['type'] for issue in file_issues)
+    has_parsing_errors = any('parsing_error' in issue['type'] for issue in file_issues)
+    has_missing_required = any('missing_required_field' in issue['type'] for issue in file_issues)
+    return has_errors and (has_frontmatter_issues or has_parsing_errors or has_missing_required)
+
+
+def format_issues(issues):
+    """Contenu de la section « Problèmes détectés » d'une tâche."""
+    lines = []
+    for i, issue in enumerate(issues, 1):
+        details = f" ({issue['details']})" if issue.get('details') else ""
+        lines.append(f"{i}. **{issue['type'].replace('_', ' ').title()}**{details}:\n")
+        lines.append(f"   {issue['message']}\n\n")
+    return ''.join(lines)
+
+
+def task_content(task_id, file_path, issues):
+    """
+    Contenu d'une nouvelle tâche de révision manuelle.
+
+    Args:
+        task_id (str): Identifiant de la tâche
+        file_path (str): Chemin relatif du fichier problématique
+        issues (list): Problèmes détectés pour ce fichier
+
+    Returns:
+        str: Contenu markdown de la tâche
+    """
+    name = os.path.basename(file_path)
+    today = datetime.now().strftime('%Y-%m-%d')
+    due = (datetime.now() + timedelta(days=3)).strftime('%Y-%m-%d')
+    return f"""---
+id: {task_id}
+titre: Révision manuelle requise pour {name}
+statut: À faire
+priorite: 2
+date_creation: {today}
+date_debut: {today}
+date_fin: {due}
+fichier: {file_path}
+tags: tâche, révision-structure
+---
+
+# Révision manuelle requise pour {name} [{task_id}]
+
+**Statut**: À faire
+**Priorité**: 2/5
+**Période**: {today} → {due}
+
+## Description
+
+Le fichier `{file_path}` présente des problèmes de structure qui nécessitent une révision manuelle. Une modification automatique pourrait corrompre le contenu.
+
+{ISSUES_HEADING}
+
+{format_issues(issues)}
+## Actions recommandées
+
+- [ ] Ouvrir le fichier dans un éditeur de texte
+- [ ] Corriger les problèmes structurels identifiés
+- [ ] Vérifier que le contenu reste cohérent et valide
+- [ ] Exécuter le script de vérification en mode analyse uniquement pour confirmer les corrections
+
+## Intervenants assignés
+
+- [[]] <!-- Ajouter manuellement les intervenants appropriés -->
+
+## Ressources nécessaires
+
+- Format standard attendu pour ce type de fichier
+- Documentation de référence sur la structure du projet
+
+## Notes
+
+**IMPORTANT**: Ne pas utiliser d'outils automatisés pour modifier ce fichier avant d'avoir résolu les problèmes structurels.
+"""
+
+
+def replace_issues_section(content, issues):
+    """
+    Remplace la section « Problèmes détectés » d'une tâche existante.
+
+    Args:
+        content (str): Contenu actuel de la tâche
+        issues (list): Problèmes détectés pour le fichier
+
+    Returns:
+        str: Nouveau contenu (section ajoutée en fin de tâche si absente)
+    """
+    section = f"{ISSUES_HEADING}\n\n{format_issues(issues)}"
+    start = content.find(ISSUES_HEADING + '\n')
+    if start == -1:
+        return content.rstrip('\n') + '\n\n' + section
+    end = content.find('\n## ', start + len(ISSUES_HEADING))
+    if end == -1:
+        return content[:start] + section
+    return content[:start] + section + content[end + 1:]
+
+
+def close_task_content(content):
+    """
+    Contenu d'une tâche fermée automatiquement.
+
+    Args:
+        content (str): Contenu actuel de la tâche
+
+    Returns:
+        str: Contenu avec le statut « Terminée » et la date de clôture
+    """
+    content = re.sub(r"^statut:.*$", "statut: Terminée", content, count=1, flags=re.MULTILINE)
+    content = re.sub(r"^\*\*Statut\*\*:.*$", "**Statut**: Terminée", content, count=1, flags=re.MULTILINE)
+    return (content.rstrip('\n') + f"\n\n## Clôture\n\nFermée automatiquement le "
+            f"{datetime.now().strftime('%Y-%m-%d')}: la vérification ne détecte plus ces problèmes.\n")
+
+
+def _frontmatter_field(content, name):
+    match = re.search(FRONTMATTER_FIELD_PATTERN.format(name), content, re.MULTILINE)
+    return match.group(1).strip() if match else None
+
+
+def _read(path):
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+class ReviewTaskIndex(object):
+    """
+    Index des tâches de révision ouvertes d'un projet.
+    """
+
+    def __init__(self, project_path):
+        self.project_path = Path(project_path)
+        self.tasks = {}       # fichier -> {'id', 'path', 'fingerprints'}
+        self.duplicates = []  # tâches en double reprises d'avant l'index, fermées au prochain plan complet
+
+    @property
+    def index_path(self):
+        return self.project_path / REVIEW_INDEX_FILE
+
+    @classmethod
+    def load(cls, project_path):
+        """
+        Charge l'index, ou le reconstruit depuis les tâches existantes.
+
+        Args:
+            project_path (Path): Chemin de base du projet
+
+        Returns:
+            ReviewTaskIndex: Index des tâches ouvertes
+        """
+        index = cls(project_path)
+        try:
+            with open(index.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            index.tasks = data['tasks']
+            index.duplicates = data.get('duplicates', [])
+        except FileNotFoundError:
+            index.adopt_existing_tasks()
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Index des tâches de révision illisible, reconstruction: {e}")
+            index.adopt_existing_tasks()
+        return index
+
+    def adopt_existing_tasks(self):
+        """
+        Reprend les tâches ouvertes de review/claude_suggestions/: la plus
+        récente de chaque fichier est conservée, les autres sont des doublons.
+        """
+        tasks_dir = self.project_path / TASKS_DIR
+        if not tasks_dir.is_dir():
+            return
+        found = {}
+        for entry in sorted(os.listdir(tasks_dir)):
+            if not entry.endswith(TASK_SUFFIX):
+                continue
+            content = _read(tasks_dir / entry)
+            if content is None or _frontmatter_field(content, 'statut') == 'Terminée':
+                continue
+            file_path = _frontmatter_field(content, 'fichier')
+            if not file_path:
+                match = LEGACY_FILE_PATTERN.search(content)
+                if not match:
+                    continue
+                file_path = match.group(1)
+            task_id = _frontmatter_field(content, 'id') or entry[:-len(TASK_SUFFIX)]
+            found.setdefault(file_path, []).append((task_id, f"{TASKS_DIR}/{entry}"))
+
+        for file_path, tasks in found.items():
+            tasks.sort()
+            task_id, task_path = tasks[-1]
+            # Empreintes inconnues: la section des problèmes sera réécrite
+            self.tasks[file_path] = {'id': task_id, 'path': task_path, 'fingerprints': []}
+            self.duplicates.extend(path for _, path in tasks[:-1])
+        if found:
+            logger.info(f"{len(self.tasks)} tâches de révision reprises, {len(self.duplicates)} doublons à fermer")
+
+    def new_task_id(self, file_path, used_ids):
+        """
+        Identifiant d'une nouvelle tâche (TODO-AAAAMMJJHHMM-NOM), unique dans le projet.
+
+        Args:
+            file_path (str): Chemin relatif du fichier problématique
+            used_ids (set): Identifiants déjà pris, complété par le nouvel identifiant
+
+        Returns:
+            str: Identifiant
+        """
+        base = f"TODO-{datetime.now().strftime('%Y%m%d%H%M')}-{os.path.basename(file_path).split('.')[0][:4].upper()}"
+        task_id = base
+        counter = 2
+        while task_id in used_ids or (self.project_path / TASKS_DIR / f"{task_id}{TASK_SUFFIX}").exists():
+            task_id = f"{base}-{counter}"
+            counter += 1
+        used_ids.add(task_id)
+        return task_id
+
+    def plan(self, issues_by_file, complete=True, read=None):
+        """
+        Prépare la synchronisation des tâches avec les problèmes actuels.
+
+        Args:
+            issues_by_file (dict): Fichier -> problèmes, pour les fichiers qui
+                nécessitent une révision manuelle
+            complete (bool): issues_by_file vient d'une vérification complète
+                du projet: les tâches existantes sont mises à jour et celles
+                des fichiers absents sont fermées. Sinon (problèmes d'une
+                seule étape d'un plan), seules les tâches manquantes sont créées
+            read (callable, optional): Lecture d'un fichier par chemin relatif
+                (par défaut sur le disque)
+
+        Returns:
+            dict: 'writes' (chemin -> contenu), 'closes' ([(chemin, chemin
+                  fermé, contenu)]), 'created', 'updated', 'unchanged'
+        """
+        if read is None:
+            read = lambda rel_path: _read(self.project_path / rel_path)
+        plan = {'writes': {}, 'closes': [], 'created': [], 'updated': [], 'unchanged': []}
+        used_ids = {task['id'] for task in self.tasks.values()}
+
+        for file_path in sorted(issues_by_file):
+            issues = issues_by_file[file_path]
+            fingerprints = sorted({issue_fingerprint(issue) for issue in issues})
+            task = self.tasks.get(file_path)
+            current = read(task['path']) if task else None
+            if current is not None:
+                if task['fingerprints'] == fingerprints or not complete:
+                    plan['unchanged'].append(task['path'])
+                    continue
+                plan['writes'][task['path']] = replace_issues_section(current, issues)
+                task['fingerprints'] = fingerprints
+                plan['updated'].append(task['path'])
+                continue
+
+            task_id = self.new_task_id(file_path, used_ids)
+            task = {'id': task_id, 'path': f"{TASKS_DIR}/{task_id}{TASK_SUFFIX}", 'fingerprints': fingerprints}
+            self.tasks[file_path] = task
+            plan['writes'][task['path']] = task_content(task_id, file_path, issues)
+            plan['created'].append(task['path'])
+
+        if complete:
+            resolved = [file_path for file_path in self.tasks if file_path not in issues_by_file]
+            closing = [self.tasks.pop(file_path)['path'] for file_path in resolved] + self.duplicates
+            self.duplicates = []
+            for task_path in closing:
+                content = read(task_path)
+                if content is not None:
+                    closed_path = f"{COMPLETED_DIR}/{os.path.basename(task_path)}"
+                    plan['closes'].append((task_path, closed_path, close_task_content(content)))
+        return plan
+
+    def to_json(self):
+        """Contenu du fichier d'index."""
+        return json.dumps({'tasks': self.tasks, 'duplicates': self.duplicates}, ensure_ascii=False, indent=2, sort_keys=True)
+
+    def apply(self, plan):
+        """
+        Écrit en un lot les tâches préparées par plan(), puis l'index.
+
+        Args:
+            plan (dict): Résultat de plan()
+        """
+        for directory in {os.path.dirname(path) for path in plan['writes']} | \
+                {os.path.dirname(closed) for _, closed, _ in plan['closes']}:
+            os.makedirs(self.project_path / directory, exist_ok=True)
+        for rel_path, content in plan['writes'].items():
+            atomic_write(self.project_path / rel_path, content)
+        for task_path, closed_path, content in plan['closes']:
+            atomic_write(self.project_path / closed_path, content)
+            os.remove(self.project_path / task_path)
+        atomic_write(self.index_path, self.to_json())
+
+
+def sync_review_tasks(project_path, issues_by_file, complete=True, changes=None):
+    """
+    Crée, met à jour et ferme les tâches de révision d'un projet.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues_by_file (dict): Fichier -> problèmes, pour les fichiers qui
+            nécessitent une révision manuelle
+        complete (bool): issues_by_file vient d'une vérification complète du
+            projet (voir ReviewTaskIndex.plan)
+        changes (PlannedChanges, optional): Si fourni, les tâches et l'index
+            sont ajoutés à ces modifications au lieu d'être écrits (avec
+            complete=False seulement: un plan ne supprime pas de fichier)
+
+    Returns:
+        dict: Chemins des tâches 'created', 'updated', 'unchanged' et 'closed'
+    """
+    if changes is not None and complete:
+        raise ValueError("Les tâches ne peuvent pas être fermées dans un plan de modifications (complete=False)")
+    index = ReviewTaskIndex.load(project_path)
+    if changes is not None:
+        plan = index.plan(issues_by_file, complete=False, read=changes.read)
+        for rel_path, content in plan['writes'].items():
+            changes.write(rel_path, content)
+        if plan['writes']:
+            changes.write(REVIEW_INDEX_FILE, index.to_json())
+    else:
+        plan = index.plan(issues_by_file, complete)
+        if plan['writes'] or plan['closes'] or not index.index_path.exists():
+            index.apply(plan)
+
+    result = {
+        'created': plan['created'],
+        'updated': plan['updated'],
+        'unchanged': plan['unchanged'],
+        'closed': [task_path for task_path, _, _ in plan['closes']],
+    }
+    logger.debug(f"Tâches de révision: {len(result['created'])} créées, {len(result['updated'])} mises à jour, "
+                 f"{len(result['unchanged'])} inchangées, {len(result['closed'])} fermées")
+    return result
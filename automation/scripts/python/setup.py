@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Installation des scripts de vérification de structure et de la commande
+verify-structure (voir structure_cli).
+
+Les règles et politiques par défaut sont lues dans automation/config du
+dépôt: installer en mode modifiable, depuis la racine du projet:
+
+    pip install -e automation/scripts/python
+"""
+
+from setuptools import setup
+
+setup(
+    name='structure-verification',
+    version='1.0.0',
+    description="Vérification et correction de la structure des projets d'édition littéraire",
+    python_requires='>=3.7',
+    py_modules=[
+        'structure_cli',
+        'verify_structure_script',
+        'verify_structure_improved_part1',
+        'verify_structure_improved_part2',
+        'verify_structure_improved_part3',
+        'backup_store',
+        'batch_verification',
+        'file_analysis',
+        'fix_policy',
+        'frontmatter_rules',
+        'fuzzy_index',
+        'issue_output',
+        'issue_store',
+        'link_graph',
+        'link_rewriter',
+        'phase_profiler',
+        'plan_executor',
+        'review_tasks',
+        'structure_cache',
+        'structure_spec',
+        'vault_snapshot',
+        'vault_watcher',
+    ],
+    install_requires=['PyYAML'],
+    entry_points={
+        'console_scripts': [
+            'verify-structure=structure_cli:main',
+        ],
+    },
+)
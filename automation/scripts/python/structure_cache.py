@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache persistant des résultats de vérification par fichier.
+
+Le cache est une base SQLite (.structure-cache.sqlite à la racine du projet)
+indexée par chemin relatif. Chaque entrée mémorise la date de modification,
+la taille et l'empreinte du contenu du fichier (absente si le fichier n'a
+pas été lu en entier), ainsi que les problèmes de frontmatter, les liens
+sortants avec leur position, leurs cibles résolues et les liens cassés
+détectés. Une entrée n'est réutilisée que si le fichier n'a pas changé.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import sqlite3
+
+logger = logging.getLogger('structure_verification')
+
+CACHE_FILENAME = '.structure-cache.sqlite'
+
+# À incrémenter quand le format des résultats mis en cache change
+SCHEMA_VERSION = '2'
+
+# Colonnes de résultats stockées en JSON
+RESULT_FIELDS = ('frontmatter_issues', 'links', 'targets', 'broken_links')
+
+
+def content_hash(raw):
+    """
+    Calcule l'empreinte du contenu d'un fichier.
+
+    Args:
+        raw (bytes): Contenu brut du fichier
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    return hashlib.sha1(raw).hexdigest()
+
+
+def rules_fingerprint(*rules):
+    """
+    Calcule l'empreinte des règles de validation, pour invalider le cache
+    quand elles changent.
+
+    Args:
+        *rules: Structures sérialisables en JSON (ex: FRONTMATTER_RULES)
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    serialized = json.dumps(rules, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+
+class CacheEntry(object):
+    """
+    Entrée du cache pour un fichier. Les résultats sont décodés du JSON au
+    premier accès seulement.
+    """
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'sha1', '_raw_results', '_results')
+
+    def __init__(self, path, mtime_ns, size, sha1, raw_results=None, results=None):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.sha1 = sha1
+        self._raw_results = raw_results or {}
+        self._results = results or {}
+
+    def matches_stat(self, stat):
+        """Indique si la date de modification et la taille sont inchangées."""
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+    def get(self, field):
+        """Retourne un résultat mis en cache, ou None s'il est absent."""
+        if field not in self._results:
+            raw_value = self._raw_results.get(field)
+            self._results[field] = json.loads(raw_value) if raw_value is not None else None
+        return self._results[field]
+
+    def set(self, field, value):
+        """Remplace un résultat."""
+        self._results[field] = value
+
+    def results(self):
+        """Retourne tous les résultats sous forme de dictionnaire."""
+        return {field: self.get(field) for field in RESULT_FIELDS}
+
+
+class StructureCache(object):
+    """
+    Cache SQLite des résultats de vérification d'un projet.
+    """
+
+    def __init__(self, project_path, fingerprint='', filename=CACHE_FILENAME):
+        """
+        Args:
+            project_path (Path): Chemin de base du projet
+            fingerprint (str): Empreinte des règles de validation en vigueur
+            filename (str): Nom du fichier de cache à la racine du projet
+        """
+        self.project_path = project_path
+        self.db_path = os.path.join(str(project_path), filename)
+        self.fingerprint = fingerprint
+        self.entries = {}
+        self.connection = None
+
+    def open(self):
+        """
+        Ouvre la base et charge toutes les entrées en mémoire. Le cache est
+        vidé si la version du schéma ou l'empreinte des règles a changé.
+
+        Returns:
+            StructureCache: L'instance elle-même
+        """
+        try:
+            self.connection = sqlite3.connect(self.db_path)
+            self._ensure_schema()
+            self._load()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache inutilisable ({self.db_path}), reconstruction complète: {e}")
+            self.close()
+            self._reset_file()
+        return self
+
+    def _reset_file(self):
+        try:
+            os.remove(self.db_path)
+        except OSError:
+            pass
+        self.entries = {}
+        self.connection = sqlite3.connect(self.db_path)
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        cursor = self.connection.cursor()
+        cursor.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha1 TEXT,"
+            " frontmatter_issues TEXT, links TEXT, targets TEXT, broken_links TEXT)"
+        )
+        meta = dict(cursor.execute("SELECT key, value FROM meta").fetchall())
+        if meta.get('schema') != SCHEMA_VERSION or meta.get('fingerprint') != self.fingerprint:
+            if meta:
+                logger.info("Règles ou format du cache modifiés: invalidation du cache.")
+            cursor.execute("DELETE FROM files")
+            cursor.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [('schema', SCHEMA_VERSION), ('fingerprint', self.fingerprint)]
+            )
+        self.connection.commit()
+
+    def _load(self):
+        self.entries = {}
+        rows = self.connection.execute(
+            "SELECT path, mtime_ns, size, sha1, frontmatter_issues, links, targets, broken_links FROM files"
+        )
+        for path, mtime_ns, size, sha1, *raw_values in rows:
+            self.entries[path] = CacheEntry(path, mtime_ns, size, sha1, dict(zip(RESULT_FIELDS, raw_values)))
+        logger.debug(f"Cache chargé: {len(self.entries)} entrées")
+
+    def get(self, rel_path):
+        """Retourne l'entrée d'un fichier, quelle que soit sa fraîcheur, ou None."""
+        return self.entries.get(rel_path)
+
+    def previous_paths(self):
+        """Retourne l'ensemble des chemins connus lors de la dernière exécution."""
+        return set(self.entries)
+
+    def save(self, updates, current_paths):
+        """
+        Enregistre les entrées mises à jour et supprime celles des fichiers disparus.
+
+        Args:
+            updates (dict): Entrées à enregistrer {chemin: CacheEntry}
+            current_paths (set): Chemins présents dans le projet
+        """
+        removed = [path for path in self.entries if path not in current_paths]
+        for path in removed:
+            del self.entries[path]
+        self.entries.update(updates)
+
+        if self.connection is None:
+            return
+        rows = []
+        for path, entry in updates.items():
+            values = [None if value is None else json.dumps(value, ensure_ascii=False)
+                      for value in (entry.get(field) for field in RESULT_FIELDS)]
+            rows.append([path, entry.mtime_ns, entry.size, entry.sha1] + values)
+        try:
+            with self.connection:
+                self.connection.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in removed])
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size, sha1, frontmatter_issues, links, targets, broken_links)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Impossible d'enregistrer le cache {self.db_path}: {e}")
+        else:
+            logger.debug(f"Cache enregistré: {len(rows)} entrées mises à jour, {len(removed)} supprimées")
+
+    def close(self):
+        """Ferme la connexion à la base."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
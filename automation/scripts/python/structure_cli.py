@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Commande unique de vérification de structure (verify-structure).
+
+Chaque sous-commande est décrite par le module et la fonction qui
+l'implémentent: le module n'est importé qu'au lancement de la sous-commande,
+si bien que `verify-structure --help` ne charge ni YAML, ni SQLite, ni
+multiprocessing. Les options qui suivent la sous-commande sont transmises
+telles quelles à sa fonction main(argv).
+
+Le budget de temps d'import des points d'entrée est vérifié par
+benchmarks/import_budget.py.
+
+Utilisation:
+    verify-structure COMMANDE [options]
+    verify-structure COMMANDE --help
+    python -m structure_cli COMMANDE [options]
+"""
+
+import sys
+import argparse
+from importlib import import_module
+
+# Sous-commande -> (module, fonction, arguments ajoutés en tête, description)
+COMMANDS = {
+    'analyze': ('verify_structure_script', 'main', ['--mode', 'analyze'],
+                "Vérifie la structure du projet et crée le rapport"),
+    'report': ('verify_structure_script', 'main', ['--mode', 'report'],
+               "Vérifie et crée des tâches de révision pour les problèmes complexes"),
+    'fix': ('verify_structure_script', 'main', ['--mode', 'fix'],
+            "Corrige les problèmes simples (sans question avec --policy)"),
+    'links': ('verify_structure_script', 'main', ['--mode', 'links'],
+              "Interroge l'index des liens (--backlinks, --orphans)"),
+    'interactive': ('verify_structure_improved_part3', 'main', ['--mode', 'interactive'],
+                    "Corrige pas à pas selon un plan de correction (sans journal)"),
+    'journal': ('plan_executor', 'main', [],
+                "Affiche, annule ou reprend une correction interrompue"),
+    'backups': ('backup_store', 'main', [],
+                "Liste, restaure ou élague les sauvegardes des fichiers corrigés"),
+}
+
+
+def format_commands():
+    """Liste des sous-commandes pour l'aide."""
+    width = max(len(name) for name in COMMANDS)
+    lines = ["commandes:"]
+    for name, (_, _, _, description) in COMMANDS.items():
+        lines.append(f"  {name:<{width}}  {description}")
+    lines.append("")
+    lines.append("Options d'une commande: verify-structure COMMANDE --help")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Lance une sous-commande.
+
+    Args:
+        argv (list, optional): Arguments de la ligne de commande (par défaut sys.argv)
+
+    Returns:
+        int: Code de retour de la sous-commande
+    """
+    parser = argparse.ArgumentParser(
+        prog='verify-structure',
+        description="Vérifie et corrige la structure d'un projet d'édition littéraire.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=format_commands())
+    parser.add_argument("command", choices=list(COMMANDS), metavar="COMMANDE", help="Sous-commande à lancer")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Options de la sous-commande")
+    args = parser.parse_args(argv)
+
+    module_name, function_name, fixed_args, _ = COMMANDS[args.command]
+    command = getattr(import_module(module_name), function_name)
+
+    # Nom affiché par l'aide et les erreurs de la sous-commande (argparse le tire de sys.argv[0])
+    sys.argv[0] = f"{parser.prog} {args.command}"
+    return command(fixed_args + args.args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
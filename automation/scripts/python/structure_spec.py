@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arborescence attendue d'un projet littéraire, comparée au disque en une passe.
+
+Les deux définitions historiques sont réunies dans un seul arbre:
+- EXPECTED_STRUCTURE (vérification): éléments requis ou recommandés;
+- PROJECT_STRUCTURE (initialisation): éléments à créer et contenu par défaut
+  des fichiers.
+
+diff_structure lit chaque dossier décrit avec un seul os.scandir et classe
+tous les éléments en une passe: présents, manquants, de type incorrect
+(fichier au lieu de dossier ou inversement) et non prévus. Les validateurs
+en tirent leurs problèmes et les correcteurs créent les éléments manquants
+d'après ce même résultat, sans réinterroger le disque.
+"""
+
+import os
+import logging
+
+logger = logging.getLogger('structure_verification')
+
+# Structure attendue du projet basée sur le guide complet
+EXPECTED_STRUCTURE = {
+    'index.md': {'type': 'file', 'required': True},
+    'README.md': {'type': 'file', 'required': True},
+    'chapitres': {'type': 'dir', 'required': True},
+    'structure': {
+        'type': 'dir', 
+        'required': True,
+        'children': {
+            'plan-general.md': {'type': 'file', 'required': True},
+            'arcs-narratifs.md': {'type': 'file', 'required': False},
+            'chronologie.md': {'type': 'file', 'required': False},
+            'personnages.md': {'type': 'file', 'required': True},
+            'univers.md': {'type': 'file', 'required': True}
+        }
+    },
+    'personnages': {
+        'type': 'dir', 
+        'required': True,
+        'children': {
+            'index.md': {'type': 'file', 'required': True},
+            'entites': {'type': 'dir', 'required': False},
+            'manifestations': {'type': 'dir', 'required': False},
+            'mortels': {'type': 'dir', 'required': False},
+            'secondaires': {'type': 'dir', 'required': False}
+        }
+    },
+    'lieux': {
+        'type': 'dir', 
+        'required': False,
+        'children': {
+            'reels': {'type': 'dir', 'required': False},
+            'fictifs': {'type': 'dir', 'required': False}
+        }
+    },
+    'concepts': {'type': 'dir', 'required': False},
+    'references': {
+        'type': 'dir', 
+        'required': True,
+        'children': {
+            'index.md': {'type': 'file', 'required': True}
+        }
+    },
+    'styles': {
+        'type': 'dir', 
+        'required': False,
+        'children': {
+            'index.md': {'type': 'file', 'required': False},
+            'registres': {'type': 'dir', 'required': False}
+        }
+    },
+    'ressources': {'type': 'dir', 'required': True},
+    'claude-sessions': {'type': 'dir', 'required': True},
+    'templates': {'type': 'dir', 'required': True},
+    'export': {'type': 'dir', 'required': True},
+    'automation': {
+        'type': 'dir', 
+        'required': True,
+        'children': {
+            'scripts': {
+                'type': 'dir',
+                'required': True,
+                'children': {
+                    'python': {'type': 'dir', 'required': True},
+                    'bash': {'type': 'dir', 'required': False},
+                    'js': {'type': 'dir', 'required': False}
+                }
+            },
+            'config': {'type': 'dir', 'required': True},
+            'templates': {'type': 'dir', 'required': True},
+            'hooks': {'type': 'dir', 'required': False},
+            'docs': {'type': 'dir', 'required': True}
+        }
+    },
+    'review': {
+        'type': 'dir', 
+        'required': True,
+        'children': {
+            'pending': {'type': 'dir', 'required': True},
+            'in_progress': {'type': 'dir', 'required': True},
+            'completed': {'type': 'dir', 'required': True},
+            'claude_suggestions': {'type': 'dir', 'required': True},
+            'templates': {'type': 'dir', 'required': False}
+        }
+    },
+    'media': {'type': 'dir', 'required': True}
+}
+
+# Définition de la structure standard du projet
+PROJECT_STRUCTURE = {
+    'index.md': "# Projet Littéraire\n\n[Description du projet]",
+    'import': {
+        'README.md': "# Dossier d'import\n\nCe dossier est destiné à contenir les manuscrits originaux et documents externes à importer dans le projet.\n\n## Utilisation\n\n1. Placez vos documents originaux (manuscrits, notes, etc.) dans ce dossier\n2. Utilisez les scripts d'importation du dossier `automation/scripts/python/` pour les traiter\n3. Les documents traités seront convertis au format approprié et placés dans les dossiers correspondants"
+    },
+    'chapitres': {},
+    'structure': {
+        'plan-general.md': "# Plan Général\n\n[Ajouter le plan général ici]",
+        'arcs-narratifs.md': "# Arcs Narratifs\n\n[Ajouter les arcs narratifs ici]",
+        'chronologie.md': "# Chronologie\n\n[Ajouter la chronologie ici]",
+        'personnages': {
+            'index.md': "# Index des Personnages\n\n[Liste des personnages]",
+            'entites': {},
+            'manifestations': {},
+            'mortels': {},
+            'secondaires': {}
+        }
+    },
+    'lieux': {
+        'reels': {},
+        'fictifs': {}
+    },
+    'concepts': {
+        'temporalite.md': "# Temporalité\n\n[Concepts liés au temps]",
+        'manifestations.md': "# Manifestations\n\n[Concept des manifestations]"
+    },
+    'ressources': {
+        'brainstorming': {},
+        'recherche': {},
+        'medias': {
+            'playlists': {},
+            'moodboards': {}
+        },
+        'extraits': {},
+        'auteurs': {}
+    },
+    'references': {
+        'index.md': "# Index des Références\n\n[Liste des références]"
+    },
+    'styles': {
+        'index.md': "# Styles Narratifs\n\n[Vue d'ensemble des styles]",
+        'registres': {},
+        'transitions.md': "# Transitions entre styles\n\n[Matrices de transition]",
+        'verification.md': "# Vérification de style\n\n[Checklist de cohérence]"
+    },
+    'claude-sessions': {
+        'index.md': "# Sessions Claude\n\n[Organisation des sessions]",
+        'developpement': {},
+        'personnages': {},
+        'revision': {},
+        'brainstorming': {}
+    },
+    'automation': {
+        'scripts': {
+            'python': {
+                'README.md': "# Scripts Python\n\nCette section contient les scripts Python pour l'automatisation du projet littéraire."
+            },
+            'bash': {},
+            'js': {}
+        },
+        'config': {},
+        'hooks': {},
+        'templates': {},
+        'docs': {
+            'README.md': "# Documentation des scripts\n\nCette section contient la documentation pour les scripts et workflows d'automatisation."
+        }
+    },
+    'review': {
+        'pending': {},
+        'in_progress': {},
+        'completed': {},
+        'claude_suggestions': {},
+        'templates': {}
+    },
+    'templates': {
+        'personnage-avance.md': "# Template de Personnage Avancé\n\n[Contenu du template]",
+        'chapitre.md': "# Template de Chapitre\n\n[Contenu du template]",
+        'reference.md': "# Template de Référence\n\n[Contenu du template]",
+        'intervenant.md': "# Template d'Intervenant\n\n[Contenu du template]",
+        'todo.md': "# Template de Tâche\n\n[Contenu du template]",
+        'gantt.md': "# Template de Diagramme Gantt\n\n[Contenu du template]"
+    },
+    'export': {
+        'pdf': {},
+        'epub': {},
+        'html': {}
+    }
+}
+
+
+class StructureNode(object):
+    """
+    Élément de l'arborescence attendue.
+
+    required vaut True (requis) ou False (recommandé) pour les éléments de
+    EXPECTED_STRUCTURE, None pour ceux que seule l'initialisation connaît;
+    scaffold indique que l'initialisation crée l'élément, avec content pour
+    contenu s'il s'agit d'un fichier.
+    """
+
+    __slots__ = ('name', 'kind', 'required', 'scaffold', 'content', 'children')
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.required = None
+        self.scaffold = False
+        self.content = None
+        self.children = {}
+
+    def walk(self, rel_path):
+        """
+        Parcourt l'élément et ses descendants, en préordre.
+
+        Args:
+            rel_path (str): Chemin relatif de l'élément
+
+        Yields:
+            tuple: (chemin relatif, StructureNode)
+        """
+        yield rel_path, self
+        for child in self.children.values():
+            yield from child.walk(os.path.join(rel_path, child.name) if rel_path else child.name)
+
+
+def _merge_expected(node, expected_structure):
+    for name, details in expected_structure.items():
+        child = node.children.get(name)
+        if child is None:
+            child = node.children[name] = StructureNode(name, details['type'])
+        child.required = details.get('required', False)
+        if 'children' in details:
+            _merge_expected(child, details['children'])
+
+
+def _merge_project(node, project_structure):
+    for name, content in project_structure.items():
+        kind = 'file' if isinstance(content, str) else 'dir'
+        child = node.children.get(name)
+        if child is None:
+            child = node.children[name] = StructureNode(name, kind)
+        elif child.kind != kind:
+            logger.debug(f"Définitions contradictoires pour {name}: {child.kind} attendu, {kind} à l'initialisation")
+            continue
+        child.scaffold = True
+        if kind == 'file':
+            child.content = content
+        else:
+            _merge_project(child, content)
+
+
+def compile_structure(expected_structure=None, project_structure=None):
+    """
+    Réunit les définitions de la structure dans un seul arbre.
+
+    Args:
+        expected_structure (dict, optional): Définition de vérification
+            (voir EXPECTED_STRUCTURE)
+        project_structure (dict, optional): Définition d'initialisation
+            (voir PROJECT_STRUCTURE)
+
+    Returns:
+        StructureNode: Racine de l'arbre; en cas de désaccord sur le type
+                       d'un élément, la définition de vérification l'emporte
+    """
+    root = StructureNode('', 'dir')
+    if expected_structure:
+        _merge_expected(root, expected_structure)
+    if project_structure:
+        _merge_project(root, project_structure)
+    return root
+
+
+# Arbre unique des deux définitions
+STRUCTURE_TREE = compile_structure(EXPECTED_STRUCTURE, PROJECT_STRUCTURE)
+
+
+def list_directory(abs_dir):
+    """
+    Liste le contenu d'un dossier avec un seul os.scandir.
+
+    Args:
+        abs_dir (str): Chemin absolu du dossier
+
+    Returns:
+        dict: Nom -> 'dir' ou 'file' (liens symboliques suivis, liens cassés ignorés)
+    """
+    listing = {}
+    try:
+        with os.scandir(abs_dir) as iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_dir():
+                        listing[entry.name] = 'dir'
+                    elif entry.is_file() or os.path.exists(entry.path):
+                        listing[entry.name] = 'file'
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.warning(f"Impossible de parcourir {abs_dir}: {e}")
+    return listing
+
+
+class DiffEntry(object):
+    """
+    Élément comparé: status vaut 'present', 'missing', 'mismatch' ou 'extra'.
+    """
+
+    __slots__ = ('status', 'path', 'node', 'actual')
+
+    def __init__(self, status, path, node, actual=None):
+        self.status = status
+        self.path = path
+        self.node = node      # StructureNode (None pour un élément non prévu)
+        self.actual = actual  # type trouvé sur le disque ('dir' ou 'file')
+
+
+class StructureDiff(object):
+    """
+    Résultat de la comparaison de l'arbre attendu avec le disque, dans
+    l'ordre des définitions (préordre). Le contenu d'un dossier manquant
+    n'est pas détaillé: node.walk() donne les éléments qu'il devrait contenir.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.listings = {}  # dossier relatif -> contenu lu sur le disque
+
+    def add(self, status, path, node, actual=None):
+        self.entries.append(DiffEntry(status, path, node, actual))
+
+    def _with_status(self, status):
+        return [entry for entry in self.entries if entry.status == status]
+
+    @property
+    def missing(self):
+        """Éléments attendus absents du disque."""
+        return self._with_status('missing')
+
+    @property
+    def mismatched(self):
+        """Éléments présents avec le mauvais type."""
+        return self._with_status('mismatch')
+
+    @property
+    def extra(self):
+        """Éléments présents dans un dossier décrit mais non prévus."""
+        return self._with_status('extra')
+
+    @property
+    def present(self):
+        """Éléments attendus présents avec le bon type."""
+        return self._with_status('present')
+
+    def missing_by_path(self):
+        """
+        Index des éléments manquants.
+
+        Returns:
+            dict: Chemin relatif -> StructureNode
+        """
+        return {entry.path: entry.node for entry in self.entries if entry.status == 'missing'}
+
+
+def _diff_directory(abs_dir, rel_dir, node, diff):
+    listing = list_directory(abs_dir)
+    diff.listings[rel_dir] = listing
+    for name, child in node.children.items():
+        rel_path = os.path.join(rel_dir, name) if rel_dir else name
+        actual = listing.get(name)
+        if actual is None:
+            diff.add('missing', rel_path, child)
+        elif actual != child.kind:
+            diff.add('mismatch', rel_path, child, actual)
+        else:
+            diff.add('present', rel_path, child)
+            if child.kind == 'dir' and child.children:
+                _diff_directory(os.path.join(abs_dir, name), rel_path, child, diff)
+
+    for name in sorted(listing):
+        if name not in node.children and not name.startswith('.'):
+            diff.add('extra', os.path.join(rel_dir, name) if rel_dir else name, None, listing[name])
+
+
+def diff_structure(project_path, tree=None, base=""):
+    """
+    Compare l'arborescence attendue au disque, en une passe.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        tree (StructureNode, optional): Arbre attendu (par défaut STRUCTURE_TREE)
+        base (str): Chemin relatif du dossier auquel correspond la racine de l'arbre
+
+    Returns:
+        StructureDiff: Éléments présents, manquants, de type incorrect et non prévus
+    """
+    if tree is None:
+        tree = STRUCTURE_TREE
+    diff = StructureDiff()
+    abs_dir = os.path.join(str(project_path), base) if base else str(project_path)
+    _diff_directory(abs_dir, base, tree, diff)
+    return diff
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+Configuration des tests: les modules des scripts sont importés depuis le
+dossier parent, sans installation préalable.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du magasin de sauvegardes adressé par contenu (backup_store):
+déduplication par lien physique, vérification des objets, élagage.
+"""
+
+import os
+
+import pytest
+
+import backup_store
+import plan_executor
+from backup_store import (create_backup, file_hash, list_backups, main, object_path, prune_backups,
+                          restore_backup)
+from plan_executor import PlannedChanges, execute_changes, journal_path, load_journal
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "personnages").mkdir()
+    (tmp_path / "personnages" / "alice.md").write_text("# Alice\n", encoding="utf-8")
+    (tmp_path / "personnages" / "copie.md").write_text("# Alice\n", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("Notes.\n", encoding="utf-8")
+    return tmp_path
+
+
+def objects(project):
+    """Objets du magasin, sous forme d'empreintes."""
+    root = project / ".structure-backups" / "objects"
+    return sorted(path.parent.name + path.name for path in root.glob("*/*"))
+
+
+def test_identical_files_share_a_linked_object(project, caplog):
+    alice = project / "personnages" / "alice.md"
+    with caplog.at_level("INFO", logger="structure_verification"):
+        create_backup(project, ["personnages/alice.md", "personnages/copie.md", "nouveau.md"], "test")
+    sha1 = file_hash(str(alice))
+    assert objects(project) == [sha1]
+    assert os.path.samefile(alice, object_path(project, sha1))
+    assert "Sauvegarde de 3 fichiers (1 liens physiques)" in caplog.text
+
+
+def test_copy_when_links_are_not_supported(project, monkeypatch):
+    def failing_link(source, target):
+        raise OSError("liens physiques non pris en charge")
+
+    monkeypatch.setattr(backup_store.os, "link", failing_link)
+    create_backup(project, ["notes.md"])
+    sha1 = file_hash(str(project / "notes.md"))
+    assert not os.path.samefile(project / "notes.md", object_path(project, sha1))
+    assert object_path(project, sha1).read_text(encoding="utf-8") == "Notes.\n"
+
+
+def replace(path, content):
+    """Remplace un fichier comme le font les correcteurs: l'objet lié garde l'ancien contenu."""
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(content, encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def test_restore_puts_back_content_and_removes_created_files(project):
+    notes = project / "notes.md"
+    notes.chmod(0o600)
+    create_backup(project, ["notes.md", "nouveau.md"])
+    replace(notes, "Corrigé.\n")
+    (project / "nouveau.md").write_text("Créé.\n", encoding="utf-8")
+
+    assert restore_backup(project) == 2
+    assert notes.read_text(encoding="utf-8") == "Notes.\n"
+    assert notes.stat().st_mode & 0o777 == 0o600
+    assert not (project / "nouveau.md").exists()
+
+
+def test_restore_skips_an_altered_object(project):
+    notes = project / "notes.md"
+    create_backup(project, ["notes.md"])
+    replace(notes, "Corrigé.\n")
+    (sha1,) = objects(project)
+    object_path(project, sha1).write_text("Altéré.\n", encoding="utf-8")
+
+    assert restore_backup(project) == 0
+    assert notes.read_text(encoding="utf-8") == "Corrigé.\n"
+
+
+def test_object_modified_through_the_link_is_not_reused(project):
+    alice = project / "personnages" / "alice.md"
+    first = create_backup(project, ["personnages/alice.md"])
+    sha1 = file_hash(str(alice))
+    # Réécriture sur place: l'objet lié est modifié en même temps que le fichier
+    with open(alice, "w", encoding="utf-8") as f:
+        f.write("# Alice modifiée\n")
+    assert file_hash(str(object_path(project, sha1))) != sha1
+
+    # Une nouvelle sauvegarde du même contenu remplace l'objet altéré
+    create_backup(project, ["personnages/copie.md"])
+    assert file_hash(str(object_path(project, sha1))) == sha1
+    assert restore_backup(project, first) == 1
+    assert alice.read_text(encoding="utf-8") == "# Alice\n"
+
+
+def backups(project, count):
+    """Crée des sauvegardes successives de notes.md avec des contenus différents."""
+    manifests = []
+    for index in range(count):
+        replace(project / "notes.md", f"Version {index}.\n")
+        manifests.append(create_backup(project, ["notes.md", "personnages/alice.md"], f"v{index}"))
+    return manifests
+
+
+def test_prune_keeps_recent_backups_and_their_objects(project):
+    manifests = backups(project, 3)
+    assert len(objects(project)) == 4
+
+    assert prune_backups(project, keep=1) == (2, 2)
+    assert list_backups(project) == manifests[-1:]
+    assert objects(project) == sorted([file_hash(str(project / "notes.md")),
+                                       file_hash(str(project / "personnages" / "alice.md"))])
+    replace(project / "notes.md", "Corrigé.\n")
+    assert restore_backup(project) == 1
+    assert (project / "notes.md").read_text(encoding="utf-8") == "Version 2.\n"
+
+
+def test_prune_removes_leftover_temporary_files(project):
+    backups(project, 1)
+    leftover = object_path(project, "ab" * 20).parent / "tmp1234.tmp"
+    leftover.parent.mkdir(parents=True, exist_ok=True)
+    leftover.write_bytes(b"copie interrompue")
+    assert prune_backups(project) == (0, 1)
+    assert not leftover.parent.exists()
+
+
+def test_prune_keeps_what_a_pending_journal_needs(project, monkeypatch):
+    changes = PlannedChanges(project)
+    changes.write("notes.md", "Après.\n")
+
+    def crashing_apply_file(project_path, rel_path, content):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(plan_executor, "_apply_file", crashing_apply_file)
+    with pytest.raises(KeyboardInterrupt):
+        execute_changes(changes, "test", threads=1)
+    monkeypatch.undo()
+    journal = load_journal(project)
+
+    assert prune_backups(project, keep=0) == (0, 0)
+    assert [path.name for path in list_backups(project)] == [journal['manifest']]
+    assert all(object_path(project, entry['sha1']).exists() for entry in journal['files'])
+    assert journal_path(project).exists()
+
+
+def test_prune_command(project):
+    backups(project, 3)
+    assert main(["--project-dir", str(project), "--prune", "2"]) == 0
+    assert len(list_backups(project)) == 2
+    assert main(["--project-dir", str(project), "--prune"]) == 0
+    assert len(list_backups(project)) == 2
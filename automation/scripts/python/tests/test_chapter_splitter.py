@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du découpage en chapitres (chapter_splitter).
+"""
+
+import os
+
+from chapter_splitter import SINGLE_FILENAME, split_chapters
+
+
+def split(tmp_path, text):
+    chapters = split_chapters(text.splitlines(keepends=True), str(tmp_path))
+    return [title for _, title, _ in chapters], sorted(os.listdir(tmp_path))
+
+
+def test_summary_in_lower_style_before_chapters(tmp_path):
+    titles, files = split(tmp_path, "## Résumé\nUn résumé.\n\n# Partie Un\nUn.\n\n# Partie Deux\nDeux.\n")
+    assert titles == ["Préambule", "Partie Un", "Partie Deux"]
+    assert SINGLE_FILENAME not in files
+    with open(tmp_path / files[0], encoding="utf-8") as f:
+        assert f.read() == "# Préambule\n\n## Résumé\nUn résumé.\n"
+
+
+def test_priority_style_found_after_the_end_of_a_lower_style(tmp_path):
+    text = "Chapitre 1: Faux départ\n\n## A\na\n\nChapitre 2\nb\n\n## B\nc\n"
+    titles, _ = split(tmp_path, text)
+    assert titles == ["Préambule", "A", "B"]
+
+
+def test_style_with_a_single_heading_is_content(tmp_path):
+    text = "# Mon livre\n\nChapitre 1: Début\nx\n\nChapitre 2: Suite\ny\n"
+    titles, files = split(tmp_path, text)
+    assert titles == ["Préambule", "Début", "Suite"]
+    with open(tmp_path / files[0], encoding="utf-8") as f:
+        assert f.read() == "# Préambule\n\n# Mon livre\n"
+
+
+def test_no_style_with_two_headings_keeps_the_whole_text(tmp_path):
+    text = "# Titre\n\n## Partie\n\nChapitre 1\ntexte\n"
+    titles, files = split(tmp_path, text)
+    assert titles == []
+    assert files == [SINGLE_FILENAME]
+    with open(tmp_path / SINGLE_FILENAME, encoding="utf-8") as f:
+        assert f.read() == text
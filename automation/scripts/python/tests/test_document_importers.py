@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la conversion des documents importés (document_importers) et de
+leur import dans un projet (init_projet_litteraire.import_document).
+"""
+
+import os
+import zipfile
+
+from document_importers import convert_document, document_lines
+from init_projet_litteraire import import_document
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+DOCX_BODY = (
+    '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Premier</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t xml:space="preserve">Il était </w:t></w:r>'
+    '<w:r><w:rPr><w:b/></w:rPr><w:t>une fois</w:t></w:r><w:r><w:t>.</w:t></w:r></w:p>'
+    '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Second</w:t></w:r></w:p>'
+    '<w:p><w:r><w:rPr><w:i/></w:rPr><w:t>Fin</w:t></w:r></w:p>'
+)
+
+DOCX_MARKDOWN = "# Premier\n\nIl était **une fois**.\n\n# Second\n\n*Fin*\n\n"
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def docx(path, body=DOCX_BODY, complete=True):
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="{W_NS}"><w:body>{body}'
+    if complete:
+        xml += "</w:body></w:document>"
+    return write_zip(path, {"word/document.xml": xml})
+
+
+def read_lines(path):
+    return "".join(document_lines(path))
+
+
+def test_docx_headings_and_formatting(tmp_path):
+    assert read_lines(docx(tmp_path / "livre.docx")) == DOCX_MARKDOWN
+
+
+def test_odt_headings_and_styles(tmp_path):
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0"'
+        ' xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+        '<office:automatic-styles><style:style style:name="T1" style:family="text">'
+        '<style:text-properties fo:font-style="italic"/></style:style></office:automatic-styles>'
+        '<office:body><office:text>'
+        '<text:h text:outline-level="2">Titre</text:h>'
+        '<text:p>Un <text:span text:style-name="T1">mot</text:span> en italique.</text:p>'
+        '<text:list><text:list-item><text:p>Point</text:p></text:list-item></text:list>'
+        '</office:text></office:body></office:document-content>'
+    )
+    path = write_zip(tmp_path / "livre.odt", {"content.xml": content})
+    assert read_lines(path) == "## Titre\n\nUn *mot* en italique.\n\n- Point\n\n"
+
+
+def test_html_blocks(tmp_path):
+    path = tmp_path / "livre.html"
+    path.write_text("<html><head><title>Ignoré</title></head><body><h1>Titre</h1>"
+                    "<p>Un <em>mot</em>\n et <strong>deux</strong>.</p><ul><li>Point</li></ul></body></html>",
+                    encoding="utf-8")
+    assert read_lines(str(path)) == "# Titre\n\nUn *mot* et **deux**.\n\n- Point\n\n"
+
+
+def test_epub_documents_in_spine_order(tmp_path):
+    def chapter(title):
+        return f'<html xmlns="http://www.w3.org/1999/xhtml"><body><h1>{title}</h1><p>Texte.</p></body></html>'
+
+    path = write_zip(tmp_path / "livre.epub", {
+        "META-INF/container.xml": (
+            '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container" version="1.0"><rootfiles>'
+            '<rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>'
+            '</rootfiles></container>'),
+        "OEBPS/content.opf": (
+            '<package xmlns="http://www.idpf.org/2007/opf" version="3.0"><manifest>'
+            '<item id="a" href="a.xhtml" media-type="application/xhtml+xml"/>'
+            '<item id="b" href="texte/b.xhtml" media-type="application/xhtml+xml"/>'
+            '</manifest><spine><itemref idref="b"/><itemref idref="a"/></spine></package>'),
+        "OEBPS/a.xhtml": chapter("Deux"),
+        "OEBPS/texte/b.xhtml": chapter("Un"),
+    })
+    assert read_lines(path) == "# Un\n\nTexte.\n\n# Deux\n\nTexte.\n\n"
+
+
+def test_corrupt_archive_is_reported(tmp_path):
+    path = tmp_path / "livre.docx"
+    path.write_bytes(b"pas une archive")
+    result = convert_document((str(path), str(tmp_path / "sortie"), True))
+    assert result['error'] == "File is not a zip file"
+    assert result['chapters'] == []
+
+
+def project(tmp_path):
+    root = tmp_path / "projet"
+    (root / "chapitres").mkdir(parents=True)
+    (root / "ressources").mkdir()
+    (root / "index.md").write_text("# Livre\n\n## Chapitres\n- existant\n", encoding="utf-8")
+    return root
+
+
+def test_import_splits_docx_into_chapters(tmp_path):
+    root = project(tmp_path)
+    import_document(str(root), docx(tmp_path / "livre.docx"), "Livre", "Auteur")
+    assert sorted(os.listdir(root / "chapitres")) == ["chapitre-01-premier.md", "chapitre-02-second.md"]
+    assert "chapitres/chapitre-02-second.md" in (root / "index.md").read_text(encoding="utf-8")
+
+
+def test_failed_import_leaves_chapters_untouched(tmp_path):
+    root = project(tmp_path)
+    existing = root / "chapitres" / "document-complet.md"
+    existing.write_text("Texte existant.\n", encoding="utf-8")
+    corrupt = tmp_path / "corrompu.docx"
+    corrupt.write_bytes(b"pas une archive")
+    truncated = docx(tmp_path / "tronque.docx", DOCX_BODY * 2, complete=False)
+
+    for document in (str(corrupt), truncated):
+        import_document(str(root), document, "Livre", "Auteur")
+        assert os.listdir(root / "chapitres") == ["document-complet.md"]
+        assert existing.read_text(encoding="utf-8") == "Texte existant.\n"
+        assert (root / "index.md").read_text(encoding="utf-8") == "# Livre\n\n## Chapitres\n- existant\n"
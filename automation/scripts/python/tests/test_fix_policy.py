@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Tests des décisions de la politique de correction (fix_policy) et du plan
+de modifications qu'elle produit.
+"""
+
+import pytest
+
+from backup_store import restore_backup
+from fix_policy import REVIEW_QUEUE_FILE, FixPolicy, PolicyEngine, apply_fix_policy
+from plan_executor import journal_path
+from vault_snapshot import VaultSnapshot
+from verify_structure_script import check_broken_links
+
+NOTES = ("Voir [[Personnages/Alice]], [[personages/bob]], [[personnages/alise]], "
+         "[[personnages/robert-marti]] et [[lieux/inconnu]].\n")
+
+
+@pytest.fixture
+def project(tmp_path):
+    for rel_path in ("personnages/alice.md", "personnages/bob.md", "personnages/robert-martin.md",
+                     "personnages/roberta-martin.md", "lieux/paris.md"):
+        (tmp_path / rel_path).parent.mkdir(exist_ok=True)
+        (tmp_path / rel_path).write_text("# Note\n", encoding="utf-8")
+    (tmp_path / "notes.md").write_text(NOTES, encoding="utf-8")
+    return tmp_path
+
+
+def broken_links(project):
+    snapshot = VaultSnapshot.build(project)
+    return snapshot, {issue['raw_link']: issue for issue in check_broken_links(project, snapshot=snapshot)}
+
+
+def decide(project, rule, raw_link):
+    snapshot, issues = broken_links(project)
+    return PolicyEngine(project, snapshot, FixPolicy([dict(rule, type='broken_link')])).decide(issues[raw_link])
+
+
+def test_fix_case(project):
+    decision = decide(project, {'action': 'fix_case'}, "Personnages/Alice")
+    assert (decision.action, decision.target) == ('fix_case', "personnages/alice")
+    assert decide(project, {'action': 'fix_case'}, "personages/bob").action == 'review'
+
+
+@pytest.mark.parametrize("min_confidence, action", [(0.9, 'replace_prefix'), (0.99, 'review')])
+def test_replace_prefix_confidence(project, min_confidence, action):
+    decision = decide(project, {'action': 'replace_prefix', 'min_confidence': min_confidence}, "personages/bob")
+    assert decision.action == action
+    if action == 'replace_prefix':
+        assert decision.target == "personnages/bob"
+
+
+@pytest.mark.parametrize("min_confidence, action", [(0.9, 'review'), (0.75, 'link_similar')])
+def test_link_similar_confidence(project, min_confidence, action):
+    decision = decide(project, {'action': 'link_similar', 'min_confidence': min_confidence}, "personnages/alise")
+    assert decision.action == action
+    if action == 'link_similar':
+        assert decision.target == "personnages/alice"
+
+
+@pytest.mark.parametrize("min_margin, action", [(0.05, 'review'), (0.01, 'link_similar')])
+def test_link_similar_margin(project, min_margin, action):
+    rule = {'action': 'link_similar', 'min_confidence': 0.8, 'min_margin': min_margin}
+    decision = decide(project, rule, "personnages/robert-marti")
+    assert decision.action == action
+    if action == 'link_similar':
+        assert decision.target == "personnages/robert-martin"
+
+
+def test_first_rule_that_succeeds_wins(project):
+    snapshot, issues = broken_links(project)
+    policy = FixPolicy([{'type': 'broken_link', 'action': 'fix_case'},
+                        {'type': 'broken_link', 'action': 'replace_prefix'}])
+    decision = PolicyEngine(project, snapshot, policy).decide(issues["personages/bob"])
+    assert decision.action == 'replace_prefix'
+    assert decision.rule is policy.rules[1]
+
+
+def test_create_dir_refuses_a_file_path(project):
+    snapshot = VaultSnapshot.build(project)
+    engine = PolicyEngine(project, snapshot, FixPolicy([{'type': 'missing_required', 'action': 'create_dir'}]))
+    issue = {'type': 'missing_required', 'path': "index.md", 'message': "Fichier manquant"}
+    decision = engine.decide(issue)
+    assert decision.action == 'review'
+    assert decision.reason == "le chemin désigne un fichier"
+    assert engine.decide(dict(issue, path="recherche")).target == "recherche"
+
+
+def test_dry_run_plans_fixes_and_review_queue(project):
+    snapshot, issues = broken_links(project)
+    policy = FixPolicy([{'type': 'broken_link', 'action': 'fix_case'},
+                        {'type': 'broken_link', 'action': 'replace_prefix'}])
+    result = apply_fix_policy(project, list(issues.values()), policy, snapshot, dry_run=True)
+
+    assert sorted(result['decisions']) == ['fix_case', 'replace_prefix', 'review']
+    assert result['fixed'] == 2
+    changes = result['changes']
+    assert "[[personnages/alice]]" in changes.files["notes.md"]
+    assert "[[personnages/bob]]" in changes.files["notes.md"]
+    assert changes.files[REVIEW_QUEUE_FILE].count("- [ ]") == 3
+    # Rien n'est écrit en dry-run
+    assert (project / "notes.md").read_text(encoding="utf-8") == NOTES
+    assert not (project / REVIEW_QUEUE_FILE).exists()
+
+
+def test_no_review_queue_without_review(project):
+    snapshot, issues = broken_links(project)
+    policy = FixPolicy([{'type': 'broken_link', 'action': 'skip'}])
+    result = apply_fix_policy(project, list(issues.values()), policy, snapshot, dry_run=True)
+    assert len(result['changes']) == 0
+
+
+def test_empty_review_queue_is_removed_under_the_journal(project):
+    queue = project / REVIEW_QUEUE_FILE
+    queue.parent.mkdir()
+    queue.write_text("# Ancienne file\n", encoding="utf-8")
+    snapshot, issues = broken_links(project)
+    policy = FixPolicy([{'type': 'broken_link', 'action': 'skip'}])
+
+    result = apply_fix_policy(project, list(issues.values()), policy, snapshot, dry_run=True)
+    assert result['changes'].deleted == [REVIEW_QUEUE_FILE]
+    assert queue.exists()
+
+    apply_fix_policy(project, list(issues.values()), policy, snapshot)
+    assert not queue.exists()
+    assert not journal_path(project).exists()
+    # La suppression est sauvegardée comme les autres modifications
+    restore_backup(project)
+    assert queue.read_text(encoding="utf-8") == "# Ancienne file\n"
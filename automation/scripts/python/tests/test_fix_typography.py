@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du correcteur typographique créé dans les projets (scripts/fix_typography.py,
+modèle de init_projet_litteraire.create_simple_scripts).
+"""
+
+import importlib.util
+
+import pytest
+
+from init_projet_litteraire import create_simple_scripts
+
+NBSP = "\u00a0"
+NNBSP = "\u202f"
+
+
+@pytest.fixture(scope="module")
+def typography(tmp_path_factory):
+    root = tmp_path_factory.mktemp("projet")
+    (root / "scripts").mkdir()
+    create_simple_scripts(str(root))
+    spec = importlib.util.spec_from_file_location("fix_typography", root / "scripts" / "fix_typography.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_straight_quotes_become_guillemets(typography):
+    assert typography.fix_french_typography('Il dit "bonjour".') == f"Il dit «{NBSP}bonjour{NBSP}»."
+
+
+@pytest.mark.parametrize("text", ["Il dit «bonjour».", "Il dit « bonjour ».", f"Il dit «{NNBSP}bonjour{NNBSP}»."])
+def test_existing_guillemets_get_non_breaking_spaces(typography, text):
+    assert typography.fix_french_typography(text) == f"Il dit «{NBSP}bonjour{NBSP}»."
+
+
+def test_double_punctuation(typography):
+    assert typography.fix_french_typography("Quoi ? Oui ! Note : fin ; 12:30") == \
+        f"Quoi{NNBSP}? Oui{NNBSP}! Note{NBSP}: fin{NNBSP}; 12:30"
+
+
+def test_url_keeps_its_trailing_punctuation_out(typography):
+    assert typography.fix_french_typography("voir https://x.org!") == f"voir https://x.org{NNBSP}!"
+    assert typography.fix_french_typography("voir https://x.org/a?b=1:2") == "voir https://x.org/a?b=1:2"
+
+
+def test_inline_code_and_links_are_protected(typography):
+    text = 'Le code `a ? "b"` et [[Note: titre]] ou [lien](https://x.org/a?b) !'
+    assert typography.fix_french_typography(text) == \
+        f'Le code `a ? "b"` et [[Note: titre]] ou [lien](https://x.org/a?b){NNBSP}!'
+
+
+def test_frontmatter_and_fences_are_copied(typography):
+    text = '---\ntitre: "Un: deux ?"\n---\n\n```\nx = "a" ?\n```\nFin ?\n'
+    assert typography.fix_french_typography(text) == \
+        f'---\ntitre: "Un: deux ?"\n---\n\n```\nx = "a" ?\n```\nFin{NNBSP}?\n'
+
+
+def test_indented_code_is_copied(typography):
+    text = "Texte :\n\n    indented: code ?\n\n\tautre ?\nFin ?\n"
+    assert typography.fix_french_typography(text) == \
+        f"Texte{NBSP}:\n\n    indented: code ?\n\n\tautre ?\nFin{NNBSP}?\n"
+
+
+def test_indented_continuation_line_is_text(typography):
+    assert typography.fix_french_typography("Un ?\n    deux ?\n") == f"Un{NNBSP}?\n    deux{NNBSP}?\n"
+
+
+def test_correct_lines_keeps_state_across_lines(typography):
+    lines = ["```\n", "a ?\n", "```\n", '"Un\n', 'deux"\n']
+    assert list(typography.correct_lines(lines)) == ["```\n", "a ?\n", "```\n", f"«{NBSP}Un\n", f"deux{NBSP}»\n"]
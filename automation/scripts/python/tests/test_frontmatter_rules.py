@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Règles de frontmatter propres au projet (automation/config/frontmatter-rules.yaml):
+chaque point d'entrée de la vérification doit les appliquer.
+"""
+
+import json
+
+import pytest
+
+import verify_structure_improved_part3
+import verify_structure_script
+from verify_structure_script import validate_frontmatter
+
+MISSING = "Champ requis manquant dans personnages/alice.md: origine"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    config = tmp_path / "automation" / "config"
+    config.mkdir(parents=True)
+    (config / "frontmatter-rules.yaml").write_text(
+        "'personnages/.*':\n  required_fields: [nom, tags, origine]\n", encoding="utf-8")
+    (tmp_path / "index.md").write_text("# Projet\n", encoding="utf-8")
+    (tmp_path / "personnages").mkdir()
+    (tmp_path / "personnages" / "alice.md").write_text(
+        "---\nnom: Alice\ntags: [personnage]\n---\n\n# Alice\n", encoding="utf-8")
+    # Journal de la vérification écrit dans le dossier courant
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_validate_frontmatter_defaults_to_project_rules(project):
+    messages = [issue['message'] for issue in validate_frontmatter(project)]
+    assert MISSING in messages
+
+
+def test_verify_structure_script_reports_project_rule(project):
+    output = project / "rapport.jsonl"
+    verify_structure_script.main(["--project-dir", str(project), "--format", "jsonl",
+                                  "--output", str(output), "--no-cache"])
+    with open(output, encoding="utf-8") as f:
+        messages = [json.loads(line).get('message') for line in f if line.strip()]
+    assert MISSING in messages
+
+
+def test_improved_script_reports_project_rule(project):
+    output = project / "rapport.md"
+    verify_structure_improved_part3.main(["--project-dir", str(project), "--mode", "analyze",
+                                          "--output", str(output)])
+    assert MISSING in output.read_text(encoding="utf-8")
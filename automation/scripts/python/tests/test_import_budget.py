@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Budget d'import des points d'entrée (benchmarks.import_budget), vérifié à
+chaque lancement des tests et non plus seulement à la main.
+
+Les modules interdits et les fichiers créés à l'import sont toujours
+vérifiés. Les temps d'import dépendent de la machine et de sa charge: ils ne
+sont comparés aux budgets qu'avec IMPORT_BUDGET_TIMING=1 (machine de
+référence, ou benchmarks/import_budget.py lancé à la main).
+"""
+
+import os
+
+import pytest
+
+from benchmarks.import_budget import IMPORT_BUDGETS, child_environment, measure_import
+
+# Modules que structure_cli ne doit jamais charger, quel que soit le budget
+CLI_FORBIDDEN = ['yaml', 'sqlite3', 'logging', 'verify_structure_script']
+
+
+@pytest.fixture(scope="module")
+def env():
+    env = child_environment()
+    # Compilation des modules avant les mesures, comme après une installation
+    for module_name in IMPORT_BUDGETS:
+        measure_import(module_name, 1, env)
+    return env
+
+
+def test_cli_does_not_load_command_modules(env):
+    assert set(CLI_FORBIDDEN) <= set(IMPORT_BUDGETS['structure_cli'][1])
+    _, loaded, _ = measure_import('structure_cli', 1, env)
+    assert sorted(set(CLI_FORBIDDEN) & loaded) == []
+
+
+@pytest.mark.parametrize("module_name", sorted(IMPORT_BUDGETS))
+def test_import_loads_nothing_forbidden(env, module_name):
+    _, forbidden = IMPORT_BUDGETS[module_name]
+    milliseconds, loaded, created = measure_import(module_name, 1, env)
+    assert milliseconds is not None
+    assert sorted(set(forbidden) & loaded) == []
+    assert created == []
+
+
+@pytest.mark.skipif(os.environ.get('IMPORT_BUDGET_TIMING') != '1',
+                    reason="temps d'import vérifiés seulement avec IMPORT_BUDGET_TIMING=1")
+@pytest.mark.parametrize("module_name", sorted(IMPORT_BUDGETS))
+def test_import_within_budget(env, module_name):
+    budget, _ = IMPORT_BUDGETS[module_name]
+    milliseconds, _, _ = measure_import(module_name, 3, env)
+    assert milliseconds is not None
+    assert milliseconds <= budget, f"import {module_name}: {milliseconds:.1f} ms au lieu de {budget} ms au plus"
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la réécriture des liens (link_rewriter) et de leur journalisation.
+"""
+
+import logging
+
+from link_rewriter import rewrite_file_links
+from verify_structure_improved_part1 import replace_links_in_file
+
+
+def test_only_applied_targets_are_returned(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("[[a]] [[a#titre|alias]] [texte](b.md)\n", encoding="utf-8")
+    applied = rewrite_file_links(note, {"a": "A", "b.md": "B.md", "absent": "ailleurs"})
+    assert applied == {"a": 2, "b.md": 1}
+    assert note.read_text(encoding="utf-8") == "[[A]] [[A#titre|alias]] [texte](B.md)\n"
+    assert rewrite_file_links(note, {"a": "A"}) == {}
+
+
+def test_only_applied_replacements_are_logged(tmp_path, caplog):
+    note = tmp_path / "note.md"
+    note.write_text("Voir [[ancien]].\n", encoding="utf-8")
+    with caplog.at_level(logging.INFO, logger="structure_verification"):
+        count = replace_links_in_file(note, {"ancien": "nouveau", "absent": "ailleurs"})
+    assert count == 1
+    messages = [record.getMessage() for record in caplog.records if "Liens remplacés" in record.getMessage()]
+    assert len(messages) == 1
+    assert "'ancien' → 'nouveau'" in messages[0]
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de l'exécution journalisée des plans de correction (plan_executor):
+journal, reprise ou annulation d'une exécution interrompue, conflits.
+"""
+
+import pytest
+
+import plan_executor
+from backup_store import object_path
+from plan_executor import (PlannedChanges, execute_changes, journal_path, load_journal, main,
+                           resume_journal, rollback_journal)
+
+ORIGINAL = {"notes.md": "Avant.\n", "review/fix-queue.md": "# File\n"}
+
+
+@pytest.fixture
+def project(tmp_path):
+    for rel_path, content in ORIGINAL.items():
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+def plan(project):
+    changes = PlannedChanges(project)
+    changes.make_dir("lieux")
+    changes.write("notes.md", "Après.\n")
+    changes.write("personnages/alice.md", "# Alice\n")
+    changes.delete("review/fix-queue.md")
+    return changes
+
+
+def tree(project):
+    """Fichiers du projet (hors sauvegardes) et leur contenu, dossiers vides compris."""
+    state = {}
+    for path in sorted(project.rglob("*")):
+        rel_path = path.relative_to(project).as_posix()
+        if rel_path.startswith(".structure-backups"):
+            continue
+        if path.is_file():
+            state[rel_path] = path.read_text(encoding="utf-8")
+        elif not any(path.iterdir()):
+            state[rel_path + "/"] = None
+    return state
+
+
+FINAL = {"lieux/": None, "notes.md": "Après.\n", "personnages/alice.md": "# Alice\n", "review/": None}
+
+
+def interrupt_after(monkeypatch, steps):
+    """Simule l'arrêt brutal du processus après quelques écritures ou suppressions."""
+    done = []
+
+    def crashing(apply):
+        def crashing_apply(project_path, rel_path, *args):
+            if len(done) == steps:
+                raise KeyboardInterrupt
+            apply(project_path, rel_path, *args)
+            done.append(rel_path)
+        return crashing_apply
+
+    monkeypatch.setattr(plan_executor, "_apply_file", crashing(plan_executor._apply_file))
+    monkeypatch.setattr(plan_executor, "_apply_delete", crashing(plan_executor._apply_delete))
+
+
+def test_plan_is_not_written_before_execution(project):
+    changes = plan(project)
+    assert changes.read("review/fix-queue.md") is None
+    assert not changes.exists("review/fix-queue.md")
+    assert changes.summary() == ("1 dossiers à créer, 1 fichiers à créer, 1 fichiers à modifier, "
+                                 "1 fichiers à supprimer")
+    assert "-# File" in changes.format_diff()
+    assert tree(project) == ORIGINAL
+
+
+def test_execution_applies_everything_and_removes_the_journal(project):
+    assert execute_changes(plan(project), "test", threads=1) == 4
+    assert tree(project) == FINAL
+    assert not journal_path(project).exists()
+
+
+def test_error_during_execution_restores_the_tree(project, monkeypatch):
+    def failing_apply_file(project_path, rel_path, content):
+        raise OSError("disque plein")
+
+    monkeypatch.setattr(plan_executor, "_apply_file", failing_apply_file)
+    with pytest.raises(OSError):
+        execute_changes(plan(project), "test", threads=1)
+    assert tree(project) == ORIGINAL
+    assert not journal_path(project).exists()
+
+
+@pytest.mark.parametrize("steps", [0, 1, 2])
+def test_interrupted_execution_is_rolled_back(project, monkeypatch, steps):
+    interrupt_after(monkeypatch, steps)
+    with pytest.raises(KeyboardInterrupt):
+        execute_changes(plan(project), "test", threads=1)
+    assert load_journal(project)['label'] == "test"
+
+    rollback_journal(project)
+    assert tree(project) == ORIGINAL
+    assert not journal_path(project).exists()
+
+
+@pytest.mark.parametrize("steps", [0, 1, 2])
+def test_interrupted_execution_is_resumed(project, monkeypatch, steps):
+    interrupt_after(monkeypatch, steps)
+    with pytest.raises(KeyboardInterrupt):
+        execute_changes(plan(project), "test", threads=1)
+    monkeypatch.undo()
+
+    resume_journal(project)
+    assert tree(project) == FINAL
+    assert not journal_path(project).exists()
+
+
+def test_pending_journal_blocks_a_new_execution(project, monkeypatch):
+    interrupt_after(monkeypatch, 1)
+    with pytest.raises(KeyboardInterrupt):
+        execute_changes(plan(project), "test", threads=1)
+    monkeypatch.undo()
+
+    partial = tree(project)
+    other = PlannedChanges(project)
+    other.write("autre.md", "Autre.\n")
+    with pytest.raises(RuntimeError):
+        execute_changes(other, "autre")
+    assert tree(project) == partial
+    assert main(["--project-dir", str(project)]) == 1
+
+    assert main(["--project-dir", str(project), "--rollback"]) == 0
+    assert main(["--project-dir", str(project)]) == 0
+    assert tree(project) == ORIGINAL
+
+
+def test_resume_refuses_an_altered_final_content(project, monkeypatch):
+    interrupt_after(monkeypatch, 0)
+    with pytest.raises(KeyboardInterrupt):
+        execute_changes(plan(project), "test", threads=1)
+
+    entry = next(entry for entry in load_journal(project)['files'] if entry['path'] == "notes.md")
+    object_path(project, entry['sha1']).write_text("Altéré.\n", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        resume_journal(project)
+    assert journal_path(project).exists()
+    rollback_journal(project)
+    assert tree(project) == ORIGINAL
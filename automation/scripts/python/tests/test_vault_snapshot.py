@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du cache des résultats par fichier (vault_snapshot, structure_cache):
+un fichier dont seul l'en-tête a été lu n'est pas relu en entier.
+"""
+
+import os
+
+import pytest
+
+from frontmatter_rules import load_frontmatter_rules
+from structure_cache import StructureCache, content_hash
+from vault_snapshot import VaultSnapshot
+from verify_structure_script import validate_frontmatter
+
+BODY = "Texte du chapitre.\n" * 20000
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "personnages").mkdir()
+    (tmp_path / "personnages" / "alice.md").write_text(
+        "---\nnom: Alice\ntags: [personnage]\n---\n\n" + BODY, encoding="utf-8")
+    return tmp_path
+
+
+def check_frontmatter(project):
+    """Vérification du frontmatter seul, avec le cache; retourne l'instantané."""
+    rules = load_frontmatter_rules(project)
+    cache = StructureCache(project, rules.fingerprint).open()
+    try:
+        snapshot = VaultSnapshot.build(project, cache=cache)
+        issues = validate_frontmatter(project, snapshot=snapshot, frontmatter_rules=rules)
+        snapshot.save_cache()
+    finally:
+        cache.close()
+    return snapshot, issues
+
+
+def test_header_only_file_is_not_read_to_save_the_cache(project):
+    snapshot, issues = check_frontmatter(project)
+    assert snapshot.bytes_read < len(BODY)
+    assert snapshot.files["personnages/alice.md"].loaded_hash is None
+
+    # Exécution suivante: entrée réutilisée d'après la date et la taille
+    snapshot, cached_issues = check_frontmatter(project)
+    assert snapshot.bytes_read == 0
+    assert cached_issues == issues
+
+
+def test_entry_without_hash_is_dropped_when_the_file_is_touched(project):
+    check_frontmatter(project)
+    path = project / "personnages" / "alice.md"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    snapshot, _ = check_frontmatter(project)
+    # Sans empreinte, l'ancienne entrée ne peut pas être comparée au contenu: en-tête relu
+    assert 0 < snapshot.bytes_read < len(BODY)
+
+
+def test_hash_is_kept_when_the_content_was_read(project):
+    rules = load_frontmatter_rules(project)
+    cache = StructureCache(project, rules.fingerprint).open()
+    try:
+        snapshot = VaultSnapshot.build(project, cache=cache)
+        md_file = snapshot.files["personnages/alice.md"]
+        assert md_file.links == []
+        snapshot.save_cache()
+        assert cache.get("personnages/alice.md").sha1 == content_hash(md_file.raw)
+    finally:
+        cache.close()
@@ -0,0 +1,623 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instantané unique des fichiers markdown d'un projet littéraire.
+
+Le projet est parcouru une seule fois avec os.scandir, en élaguant les
+dossiers cachés (.git, .obsidian, ...) et le dossier export/. Chaque fichier
+n'est lu qu'une seule fois, au premier accès à son contenu; le frontmatter
+et les liens sont extraits à la demande puis conservés. Tous les validateurs
+et correcteurs travaillent ensuite sur cet instantané.
+
+Le frontmatter seul se lit sans charger le fichier: la lecture s'arrête au
+délimiteur --- de fermeture, et les blocs YAML déjà analysés sont retrouvés
+par leur empreinte.
+
+Avec un StructureCache, les fichiers inchangés depuis la dernière exécution
+ne sont pas relus: leurs liens et résultats de validation viennent du cache.
+"""
+
+import os
+import re
+import copy
+from bisect import bisect_right
+from collections import OrderedDict
+from time import perf_counter
+import logging
+
+import yaml
+
+from phase_profiler import counters
+from structure_cache import CacheEntry, content_hash
+
+logger = logging.getLogger('structure_verification')
+
+# Dossiers ignorés à n'importe quelle profondeur (en plus des dossiers cachés)
+EXCLUDED_DIRS = frozenset(['export'])
+
+# Chargeur YAML sûr, en C (libyaml) quand l'extension est disponible
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Taille maximale lue pour trouver la fin du frontmatter avant de lire tout le fichier
+FRONTMATTER_MAX_BYTES = 64 * 1024
+
+# Nombre de blocs de frontmatter analysés conservés (LRU par empreinte)
+FRONTMATTER_CACHE_SIZE = 1024
+_frontmatter_lru = OrderedDict()
+
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+WIKI_LINK_PATTERN = re.compile(r'\[\[(.*?)(?:\|.*?)?\]\]')
+MD_LINK_PATTERN = re.compile(r'\[.*?\]\((.*?)\)')
+NEWLINE_PATTERN = re.compile(r'\n')
+
+
+def parse_frontmatter(content):
+    """
+    Sépare et analyse le frontmatter YAML d'un contenu markdown.
+
+    Args:
+        content (str): Contenu complet du fichier
+
+    Returns:
+        tuple: (frontmatter_dict, content_str) ou (None, content_str) si pas de frontmatter
+
+    Raises:
+        ValueError: Si le frontmatter n'est pas un YAML valide
+    """
+    start = perf_counter()
+    frontmatter_match = FRONTMATTER_PATTERN.match(content)
+    counters['regex_seconds'] += perf_counter() - start
+    if not frontmatter_match:
+        return None, content
+
+    frontmatter_str = frontmatter_match.group(1)
+    remaining_content = content[frontmatter_match.end():]
+
+    return load_frontmatter_yaml(frontmatter_str), remaining_content
+
+
+def load_frontmatter_yaml(frontmatter_str):
+    """
+    Analyse un bloc YAML de frontmatter, en réutilisant le résultat d'un bloc
+    identique déjà analysé (fréquent pour les fichiers issus d'un même template).
+
+    Args:
+        frontmatter_str (str): Contenu du bloc, sans les délimiteurs
+
+    Returns:
+        Valeur YAML analysée (copie indépendante)
+
+    Raises:
+        ValueError: Si le bloc n'est pas un YAML valide
+    """
+    key = content_hash(frontmatter_str.encode('utf-8'))
+    if key in _frontmatter_lru:
+        _frontmatter_lru.move_to_end(key)
+    else:
+        start = perf_counter()
+        try:
+            _frontmatter_lru[key] = yaml.load(frontmatter_str, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            raise ValueError(f"YAML invalide dans le frontmatter: {frontmatter_str}")
+        finally:
+            counters['yaml_parses'] += 1
+            counters['yaml_seconds'] += perf_counter() - start
+        if len(_frontmatter_lru) > FRONTMATTER_CACHE_SIZE:
+            _frontmatter_lru.popitem(last=False)
+    return copy.deepcopy(_frontmatter_lru[key])
+
+
+def read_frontmatter_header(path, max_bytes=FRONTMATTER_MAX_BYTES):
+    """
+    Lit le frontmatter en tête de fichier sans lire le reste du contenu.
+
+    La lecture s'arrête dès la première ligne si elle n'ouvre pas de bloc
+    ---, sinon au délimiteur de fermeture, et au plus après max_bytes octets.
+
+    Args:
+        path (str): Chemin absolu du fichier
+        max_bytes (int): Nombre maximal d'octets lus
+
+    Returns:
+        tuple: (trouvé, frontmatter_dict, octets_lus); trouvé vaut False si
+               l'en-tête n'a pas pu être délimité (le fichier doit alors
+               être lu entièrement)
+
+    Raises:
+        ValueError: Si le frontmatter n'est pas un YAML valide
+    """
+    counters['files_read'] += 1
+    with open(path, 'rb') as f:
+        first_line = f.readline(max_bytes)
+        bytes_read = len(first_line)
+        if not first_line.startswith(b'---'):
+            counters['bytes_read'] += bytes_read
+            return True, None, bytes_read
+
+        lines = [first_line]
+        while bytes_read < max_bytes:
+            line = f.readline(max_bytes - bytes_read)
+            if not line:
+                break
+            lines.append(line)
+            bytes_read += len(line)
+            if line.endswith(b'\n') and line.rstrip() == b'---':
+                counters['bytes_read'] += bytes_read
+                start = perf_counter()
+                frontmatter_match = FRONTMATTER_PATTERN.match(b''.join(lines).decode('utf-8'))
+                counters['regex_seconds'] += perf_counter() - start
+                if frontmatter_match:
+                    return True, load_frontmatter_yaml(frontmatter_match.group(1)), bytes_read
+                return False, None, bytes_read
+
+    counters['bytes_read'] += bytes_read
+    return False, None, bytes_read
+
+
+def extract_links(content):
+    """
+    Extrait les liens wiki [[lien]] puis les liens markdown [texte](lien).
+
+    Args:
+        content (str): Contenu du fichier
+
+    Returns:
+        list: Liens bruts, dans l'ordre liens wiki puis liens markdown
+    """
+    return [link for link, _, _ in extract_link_positions(content)]
+
+
+def extract_link_positions(content):
+    """
+    Extrait les liens avec leur position dans le contenu.
+
+    Args:
+        content (str): Contenu du fichier
+
+    Returns:
+        list: Triplets [lien, ligne, colonne] (numérotés à partir de 1), dans
+              l'ordre liens wiki puis liens markdown
+    """
+    start = perf_counter()
+    newlines = None
+    positions = []
+    for pattern in (WIKI_LINK_PATTERN, MD_LINK_PATTERN):
+        for match in pattern.finditer(content):
+            if newlines is None:
+                newlines = [m.start() for m in NEWLINE_PATTERN.finditer(content)]
+            offset = match.start()
+            line = bisect_right(newlines, offset)
+            line_start = newlines[line - 1] + 1 if line else 0
+            positions.append([match.group(1), line + 1, offset - line_start + 1])
+    counters['regex_seconds'] += perf_counter() - start
+    return positions
+
+
+def walk_markdown_files(project_path, excluded_dirs=EXCLUDED_DIRS):
+    """
+    Parcourt le projet et produit les fichiers markdown visibles.
+
+    Les dossiers cachés et exclus sont élagués avant d'y descendre, au lieu
+    d'être filtrés après coup. Les entrées sont triées pour un ordre stable.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        excluded_dirs (frozenset): Noms de dossiers à ignorer
+
+    Yields:
+        tuple: (chemin_relatif, chemin_absolu, os.stat_result)
+    """
+    pending = [('', str(project_path))]
+    while pending:
+        rel_dir, abs_dir = pending.pop()
+        try:
+            with os.scandir(abs_dir) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.warning(f"Impossible de parcourir {abs_dir}: {e}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            try:
+                if entry.is_dir():
+                    if entry.name not in excluded_dirs:
+                        subdirs.append((rel_path, entry.path))
+                elif entry.name.endswith('.md'):
+                    counters['files_visited'] += 1
+                    yield rel_path, entry.path, entry.stat()
+            except OSError as e:
+                logger.warning(f"Impossible d'accéder à {entry.path}: {e}")
+
+        # Empiler à l'envers pour visiter les sous-dossiers dans l'ordre alphabétique
+        pending.extend(reversed(subdirs))
+
+
+def walk_order_key(rel_path):
+    """
+    Clé de tri reproduisant l'ordre de walk_markdown_files: dans chaque
+    dossier, les fichiers puis les sous-dossiers, par ordre alphabétique.
+
+    Args:
+        rel_path (str): Chemin relatif d'un fichier
+
+    Returns:
+        list: Clé de tri
+    """
+    parts = rel_path.split(os.sep)
+    return [(1, part) for part in parts[:-1]] + [(0, parts[-1])]
+
+
+class VaultFile(object):
+    """
+    Fichier markdown de l'instantané. Le contenu, le frontmatter et les liens
+    sont calculés au premier accès puis conservés.
+    """
+
+    __slots__ = ('rel_path', 'path', 'stat', '_snapshot', '_raw', '_text',
+                 '_frontmatter', '_body', '_frontmatter_error', '_frontmatter_loaded',
+                 '_links', '_cache_entry', '_cache_checked')
+
+    def __init__(self, snapshot, rel_path, path, stat):
+        self._snapshot = snapshot
+        self.rel_path = rel_path
+        self.path = path
+        self.stat = stat
+        self._raw = None
+        self._text = None
+        self._frontmatter = None
+        self._body = None
+        self._frontmatter_error = None
+        self._frontmatter_loaded = False
+        self._links = None
+        self._cache_entry = None
+        self._cache_checked = False
+
+    @property
+    def raw(self):
+        """Contenu brut (bytes), lu une seule fois."""
+        if self._raw is None:
+            with open(self.path, 'rb') as f:
+                self._raw = f.read()
+            self._snapshot.bytes_read += len(self._raw)
+            counters['files_read'] += 1
+            counters['bytes_read'] += len(self._raw)
+        return self._raw
+
+    @property
+    def loaded_hash(self):
+        """Empreinte du contenu s'il a déjà été lu, sinon None (sans lire le fichier)."""
+        return content_hash(self._raw) if self._raw is not None else None
+
+    @property
+    def text(self):
+        """Contenu décodé en UTF-8."""
+        if self._text is None:
+            self._text = self.raw.decode('utf-8')
+        return self._text
+
+    def _parse_frontmatter(self):
+        if self._body is not None or self._frontmatter_error is not None:
+            return
+        try:
+            self._frontmatter, self._body = parse_frontmatter(self.text)
+        except ValueError as e:
+            self._frontmatter_error = e
+
+    def _load_frontmatter(self):
+        if self._frontmatter_loaded:
+            return
+        self._frontmatter_loaded = True
+        if self._raw is None:
+            # Contenu pas encore lu: se limiter à l'en-tête du fichier
+            try:
+                found, self._frontmatter, bytes_read = read_frontmatter_header(self.path)
+            except ValueError as e:
+                self._frontmatter_error = e
+                return
+            self._snapshot.bytes_read += bytes_read
+            if found:
+                return
+        self._parse_frontmatter()
+
+    @property
+    def frontmatter(self):
+        """
+        Frontmatter YAML analysé, ou None s'il est absent. Seul l'en-tête du
+        fichier est lu si le contenu ne l'a pas encore été.
+
+        Raises:
+            ValueError: Si le frontmatter n'est pas un YAML valide
+        """
+        self._load_frontmatter()
+        if self._frontmatter_error is not None:
+            raise self._frontmatter_error
+        return self._frontmatter
+
+    @property
+    def body(self):
+        """Contenu sans le frontmatter."""
+        self._parse_frontmatter()
+        if self._frontmatter_error is not None:
+            return self.text
+        return self._body
+
+    @property
+    def links(self):
+        """Liens bruts extraits du contenu (wiki puis markdown)."""
+        return [link for link, _, _ in self.link_positions]
+
+    @property
+    def link_positions(self):
+        """Liens extraits avec leur position: [lien, ligne, colonne]."""
+        if self._links is None:
+            cached_links = self._snapshot.cached_result(self, 'links')
+            if cached_links is not None:
+                self._links = cached_links
+            else:
+                self._links = extract_link_positions(self.text)
+                self._snapshot.record_result(self, 'links', self._links)
+        return self._links
+
+    def preload(self, links, sha1, bytes_read):
+        """
+        Reprend les résultats d'une analyse faite dans un autre processus,
+        sans relire le fichier.
+
+        Args:
+            links (list): Liens extraits avec leur position
+            sha1 (str): Empreinte du contenu analysé
+            bytes_read (int): Nombre d'octets lus par l'analyse
+        """
+        self._links = links
+        self._snapshot.bytes_read += bytes_read
+        self._snapshot.record_result(self, 'links', links, sha1)
+
+    @property
+    def cache_entry(self):
+        """
+        Entrée du cache encore valide pour ce fichier, ou None.
+
+        Si la date ou la taille ont changé, le contenu est relu et l'entrée
+        n'est conservée que si son empreinte est identique (une entrée sans
+        empreinte, dont le fichier n'avait pas été lu en entier, est abandonnée).
+        """
+        if not self._cache_checked:
+            self._cache_checked = True
+            cache = self._snapshot.cache
+            entry = cache.get(self.rel_path) if cache is not None else None
+            if entry is not None and not entry.matches_stat(self.stat):
+                if entry.sha1 is not None and entry.sha1 == content_hash(self.raw):
+                    # Contenu identique (fichier simplement touché): garder les résultats
+                    self._snapshot.refresh_entry(self, entry)
+                else:
+                    entry = None
+            self._cache_entry = entry
+        return self._cache_entry
+
+    def invalidate(self):
+        """Oublie le contenu mémorisé après une modification du fichier."""
+        self._raw = self._text = self._frontmatter = self._body = None
+        self._frontmatter_error = self._links = None
+        self._frontmatter_loaded = False
+        self._cache_entry = None
+        self._cache_checked = False
+        try:
+            self.stat = os.stat(self.path)
+        except OSError:
+            pass
+        self._snapshot.forget_results(self)
+
+
+class VaultSnapshot(object):
+    """
+    Vue unique des fichiers markdown d'un projet, construite en un seul parcours.
+    """
+
+    def __init__(self, project_path, cache=None):
+        self.project_path = project_path
+        self.cache = cache
+        self.files = {}
+        self.bytes_read = 0
+        self._cache_updates = {}
+        self._changed_targets = None
+        self._targets_by_lower = None
+        self.link_graph = None  # LinkGraph, construit à la demande (link_graph_for)
+        self.fuzzy_index = None  # TrigramIndex, construit à la demande (fuzzy_index_for)
+        self._files_by_name = None
+
+    @classmethod
+    def build(cls, project_path, excluded_dirs=EXCLUDED_DIRS, cache=None):
+        """
+        Construit l'instantané du projet.
+
+        Args:
+            project_path (Path): Chemin de base du projet
+            excluded_dirs (frozenset): Noms de dossiers à ignorer
+            cache (StructureCache, optional): Cache des résultats par fichier
+
+        Returns:
+            VaultSnapshot: Instantané du projet
+        """
+        snapshot = cls(project_path, cache)
+        for rel_path, abs_path, stat in walk_markdown_files(project_path, excluded_dirs):
+            snapshot.files[rel_path] = VaultFile(snapshot, rel_path, abs_path, stat)
+        logger.debug(f"Instantané construit: {len(snapshot.files)} fichiers markdown")
+        return snapshot
+
+    def __iter__(self):
+        return iter(self.files.values())
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, rel_path):
+        return rel_path in self.files
+
+    def get(self, rel_path):
+        """Retourne le VaultFile d'un chemin relatif, ou None."""
+        return self.files.get(rel_path)
+
+    @property
+    def targets_by_lower(self):
+        """Cibles de liens indexées par leur forme en minuscules."""
+        if self._targets_by_lower is None:
+            targets = {}
+            for rel_path in self.files:
+                targets[rel_path.lower()] = rel_path
+                targets[rel_path[:-3].lower()] = rel_path[:-3]
+            self._targets_by_lower = targets
+        return self._targets_by_lower
+
+    def add_file(self, rel_path):
+        """
+        Ajoute un fichier créé depuis la construction de l'instantané, ou
+        relit un fichier modifié.
+
+        Args:
+            rel_path (str): Chemin relatif du fichier
+
+        Returns:
+            VaultFile: Fichier ajouté ou mis à jour
+        """
+        vault_file = self.files.get(rel_path)
+        if vault_file is not None:
+            vault_file.invalidate()
+            return vault_file
+
+        abs_path = os.path.join(str(self.project_path), rel_path)
+        vault_file = VaultFile(self, rel_path, abs_path, os.stat(abs_path))
+        self.files[rel_path] = vault_file
+        self.files = dict(sorted(self.files.items(), key=lambda item: walk_order_key(item[0])))
+        self._reset_indexes()
+        if self.link_graph is not None:
+            self.link_graph.add_node(rel_path)
+            self.link_graph.refresh(self, vault_file)
+        return vault_file
+
+    def remove_file(self, rel_path):
+        """
+        Retire un fichier supprimé depuis la construction de l'instantané.
+
+        Args:
+            rel_path (str): Chemin relatif du fichier
+        """
+        if self.files.pop(rel_path, None) is None:
+            return
+        self._cache_updates.pop(rel_path, None)
+        self._reset_indexes()
+        if self.link_graph is not None:
+            self.link_graph.remove_node(rel_path)
+
+    def _reset_indexes(self):
+        self._changed_targets = None
+        self._targets_by_lower = None
+        self._files_by_name = None
+        self.fuzzy_index = None
+
+    def files_named(self, filename):
+        """
+        Retourne les fichiers portant exactement ce nom, quel que soit leur dossier.
+
+        Args:
+            filename (str): Nom de fichier recherché (ex: 'chapitre-01.md')
+
+        Returns:
+            list: Liste de VaultFile
+        """
+        if self._files_by_name is None:
+            by_name = {}
+            for vault_file in self.files.values():
+                by_name.setdefault(os.path.basename(vault_file.rel_path), []).append(vault_file)
+            self._files_by_name = by_name
+        return self._files_by_name.get(filename, [])
+
+    @property
+    def changed_targets(self):
+        """
+        Cibles de liens ajoutées, supprimées ou renommées depuis la dernière
+        exécution (avec et sans extension .md). Sans cache, retourne None:
+        toutes les cibles sont alors considérées comme modifiées.
+        """
+        if self.cache is None:
+            return None
+        if self._changed_targets is None:
+            changed = self.cache.previous_paths().symmetric_difference(self.files)
+            targets = set()
+            for rel_path in changed:
+                targets.add(rel_path)
+                targets.add(rel_path[:-3])
+            self._changed_targets = targets
+        return self._changed_targets
+
+    def cached_result(self, vault_file, field):
+        """
+        Retourne un résultat de vérification déjà connu pour ce fichier:
+        calculé pendant cette exécution (éventuellement par un processus
+        de travail) ou lu dans le cache.
+
+        Args:
+            vault_file (VaultFile): Fichier concerné
+            field (str): Nom du résultat (voir structure_cache.RESULT_FIELDS)
+
+        Returns:
+            Valeur connue, ou None si absente ou périmée
+        """
+        update = self._cache_updates.get(vault_file.rel_path)
+        if update is not None and update.get(field) is not None:
+            return update.get(field)
+        if self.cache is None:
+            return None
+        entry = vault_file.cache_entry
+        return entry.get(field) if entry is not None else None
+
+    def record_result(self, vault_file, field, value, sha1=None):
+        """
+        Mémorise un résultat calculé, pour cette exécution et pour le cache.
+
+        Args:
+            vault_file (VaultFile): Fichier concerné
+            field (str): Nom du résultat
+            value: Valeur sérialisable en JSON
+            sha1 (str, optional): Empreinte du contenu si elle est déjà connue
+        """
+        update = self._cache_updates.get(vault_file.rel_path)
+        if update is None:
+            entry = vault_file.cache_entry
+            stat = vault_file.stat
+            if entry is not None:
+                update = CacheEntry(vault_file.rel_path, stat.st_mtime_ns, stat.st_size,
+                                    entry.sha1, results=entry.results())
+            else:
+                # L'empreinte est calculée à l'enregistrement si elle n'est pas fournie
+                update = CacheEntry(vault_file.rel_path, stat.st_mtime_ns, stat.st_size, sha1)
+            self._cache_updates[vault_file.rel_path] = update
+        update.set(field, value)
+
+    def refresh_entry(self, vault_file, entry):
+        """Reprend une entrée dont seul l'horodatage du fichier a changé."""
+        stat = vault_file.stat
+        self._cache_updates[vault_file.rel_path] = CacheEntry(
+            vault_file.rel_path, stat.st_mtime_ns, stat.st_size, entry.sha1, results=entry.results()
+        )
+
+    def forget_results(self, vault_file):
+        """Abandonne les résultats en attente d'un fichier modifié."""
+        self._cache_updates.pop(vault_file.rel_path, None)
+        if self.link_graph is not None:
+            self.link_graph.refresh(self, vault_file)
+
+    def save_cache(self):
+        """Enregistre les résultats calculés pendant cette exécution dans le cache."""
+        if self.cache is None:
+            return
+        for rel_path, update in self._cache_updates.items():
+            # Fichier dont seul l'en-tête a été lu: l'entrée reste liée à sa date
+            # et à sa taille, sans relire tout le fichier pour son empreinte
+            if update.sha1 is None:
+                update.sha1 = self.files[rel_path].loaded_hash
+        self.cache.save(self._cache_updates, set(self.files))
+        self._cache_updates = {}
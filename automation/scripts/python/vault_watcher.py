@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Surveillance des fichiers markdown d'un projet (option --watch).
+
+Sous Linux, les modifications sont signalées par inotify (appelé via ctypes,
+sans dépendance externe); ailleurs, ou si inotify est indisponible, le projet
+est reparcouru périodiquement et les dates de modification comparées. Les
+rafales d'événements (une sauvegarde Obsidian écrit souvent plusieurs fois le
+même fichier) sont regroupées en un seul lot après un court délai de calme.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import logging
+import ctypes
+import ctypes.util
+
+from vault_snapshot import EXCLUDED_DIRS, walk_markdown_files
+
+logger = logging.getLogger('structure_verification')
+
+# Intervalle entre deux parcours du projet en mode de scrutation (secondes)
+POLL_INTERVAL = 1.0
+
+# Délai de calme avant de traiter un lot de modifications (secondes)
+DEFAULT_DEBOUNCE = 0.5
+
+# Constantes inotify (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+EVENT_HEADER = struct.Struct('iIII')
+
+# Marqueur de changement global (file d'événements débordée): tout reparcourir
+RESCAN_ALL = ''
+
+
+def is_ignored(rel_path, excluded_dirs=EXCLUDED_DIRS):
+    """
+    Indique si un chemin relatif est hors du périmètre de vérification.
+
+    Args:
+        rel_path (str): Chemin relatif au projet
+        excluded_dirs (frozenset): Noms de dossiers ignorés
+
+    Returns:
+        bool: True si un composant est caché ou exclu
+    """
+    parts = rel_path.split(os.sep)
+    return any(part.startswith('.') for part in parts) or any(part in excluded_dirs for part in parts[:-1])
+
+
+class PollingWatcher(object):
+    """
+    Détection des modifications par parcours périodique du projet.
+    """
+
+    def __init__(self, project_path, ignored=(), excluded_dirs=EXCLUDED_DIRS, interval=POLL_INTERVAL):
+        self.project_path = project_path
+        self.ignored = set(ignored)
+        self.excluded_dirs = excluded_dirs
+        self.interval = interval
+        self.known = self._scan()
+
+    def _scan(self):
+        return {rel_path: (stat.st_mtime_ns, stat.st_size)
+                for rel_path, _, stat in walk_markdown_files(self.project_path, self.excluded_dirs)
+                if rel_path not in self.ignored}
+
+    def poll(self, timeout=None):
+        """
+        Attend des modifications.
+
+        Args:
+            timeout (float): Délai maximal d'attente, None pour attendre indéfiniment
+
+        Returns:
+            set: Chemins relatifs créés, modifiés ou supprimés
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = max(0.0, min(delay, deadline - time.monotonic()))
+            time.sleep(delay)
+
+            current = self._scan()
+            changes = {rel_path for rel_path in set(current) | set(self.known)
+                       if current.get(rel_path) != self.known.get(rel_path)}
+            self.known = current
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return changes
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher(object):
+    """
+    Détection des modifications par inotify (Linux).
+    """
+
+    def __init__(self, project_path, ignored=(), excluded_dirs=EXCLUDED_DIRS):
+        self.project_path = str(project_path)
+        self.ignored = set(ignored)
+        self.excluded_dirs = excluded_dirs
+        self.directories = {}  # descripteur de surveillance -> chemin relatif du dossier
+
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._watch_tree('')
+
+    def _watch_tree(self, rel_dir):
+        """Surveille un dossier et tous ses sous-dossiers visibles."""
+        pending = [rel_dir]
+        while pending:
+            current = pending.pop()
+            abs_dir = os.path.join(self.project_path, current) if current else self.project_path
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(abs_dir), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error == errno.ENOSPC:
+                    raise OSError(error, "Limite de surveillances inotify atteinte (fs.inotify.max_user_watches)")
+                logger.debug(f"Impossible de surveiller {abs_dir}: {os.strerror(error)}")
+                continue
+            self.directories[wd] = current
+            try:
+                with os.scandir(abs_dir) as iterator:
+                    for entry in iterator:
+                        if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.') \
+                                and entry.name not in self.excluded_dirs:
+                            pending.append(os.path.join(current, entry.name) if current else entry.name)
+            except OSError as e:
+                logger.debug(f"Impossible de parcourir {abs_dir}: {e}")
+
+    def _read_events(self):
+        changes = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changes
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    changes.add(RESCAN_ALL)
+                    continue
+                if mask & IN_IGNORED:
+                    self.directories.pop(wd, None)
+                    continue
+                rel_dir = self.directories.get(wd)
+                if rel_dir is None or not name:
+                    continue
+
+                rel_path = os.path.join(rel_dir, name) if rel_dir else name
+                if is_ignored(rel_path, self.excluded_dirs) or rel_path in self.ignored:
+                    continue
+                if mask & IN_ISDIR:
+                    if name in self.excluded_dirs:
+                        continue
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._watch_tree(rel_path)
+                    changes.add(rel_path)
+                elif name.endswith('.md'):
+                    changes.add(rel_path)
+
+    def poll(self, timeout=None):
+        """
+        Attend des modifications.
+
+        Args:
+            timeout (float): Délai maximal d'attente, None pour attendre indéfiniment
+
+        Returns:
+            set: Chemins relatifs modifiés (fichiers markdown ou dossiers)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self.fd], [], [], remaining)
+            if not readable:
+                return set()
+            changes = self._read_events()
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return changes
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(project_path, ignored=(), excluded_dirs=EXCLUDED_DIRS):
+    """
+    Crée le meilleur mécanisme de surveillance disponible.
+
+    Args:
+        project_path (Path): Chemin de base du projet
+        ignored (iterable): Chemins relatifs à ne pas signaler (ex: le rapport)
+        excluded_dirs (frozenset): Noms de dossiers ignorés
+
+    Returns:
+        InotifyWatcher ou PollingWatcher
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            watcher = InotifyWatcher(project_path, ignored, excluded_dirs)
+            logger.debug(f"Surveillance inotify de {len(watcher.directories)} dossiers")
+            return watcher
+        except (OSError, AttributeError) as e:
+            logger.info(f"inotify indisponible ({e}), surveillance par scrutation.")
+    return PollingWatcher(project_path, ignored, excluded_dirs)
+
+
+def next_batch(watcher, debounce=DEFAULT_DEBOUNCE):
+    """
+    Attend le prochain lot de modifications, regroupées tant qu'elles se
+    suivent à moins de `debounce` secondes d'intervalle.
+
+    Args:
+        watcher: InotifyWatcher ou PollingWatcher
+        debounce (float): Délai de calme en secondes
+
+    Returns:
+        set: Chemins relatifs modifiés
+    """
+    changes = set()
+    while not changes:
+        changes |= watcher.poll(None)
+    while True:
+        more = watcher.poll(debounce)
+        if not more:
+            return changes
+        changes |= more
+
+
+def apply_changes(snapshot, changes, excluded_dirs=EXCLUDED_DIRS):
+    """
+    Met à jour l'instantané avec un lot de modifications.
+
+    Args:
+        snapshot (VaultSnapshot): Instantané gardé en mémoire
+        changes (set): Chemins relatifs signalés par le mécanisme de surveillance
+        excluded_dirs (frozenset): Noms de dossiers ignorés
+
+    Returns:
+        tuple: (chemins créés ou modifiés, chemins supprimés)
+    """
+    project_path = str(snapshot.project_path)
+    changed, removed = set(), set()
+
+    for rel_path in sorted(changes):
+        abs_path = os.path.join(project_path, rel_path) if rel_path else project_path
+
+        if rel_path.endswith('.md') and not os.path.isdir(abs_path):
+            if os.path.isfile(abs_path):
+                snapshot.add_file(rel_path)
+                changed.add(rel_path)
+            elif rel_path in snapshot:
+                snapshot.remove_file(rel_path)
+                removed.add(rel_path)
+            continue
+
+        # Dossier créé, déplacé ou supprimé (ou débordement): réconcilier son contenu
+        prefix = os.path.join(rel_path, '') if rel_path else ''
+        on_disk = {}
+        if os.path.isdir(abs_path):
+            for sub_path, _, stat in walk_markdown_files(abs_path, excluded_dirs):
+                on_disk[prefix + sub_path] = stat
+        for known in [path for path in snapshot.files if path.startswith(prefix)]:
+            if known not in on_disk:
+                snapshot.remove_file(known)
+                removed.add(known)
+        for path, stat in on_disk.items():
+            known = snapshot.get(path)
+            if known is None or (known.stat.st_mtime_ns, known.stat.st_size) != (stat.st_mtime_ns, stat.st_size):
+                snapshot.add_file(path)
+                changed.add(path)
+
+    return changed, removed
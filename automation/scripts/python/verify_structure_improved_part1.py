@@ -5,24 +5,31 @@ Fonctions améliorées pour la détection et la correction de liens cassés
 """
 
 import os
-import re
 import logging
-from pathlib import Path
 from difflib import SequenceMatcher
 
+from fuzzy_index import fuzzy_index_for
+from issue_store import IssueStore, get_broken_link
+from link_rewriter import rewrite_file_links
+from vault_snapshot import VaultSnapshot
+
 logger = logging.getLogger('structure_verification')
 
-def find_similar_files(project_path, broken_link):
+def find_similar_files(project_path, broken_link, snapshot=None):
     """
     Recherche des fichiers similaires au lien cassé dans le projet.
     
     Args:
         project_path (Path): Chemin de base du projet
         broken_link (str): Lien cassé à rechercher
+        snapshot (VaultSnapshot, optional): Instantané du projet à réutiliser
         
     Returns:
         list: Liste de fichiers similaires trouvés [(chemin, score_similitude)]
     """
+    if snapshot is None:
+        snapshot = VaultSnapshot.build(project_path)
+    
     # Extraire le nom de fichier sans le chemin
     link_parts = broken_link.split('/')
     filename = link_parts[-1]
@@ -33,37 +40,29 @@ def find_similar_files(project_path, broken_link):
     
     # Rechercher des fichiers avec le même nom dans tout le projet
     similar_files = []
-    for file_path in project_path.glob(f'**/{filename}'):
-        # Ignorer les fichiers dans .git, export, etc.
-        if any(part.startswith('.') for part in file_path.parts) or 'export' in file_path.parts:
-            continue
-        
-        rel_path = file_path.relative_to(project_path)
+    for vault_file in snapshot.files_named(filename):
+        rel_path = vault_file.rel_path
         
         # Calculer un score de similarité
-        similarity = calculate_path_similarity(str(rel_path), broken_link)
-        similar_files.append((str(rel_path), similarity))
+        similarity = calculate_path_similarity(rel_path, broken_link)
+        similar_files.append((rel_path, similarity))
     
     # Si aucun fichier avec le même nom n'est trouvé, chercher des noms similaires
+    # parmi les seuls candidats proposés par l'index de trigrammes
     if not similar_files:
-        for file_path in project_path.glob('**/*.md'):
-            # Ignorer les fichiers dans .git, export, etc.
-            if any(part.startswith('.') for part in file_path.parts) or 'export' in file_path.parts:
-                continue
-            
-            rel_path = file_path.relative_to(project_path)
-            file_basename = os.path.basename(str(rel_path))
-            link_basename = os.path.basename(broken_link)
+        link_basename = os.path.basename(broken_link)
+        for rel_path, _ in fuzzy_index_for(snapshot).candidates(link_basename):
+            file_basename = os.path.basename(rel_path)
             
             # Calculer la similarité entre les noms de fichier
             name_similarity = SequenceMatcher(None, file_basename, link_basename).ratio()
             if name_similarity > 0.6:  # Seuil de similarité pour les noms
                 # Calculer la similarité globale du chemin
-                path_similarity = calculate_path_similarity(str(rel_path), broken_link)
+                path_similarity = calculate_path_similarity(rel_path, broken_link)
                 # Combiner les deux scores, en donnant plus de poids à la similarité du nom
                 combined_similarity = (name_similarity * 0.7) + (path_similarity * 0.3)
                 if combined_similarity > 0.5:  # Seuil minimal de similarité combinée
-                    similar_files.append((str(rel_path), combined_similarity))
+                    similar_files.append((rel_path, combined_similarity))
     
     return sorted(similar_files, key=lambda x: x[1], reverse=True)
 
@@ -113,34 +112,12 @@ def detect_common_path_issues(issues):
     Détecte les problèmes de chemin communs (par exemple, préfixe 'docs/' incorrect).
     
     Args:
-        issues (list): Liste des problèmes de liens cassés
+        issues (list ou IssueStore): Problèmes (seuls les liens cassés sont comptés)
         
     Returns:
         dict: Dictionnaire des motifs de préfixe détectés et leur fréquence
     """
-    prefix_patterns = {}
-    
-    for issue in issues:
-        if issue['type'] != 'broken_link':
-            continue
-        
-        # Extraire le chemin du message d'erreur
-        message = issue['message']
-        link_match = re.search(r"'([^']+)'", message)
-        if not link_match:
-            continue
-            
-        path = link_match.group(1)
-        
-        # Détecter les préfixes communs
-        parts = path.split('/')
-        if len(parts) > 1:
-            prefix = parts[0]
-            if prefix not in prefix_patterns:
-                prefix_patterns[prefix] = 0
-            prefix_patterns[prefix] += 1
-    
-    return prefix_patterns
+    return IssueStore.of(issues).link_prefixes()
 
 def suggest_prefix_replacements(prefix_patterns, project_path):
     """
@@ -190,52 +167,52 @@ def replace_link_in_file(file_path, old_link, new_link):
     Returns:
         bool: True si le remplacement a réussi, False sinon
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Normaliser les liens pour la recherche
-        old_link_norm = old_link.replace('\\', '/').strip()
-        new_link_norm = new_link.replace('\\', '/').strip()
-        
-        # Escape les caractères spéciaux pour la regex
-        old_link_esc = re.escape(old_link_norm)
-        
-        # Remplacer dans les liens markdown
-        md_pattern = r'\[([^\]]*)\]\(' + old_link_esc + r'(?:#[^)]+)?\)'
-        content = re.sub(md_pattern, lambda m: f'[{m.group(1)}]({new_link_norm})', content)
-        
-        # Remplacer dans les liens wiki
-        wiki_pattern = r'\[\[' + old_link_esc + r'(\|[^\]]+)?\]\]'
-        
-        def wiki_replacer(match):
-            pipe_part = match.group(1) if match.group(1) else ''
-            return f'[[{new_link_norm}{pipe_part}]]'
-        
-        content = re.sub(wiki_pattern, wiki_replacer, content)
-        
-        # Vérifier si des modifications ont été apportées
-        # Utiliser une différence de longueur pour éviter les faux positifs
-        # dus aux caractères spéciaux dans les regex
-        original_len = len(content)
-        new_content = content
-        if new_content == content:
-            logger.debug(f"Aucune modification apportée à {file_path}")
-            return False
+    return replace_links_in_file(file_path, {old_link: new_link}) > 0
+
+def normalize_replacements(replacements):
+    """
+    Normalise les liens à remplacer pour la recherche dans les fichiers.
+    
+    Args:
+        replacements (dict): Liens à remplacer {ancien: nouveau}
         
-        # Sauvegarder les modifications
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+    Returns:
+        dict: Liens normalisés (séparateurs '/', sans espaces autour)
+    """
+    normalized = {}
+    for old_link, new_link in replacements.items():
+        normalized[old_link.replace('\\', '/').strip()] = new_link.replace('\\', '/').strip()
+    return normalized
+
+def replace_links_in_file(file_path, replacements):
+    """
+    Remplace en une seule passe (une lecture, une écriture atomique) tous
+    les liens à corriger dans un fichier.
+    
+    Args:
+        file_path (Path): Chemin du fichier
+        replacements (dict): Liens à remplacer {ancien: nouveau}
         
-        logger.info(f"Liens remplacés dans {file_path}: '{old_link}' → '{new_link}'")
-        return True
+    Returns:
+        int: Nombre de liens remplacés
+    """
+    replacements = normalize_replacements(replacements)
+    try:
+        applied = rewrite_file_links(file_path, replacements)
     except Exception as e:
         logger.error(f"Erreur lors du remplacement de liens dans {file_path}: {e}")
-        return False
+        return 0
+    
+    # Seuls les liens effectivement présents dans le fichier sont signalés
+    for old_link, count in applied.items():
+        logger.info(f"Liens remplacés dans {file_path}: '{old_link}' → '{replacements[old_link]}' ({count})")
+    if not applied:
+        logger.debug(f"Aucune modification apportée à {file_path}")
+    return sum(applied.values())
 
-def fix_prefix_in_group(project_path, issues, prefix, replacement):
+def prefix_replacements_by_file(project_path, issues, prefix, replacement):
     """
-    Remplace un préfixe de chemin dans un groupe de liens cassés.
+    Calcule, fichier par fichier, les liens d'un groupe dont le préfixe est à remplacer.
     
     Args:
         project_path (Path): Chemin de base du projet
@@ -244,87 +221,106 @@ def fix_prefix_in_group(project_path, issues, prefix, replacement):
         replacement (str): Préfixe de remplacement
         
     Returns:
-        int: Nombre de liens corrigés
+        dict: Remplacements {ancien: nouveau} par chemin de fichier
     """
-    fixed_count = 0
-    processed_files = set()
+    replacements_by_file = {}
     
     for issue in issues:
-        # Extraire le chemin du fichier contenant le lien cassé
-        file_path = project_path / issue['path']
-        if str(file_path) in processed_files:
+        broken_link = get_broken_link(issue)
+        if not broken_link:
             continue
         
-        # Extraire le lien cassé du message
-        link_match = re.search(r"'([^']+)'", issue['message'])
-        if not link_match:
+        # Vérifier si ce lien commence par le préfixe à remplacer
+        if not broken_link.startswith(f"{prefix}/"):
             continue
-            
-        broken_link = link_match.group(1)
         
-        # Vérifier si ce lien commence par le préfixe à remplacer
+        # Remplacer le lien tel qu'il est écrit dans le fichier, s'il est connu
+        broken_link = issue.get('raw_link', broken_link)
         if not broken_link.startswith(f"{prefix}/"):
             continue
         
         # Créer le nouveau lien avec le préfixe remplacé
         new_link = broken_link.replace(f"{prefix}/", f"{replacement}/", 1)
+        file_path = project_path / issue['path']
+        replacements_by_file.setdefault(file_path, {})[broken_link] = new_link
+    
+    return replacements_by_file
+
+def fix_prefix_in_group(project_path, issues, prefix, replacement):
+    """
+    Remplace un préfixe de chemin dans un groupe de liens cassés.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste des problèmes de liens cassés
+        prefix (str): Préfixe à remplacer
+        replacement (str): Préfixe de remplacement
         
-        try:
-            # Remplacer le lien dans le fichier
-            success = replace_link_in_file(file_path, broken_link, new_link)
-            if success:
-                fixed_count += 1
-            
-            processed_files.add(str(file_path))
-        except Exception as e:
-            logger.error(f"Erreur lors du remplacement des préfixes dans {file_path}: {e}")
+    Returns:
+        int: Nombre de liens corrigés
+    """
+    # Regrouper les remplacements par fichier: une seule réécriture par fichier
+    replacements_by_file = prefix_replacements_by_file(project_path, issues, prefix, replacement)
+    
+    fixed_count = 0
+    for file_path, replacements in replacements_by_file.items():
+        fixed_count += replace_links_in_file(file_path, replacements)
     
     return fixed_count
 
-def create_missing_file(project_path, broken_link, template_name=None):
+def missing_file_path(broken_link):
     """
-    Crée un fichier manquant à partir d'un template.
+    Chemin relatif du fichier à créer pour un lien cassé.
     
     Args:
-        project_path (Path): Chemin de base du projet
         broken_link (str): Chemin du lien cassé
-        template_name (str, optional): Nom du template à utiliser
         
     Returns:
-        bool: True si le fichier a été créé, False sinon
+        str: Chemin normalisé, avec l'extension .md
     """
-    from datetime import datetime
-    
-    # Normaliser le chemin
     normalized_path = broken_link.replace('\\', '/')
     if not normalized_path.endswith('.md'):
         normalized_path += '.md'
+    return normalized_path
+
+def missing_file_content(project_path, broken_link, template_name=None, read_file=None):
+    """
+    Construit le contenu d'un fichier manquant à partir d'un template.
     
-    target_path = project_path / normalized_path
+    Args:
+        project_path (Path): Chemin de base du projet
+        broken_link (str): Chemin du lien cassé
+        template_name (str, optional): Nom du template à utiliser
+        read_file (callable, optional): Lecture d'un fichier par chemin
+            relatif, qui retourne None s'il n'existe pas (par défaut le disque)
+        
+    Returns:
+        str: Contenu du fichier
+    """
+    from datetime import datetime
     
-    # Vérifier que le dossier parent existe
-    parent_dir = target_path.parent
-    if not parent_dir.exists():
-        try:
-            os.makedirs(parent_dir, exist_ok=True)
-            logger.info(f"Dossier créé: {parent_dir}")
-        except Exception as e:
-            logger.error(f"Impossible de créer le dossier {parent_dir}: {e}")
-            return False
+    normalized_path = missing_file_path(broken_link)
     
     # Déterminer le template à utiliser
     template_content = ""
     if template_name:
-        template_path = project_path / "templates" / f"{template_name}.md"
-        if template_path.exists():
-            try:
-                with open(template_path, 'r', encoding='utf-8') as f:
+        template_rel_path = f"templates/{template_name}.md"
+        try:
+            if read_file is not None:
+                template_content = read_file(template_rel_path)
+            else:
+                with open(project_path / template_rel_path, 'r', encoding='utf-8') as f:
                     template_content = f.read()
-                logger.debug(f"Template utilisé: {template_name}")
-            except Exception as e:
-                logger.warning(f"Erreur lors de la lecture du template {template_name}: {e}")
-        else:
+        except FileNotFoundError:
+            template_content = None
+        except Exception as e:
+            logger.warning(f"Erreur lors de la lecture du template {template_name}: {e}")
+            template_content = ""
+        if template_content is None:
             logger.warning(f"Template {template_name} non trouvé, utilisation du template par défaut")
+            template_content = ""
+        elif template_content:
+            logger.debug(f"Template utilisé: {template_name}")
     
     if not template_content:
         # Template par défaut si aucun template spécifique n'est trouvé
@@ -399,6 +395,34 @@ Remplacez ce texte par le contenu approprié.
 
 """
     
+    return template_content
+
+def create_missing_file(project_path, broken_link, template_name=None):
+    """
+    Crée un fichier manquant à partir d'un template.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        broken_link (str): Chemin du lien cassé
+        template_name (str, optional): Nom du template à utiliser
+        
+    Returns:
+        bool: True si le fichier a été créé, False sinon
+    """
+    target_path = project_path / missing_file_path(broken_link)
+    
+    # Vérifier que le dossier parent existe
+    parent_dir = target_path.parent
+    if not parent_dir.exists():
+        try:
+            os.makedirs(parent_dir, exist_ok=True)
+            logger.info(f"Dossier créé: {parent_dir}")
+        except Exception as e:
+            logger.error(f"Impossible de créer le dossier {parent_dir}: {e}")
+            return False
+    
+    template_content = missing_file_content(project_path, broken_link, template_name)
+    
     # Écrire le fichier
     try:
         with open(target_path, 'w', encoding='utf-8') as f:
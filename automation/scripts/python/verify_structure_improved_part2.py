@@ -4,11 +4,22 @@
 Fonctions pour le traitement par lots et la prioritisation des problèmes
 """
 
-import os
-import re
 import logging
-import textwrap
-from pathlib import Path
+
+from issue_store import IssueStore
+from link_graph import link_graph_for
+from vault_snapshot import VaultSnapshot
+
+# Importer les fonctions nécessaires du module précédent
+from verify_structure_improved_part1 import (
+    find_similar_files, 
+    get_broken_link,
+    detect_common_path_issues, 
+    suggest_prefix_replacements, 
+    replace_links_in_file,
+    fix_prefix_in_group, 
+    create_missing_file
+)
 
 logger = logging.getLogger('structure_verification')
 
@@ -17,116 +28,25 @@ def group_issues_by_pattern(issues):
     Regroupe les problèmes par motifs similaires pour un traitement par lots.
     
     Args:
-        issues (list): Liste des problèmes détectés
+        issues (list ou IssueStore): Problèmes détectés
         
     Returns:
-        dict: Dictionnaire des groupes de problèmes
+        dict: Dictionnaire des groupes de problèmes (voir IssueStore.groups_by_pattern)
     """
-    groups = {
-        'missing_dirs': [],
-        'missing_files': [],
-        'broken_links': {},
-        'frontmatter_issues': {},
-        'template_issues': [],
-        'other_issues': []
-    }
-    
-    # Regrouper les problèmes par type
-    for issue in issues:
-        if issue['type'] == 'missing_required' and '.md' not in issue['path']:
-            groups['missing_dirs'].append(issue)
-        elif issue['type'] == 'missing_required' and '.md' in issue['path']:
-            groups['missing_files'].append(issue)
-        elif issue['type'] == 'missing_template':
-            groups['template_issues'].append(issue)
-        elif issue['type'] == 'broken_link':
-            # Extraire le lien cassé
-            link_match = re.search(r"'([^']+)'", issue['message'])
-            if not link_match:
-                groups['other_issues'].append(issue)
-                continue
-                
-            link = link_match.group(1)
-            
-            # Déterminer le motif (par ex: docs/, personnages/, etc.)
-            pattern = 'autres'
-            parts = link.split('/')
-            if len(parts) > 1:
-                pattern = parts[0]
-            
-            if pattern not in groups['broken_links']:
-                groups['broken_links'][pattern] = []
-            groups['broken_links'][pattern].append(issue)
-        elif 'frontmatter' in issue['type']:
-            # Regrouper par type de fichier
-            file_type = 'autres'
-            path = issue['path']
-            
-            if 'personnages/' in path:
-                file_type = 'personnages'
-            elif 'chapitres/' in path:
-                file_type = 'chapitres'
-            elif 'structure/' in path:
-                file_type = 'structure'
-            elif 'review/' in path:
-                file_type = 'review'
-            
-            if file_type not in groups['frontmatter_issues']:
-                groups['frontmatter_issues'][file_type] = []
-            groups['frontmatter_issues'][file_type].append(issue)
-        else:
-            groups['other_issues'].append(issue)
-    
-    return groups
+    return IssueStore.of(issues).groups_by_pattern()
 
-def prioritize_issues(issues):
+def prioritize_issues(issues, limit=None):
     """
     Classe les problèmes par ordre de priorité pour une résolution efficace.
     
     Args:
-        issues (list): Liste des problèmes détectés
+        issues (list ou IssueStore): Problèmes détectés
+        limit (int, optional): Ne garder que les plus prioritaires
         
     Returns:
-        list: Liste des problèmes classés par priorité
+        list: Liste des problèmes classés par priorité (voir issue_store.priority_score)
     """
-    # Définir les poids de priorité pour chaque type de problème
-    priority_weights = {
-        'missing_required': 100,    # Éléments requis manquants (plus haute priorité)
-        'missing_template': 90,     # Templates manquants
-        'type_mismatch': 80,        # Type incorrect (fichier vs dossier)
-        'frontmatter_parsing_error': 70,  # Erreurs de parsing YAML
-        'missing_required_field': 60,     # Champs requis manquants
-        'broken_link': 50,          # Liens cassés
-        'invalid_tags': 40,         # Tags invalides
-        'missing_recommended_field': 30,  # Champs recommandés manquants
-        'missing_optional': 20,     # Éléments optionnels manquants (priorité plus basse)
-        'default': 10               # Valeur par défaut pour les autres types
-    }
-    
-    # Fonction de calcul du score de priorité
-    def get_priority_score(issue):
-        # Score de base selon le type d'issue
-        base_score = priority_weights.get(issue['type'], priority_weights['default'])
-        
-        # Ajustements basés sur le niveau de sévérité
-        level_multiplier = 2 if issue['level'] == 'error' else 1
-        
-        # Ajustements basés sur le chemin (les fichiers de structure ont une priorité plus élevée)
-        path_bonus = 0
-        if 'path' in issue:
-            if 'structure/' in issue['path']:
-                path_bonus += 20
-            elif 'templates/' in issue['path']:
-                path_bonus += 15
-            elif 'index.md' in issue['path']:
-                path_bonus += 10
-        
-        return base_score * level_multiplier + path_bonus
-    
-    # Trier les problèmes selon le score de priorité
-    prioritized_issues = sorted(issues, key=get_priority_score, reverse=True)
-    
-    return prioritized_issues
+    return IssueStore.of(issues).top(limit)
 
 def generate_correction_plan(issues, groups):
     """
@@ -221,7 +141,9 @@ def present_correction_plan(plan, interactive=True):
     if not plan:
         print("\nAucun problème à corriger. Tout est en ordre!")
         return {}
-        
+    
+    import textwrap
+    
     execution_plan = {}
     
     print("\n" + "="*50)
@@ -249,6 +171,100 @@ def present_correction_plan(plan, interactive=True):
         print()
         
         if interactive:
+            action = input(f"Exécuter l'étape {i}? [Y/n/v(voir plus)]: ").strip().lower()
+            
+            if action == 'v':
+                # Afficher plus de détails
+                print("\n   Détails complets:")
+                for j, item in enumerate(step['items'], 1):
+                    if 'path' in item:
+                        print(f"   {j}. {item['path']}: {item['message']}")
+                    else:
+                        print(f"   {j}. {item['message']}")
+                print()
+                
+                action = input(f"Exécuter l'étape {i}? [Y/n]: ").strip().lower()
+            
+            execution_plan[i] = not action or action in ('y', 'yes', 'oui')
+        else:
+            execution_plan[i] = True
+            print("   [Étape approuvée automatiquement en mode non-interactif]")
+    
+    return execution_plan
+
+def batch_fix_broken_links(project_path, link_groups, interactive=True, snapshot=None):
+    """
+    Corrige par lots des groupes de liens cassés similaires.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        link_groups (dict): Groupes de liens cassés par motif
+        interactive (bool): Demander confirmation à l'utilisateur
+        snapshot (VaultSnapshot, optional): Instantané du projet; son index des
+            liens fournit le lien tel qu'il est écrit dans chaque fichier
+        
+    Returns:
+        int: Nombre de liens corrigés
+    """
+    total_fixed = 0
+    
+    # Un seul instantané pour toutes les recherches (index des liens et des noms)
+    if snapshot is None:
+        snapshot = VaultSnapshot.build(project_path)
+    graph = link_graph_for(snapshot)
+    
+    # Détecter les préfixes problématiques
+    all_broken_links = []
+    for group in link_groups.values():
+        all_broken_links.extend(group)
+    
+    prefix_patterns = detect_common_path_issues(all_broken_links)
+    prefix_suggestions = suggest_prefix_replacements(prefix_patterns, project_path)
+    
+    # Proposer des corrections par préfixe
+    if prefix_suggestions and interactive:
+        print("\nCorrections de préfixe suggérées:")
+        for prefix, suggestion in prefix_suggestions.items():
+            count = prefix_patterns.get(prefix, 0)
+            print(f"  '{prefix}/' → '{suggestion}/' ({count} occurrences)")
+        
+        apply_all = input("\nAppliquer toutes ces corrections de préfixe? [Y/n/s(elect)]: ").strip().lower()
+        
+        if apply_all == 's' or apply_all == 'select':
+            # Mode sélection individuelle
+            approved_prefixes = {}
+            for prefix, suggestion in prefix_suggestions.items():
+                approval = input(f"  Remplacer '{prefix}/' par '{suggestion}/'? [Y/n]: ").strip().lower()
+                if not approval or approval in ('y', 'yes', 'oui'):
+                    approved_prefixes[prefix] = suggestion
+            prefix_suggestions = approved_prefixes
+        elif apply_all and apply_all not in ('y', 'yes', 'oui'):
+            prefix_suggestions = {}  # Annuler toutes les suggestions
+    
+    # Traiter chaque groupe de liens
+    for pattern, issues in link_groups.items():
+        if not issues:
+            continue
+        
+        if interactive:
+            print(f"\nTraitement de {len(issues)} liens cassés avec le motif '{pattern}/':")
+            for i, issue in enumerate(issues[:5]):  # Montrer seulement les 5 premiers exemples
+                link = get_broken_link(issue)
+                if link:
+                    print(f"  {i+1}. {link} (dans {issue['path']})")
+            if len(issues) > 5:
+                print(f"  ... et {len(issues) - 5} autres")
+        
+        # Déterminer l'action pour ce groupe
+        action = None
+        if interactive:
+            action_prompt = """
+Quelle action souhaitez-vous effectuer pour ce groupe?
+1. Corriger les préfixes (si applicable)
+2. Chercher des fichiers similaires pour chaque lien
+3. Créer les fichiers manquants
+4. Ignorer ce groupe
+Votre choix [1-4]: """
             action = input(action_prompt).strip()
         else:
             # Mode non-interactif: commencer par les préfixes
@@ -277,14 +293,18 @@ def present_correction_plan(plan, interactive=True):
                     continue
         
         if action == "2":
-            # Chercher des fichiers similaires
+            # Chercher des fichiers similaires; les remplacements sont regroupés
+            # par fichier et appliqués en une seule réécriture par fichier
+            replacements_by_file = {}
             for issue in issues:
-                link_match = re.search(r"'([^']+)'", issue['message'])
-                if not link_match:
+                edge = graph.edge_for_issue(issue)
+                link = edge.target if edge else get_broken_link(issue)
+                if not link:
                     continue
-                    
-                link = link_match.group(1)
-                similar_files = find_similar_files(project_path, link)
+                
+                # Lien tel qu'il est écrit dans le fichier
+                raw_link = edge.raw if edge else issue.get('raw_link', link)
+                similar_files = find_similar_files(project_path, link, snapshot)
                 
                 if similar_files:
                     file_path = project_path / issue['path']
@@ -317,12 +337,8 @@ def present_correction_plan(plan, interactive=True):
                             if approval and approval not in ('y', 'yes', 'oui'):
                                 continue
                     
-                    # Effectuer le remplacement
-                    success = replace_link_in_file(file_path, link, best_match)
-                    if success:
-                        group_fixed += 1
-                        if interactive:
-                            print(f"  ✓ Lien corrigé: '{link}' → '{best_match}'")
+                    # Programmer le remplacement
+                    replacements_by_file.setdefault(file_path, {})[raw_link] = best_match
                 elif interactive:
                     print(f"\nAucune correspondance trouvée pour '{link}' dans {issue['path']}")
                     create_option = input("  Créer ce fichier? [y/N]: ").strip().lower()
@@ -332,6 +348,14 @@ def present_correction_plan(plan, interactive=True):
                         success = create_missing_file(project_path, link, template_name)
                         if success:
                             group_fixed += 1
+            
+            # Effectuer les remplacements
+            for file_path, replacements in replacements_by_file.items():
+                fixed = replace_links_in_file(file_path, replacements)
+                group_fixed += fixed
+                if interactive and fixed:
+                    for raw_link, best_match in replacements.items():
+                        print(f"  ✓ Lien corrigé: '{raw_link}' → '{best_match}'")
         
         elif action == "3":
             # Créer les fichiers manquants
@@ -340,11 +364,10 @@ def present_correction_plan(plan, interactive=True):
                 template_name = input("Nom du template à utiliser (vide pour le template par défaut): ").strip()
             
             for issue in issues:
-                link_match = re.search(r"'([^']+)'", issue['message'])
-                if not link_match:
+                link = get_broken_link(issue)
+                if not link:
                     continue
-                    
-                link = link_match.group(1)
+                
                 success = create_missing_file(project_path, link, template_name)
                 if success:
                     group_fixed += 1
@@ -356,6 +379,26 @@ def present_correction_plan(plan, interactive=True):
     
     return total_fixed
 
+def missing_file_type(file_path):
+    """
+    Type d'un fichier manquant, qui détermine le template proposé.
+    
+    Args:
+        file_path (str): Chemin relatif du fichier
+        
+    Returns:
+        str: 'personnage', 'structure', 'index', 'chapitre' ou 'autres'
+    """
+    if 'personnages/' in file_path:
+        return 'personnage'
+    elif 'structure/' in file_path:
+        return 'structure'
+    elif file_path.endswith('index.md'):
+        return 'index'
+    elif 'chapitre' in file_path:
+        return 'chapitre'
+    return 'autres'
+
 def batch_create_missing_files(project_path, missing_files, interactive=True):
     """
     Crée par lots les fichiers manquants identifiés.
@@ -373,17 +416,7 @@ def batch_create_missing_files(project_path, missing_files, interactive=True):
     # Regrouper les fichiers par type
     file_groups = {}
     for issue in missing_files:
-        file_path = issue['path']
-        file_type = 'autres'
-        
-        if 'personnages/' in file_path:
-            file_type = 'personnage'
-        elif 'structure/' in file_path:
-            file_type = 'structure'
-        elif file_path.endswith('index.md'):
-            file_type = 'index'
-        elif 'chapitre' in file_path:
-            file_type = 'chapitre'
+        file_type = missing_file_type(issue['path'])
         
         if file_type not in file_groups:
             file_groups[file_type] = []
@@ -422,101 +455,3 @@ def batch_create_missing_files(project_path, missing_files, interactive=True):
             print(f"Groupe '{file_type}': {files_created} fichiers créés sur {len(issues)}")
     
     return files_created
-
-# Importer les fonctions nécessaires du module précédent
-from verify_structure_improved_part1 import (
-    find_similar_files, 
-    detect_common_path_issues, 
-    suggest_prefix_replacements, 
-    replace_link_in_file, 
-    fix_prefix_in_group, 
-    create_missing_file
-)f"Exécuter l'étape {i}? [Y/n/v(voir plus)]: ").strip().lower()
-            
-            if action == 'v':
-                # Afficher plus de détails
-                print("\n   Détails complets:")
-                for j, item in enumerate(step['items'], 1):
-                    if 'path' in item:
-                        print(f"   {j}. {item['path']}: {item['message']}")
-                    else:
-                        print(f"   {j}. {item['message']}")
-                print()
-                
-                action = input(f"Exécuter l'étape {i}? [Y/n]: ").strip().lower()
-            
-            execution_plan[i] = not action or action in ('y', 'yes', 'oui')
-        else:
-            execution_plan[i] = True
-            print("   [Étape approuvée automatiquement en mode non-interactif]")
-    
-    return execution_plan
-
-def batch_fix_broken_links(project_path, link_groups, interactive=True):
-    """
-    Corrige par lots des groupes de liens cassés similaires.
-    
-    Args:
-        project_path (Path): Chemin de base du projet
-        link_groups (dict): Groupes de liens cassés par motif
-        interactive (bool): Demander confirmation à l'utilisateur
-        
-    Returns:
-        int: Nombre de liens corrigés
-    """
-    total_fixed = 0
-    
-    # Détecter les préfixes problématiques
-    all_broken_links = []
-    for group in link_groups.values():
-        all_broken_links.extend(group)
-    
-    prefix_patterns = detect_common_path_issues(all_broken_links)
-    prefix_suggestions = suggest_prefix_replacements(prefix_patterns, project_path)
-    
-    # Proposer des corrections par préfixe
-    if prefix_suggestions and interactive:
-        print("\nCorrections de préfixe suggérées:")
-        for prefix, suggestion in prefix_suggestions.items():
-            count = prefix_patterns.get(prefix, 0)
-            print(f"  '{prefix}/' → '{suggestion}/' ({count} occurrences)")
-        
-        apply_all = input("\nAppliquer toutes ces corrections de préfixe? [Y/n/s(elect)]: ").strip().lower()
-        
-        if apply_all == 's' or apply_all == 'select':
-            # Mode sélection individuelle
-            approved_prefixes = {}
-            for prefix, suggestion in prefix_suggestions.items():
-                approval = input(f"  Remplacer '{prefix}/' par '{suggestion}/'? [Y/n]: ").strip().lower()
-                if not approval or approval in ('y', 'yes', 'oui'):
-                    approved_prefixes[prefix] = suggestion
-            prefix_suggestions = approved_prefixes
-        elif apply_all and apply_all not in ('y', 'yes', 'oui'):
-            prefix_suggestions = {}  # Annuler toutes les suggestions
-    
-    # Traiter chaque groupe de liens
-    for pattern, issues in link_groups.items():
-        if not issues:
-            continue
-        
-        if interactive:
-            print(f"\nTraitement de {len(issues)} liens cassés avec le motif '{pattern}/':")
-            for i, issue in enumerate(issues[:5]):  # Montrer seulement les 5 premiers exemples
-                link_match = re.search(r"'([^']+)'", issue['message'])
-                if link_match:
-                    link = link_match.group(1)
-                    print(f"  {i+1}. {link} (dans {issue['path']})")
-            if len(issues) > 5:
-                print(f"  ... et {len(issues) - 5} autres")
-        
-        # Déterminer l'action pour ce groupe
-        action = None
-        if interactive:
-            action_prompt = """
-Quelle action souhaitez-vous effectuer pour ce groupe?
-1. Corriger les préfixes (si applicable)
-2. Chercher des fichiers similaires pour chaque lien
-3. Créer les fichiers manquants
-4. Ignorer ce groupe
-Votre choix [1-4]: """
-            action = input(
\ No newline at end of file
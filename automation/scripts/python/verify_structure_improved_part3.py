@@ -1,201 +1,53 @@
-    # Collecter tous les problèmes
-    all_issues = []
-    
-    try:
-        # 1. Valider la structure des dossiers et fichiers
-        logger.info("Vérification de la structure de base...")
-        structure_issues = validate_structure(project_path, EXPECTED_STRUCTURE)
-        all_issues.extend(structure_issues)
-        
-        # 2. Vérifier les templates
-        logger.info("Vérification des templates...")
-        template_issues = validate_template_existence(project_path)
-        all_issues.extend(template_issues)
-        
-        # 3. Vérifier les frontmatters
-        logger.info("Vérification des frontmatter YAML...")
-        frontmatter_issues = validate_frontmatter(project_path)
-        all_issues.extend(frontmatter_issues)
-        
-        # 4. Vérifier les liens internes
-        logger.info("Vérification des liens internes...")
-        link_issues = check_broken_links(project_path)
-        all_issues.extend(link_issues)
-    except Exception as e:
-        logger.error(f"Erreur pendant la vérification: {e}")
-        return 1
-    
-    # Afficher un résumé des problèmes
-    error_count = sum(1 for issue in all_issues if issue['level'] == 'error')
-    warning_count = sum(1 for issue in all_issues if issue['level'] == 'warning')
-    
-    logger.info(f"Vérification terminée. Trouvé {error_count} erreurs et {warning_count} avertissements.")
-    
-    # Déterminer l'action selon le mode
-    correction_results = {}
-    
-    if args.mode in ["fix", "interactive"]:
-        logger.info(f"Mode {args.mode} activé. Préparation des corrections...")
-        
-        # Sauvegarde du projet avant modification (sauf en mode analyse)
-        if not args.yes:
-            backup_confirm = True
-            if args.mode != "analyze":
-                backup_confirm = input("Créer une sauvegarde avant de procéder aux modifications? [Y/n]: ").strip().lower()
-                backup_confirm = not backup_confirm or backup_confirm in ('y', 'yes', 'oui')
-            
-            if backup_confirm:
-                backup_time = datetime.now().strftime("%Y%m%d%H%M%S")
-                backup_dir = project_path.parent / f"{project_path.name}_backup_{backup_time}"
-                
-                try:
-                    logger.info(f"Création d'une sauvegarde du projet: {backup_dir}")
-                    shutil.copytree(project_path, backup_dir, ignore=shutil.ignore_patterns('.git', '__pycache__', '.DS_Store'))
-                    logger.info(f"Sauvegarde créée: {backup_dir}")
-                except Exception as e:
-                    logger.error(f"Erreur lors de la création de la sauvegarde: {e}")
-                    if not args.yes:
-                        confirm = input("Impossible de créer une sauvegarde. Continuer quand même? [y/N]: ").strip().lower()
-                        if confirm not in ('y', 'yes', 'oui'):
-                            logger.info("Opération annulée.")
-                            return 0
-                    else:
-                        logger.warning("Les modifications seront effectuées sans sauvegarde (mode automatique).")
-        
-        # Regrouper les problèmes pour le traitement par lots
-        issue_groups = group_issues_by_pattern(all_issues)
-        
-        # Créer le plan de correction
-        correction_plan = generate_correction_plan(all_issues, issue_groups)
-        
-        # En mode interactif, présenter le plan et demander confirmation
-        if args.mode == "interactive" and not args.yes:
-            execution_plan = present_correction_plan(correction_plan, True)
-        else:
-            # En mode fix non-interactif, exécuter toutes les étapes
-            execution_plan = {i+1: True for i in range(len(correction_plan))}
-            if not args.yes:
-                # Si pas --yes, demander confirmation globale
-                all_changes = sum(step['count'] for step in correction_plan)
-                print(f"\nLes modifications suivantes seront effectuées:")
-                for i, step in enumerate(correction_plan, 1):
-                    print(f"- {step['title']} ({step['count']} éléments)")
-                
-                confirm = input(f"\nVoulez-vous procéder à ces {all_changes} corrections? [Y/n]: ").strip().lower()
-                if confirm and confirm not in ('y', 'yes', 'oui'):
-                    logger.info("Opération de correction annulée par l'utilisateur.")
-                    
-                    # Créer quand même le rapport pour référence
-                    report_path = create_markdown_report(project_path, all_issues, {}, args.output)
-                    logger.info(f"Rapport détaillé créé sans corrections: {report_path}")
-                    
-                    return 0
-        
-        # Exécuter le plan de correction
-        interactive_mode = args.mode == "interactive" and not args.yes
-        correction_results = execute_correction_plan(project_path, correction_plan, execution_plan, interactive_mode)
-        
-        # Vérifier à nouveau pour voir les problèmes résolus
-        logger.info("Nouvelle vérification après corrections...")
-        
-        new_issues = []
-        try:
-            new_issues.extend(validate_structure(project_path, EXPECTED_STRUCTURE))
-            new_issues.extend(validate_template_existence(project_path))
-            new_issues.extend(validate_frontmatter(project_path))
-            new_issues.extend(check_broken_links(project_path))
-        except Exception as e:
-            logger.error(f"Erreur pendant la vérification post-correction: {e}")
-        
-        new_error_count = sum(1 for issue in new_issues if issue['level'] == 'error')
-        new_warning_count = sum(1 for issue in new_issues if issue['level'] == 'warning')
-        
-        logger.info(f"Après corrections: {new_error_count} erreurs et {new_warning_count} avertissements restants.")
-        
-        # Mettre à jour la liste des problèmes pour le rapport
-        all_issues = new_issues
-    
-    # Créer le rapport Markdown
-    report_path = create_markdown_report(project_path, all_issues, correction_results, args.output)
-    logger.info(f"Rapport détaillé créé: {report_path}")
-    
-    # En mode rapport ou après corrections, créer des tâches pour les problèmes complexes
-    if args.mode in ["report", "fix", "interactive"] and len(all_issues) > 0:
-        logger.info("Création des tâches de révision manuelle pour les problèmes complexes...")
-        
-        # Grouper les problèmes par fichier
-        grouped_issues = {}
-        for issue in all_issues:
-            if 'path' not in issue:
-                continue
-                
-            path = issue['path']
-            if path not in grouped_issues:
-                grouped_issues[path] = []
-            grouped_issues[path].append(issue)
-        
-        tasks_created = 0
-        
-        for file_path, file_issues in grouped_issues.items():
-            # Déterminer si ce fichier nécessite une révision manuelle
-            # (problèmes complexes uniquement, non résolus automatiquement)
-            has_errors = any(issue['level'] == 'error' for issue in file_issues)
-            has_frontmatter_issues = any('frontmatter' in issue['type'] for issue in file_issues)
-            has_parsing_errors = any('parsing_error' in issue['type'] for issue in file_issues)
-            has_missing_required = any('missing_required_field' in issue['type'] for issue in file_issues)
-            
-            # Ne créer une tâche que si le fichier a des problèmes complexes
-            complex_issues = has_errors and (has_frontmatter_issues or has_parsing_errors or has_missing_required)
-            if complex_issues:
-                try:
-                    task_path = create_manual_review_task(project_path, file_path, file_issues)
-                    if task_path:
-                        tasks_created += 1
-                        logger.info(f"Tâche créée pour {file_path}: {task_path}")
-                except Exception as e:
-                    logger.error(f"Erreur lors de la création de la tâche pour {file_path}: {e}")
-        
-        logger.info(f"{tasks_created} tâches de révision manuelle créées.")
-    
-    # Retourner 1 s'il y a des erreurs, 0 sinon
-    return 1 if error_count > 0 else 0
-
-if __name__ == "__main__":
-    sys.exit(main())#!/usr/bin/env python3
+#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
 Fonctions pour l'exécution du plan de correction et l'intégration avec le script principal
+
+En mode 'fix' (et 'interactive' avec --yes), les étapes approuvées sont
+calculées d'un bloc (plan_correction_changes) puis appliquées par
+plan_executor, sous la protection de son journal. En mode 'interactive', les
+corrections sont appliquées une à une au fil des questions
+(execute_correction_plan), hors journal: une exécution interrompue ne peut
+être ni annulée ni reprise, seule la sauvegarde créée avant les corrections
+permet de revenir en arrière (python backup_store.py --restore).
 """
 
 import os
-import re
 import sys
 import logging
 import argparse
 import shutil
-import yaml
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Importer les fonctions des modules précédents
 from verify_structure_improved_part1 import (
-    find_similar_files,
+    get_broken_link,
     detect_common_path_issues,
     suggest_prefix_replacements,
-    replace_link_in_file,
-    fix_prefix_in_group,
-    create_missing_file
+    normalize_replacements,
+    prefix_replacements_by_file,
+    missing_file_path,
+    missing_file_content
 )
 
 from verify_structure_improved_part2 import (
     group_issues_by_pattern,
-    prioritize_issues,
     generate_correction_plan,
     present_correction_plan,
     batch_fix_broken_links,
+    missing_file_type,
     batch_create_missing_files
 )
 
+from backup_store import create_backup
+from frontmatter_rules import load_frontmatter_rules
+from issue_store import IssueStore
+from link_rewriter import rewrite_links
+from plan_executor import PlannedChanges, execute_changes
+from review_tasks import needs_manual_review, sync_review_tasks
+from vault_snapshot import VaultSnapshot
+
 # Configuration du logging
 logger = logging.getLogger('structure_verification')
 
@@ -223,7 +75,24 @@ def setup_logging(verbose=False):
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
 
-def execute_correction_plan(project_path, plan, execution_plan, interactive=True):
+def review_issues_by_file(issues):
+    """
+    Regroupe par fichier les problèmes de frontmatter d'une étape du plan
+    qui nécessitent une révision manuelle.
+    
+    Args:
+        issues (list): Problèmes de l'étape
+        
+    Returns:
+        dict: Fichier -> problèmes à réviser
+    """
+    grouped = {}
+    for issue in issues:
+        if 'frontmatter_parsing_error' in issue['type'] or 'missing_required_field' in issue['type']:
+            grouped.setdefault(issue['path'], []).append(issue)
+    return grouped
+
+def execute_correction_plan(project_path, plan, execution_plan, interactive=True, snapshot=None):
     """
     Exécute le plan de correction en fonction des étapes approuvées.
     
@@ -232,6 +101,7 @@ def execute_correction_plan(project_path, plan, execution_plan, interactive=True
         plan (list): Plan de correction généré
         execution_plan (dict): Étapes approuvées pour exécution
         interactive (bool): Mode interactif pour les confirmations
+        snapshot (VaultSnapshot, optional): Instantané du projet (index des liens)
         
     Returns:
         dict: Résultats des corrections par étape
@@ -292,21 +162,7 @@ def execute_correction_plan(project_path, plan, execution_plan, interactive=True
                     template_dest = project_path / "templates" / template_name
                     try:
                         with open(template_dest, 'w', encoding='utf-8') as f:
-                            template_content = f"""---
-title: Template {template_name.replace('.md', '')}
-created: {datetime.now().strftime('%Y-%m-%d')}
----
-
-# {{{{title}}}}
-
-<!-- Template créé automatiquement -->
-
-## Contenu
-
-<!-- Ajoutez le contenu du template ici -->
-
-"""
-                            f.write(template_content)
+                            f.write(default_template_content(template_name))
                         logger.info(f"Template par défaut créé: {template_dest}")
                         fixed += 1
                     except Exception as e:
@@ -319,13 +175,9 @@ created: {datetime.now().strftime('%Y-%m-%d')}
             
             # Cette action nécessite souvent une intervention manuelle
             # Génération de tâches TODO pour les problèmes complexes
-            todo_tasks_created = 0
-            
-            for issue in step['items']:
-                if 'frontmatter_parsing_error' in issue['type'] or 'missing_required_field' in issue['type']:
-                    todo_path = create_manual_review_task(project_path, issue['path'], [issue])
-                    if todo_path:
-                        todo_tasks_created += 1
+            # (une tâche par fichier, mise à jour si elle existe déjà)
+            tasks = sync_review_tasks(project_path, review_issues_by_file(step['items']), complete=False)
+            todo_tasks_created = len(tasks['created']) + len(tasks['updated'])
             
             if todo_tasks_created > 0:
                 logger.info(f"{todo_tasks_created} tâches de révision manuelle créées pour les problèmes de frontmatter.")
@@ -340,7 +192,7 @@ created: {datetime.now().strftime('%Y-%m-%d')}
             # Corriger les liens cassés pour ce motif
             pattern = step.get('pattern', '')
             broken_links = {pattern: step['items']}
-            fixed = batch_fix_broken_links(project_path, broken_links, interactive)
+            fixed = batch_fix_broken_links(project_path, broken_links, interactive, snapshot)
         
         else:
             logger.warning(f"Action inconnue: {action}")
@@ -350,94 +202,149 @@ created: {datetime.now().strftime('%Y-%m-%d')}
     
     return results
 
-def create_manual_review_task(project_path, file_path, issues):
+def plan_correction_changes(project_path, plan, execution_plan):
     """
-    Crée une tâche de révision manuelle pour un fichier problématique.
+    Calcule, sans rien écrire, les modifications des étapes approuvées d'un plan
+    en mode non interactif (mêmes choix que execute_correction_plan).
+    
+    Chaque étape lit le projet à travers les modifications des étapes
+    précédentes: un fichier touché par plusieurs étapes n'est écrit qu'une fois.
     
     Args:
         project_path (Path): Chemin de base du projet
-        file_path (str): Chemin relatif du fichier problématique
-        issues (list): Liste des problèmes détectés pour ce fichier
+        plan (list): Plan de correction généré
+        execution_plan (dict): Étapes approuvées pour exécution
         
     Returns:
-        str: Chemin du fichier de tâche créé ou None si échec
+        tuple: (PlannedChanges, dict) Modifications prévues et résultats par étape
     """
-    # Générer un ID unique pour la tâche
-    task_id = f"TODO-{datetime.now().strftime('%Y%m%d%H%M')}-{os.path.basename(file_path).split('.')[0][:4].upper()}"
+    changes = PlannedChanges(project_path)
+    results = {}
     
-    # Définir le chemin de sortie
-    output_dir = project_path / "review" / "claude_suggestions"
-    try:
-        os.makedirs(output_dir, exist_ok=True)
-    except Exception as e:
-        logger.error(f"Impossible de créer le dossier {output_dir}: {e}")
-        return None
-    
-    output_filename = f"{task_id}-structure-revision.md"
-    output_path = output_dir / output_filename
-    
-    # Formatter les problèmes détectés pour le contenu de la tâche
-    issues_content = ""
-    for i, issue in enumerate(issues, 1):
-        issues_content += f"{i}. **{issue['type'].replace('_', ' ').title()}**:\n"
-        issues_content += f"   {issue['message']}\n\n"
-    
-    # Créer le contenu de la tâche selon le template standard
-    content = f"""---
-id: {task_id}
-titre: Révision manuelle requise pour {os.path.basename(file_path)}
-statut: À faire
-priorite: 2
-date_creation: {datetime.now().strftime('%Y-%m-%d')}
-date_debut: {datetime.now().strftime('%Y-%m-%d')}
-date_fin: {(datetime.now() + timedelta(days=3)).strftime('%Y-%m-%d')}
-tags: tâche, révision-structure
----
-
-# Révision manuelle requise pour {os.path.basename(file_path)} [{task_id}]
-
-**Statut**: À faire
-**Priorité**: 2/5
-**Période**: {datetime.now().strftime('%Y-%m-%d')} → {(datetime.now() + timedelta(days=3)).strftime('%Y-%m-%d')}
-
-## Description
-
-Le fichier `{file_path}` présente des problèmes de structure qui nécessitent une révision manuelle. Une modification automatique pourrait corrompre le contenu.
-
-## Problèmes détectés
-
-{issues_content}
-
-## Actions recommandées
-
-- [ ] Ouvrir le fichier dans un éditeur de texte
-- [ ] Corriger les problèmes structurels identifiés
-- [ ] Vérifier que le contenu reste cohérent et valide
-- [ ] Exécuter le script de vérification en mode analyse uniquement pour confirmer les corrections
+    for i, step in enumerate(plan, 1):
+        if not execution_plan.get(i, False):
+            logger.info(f"Étape {i} ({step['title']}) ignorée.")
+            results[i] = {'executed': False, 'fixed': 0, 'total': step['count']}
+            continue
+        
+        fixed = 0
+        action = step.get('action', 'unknown')
+        
+        if action == 'create_missing_dirs':
+            for issue in step['items']:
+                if changes.make_dir(issue['path']):
+                    fixed += 1
+        
+        elif action == 'create_missing_files':
+            for issue in step['items']:
+                file_type = missing_file_type(issue['path'])
+                template_name = file_type if file_type != 'autres' else None
+                content = missing_file_content(project_path, issue['path'], template_name, changes.read)
+                changes.write(missing_file_path(issue['path']), content)
+                fixed += 1
+        
+        elif action == 'copy_missing_templates':
+            suggestions_dir = project_path / "review" / "claude_suggestions"
+            for issue in step['items']:
+                template_name = os.path.basename(issue['path'])
+                content = None
+                for suggestion_file in suggestions_dir.glob(f"*{template_name}*"):
+                    try:
+                        with open(suggestion_file, 'r', encoding='utf-8', newline='') as f:
+                            content = f.read()
+                        break
+                    except Exception as e:
+                        logger.error(f"Erreur lors de la lecture du template {suggestion_file}: {e}")
+                if content is None:
+                    content = default_template_content(template_name)
+                changes.write(os.path.join("templates", template_name), content)
+                fixed += 1
+        
+        elif action == 'fix_frontmatter':
+            tasks = sync_review_tasks(project_path, review_issues_by_file(step['items']),
+                                      complete=False, changes=changes)
+            fixed += len(tasks['created']) + len(tasks['updated'])
+        
+        elif action == 'fix_broken_links':
+            # En mode non interactif, seules les corrections de préfixe s'appliquent
+            pattern = step.get('pattern', '')
+            prefix_suggestions = suggest_prefix_replacements(detect_common_path_issues(step['items']), project_path)
+            if pattern in prefix_suggestions:
+                replacements_by_file = prefix_replacements_by_file(project_path, step['items'], pattern,
+                                                                   prefix_suggestions[pattern])
+                for file_path, replacements in replacements_by_file.items():
+                    rel_path = os.path.relpath(file_path, project_path)
+                    content = changes.read(rel_path)
+                    if content is None:
+                        continue
+                    new_content, count = rewrite_links(content, normalize_replacements(replacements))
+                    if count and changes.write(rel_path, new_content):
+                        fixed += count
+        
+        else:
+            logger.warning(f"Action inconnue: {action}")
+        
+        results[i] = {'executed': True, 'fixed': fixed, 'total': step['count']}
+        logger.info(f"Étape {i} préparée: {fixed} éléments à corriger sur {step['count']}.")
+    
+    return changes, results
 
-## Intervenants assignés
+def default_template_content(template_name):
+    """
+    Contenu d'un template créé par défaut quand aucune suggestion n'existe.
+    
+    Args:
+        template_name (str): Nom du fichier de template
+        
+    Returns:
+        str: Contenu du template
+    """
+    return f"""---
+title: Template {template_name.replace('.md', '')}
+created: {datetime.now().strftime('%Y-%m-%d')}
+---
 
-- [[]] <!-- Ajouter manuellement les intervenants appropriés -->
+# {{{{title}}}}
 
-## Ressources nécessaires
+<!-- Template créé automatiquement -->
 
-- Format standard attendu pour ce type de fichier
-- Documentation de référence sur la structure du projet
+## Contenu
 
-## Notes
+<!-- Ajoutez le contenu du template ici -->
 
-**IMPORTANT**: Ne pas utiliser d'outils automatisés pour modifier ce fichier avant d'avoir résolu les problèmes structurels.
 """
+
+def plan_backup_paths(plan, execution_plan):
+    """
+    Détermine les fichiers que les étapes approuvées d'un plan vont modifier
+    ou créer, pour ne sauvegarder qu'eux.
     
-    # Écrire le fichier de tâche
-    try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        logger.info(f"Tâche de révision manuelle créée: {output_path}")
-        return str(output_path)
-    except Exception as e:
-        logger.error(f"Erreur lors de la création de la tâche de révision pour {file_path}: {e}")
-        return None
+    Args:
+        plan (list): Plan de correction généré
+        execution_plan (dict): Étapes approuvées pour exécution
+        
+    Returns:
+        set: Chemins relatifs concernés
+    """
+    paths = set()
+    for i, step in enumerate(plan, 1):
+        if not execution_plan.get(i, False):
+            continue
+        
+        action = step.get('action')
+        for issue in step['items']:
+            if action == 'create_missing_files':
+                paths.add(issue['path'])
+            elif action == 'copy_missing_templates':
+                paths.add(os.path.join('templates', os.path.basename(issue['path'])))
+            elif action == 'fix_broken_links':
+                # Fichier contenant le lien, et fichier cible s'il est créé
+                paths.add(issue['path'])
+                link = get_broken_link(issue)
+                if link:
+                    link = link.replace('\\', '/')
+                    paths.add(link if link.endswith('.md') else link + '.md')
+    return paths
 
 def create_markdown_report(project_path, issues, results, output_file="structure-report.md"):
     """
@@ -453,8 +360,9 @@ def create_markdown_report(project_path, issues, results, output_file="structure
         str: Chemin du fichier de rapport créé
     """
     # Compter les problèmes par niveau
-    error_count = sum(1 for issue in issues if issue['level'] == 'error')
-    warning_count = sum(1 for issue in issues if issue['level'] == 'warning')
+    level_counts = IssueStore.of(issues).level_counts()
+    error_count = level_counts['error']
+    warning_count = level_counts['warning']
     
     # Calculer le nombre total de corrections effectuées
     total_fixed = sum(step['fixed'] for step in results.values() if step['executed'])
@@ -523,19 +431,12 @@ Les problèmes suivants n'ont pas été corrigés automatiquement et nécessiten
 
 """
         
-        # Regrouper les problèmes par type
-        issues_by_type = {}
-        for issue in remaining_issues:
-            issue_type = issue['type']
-            if issue_type not in issues_by_type:
-                issues_by_type[issue_type] = []
-            issues_by_type[issue_type].append(issue)
-        
         # Ajouter les problèmes au rapport, regroupés par type
-        for issue_type, type_issues in sorted(issues_by_type.items()):
-            report_content += f"### {issue_type.replace('_', ' ').title()} ({len(type_issues)})\n\n"
+        remaining_store = IssueStore(remaining_issues)
+        for issue_type, type_count in remaining_store.type_counts():
+            report_content += f"### {issue_type.replace('_', ' ').title()} ({type_count})\n\n"
             
-            for issue in sorted(type_issues, key=lambda x: x.get('path', '')):
+            for issue in remaining_store.of_type(issue_type):
                 level_icon = "🔴" if issue['level'] == 'error' else "🟠"
                 path_info = f" **{issue['path']}**:" if 'path' in issue else ""
                 report_content += f"- {level_icon}{path_info} {issue['message']}\n"
@@ -568,19 +469,23 @@ Aucun problème restant n'a été détecté. La structure du projet est maintena
     logger.info(f"Rapport de structure créé: {output_path}")
     return str(output_path)
 
-def main():
+def main(argv=None):
     """
     Fonction principale du script amélioré.
+    
+    Args:
+        argv (list, optional): Arguments de la ligne de commande (par défaut sys.argv)
     """
     parser = argparse.ArgumentParser(description="Vérifie et corrige la structure du projet d'édition littéraire.")
     parser.add_argument("--project-dir", default=".", help="Chemin vers le répertoire du projet")
     parser.add_argument("--mode", choices=["analyze", "report", "fix", "interactive"], default="analyze", 
-                       help="Mode de fonctionnement: 'analyze' (vérification simple), 'report' (génère des tâches), 'fix' (corrections automatiques) ou 'interactive' (corrections guidées)")
+                       help="Mode de fonctionnement: 'analyze' (vérification simple), 'report' (génère des tâches), 'fix' (corrections automatiques) ou 'interactive' (corrections guidées, appliquées une à une hors journal: seule la sauvegarde préalable permet de les annuler)")
     parser.add_argument("--verbose", action="store_true", help="Affiche des informations détaillées")
     parser.add_argument("--output", default="structure-report.md", help="Chemin vers le fichier de sortie pour le rapport")
     parser.add_argument("--yes", "-y", action="store_true", help="Mode non-interactif: répond 'oui' à toutes les questions")
+    parser.add_argument("--dry-run", action="store_true", help="Affiche le diff des modifications du plan sans rien écrire")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Configurer le logging
     setup_logging(args.verbose)
@@ -606,16 +511,10 @@ def main():
         else:
             logger.info("Continuation forcée (mode automatique).")
     
-    # Importer les fonctions nécessaires du script original
-    # Cette section devrait importer les fonctions du script existant qui sont nécessaires
-    # (validate_structure, validate_template_existence, validate_frontmatter, check_broken_links)
-    # Pour cet exemple, nous supposons qu'elles sont disponibles dans un module nommé validate_functions
-    
+    # Validateurs du script principal, chargés seulement pour une vérification
     try:
         from verify_structure_script import (
             EXPECTED_STRUCTURE,
-            EXPECTED_TEMPLATES,
-            FRONTMATTER_RULES,
             validate_structure,
             validate_template_existence,
             validate_frontmatter,
@@ -623,4 +522,173 @@ def main():
         )
     except ImportError:
         logger.error("Impossible d'importer les fonctions du script original. Assurez-vous que verify_structure_script.py est dans le même répertoire.")
-        return 1
\ No newline at end of file
+        return 1
+    
+    # Collecter tous les problèmes
+    all_issues = IssueStore()
+    
+    try:
+        # Parcourir le projet une seule fois; l'index des liens sert aussi aux corrections
+        snapshot = VaultSnapshot.build(project_path)
+        
+        # Règles du projet, chargées une fois pour la vérification et la revérification
+        frontmatter_rules = load_frontmatter_rules(project_path)
+        
+        # 1. Valider la structure des dossiers et fichiers
+        logger.info("Vérification de la structure de base...")
+        structure_issues = validate_structure(project_path, EXPECTED_STRUCTURE)
+        all_issues.extend(structure_issues)
+        
+        # 2. Vérifier les templates
+        logger.info("Vérification des templates...")
+        template_issues = validate_template_existence(project_path)
+        all_issues.extend(template_issues)
+        
+        # 3. Vérifier les frontmatters
+        logger.info("Vérification des frontmatter YAML...")
+        frontmatter_issues = validate_frontmatter(project_path, snapshot=snapshot, frontmatter_rules=frontmatter_rules)
+        all_issues.extend(frontmatter_issues)
+        
+        # 4. Vérifier les liens internes
+        logger.info("Vérification des liens internes...")
+        link_issues = check_broken_links(project_path, snapshot=snapshot)
+        all_issues.extend(link_issues)
+    except Exception as e:
+        logger.error(f"Erreur pendant la vérification: {e}")
+        return 1
+    
+    # Afficher un résumé des problèmes
+    level_counts = all_issues.level_counts()
+    error_count = level_counts['error']
+    warning_count = level_counts['warning']
+    
+    logger.info(f"Vérification terminée. Trouvé {error_count} erreurs et {warning_count} avertissements.")
+    
+    # Déterminer l'action selon le mode
+    correction_results = {}
+    
+    if args.mode in ["fix", "interactive"]:
+        logger.info(f"Mode {args.mode} activé. Préparation des corrections...")
+        
+        # Regrouper les problèmes pour le traitement par lots
+        issue_groups = group_issues_by_pattern(all_issues)
+        
+        # Créer le plan de correction
+        correction_plan = generate_correction_plan(all_issues, issue_groups)
+        
+        # En mode interactif, présenter le plan et demander confirmation
+        if args.mode == "interactive" and not args.yes:
+            execution_plan = present_correction_plan(correction_plan, True)
+        else:
+            # En mode fix non-interactif, exécuter toutes les étapes
+            execution_plan = {i+1: True for i in range(len(correction_plan))}
+            if not args.yes and not args.dry_run:
+                # Si pas --yes, demander confirmation globale
+                all_changes = sum(step['count'] for step in correction_plan)
+                print(f"\nLes modifications suivantes seront effectuées:")
+                for i, step in enumerate(correction_plan, 1):
+                    print(f"- {step['title']} ({step['count']} éléments)")
+                
+                confirm = input(f"\nVoulez-vous procéder à ces {all_changes} corrections? [Y/n]: ").strip().lower()
+                if confirm and confirm not in ('y', 'yes', 'oui'):
+                    logger.info("Opération de correction annulée par l'utilisateur.")
+                    
+                    # Créer quand même le rapport pour référence
+                    report_path = create_markdown_report(project_path, all_issues, {}, args.output)
+                    logger.info(f"Rapport détaillé créé sans corrections: {report_path}")
+                    
+                    return 0
+        
+        interactive_mode = args.mode == "interactive" and not args.yes
+        
+        # Modifications des étapes approuvées, calculées sans rien écrire
+        # (en mode interactif, les choix sont faits pendant l'exécution)
+        if args.dry_run or not interactive_mode:
+            changes, correction_results = plan_correction_changes(project_path, correction_plan, execution_plan)
+            logger.info(f"Modifications prévues: {changes.summary()}")
+            
+            if args.dry_run:
+                sys.stdout.write(changes.format_diff())
+                report_path = create_markdown_report(project_path, all_issues, {}, args.output)
+                logger.info(f"Mode dry-run: aucune modification effectuée. Rapport détaillé créé: {report_path}")
+                return 0
+            
+            # Une seule transaction: sauvegarde et journal, puis écritures en parallèle
+            try:
+                execute_changes(changes, f"verify-structure --mode {args.mode}")
+            except Exception as e:
+                logger.error(f"Erreur lors de l'application du plan de correction: {e}")
+                return 1
+        else:
+            # Sauvegarder uniquement les fichiers que le plan va modifier ou créer
+            backup_confirm = True
+            if not args.yes:
+                backup_confirm = input("Créer une sauvegarde avant de procéder aux modifications? [Y/n]: ").strip().lower()
+                backup_confirm = not backup_confirm or backup_confirm in ('y', 'yes', 'oui')
+        
+            if backup_confirm:
+                try:
+                    manifest_path = create_backup(project_path, plan_backup_paths(correction_plan, execution_plan),
+                                                  f"verify-structure --mode {args.mode}")
+                    logger.info(f"Sauvegarde créée (restauration: python backup_store.py --project-dir {project_path} --restore): {manifest_path}")
+                except Exception as e:
+                    logger.error(f"Erreur lors de la création de la sauvegarde: {e}")
+                    if not args.yes:
+                        confirm = input("Impossible de créer une sauvegarde. Continuer quand même? [y/N]: ").strip().lower()
+                        if confirm not in ('y', 'yes', 'oui'):
+                            logger.info("Opération annulée.")
+                            return 0
+                    else:
+                        logger.warning("Les modifications seront effectuées sans sauvegarde (mode automatique).")
+        
+            # Exécuter le plan de correction étape par étape, avec les choix de l'utilisateur
+            correction_results = execute_correction_plan(project_path, correction_plan, execution_plan, interactive_mode, snapshot)
+        
+        # Vérifier à nouveau pour voir les problèmes résolus
+        logger.info("Nouvelle vérification après corrections...")
+        
+        new_issues = []
+        try:
+            new_issues.extend(validate_structure(project_path, EXPECTED_STRUCTURE))
+            new_issues.extend(validate_template_existence(project_path))
+            new_issues.extend(validate_frontmatter(project_path, frontmatter_rules=frontmatter_rules))
+            new_issues.extend(check_broken_links(project_path))
+        except Exception as e:
+            logger.error(f"Erreur pendant la vérification post-correction: {e}")
+        
+        new_error_count = sum(1 for issue in new_issues if issue['level'] == 'error')
+        new_warning_count = sum(1 for issue in new_issues if issue['level'] == 'warning')
+        
+        logger.info(f"Après corrections: {new_error_count} erreurs et {new_warning_count} avertissements restants.")
+        
+        # Mettre à jour la liste des problèmes pour le rapport
+        all_issues = new_issues
+    
+    # Créer le rapport Markdown
+    report_path = create_markdown_report(project_path, all_issues, correction_results, args.output)
+    logger.info(f"Rapport détaillé créé: {report_path}")
+    
+    # En mode rapport ou après corrections, synchroniser les tâches des problèmes complexes
+    # (les tâches des fichiers corrigés depuis la dernière vérification sont fermées)
+    if args.mode in ["report", "fix", "interactive"]:
+        logger.info("Synchronisation des tâches de révision manuelle pour les problèmes complexes...")
+        
+        grouped_issues = {}
+        for issue in all_issues:
+            if 'path' in issue:
+                grouped_issues.setdefault(issue['path'], []).append(issue)
+        issues_by_file = {file_path: file_issues for file_path, file_issues in grouped_issues.items()
+                          if needs_manual_review(file_issues)}
+        
+        try:
+            tasks = sync_review_tasks(project_path, issues_by_file)
+            logger.info(f"{len(tasks['created'])} tâches de révision manuelle créées, "
+                        f"{len(tasks['updated'])} mises à jour et {len(tasks['closed'])} fermées.")
+        except OSError as e:
+            logger.error(f"Erreur lors de la synchronisation des tâches de révision: {e}")
+    
+    # Retourner 1 s'il y a des erreurs, 0 sinon
+    return 1 if error_count > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script de vérification de structure du projet d'édition littéraire.
+
+Ce script analyse la structure du projet pour vérifier sa conformité avec 
+les standards définis dans le guide complet. Il ne modifie aucun fichier 
+directement mais génère des rapports et des tâches TODO pour les problèmes 
+nécessitant une intervention manuelle.
+
+Utilisation:
+    verify-structure analyze|report|fix|links [options]   (voir structure_cli)
+    python verify-structure-script.py [options]
+
+Options:
+    --project-dir PATH    Chemin vers le répertoire du projet (défaut: répertoire courant)
+    --mode MODE           Mode de fonctionnement: 'analyze', 'report', 'fix' ou 'links' (défaut: analyze)
+    --verbose             Affiche des informations détaillées pendant l'exécution
+    --output FILE         Chemin vers le fichier de sortie pour le rapport (défaut: structure-report.md)
+    --format FORMAT       Format du rapport: 'markdown', 'jsonl' ou 'sarif' (défaut: markdown)
+    --no-cache            Ignore le cache de vérification (.structure-cache.sqlite)
+    --jobs N              Nombre de processus pour l'analyse des fichiers (défaut: 1),
+                          ou pour les projets avec --projects-root (défaut: nombre de processeurs)
+    --policy [FICHIER]    En mode 'fix', corrige sans question selon une politique (fix-policy.yaml)
+    --dry-run             Avec --policy, affiche le diff des corrections sans rien écrire
+    --projects-root DIR   Vérifie en parallèle tous les projets (index.md et chapitres/) sous DIR
+                          et crée une synthèse (structure-batch-report.md)
+    --backlinks NOTE      En mode 'links', liste les liens qui pointent vers NOTE (répétable)
+    --orphans             En mode 'links', liste les notes vers lesquelles aucun lien ne pointe
+    --watch               Après la vérification, surveille le projet et revérifie les fichiers modifiés
+    --debounce SECONDES   Délai de regroupement des modifications en mode --watch (défaut: 0.5)
+    --profile             Affiche le temps et les compteurs (octets lus, YAML, regex...) de chaque phase
+    --profile-dump FILE   Enregistre en plus un profil cProfile lisible avec pstats
+"""
+
+import os
+import sys
+import re
+import logging
+import argparse
+from pathlib import Path
+from datetime import datetime
+from time import perf_counter
+
+from file_analysis import analyze_in_parallel, validate_file_frontmatter
+from frontmatter_rules import load_frontmatter_rules
+from issue_output import (DEFAULT_OUTPUT_FILES, OUTPUT_FORMATS, IssueStream, create_issue_writer,
+                          write_issues)
+from issue_store import IssueStore
+from link_graph import broken_link_issue, link_graph_for
+from phase_profiler import PhaseProfiler, counters_since, read_counters
+from structure_cache import StructureCache
+from structure_spec import EXPECTED_STRUCTURE, STRUCTURE_TREE, compile_structure, diff_structure
+from vault_snapshot import VaultSnapshot, parse_frontmatter
+
+# Le logging est configuré par main() (setup_logging), jamais à l'import
+logger = logging.getLogger('structure_verification')
+
+# Journal écrit dans le dossier courant
+LOG_FILE = "structure_verification.log"
+
+# Templates attendus
+EXPECTED_TEMPLATES = {
+    'personnage-avance.md': {'required': True},
+    'chapitre.md': {'required': True},
+    'scene.md': {'required': False},
+    'reference.md': {'required': True},
+    'todo.md': {'required': True},
+    'gantt.md': {'required': False},
+    'intervenant.md': {'required': True}
+}
+
+
+def setup_logging(verbose=False):
+    """
+    Configure le logging de la vérification: console et fichier journal.
+    
+    Args:
+        verbose (bool): Affiche aussi les messages de débogage
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(LOG_FILE),
+            logging.StreamHandler()
+        ]
+    )
+    if verbose:
+        logger.setLevel(logging.DEBUG)
+
+def validate_structure(project_path, expected_structure, path="", issues=None, structure_diff=None):
+    """
+    Valide la structure du projet selon la définition attendue, d'après une
+    seule lecture de chaque dossier décrit (voir structure_spec.diff_structure).
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        expected_structure (dict): Structure attendue pour ce niveau
+        path (str): Chemin relatif du niveau vérifié
+        issues (list): Liste pour accumuler les problèmes détectés
+        structure_diff (StructureDiff, optional): Comparaison déjà effectuée,
+            réutilisée par les correcteurs
+        
+    Returns:
+        list: Liste des problèmes détectés
+    """
+    if issues is None:
+        issues = []
+    if structure_diff is None:
+        tree = STRUCTURE_TREE if expected_structure is EXPECTED_STRUCTURE else compile_structure(expected_structure)
+        structure_diff = diff_structure(project_path, tree, path)
+    
+    for entry in structure_diff.entries:
+        # Seuls les éléments de la définition de vérification sont signalés
+        if entry.node is None or entry.node.required is None:
+            continue
+        current_path = entry.path
+        
+        if entry.status == 'missing':
+            if entry.node.required:
+                issues.append({
+                    'level': 'error',
+                    'type': 'missing_required',
+                    'path': current_path,
+                    'message': f"Élément requis manquant: {current_path}"
+                })
+            else:
+                issues.append({
+                    'level': 'warning',
+                    'type': 'missing_optional',
+                    'path': current_path,
+                    'message': f"Élément recommandé manquant: {current_path}"
+                })
+        elif entry.status == 'mismatch':
+            issues.append({
+                'level': 'error',
+                'type': 'type_mismatch',
+                'path': current_path,
+                'message': f"Type incorrect pour {current_path}: attendu {entry.node.kind}, trouvé {entry.actual}"
+            })
+    
+    return issues
+
+def validate_template_existence(project_path, issues=None):
+    """
+    Vérifie l'existence des templates requis.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste pour accumuler les problèmes détectés
+        
+    Returns:
+        list: Liste des problèmes détectés
+    """
+    if issues is None:
+        issues = []
+    
+    templates_dir = project_path / 'templates'
+    if not templates_dir.exists() or not templates_dir.is_dir():
+        issues.append({
+            'level': 'error',
+            'type': 'missing_templates_dir',
+            'path': 'templates',
+            'message': "Le dossier templates est manquant"
+        })
+        return issues
+    
+    for template_name, details in EXPECTED_TEMPLATES.items():
+        template_path = templates_dir / template_name
+        if not template_path.exists():
+            level = 'error' if details.get('required', False) else 'warning'
+            issues.append({
+                'level': level,
+                'type': 'missing_template',
+                'path': f"templates/{template_name}",
+                'message': f"Template {template_name} manquant"
+            })
+    
+    return issues
+
+def validate_frontmatter(project_path, issues=None, snapshot=None, frontmatter_rules=None):
+    """
+    Vérifie les frontmatter YAML des fichiers markdown selon les règles définies.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste pour accumuler les problèmes détectés
+        snapshot (VaultSnapshot, optional): Instantané du projet à réutiliser
+        frontmatter_rules (RuleDispatcher, optional): Règles compilées
+            (par défaut celles du projet, automation/config/frontmatter-rules.yaml,
+            ou à défaut celles livrées avec les scripts)
+        
+    Returns:
+        list: Liste des problèmes détectés
+    """
+    if issues is None:
+        issues = []
+    if snapshot is None:
+        snapshot = VaultSnapshot.build(project_path)
+    if frontmatter_rules is None:
+        frontmatter_rules = load_frontmatter_rules(project_path)
+    
+    # Parcourir tous les fichiers markdown du projet
+    for md_file in snapshot:
+        # Réutiliser le résultat en cache si le fichier n'a pas changé
+        file_issues = snapshot.cached_result(md_file, 'frontmatter_issues')
+        if file_issues is None:
+            file_issues = validate_file_frontmatter(md_file, frontmatter_rules)
+            snapshot.record_result(md_file, 'frontmatter_issues', file_issues)
+        issues.extend(file_issues)
+    
+    return issues
+
+def extract_frontmatter(file_path):
+    """
+    Extrait le frontmatter YAML d'un fichier markdown.
+    
+    Args:
+        file_path (Path): Chemin du fichier
+        
+    Returns:
+        tuple: (frontmatter_dict, content_str) ou (None, content_str) si pas de frontmatter
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    return parse_frontmatter(content)
+
+def check_broken_links(project_path, issues=None, snapshot=None):
+    """
+    Vérifie les liens internes cassés dans les fichiers markdown, à partir
+    de l'index des liens de l'instantané.
+    
+    Avec un cache, le résultat d'un fichier inchangé est réutilisé tant
+    qu'aucune de ses cibles n'a été ajoutée, supprimée ou renommée.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste pour accumuler les problèmes détectés
+        snapshot (VaultSnapshot, optional): Instantané du projet à réutiliser
+        
+    Returns:
+        list: Liste des problèmes détectés
+    """
+    if issues is None:
+        issues = []
+    if snapshot is None:
+        snapshot = VaultSnapshot.build(project_path)
+    
+    graph = link_graph_for(snapshot)
+    changed_targets = snapshot.changed_targets
+    
+    # Vérifier les liens dans chaque fichier
+    for md_file in snapshot:
+        targets = snapshot.cached_result(md_file, 'targets')
+        file_issues = snapshot.cached_result(md_file, 'broken_links')
+        if targets is not None and file_issues is not None and changed_targets is not None \
+                and changed_targets.isdisjoint(targets):
+            issues.extend(file_issues)
+            continue
+        
+        # Liens dont la cible ne correspond à aucun fichier existant
+        file_issues = [broken_link_issue(edge) for edge in graph.unresolved_edges_from(md_file.rel_path)]
+        snapshot.record_result(md_file, 'broken_links', file_issues)
+        issues.extend(file_issues)
+    
+    return issues
+
+def group_issues_by_file(issues):
+    """
+    Groupe les problèmes par fichier.
+    
+    Args:
+        issues (list ou IssueStore): Problèmes détectés
+        
+    Returns:
+        dict: Dictionnaire des problèmes groupés par fichier
+    """
+    return IssueStore.of(issues).by_file()
+
+def create_review_tasks(project_path, issues):
+    """
+    Synchronise les tâches de révision manuelle avec les problèmes complexes
+    détectés: une tâche par fichier, mise à jour sur place, fermée quand le
+    fichier n'a plus de problème complexe (voir review_tasks).
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste complète des problèmes détectés
+        
+    Returns:
+        dict: Chemins des tâches créées, mises à jour, inchangées et fermées
+    """
+    from review_tasks import needs_manual_review, sync_review_tasks
+    
+    # Problèmes complexes uniquement, non résolus automatiquement
+    issues_by_file = {file_path: file_issues
+                      for file_path, file_issues in group_issues_by_file(issues).items()
+                      if needs_manual_review(file_issues)}
+    return sync_review_tasks(project_path, issues_by_file)
+
+def create_markdown_report(project_path, issues, output_file="structure-report.md"):
+    """
+    Crée un rapport au format Markdown des problèmes de structure détectés.
+    
+    Le rapport est écrit section par section, sans construire le document
+    complet en mémoire: décomptes, sections par type et fichiers à réviser
+    sont des requêtes sur l'IssueStore, lu page par page.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list ou IssueStore): Problèmes détectés
+        output_file (str): Nom du fichier de sortie, ou '-' pour la sortie standard
+        
+    Returns:
+        str: Chemin du fichier de rapport créé, ou '-'
+    """
+    store = IssueStore.of(issues)
+    
+    # Compter les problèmes par niveau
+    level_counts = store.level_counts()
+    
+    if output_file == '-':
+        output_path = output_file
+        f = sys.stdout
+    else:
+        output_path = project_path / output_file
+        f = open(output_path, 'w', encoding='utf-8')
+    try:
+        f.write(f"""# Rapport de vérification de structure
+
+Projet: {project_path}
+Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+## Résumé
+
+- **Erreurs**: {level_counts['error']}
+- **Avertissements**: {level_counts['warning']}
+- **Total**: {len(store)}
+
+## Problèmes détectés
+
+""")
+        
+        # Ajouter les problèmes au rapport, regroupés par type
+        for issue_type, type_count in store.type_counts():
+            f.write(f"### {issue_type.replace('_', ' ').title()} ({type_count})\n\n")
+            
+            for issue in store.of_type(issue_type):
+                level_icon = "🔴" if issue['level'] == 'error' else "🟠"
+                f.write(f"- {level_icon} **{issue['path']}**: {issue['message']}\n")
+            
+            f.write("\n")
+        
+        # Ajouter la section des tâches générées
+        f.write("""
+## Tâches de révision manuelle
+
+Les fichiers suivants nécessitent une révision manuelle et des tâches ont été créées dans le dossier `review/claude_suggestions/` :
+
+""")
+        
+        # Fichiers nécessitant une révision manuelle: erreurs et problèmes de frontmatter
+        files_needing_manual_review = store.files_with('error', 'frontmatter')
+        
+        if files_needing_manual_review:
+            for file_path in files_needing_manual_review:
+                f.write(f"- `{file_path}`\n")
+        else:
+            f.write("Aucun fichier ne nécessite de révision manuelle immédiate.\n")
+        
+        # Ajouter les recommandations
+        f.write("""
+## Recommandations
+
+1. Corriger d'abord les erreurs critiques liées à la structure de base du projet
+2. Résoudre ensuite les problèmes de frontmatter dans les fichiers spécifiques
+3. Vérifier et corriger les liens internes cassés
+4. Exécuter à nouveau ce script pour confirmer que tous les problèmes ont été résolus
+
+""")
+    finally:
+        if f is sys.stdout:
+            f.flush()
+        else:
+            f.close()
+    
+    if output_path == '-':
+        logger.info("Rapport de structure écrit sur la sortie standard")
+    else:
+        logger.info(f"Rapport de structure créé: {output_path}")
+    return str(output_path)
+
+def write_report(project_path, issues, output_format="markdown", output_file=None):
+    """
+    Écrit le rapport des problèmes dans le format demandé.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste des problèmes détectés
+        output_format (str): 'markdown', 'jsonl' ou 'sarif'
+        output_file (str, optional): Fichier de sortie (défaut selon le format), ou '-'
+            pour la sortie standard
+        
+    Returns:
+        str: Chemin du fichier de rapport créé, ou '-'
+    """
+    output_file = output_file or DEFAULT_OUTPUT_FILES[output_format]
+    if output_format == 'markdown':
+        return create_markdown_report(project_path, issues, output_file)
+    return write_issues(output_format, project_path, issues, output_file)
+
+def fix_missing_dirs(project_path, issues, structure_diff=None):
+    """
+    Crée les répertoires manquants identifiés dans les problèmes.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste des problèmes détectés
+        structure_diff (StructureDiff, optional): Comparaison de la vérification,
+            qui indique le type de chaque élément manquant sans relire le disque
+        
+    Returns:
+        int: Nombre de répertoires créés
+    """
+    if structure_diff is None:
+        structure_diff = diff_structure(project_path)
+    missing = structure_diff.missing_by_path()
+    
+    dirs_created = 0
+    for issue in issues:
+        if issue['level'] == 'error' and issue['type'] == 'missing_required':
+            node = missing.get(issue['path'])
+            if node is None or node.kind != 'dir':
+                continue
+            try:
+                dir_path = project_path / issue['path']
+                os.makedirs(dir_path, exist_ok=True)
+                logger.info(f"Répertoire créé: {dir_path}")
+                dirs_created += 1
+            except Exception as e:
+                logger.error(f"Erreur lors de la création du répertoire {issue['path']}: {e}")
+    
+    return dirs_created
+
+def copy_missing_templates(project_path, issues):
+    """
+    Copie les templates manquants à partir des templates standard.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste des problèmes détectés
+        
+    Returns:
+        int: Nombre de templates copiés
+    """
+    templates_copied = 0
+    templates_dir = project_path / 'templates'
+    
+    # S'assurer que le répertoire templates existe
+    if not templates_dir.exists():
+        os.makedirs(templates_dir, exist_ok=True)
+    
+    # Dictionnaire des templates standard et leurs sources
+    standard_templates = {
+        'todo.md': {
+            'source': project_path / 'automation' / 'scripts' / 'python' / 'script-init-todo.py',
+            'extraction_func': lambda content: re.search(r'TEMPLATE_TODO\s*=\s*"""(.*?)"""', content, re.DOTALL).group(1)
+        },
+        'intervenant.md': {
+            'source': project_path / 'automation' / 'scripts' / 'python' / 'script-init-todo.py',
+            'extraction_func': lambda content: re.search(r'TEMPLATE_INTERVENANT\s*=\s*"""(.*?)"""', content, re.DOTALL).group(1)
+        },
+        'personnage-avance.md': {
+            'source': project_path / 'review' / 'claude_suggestions' / '2025-03-20-template-personnage-avance (1).md',
+            'extraction_func': lambda content: content
+        }
+    }
+    
+    for issue in issues:
+        if issue['type'] == 'missing_template':
+            template_name = os.path.basename(issue['path'])
+            
+            if template_name in standard_templates:
+                source_info = standard_templates[template_name]
+                source_path = source_info['source']
+                
+                if source_path.exists():
+                    try:
+                        with open(source_path, 'r', encoding='utf-8') as f:
+                            source_content = f.read()
+                        
+                        # Extraire le contenu du template selon la fonction d'extraction
+                        template_content = source_info['extraction_func'](source_content)
+                        
+                        # Écrire le template
+                        target_path = templates_dir / template_name
+                        with open(target_path, 'w', encoding='utf-8') as f:
+                            f.write(template_content)
+                        
+                        logger.info(f"Template créé: {target_path}")
+                        templates_copied += 1
+                    except Exception as e:
+                        logger.error(f"Erreur lors de la création du template {template_name}: {e}")
+    
+    return templates_copied
+
+def create_missing_index_files(project_path, issues, structure_diff=None):
+    """
+    Crée les fichiers index.md manquants dans les répertoires où ils sont requis.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste des problèmes détectés
+        structure_diff (StructureDiff, optional): Comparaison de la vérification,
+            qui indique le type de chaque élément manquant sans relire le disque
+        
+    Returns:
+        int: Nombre de fichiers index créés
+    """
+    if structure_diff is None:
+        structure_diff = diff_structure(project_path)
+    missing = structure_diff.missing_by_path()
+    
+    index_files_created = 0
+    
+    # Modèles pour différents types d'index files
+    index_templates = {
+        'index.md': """# Projet d'édition littéraire
+
+## Métadonnées
+- Titre: [Titre du projet]
+- Auteur: [Nom de l'auteur]
+- Date de création: {date}
+- Statut: #en-cours
+
+## Structure
+- [Plan général](structure/plan-general.md)
+- [Personnages](structure/personnages.md)
+- [Univers](structure/univers.md)
+
+## Chapitres
+<!-- Les liens vers les chapitres seront ajoutés ici -->
+
+## Notes
+<!-- Notes générales sur le projet -->
+""",
+        'personnages/index.md': """# Index des personnages
+
+Ce document répertorie tous les personnages du projet et leurs relations.
+
+## Personnages principaux
+<!-- Liens vers les personnages principaux -->
+
+## Personnages secondaires
+<!-- Liens vers les personnages secondaires -->
+
+## Relations clés
+<!-- Description des relations importantes entre personnages -->
+""",
+        'references/index.md': """# Index des références
+
+Ce document organise toutes les références externes utilisées dans le projet.
+
+## Navigation par type
+<!-- Liens vers les différents types de références -->
+
+## Navigation par thème
+<!-- Liens vers les références organisées par thème -->
+
+## Tags fréquemment utilisés
+<!-- Liste des tags couramment utilisés -->
+"""
+    }
+    
+    for issue in issues:
+        if issue['level'] == 'error' and issue['type'] == 'missing_required':
+            node = missing.get(issue['path'])
+            if node is None or node.kind != 'file' or node.name != 'index.md':
+                continue
+            try:
+                # C'est un fichier index manquant
+                file_path = project_path / issue['path']
+                
+                # S'assurer que le répertoire parent existe
+                os.makedirs(file_path.parent, exist_ok=True)
+                
+                # Déterminer quel template utiliser
+                template_key = issue['path']
+                if template_key not in index_templates:
+                    template_key = 'index.md'  # Template par défaut
+                
+                # Créer le contenu avec la date actuelle
+                content = index_templates[template_key].format(date=datetime.now().strftime('%Y-%m-%d'))
+                
+                # Écrire le fichier
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                
+                logger.info(f"Fichier index créé: {file_path}")
+                index_files_created += 1
+            except Exception as e:
+                logger.error(f"Erreur lors de la création du fichier index {issue['path']}: {e}")
+    
+    return index_files_created
+
+def fix_broken_links(project_path, issues, interactive=True, snapshot=None):
+    """
+    Corrige les liens cassés simples (renommages, changements de casse, etc.)
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        issues (list): Liste des problèmes détectés
+        interactive (bool): Demander confirmation pour chaque fichier modifié
+        snapshot (VaultSnapshot, optional): Instantané du projet à réutiliser
+        
+    Returns:
+        int: Nombre de liens corrigés
+    """
+    from link_rewriter import rewrite_file_links
+    
+    links_fixed = 0
+    
+    # Filtrer les problèmes de liens cassés
+    broken_link_issues = [issue for issue in issues if issue['type'] == 'broken_link']
+    
+    if not broken_link_issues:
+        return 0
+    
+    if snapshot is None:
+        snapshot = VaultSnapshot.build(project_path)
+    
+    # Fichiers markdown existants indexés en minuscules pour rechercher les correspondances
+    existing_files = snapshot.targets_by_lower
+    
+    graph = link_graph_for(snapshot)
+    
+    # Traiter chaque fichier contenant des liens cassés
+    processed_files = set()
+    for issue in broken_link_issues:
+        file_path = project_path / issue['path']
+        
+        if str(file_path) in processed_files:
+            continue
+        
+        try:
+            md_file = snapshot.get(issue['path'])
+            if md_file is None:
+                continue
+            
+            # Corriger les liens cassés
+            links_to_fix = []
+            
+            # Seuls les liens non résolus de ce fichier, d'après l'index des liens
+            for edge in graph.unresolved_edges_from(md_file.rel_path):
+                link_pattern = edge.raw
+                
+                # Normaliser le lien pour la recherche
+                normalized_link = link_pattern.split('#')[0].lower()  # Enlever les ancres et mettre en minuscules
+                
+                # Si le lien normalisé existe dans notre dictionnaire de fichiers existants
+                # (l'ancre éventuelle est conservée lors du remplacement)
+                link_path = link_pattern.split('#')[0]
+                if normalized_link in existing_files and existing_files[normalized_link] != link_path:
+                    correct_link = existing_files[normalized_link]
+                    if (link_path, correct_link) not in links_to_fix:
+                        links_to_fix.append((link_path, correct_link))
+            
+            # Demander confirmation si interactive
+            if interactive and links_to_fix:
+                print(f"\nFichier: {file_path}")
+                print("Liens à corriger:")
+                for i, (old, new) in enumerate(links_to_fix, 1):
+                    print(f"{i}. '{old}' -> '{new}'")
+                
+                confirm = input("Corriger ces liens? [Y/n/s(elect)]: ").strip().lower()
+                
+                if confirm == 's' or confirm == 'select':
+                    # Mode sélection: demander pour chaque lien
+                    selected_links = []
+                    for i, (old, new) in enumerate(links_to_fix, 1):
+                        link_confirm = input(f"  Corriger '{old}' -> '{new}'? [Y/n]: ").strip().lower()
+                        if not link_confirm or link_confirm in ('y', 'yes', 'oui'):
+                            selected_links.append((old, new))
+                    
+                    links_to_fix = selected_links
+                elif confirm and confirm not in ('y', 'yes', 'oui'):
+                    # Si la réponse n'est pas vide et n'est pas oui, passer ce fichier
+                    logger.info(f"Liens non corrigés dans {file_path}")
+                    continue
+            
+            # Appliquer toutes les corrections en une passe et une seule écriture
+            fixed_in_this_file = sum(rewrite_file_links(file_path, dict(links_to_fix), md_file.text).values())
+            
+            if fixed_in_this_file > 0:
+                md_file.invalidate()
+                
+                logger.info(f"Corrigé {fixed_in_this_file} liens dans {file_path}")
+                links_fixed += fixed_in_this_file
+            
+            processed_files.add(str(file_path))
+        except Exception as e:
+            logger.error(f"Erreur lors de la correction des liens dans {file_path}: {e}")
+    
+    return links_fixed
+
+def issue_key(issue):
+    """Identité d'un problème, pour comparer deux vérifications successives."""
+    return (issue['type'], issue['path'], issue['message'])
+
+def watch_project(project_path, snapshot, output_file="structure-report.md", debounce=None,
+                  output_format="markdown", frontmatter_rules=None):
+    """
+    Surveille le projet et revérifie uniquement les fichiers créés, modifiés
+    ou supprimés, ainsi que les fichiers dont les liens pointent vers eux.
+    
+    Les problèmes apparus ou résolus sont affichés au fil de l'eau et le
+    rapport est réécrit après chaque lot de modifications.
+    
+    Args:
+        project_path (Path): Chemin de base du projet
+        snapshot (VaultSnapshot): Instantané issu de la vérification initiale
+        output_file (str): Nom du fichier de rapport (ignoré par la surveillance)
+        debounce (float, optional): Délai de regroupement des modifications en
+            secondes (par défaut DEFAULT_DEBOUNCE de vault_watcher)
+        output_format (str): Format du rapport ('markdown', 'jsonl' ou 'sarif')
+        frontmatter_rules (RuleDispatcher, optional): Règles compilées
+            (par défaut celles du projet, automation/config/frontmatter-rules.yaml,
+            ou à défaut celles livrées avec les scripts)
+        
+    Returns:
+        list: Problèmes connus à l'arrêt de la surveillance
+    """
+    from vault_watcher import DEFAULT_DEBOUNCE, apply_changes, create_watcher, next_batch
+    
+    if debounce is None:
+        debounce = DEFAULT_DEBOUNCE
+    if frontmatter_rules is None:
+        frontmatter_rules = load_frontmatter_rules(project_path)
+    graph = link_graph_for(snapshot)
+    
+    # Problèmes par fichier, repris des résultats de la vérification initiale
+    frontmatter_by_file = {}
+    links_by_file = {}
+    for md_file in snapshot:
+        file_issues = snapshot.cached_result(md_file, 'frontmatter_issues')
+        if file_issues is None:
+            file_issues = validate_file_frontmatter(md_file, frontmatter_rules)
+        frontmatter_by_file[md_file.rel_path] = file_issues
+        links_by_file[md_file.rel_path] = [broken_link_issue(edge) for edge in graph.unresolved_edges_from(md_file.rel_path)]
+    
+    def collect_issues():
+        issues = validate_structure(project_path, EXPECTED_STRUCTURE)
+        issues.extend(validate_template_existence(project_path))
+        for rel_path in snapshot.files:
+            issues.extend(frontmatter_by_file.get(rel_path, []))
+        for rel_path in snapshot.files:
+            issues.extend(links_by_file.get(rel_path, []))
+        return issues
+    
+    issues = collect_issues()
+    report_path = os.path.relpath(str(project_path / output_file), str(project_path))
+    watcher = create_watcher(project_path, ignored=[report_path])
+    logger.info(f"Surveillance du projet {project_path} (Ctrl+C pour arrêter)...")
+    
+    try:
+        while True:
+            changes = next_batch(watcher, debounce)
+            changed, removed = apply_changes(snapshot, changes)
+            if not changed and not removed:
+                continue
+            
+            # Fichiers à revérifier: les fichiers touchés et ceux qui pointent vers eux
+            affected = set(changed)
+            for rel_path in changed | removed:
+                affected.update(edge.source for edge in graph.backlinks(rel_path))
+            
+            for rel_path in removed:
+                frontmatter_by_file.pop(rel_path, None)
+                links_by_file.pop(rel_path, None)
+            for rel_path in affected:
+                md_file = snapshot.get(rel_path)
+                if md_file is None:
+                    continue
+                if rel_path in changed:
+                    frontmatter_by_file[rel_path] = validate_file_frontmatter(md_file, frontmatter_rules)
+                    snapshot.record_result(md_file, 'frontmatter_issues', frontmatter_by_file[rel_path])
+                links_by_file[rel_path] = [broken_link_issue(edge) for edge in graph.unresolved_edges_from(rel_path)]
+                snapshot.record_result(md_file, 'broken_links', links_by_file[rel_path])
+            
+            new_issues = collect_issues()
+            old_keys = {issue_key(issue) for issue in issues}
+            new_keys = {issue_key(issue) for issue in new_issues}
+            
+            logger.info(f"{len(changed)} fichiers modifiés, {len(removed)} supprimés, "
+                        f"{len(affected - changed)} dépendants revérifiés.")
+            for issue in new_issues:
+                if issue_key(issue) not in old_keys:
+                    level_icon = "🔴" if issue['level'] == 'error' else "🟠"
+                    logger.info(f"  + {level_icon} {issue['message']}")
+            for issue in issues:
+                if issue_key(issue) not in new_keys:
+                    logger.info(f"  - ✅ {issue['message']}")
+            
+            issues = new_issues
+            write_report(project_path, issues, output_format, output_file)
+            snapshot.save_cache()
+    except KeyboardInterrupt:
+        logger.info("Surveillance arrêtée.")
+    finally:
+        watcher.close()
+    
+    return issues
+
+def show_link_index(snapshot, backlinks=None, orphans=False):
+    """
+    Affiche les informations de l'index des liens (mode 'links').
+    
+    Args:
+        snapshot (VaultSnapshot): Instantané du projet
+        backlinks (list): Notes dont il faut lister les liens entrants
+        orphans (bool): Lister les notes vers lesquelles aucun lien ne pointe
+        
+    Returns:
+        LinkGraph: Graphe des liens utilisé
+    """
+    graph = link_graph_for(snapshot)
+    unresolved = sum(1 for _ in graph.unresolved_edges())
+    internal = sum(1 for edges in graph.forward.values() for edge in edges if edge.target)
+    
+    print(f"Index des liens: {len(graph.nodes)} fichiers, {internal} liens internes, {unresolved} liens cassés")
+    
+    for note in backlinks or []:
+        edges = graph.backlinks(note)
+        print(f"\nLiens vers {note} ({len(edges)}):")
+        for edge in edges:
+            print(f"  - {edge.source}:{edge.line}:{edge.column} '{edge.raw}'")
+    
+    if orphans:
+        orphan_notes = graph.orphans()
+        print(f"\nNotes orphelines ({len(orphan_notes)}):")
+        for rel_path in orphan_notes:
+            print(f"  - {rel_path}")
+    
+    return graph
+
+def verify_project(task):
+    """
+    Vérifie un projet pour l'option --projects-root, dans un processus de travail.
+    Un échec est retourné dans le résultat sans interrompre les autres projets.
+    
+    Args:
+        task (tuple): (project_path, frontmatter_rules, use_cache)
+        
+    Returns:
+        dict: Résultat: 'project', 'issues', 'files', 'seconds', 'counters' et 'error'
+    """
+    project_path, frontmatter_rules, use_cache = task
+    before = read_counters()
+    start = perf_counter()
+    issues = []
+    files = 0
+    error = None
+    
+    cache = None
+    try:
+        if use_cache:
+            cache = StructureCache(project_path, frontmatter_rules.fingerprint).open()
+        snapshot = VaultSnapshot.build(project_path, cache=cache)
+        files = len(snapshot)
+        validate_structure(project_path, EXPECTED_STRUCTURE, issues=issues)
+        validate_template_existence(project_path, issues)
+        validate_frontmatter(project_path, issues, snapshot=snapshot, frontmatter_rules=frontmatter_rules)
+        check_broken_links(project_path, issues, snapshot=snapshot)
+        snapshot.save_cache()
+    except Exception as e:
+        logger.error(f"Erreur lors de la vérification de {project_path}: {e}")
+        error = str(e)
+    finally:
+        if cache is not None:
+            cache.close()
+    
+    return {
+        'project': str(project_path),
+        'issues': issues,
+        'files': files,
+        'seconds': perf_counter() - start,
+        'counters': counters_since(before),
+        'error': error,
+    }
+
+def verify_all_projects(projects_root, args):
+    """
+    Vérifie tous les projets trouvés sous un dossier racine et crée le rapport de synthèse.
+    
+    Args:
+        projects_root (Path): Dossier racine des projets
+        args (Namespace): Options de la ligne de commande
+        
+    Returns:
+        int: 1 si un projet a des erreurs ou n'a pas pu être vérifié, 0 sinon
+    """
+    from batch_verification import BATCH_REPORT_FILE, create_batch_report, discover_projects, verify_projects
+    
+    start = perf_counter()
+    projects = discover_projects(projects_root)
+    if not projects:
+        logger.error(f"Aucun projet (dossier avec index.md et chapitres/) trouvé dans {projects_root}")
+        return 1
+    
+    # Règles de chaque projet: les projets sans règles propres partagent les mêmes
+    tasks = []
+    failed = {}
+    for project_path in projects:
+        try:
+            tasks.append((project_path, load_frontmatter_rules(project_path), not args.no_cache))
+        except ValueError as e:
+            logger.error(str(e))
+            failed[str(project_path)] = str(e)
+    
+    jobs = args.jobs or os.cpu_count() or 1
+    logger.info(f"{len(projects)} projets trouvés, vérifiés sur {min(jobs, len(projects))} processus.")
+    
+    results = []
+    for result in verify_projects(verify_project, tasks, jobs):
+        project_path = Path(result['project'])
+        if not result['error']:
+            result['report'] = write_report(project_path, result['issues'], args.format)
+            if args.mode == "report":
+                create_review_tasks(project_path, result['issues'])
+        error_count = sum(1 for issue in result['issues'] if issue['level'] == 'error')
+        warning_count = sum(1 for issue in result['issues'] if issue['level'] == 'warning')
+        logger.info(f"[{len(results) + 1}/{len(tasks)}] {project_path.name}: {error_count} erreurs et "
+                    f"{warning_count} avertissements ({result['seconds']:.2f} s)")
+        results.append(result)
+    
+    for project, error in failed.items():
+        results.append({'project': project, 'issues': [], 'files': 0, 'seconds': 0.0, 'error': error})
+    results.sort(key=lambda result: result['project'])
+    
+    create_batch_report(projects_root, results, args.output or BATCH_REPORT_FILE, perf_counter() - start)
+    
+    has_errors = any(result['error'] or any(issue['level'] == 'error' for issue in result['issues'])
+                     for result in results)
+    return 1 if has_errors else 0
+
+def main(argv=None):
+    """
+    Fonction principale du script.
+    
+    Args:
+        argv (list, optional): Arguments de la ligne de commande (par défaut sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Vérifie la structure du projet d'édition littéraire.")
+    parser.add_argument("--project-dir", default=".", help="Chemin vers le répertoire du projet")
+    parser.add_argument("--mode", choices=["analyze", "report", "fix", "links"], default="analyze", 
+                       help="Mode de fonctionnement: 'analyze' (vérification simple), 'report' (génère des tâches), 'fix' (corrige automatiquement les problèmes simples, sous la protection du journal seulement avec --policy) ou 'links' (interroge l'index des liens)")
+    parser.add_argument("--verbose", action="store_true", help="Affiche des informations détaillées")
+    parser.add_argument("--output", help="Chemin vers le fichier de sortie pour le rapport, '-' pour la sortie standard (défaut: structure-report.md, .jsonl ou .sarif selon le format)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="markdown", help="Format du rapport: 'markdown', 'jsonl' (un problème par ligne) ou 'sarif'")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore le cache de vérification et analyse tous les fichiers")
+    parser.add_argument("--jobs", type=int, help="Nombre de processus pour l'analyse du frontmatter et des liens, ou pour les projets avec --projects-root (défaut: 1, ou le nombre de processeurs avec --projects-root)")
+    parser.add_argument("--policy", nargs='?', const='', metavar="FICHIER", help="En mode 'fix', applique sans aucune question la politique de correction (automation/config/fix-policy.yaml par défaut) et place les cas ambigus dans review/fix-queue.md")
+    parser.add_argument("--dry-run", action="store_true", help="Avec --policy, affiche le diff des corrections sans rien écrire")
+    parser.add_argument("--projects-root", help="Vérifie tous les projets (dossiers avec index.md et chapitres/) trouvés sous ce dossier, en parallèle, et crée un rapport de synthèse")
+    parser.add_argument("--backlinks", action="append", metavar="NOTE", help="En mode 'links', liste les liens qui pointent vers NOTE")
+    parser.add_argument("--orphans", action="store_true", help="En mode 'links', liste les notes vers lesquelles aucun lien ne pointe")
+    parser.add_argument("--watch", action="store_true", help="Surveille le projet après la vérification et revérifie les fichiers modifiés")
+    parser.add_argument("--debounce", type=float, help="Délai de regroupement des modifications en mode --watch, en secondes (défaut: 0.5)")
+    parser.add_argument("--profile", action="store_true", help="Affiche le temps et les compteurs de chaque phase")
+    parser.add_argument("--profile-dump", metavar="FICHIER", help="Enregistre un profil cProfile (pstats) de l'exécution")
+    
+    args = parser.parse_args(argv)
+    
+    # Configurer le logging (console et fichier journal)
+    setup_logging(args.verbose)
+    
+    if args.policy is not None and args.mode != "fix":
+        parser.error("--policy s'utilise avec --mode fix")
+    if args.dry_run and args.policy is None:
+        parser.error("--dry-run s'utilise avec --policy")
+    
+    # Vérification de plusieurs projets: un rapport par projet et une synthèse
+    if args.projects_root:
+        if args.mode not in ("analyze", "report") or args.watch:
+            parser.error("--projects-root s'utilise avec --mode analyze ou report, sans --watch")
+        if args.output == '-':
+            parser.error("--projects-root écrit la synthèse dans un fichier, --output - n'est pas disponible")
+        projects_root = Path(args.projects_root).resolve()
+        if not projects_root.is_dir():
+            logger.error(f"Le répertoire spécifié n'existe pas: {projects_root}")
+            return 1
+        profiler = PhaseProfiler(args.profile, args.profile_dump).start()
+        with profiler.phase('projects'):
+            status = verify_all_projects(projects_root, args)
+        profiler.stop()
+        return status
+    
+    jobs = args.jobs or 1
+    
+    # Convertir le chemin du projet en Path
+    project_path = Path(args.project_dir).resolve()
+    logger.info(f"Vérification de la structure du projet: {project_path}")
+    
+    # Vérifier que le chemin existe et contient un projet
+    if not project_path.exists() or not project_path.is_dir():
+        logger.error(f"Le répertoire spécifié n'existe pas: {project_path}")
+        return 1
+    
+    # Vérifier qu'il s'agit bien d'un projet littéraire
+    if not (project_path / "index.md").exists() and not (project_path / "README.md").exists():
+        logger.warning(f"Ce dossier ne semble pas être un projet littéraire (index.md ou README.md manquants): {project_path}")
+        auto_confirm = hasattr(args, 'yes') and args.yes
+        if not auto_confirm:
+            confirm = input("Continuer quand même? [y/N]: ").strip().lower()
+            if confirm not in ('y', 'yes', 'oui'):
+                logger.info("Opération annulée.")
+                return 0
+        else:
+            logger.info("Continuation forcée (mode automatique).")
+    
+    # Règles de frontmatter du projet (automation/config/), compilées une seule fois
+    try:
+        frontmatter_rules = load_frontmatter_rules(project_path)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    
+    # Mesures par phase (--profile), sans coût si elles ne sont pas demandées
+    profiler = PhaseProfiler(args.profile, args.profile_dump).start()
+    
+    # Ouvrir le cache des résultats par fichier (seuls les fichiers modifiés seront analysés)
+    cache = None
+    if not args.no_cache:
+        cache = StructureCache(project_path, frontmatter_rules.fingerprint).open()
+    
+    try:
+        # Parcourir le projet une seule fois pour tous les validateurs
+        with profiler.phase('snapshot'):
+            snapshot = VaultSnapshot.build(project_path, cache=cache)
+            if jobs > 1:
+                analyzed = analyze_in_parallel(snapshot, frontmatter_rules, jobs)
+                logger.info(f"{analyzed} fichiers analysés sur {jobs} processus.")
+        
+        # Mode d'interrogation de l'index des liens: pas de vérification complète
+        if args.mode == "links":
+            with profiler.phase('links-index'):
+                show_link_index(snapshot, args.backlinks, args.orphans)
+            snapshot.save_cache()
+            profiler.stop()
+            return 0
+        
+        # Fichier de sortie du rapport, selon le format
+        output_file = args.output or DEFAULT_OUTPUT_FILES[args.format]
+        
+        # En format jsonl ou sarif, les problèmes sont écrits au fil de la vérification
+        # (en mode fix, seul le résultat final après corrections est écrit)
+        writers = []
+        if args.format != "markdown" and args.mode != "fix":
+            writers.append(create_issue_writer(args.format, project_path, output_file).open())
+        
+        # Collecter tous les problèmes (conservés seulement s'ils servent ensuite)
+        issue_stream = IssueStream(writers, keep=not writers or args.mode != "analyze" or args.watch)
+        
+        # 1. Valider la structure des dossiers et fichiers
+        logger.info("Vérification de la structure de base...")
+        with profiler.phase('structure'):
+            structure_diff = diff_structure(project_path, STRUCTURE_TREE)
+            validate_structure(project_path, EXPECTED_STRUCTURE, issues=issue_stream, structure_diff=structure_diff)
+        
+        # 2. Vérifier les templates
+        logger.info("Vérification des templates...")
+        with profiler.phase('templates'):
+            validate_template_existence(project_path, issue_stream)
+        
+        # 3. Vérifier les frontmatters
+        logger.info("Vérification des frontmatter YAML...")
+        with profiler.phase('frontmatter'):
+            validate_frontmatter(project_path, issue_stream, snapshot=snapshot, frontmatter_rules=frontmatter_rules)
+        
+        # 4. Vérifier les liens internes
+        logger.info("Vérification des liens internes...")
+        with profiler.phase('links'):
+            check_broken_links(project_path, issue_stream, snapshot=snapshot)
+        with profiler.phase('cache'):
+            snapshot.save_cache()
+        
+        for writer in writers:
+            writer.close()
+        # Problèmes indexés une fois pour le rapport, les corrections et les tâches
+        all_issues = IssueStore(issue_stream.issues)
+        
+        # Afficher un résumé des problèmes
+        error_count = issue_stream.error_count
+        warning_count = issue_stream.warning_count
+        
+        logger.info(f"Vérification terminée. Trouvé {error_count} erreurs et {warning_count} avertissements.")
+        
+        # Mode de correction automatique des problèmes simples
+        if args.mode == "fix":
+            logger.info("Mode de correction automatique activé. Correction des problèmes simples...")
+            
+            if args.policy is not None:
+                # Corrections décidées par la politique, sans aucune question
+                from fix_policy import apply_fix_policy, load_fix_policy
+                
+                try:
+                    policy = load_fix_policy(project_path, args.policy or None)
+                except ValueError as e:
+                    logger.error(str(e))
+                    profiler.stop()
+                    return 1
+                
+                with profiler.phase('fix'):
+                    try:
+                        policy_result = apply_fix_policy(project_path, all_issues, policy, snapshot, args.dry_run)
+                    except Exception as e:
+                        logger.error(f"Erreur lors de l'application de la politique de correction: {e}")
+                        profiler.stop()
+                        return 1
+                
+                if args.dry_run:
+                    sys.stdout.write(policy_result['changes'].format_diff())
+                    report_path = write_report(project_path, all_issues, args.format, output_file)
+                    logger.info(f"Mode dry-run: aucune modification effectuée. Rapport détaillé créé: {report_path}")
+                    profiler.stop()
+                    return 0
+                logger.info(f"{policy_result['fixed']} corrections appliquées selon la politique.")
+            else:
+                # Demander confirmation avant de procéder aux modifications
+                auto_confirm = hasattr(args, 'yes') and args.yes
+                if not auto_confirm:
+                    print("\nLes modifications suivantes seront effectuées:")
+                    print(f"- Création de répertoires manquants ({sum(1 for i in all_issues if i['type'] == 'missing_required' and '.md' not in i['path'])})")
+                    print(f"- Création de templates manquants ({sum(1 for i in all_issues if i['type'] == 'missing_template')})")
+                    print(f"- Création de fichiers index.md manquants ({sum(1 for i in all_issues if i['type'] == 'missing_required' and i['path'].endswith('index.md'))})")
+                    print(f"- Correction de liens cassés ({sum(1 for i in all_issues if i['type'] == 'broken_link')})")
+                
+                    confirm = input("\nVoulez-vous procéder à ces corrections? [Y/n]: ").strip().lower()
+                    if confirm and confirm not in ('y', 'yes', 'oui'):
+                        logger.info("Opération de correction annulée par l'utilisateur.")
+                    
+                        # Créer quand même le rapport pour référence
+                        report_path = write_report(project_path, all_issues, args.format, output_file)
+                        logger.info(f"Rapport détaillé créé sans corrections: {report_path}")
+                    
+                        profiler.stop()
+                        return 0
+            
+                with profiler.phase('fix'):
+                    # 1. Corriger les répertoires manquants
+                    dirs_created = fix_missing_dirs(project_path, all_issues, structure_diff)
+                    logger.info(f"{dirs_created} répertoires manquants créés.")
+            
+                    # 2. Corriger les templates manquants
+                    templates_copied = copy_missing_templates(project_path, all_issues)
+                    logger.info(f"{templates_copied} templates manquants copiés.")
+            
+                    # 3. Créer les fichiers index.md manquants
+                    index_files_created = create_missing_index_files(project_path, all_issues, structure_diff)
+                    logger.info(f"{index_files_created} fichiers index.md créés.")
+            
+                    # 4. Corriger les liens cassés simples
+                    links_fixed = fix_broken_links(project_path, all_issues, not (hasattr(args, 'yes') and args.yes), snapshot)
+                    logger.info(f"{links_fixed} liens cassés corrigés.")
+            
+            # Refaire une vérification pour voir les problèmes restants
+            logger.info("Nouvelle vérification après corrections...")
+            
+            with profiler.phase('recheck'):
+                snapshot = VaultSnapshot.build(project_path, cache=cache)
+                if jobs > 1:
+                    analyze_in_parallel(snapshot, frontmatter_rules, jobs)
+                new_issues = []
+                new_issues.extend(validate_structure(project_path, EXPECTED_STRUCTURE))
+                new_issues.extend(validate_template_existence(project_path))
+                new_issues.extend(validate_frontmatter(project_path, snapshot=snapshot, frontmatter_rules=frontmatter_rules))
+                new_issues.extend(check_broken_links(project_path, snapshot=snapshot))
+                snapshot.save_cache()
+            
+            new_error_count = sum(1 for issue in new_issues if issue['level'] == 'error')
+            new_warning_count = sum(1 for issue in new_issues if issue['level'] == 'warning')
+            
+            logger.info(f"Après corrections: {new_error_count} erreurs et {new_warning_count} avertissements restants.")
+            
+            # Mettre à jour la liste des problèmes pour le rapport
+            all_issues = new_issues
+        
+        # Créer le rapport (déjà écrit au fil de l'eau en format jsonl ou sarif)
+        if not writers:
+            with profiler.phase('report'):
+                report_path = write_report(project_path, all_issues, args.format, output_file)
+            logger.info(f"Rapport détaillé créé: {report_path}")
+        
+        # En mode rapport, créer des tâches uniquement pour les problèmes complexes
+        if args.mode == "report" or (args.mode == "fix" and len(all_issues) > 0):
+            logger.info("Création des tâches de révision manuelle pour les problèmes complexes...")
+            
+            with profiler.phase('tasks'):
+                tasks = create_review_tasks(project_path, all_issues)
+            
+            logger.info(f"{len(tasks['created'])} tâches de révision manuelle créées, "
+                        f"{len(tasks['updated'])} mises à jour et {len(tasks['closed'])} fermées.")
+        
+        # Surveiller le projet et revérifier au fil des modifications
+        if args.watch:
+            with profiler.phase('watch'):
+                all_issues = watch_project(project_path, snapshot, output_file, args.debounce, args.format,
+                                           frontmatter_rules)
+            error_count = sum(1 for issue in all_issues if issue['level'] == 'error')
+        
+        profiler.stop()
+        
+        # Retourner 1 s'il y a des erreurs, 0 sinon
+        return 1 if error_count > 0 else 0
+    finally:
+        if cache is not None:
+            cache.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file